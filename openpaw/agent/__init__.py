@@ -2,17 +2,20 @@
 
 This package consolidates agent-related functionality:
 - AgentRunner: LangGraph agent with workspace integration
+- RunContext: Per-invocation state shared by the runner, middleware and tools
 - Metrics: Token usage tracking and logging
 - Middleware: Tool execution middleware (queue-aware, approval, LLM hooks)
 - Tools: Sandboxed filesystem tools for workspace access
 """
 
 from openpaw.agent.metrics import InvocationMetrics, TokenUsageLogger, TokenUsageReader
+from openpaw.agent.run_context import RunContext
 from openpaw.agent.runner import AgentRunner
 
 __all__ = [
     "AgentRunner",
     "InvocationMetrics",
+    "RunContext",
     "TokenUsageLogger",
     "TokenUsageReader",
 ]
@@ -0,0 +1,94 @@
+"""Cache of compiled agent graphs for stateless invocations."""
+
+import logging
+from collections import OrderedDict
+from collections.abc import Hashable
+from dataclasses import dataclass
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Compiled graphs kept per workspace (one per distinct model/tool/prompt combination)
+DEFAULT_MAX_GRAPHS = 16
+
+
+@dataclass
+class CompiledAgent:
+    """A compiled agent graph and the chat model bound into it."""
+
+    graph: Any
+    model: Any
+
+
+class AgentGraphCache:
+    """LRU cache of compiled agent graphs shared by stateless runners.
+
+    Cron jobs, heartbeats and sub-agents run without a checkpointer and, since
+    per-invocation state lives on RunContext, a compiled graph can serve any
+    number of them. Entries are keyed by everything that goes into the graph:
+    model settings, tool identities, middleware identities and a hash of the
+    system prompt. Callers invalidate the cache when inputs that are not part
+    of the key change (workspace reload, model override, tool removal).
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_GRAPHS):
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum compiled graphs kept before evicting the
+                least recently used one.
+        """
+        self._max_entries = max_entries
+        self._entries: OrderedDict[Hashable, CompiledAgent] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._builds = 0
+        self._build_ms_total = 0.0
+        self._last_build_ms = 0.0
+        self._invalidations = 0
+
+    def get(self, key: Hashable) -> CompiledAgent | None:
+        """Look up a compiled graph, counting the hit or miss."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self._misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return entry
+
+    def put(self, key: Hashable, entry: CompiledAgent, build_ms: float) -> None:
+        """Store a freshly compiled graph and record how long it took to build."""
+        self._builds += 1
+        self._build_ms_total += build_ms
+        self._last_build_ms = build_ms
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, reason: str = "") -> None:
+        """Drop all compiled graphs."""
+        if self._entries:
+            logger.info(f"Invalidating {len(self._entries)} cached agent graph(s): {reason or 'requested'}")
+        self._entries.clear()
+        self._invalidations += 1
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics.
+
+        Returns:
+            Dictionary with entries, hits, misses, hit_rate, builds,
+            avg_build_ms, last_build_ms and invalidations.
+        """
+        lookups = self._hits + self._misses
+        return {
+            "entries": len(self._entries),
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": self._hits / lookups if lookups else 0.0,
+            "builds": self._builds,
+            "avg_build_ms": round(self._build_ms_total / self._builds) if self._builds else 0,
+            "last_build_ms": round(self._last_build_ms),
+            "invalidations": self._invalidations,
+        }
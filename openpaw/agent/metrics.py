@@ -6,11 +6,14 @@ import threading
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from zoneinfo import ZoneInfo
 
 from openpaw.core.paths import TOKEN_USAGE_JSONL
 
+if TYPE_CHECKING:
+    from openpaw.runtime.queue.budget import TokenBudget
+
 logger = logging.getLogger(__name__)
 
 
@@ -20,15 +23,31 @@ class InvocationMetrics:
 
     Aggregates token counts across all LLM calls within a single agent run.
     Extracted from LangChain UsageMetadataCallbackHandler or AIMessage metadata.
+    Cache read/write counts are the prompt-cache subsets of input_tokens.
+    time_to_first_token_ms is only set for streamed runs that produced text.
+    window_tokens_saved approximates the input tokens the history window kept
+    out of the model calls; elided_tokens_saved does the same for stale tool
+    outputs replaced by stubs. interrupt_latency_ms is only set for runs
+    cancelled mid-stream by an interrupting message. rate_limit_wait_ms is
+    the time model calls waited for shared provider rate limit budget. route
+    is the model route the invocation ran on (empty when not routed).
     """
 
     input_tokens: int = 0
     output_tokens: int = 0
     total_tokens: int = 0
+    cache_read_tokens: int = 0
+    cache_write_tokens: int = 0
     llm_calls: int = 0
     duration_ms: float = 0.0
     model: str = ""
     is_partial: bool = False
+    time_to_first_token_ms: float | None = None
+    window_tokens_saved: int = 0
+    elided_tokens_saved: int = 0
+    interrupt_latency_ms: float | None = None
+    rate_limit_wait_ms: float = 0.0
+    route: str = ""
 
 
 def extract_metrics_from_callback(
@@ -72,7 +91,8 @@ def extract_metrics_from_callback(
         return metrics
 
     # Aggregate across all models in usage_metadata
-    # Format: {"model_name": {"input_tokens": int, "output_tokens": int, "total_tokens": int}}
+    # Format: {"model_name": {"input_tokens": int, "output_tokens": int, "total_tokens": int,
+    #                         "input_token_details": {"cache_read": int, "cache_creation": int}}}
     for model_name, model_usage in usage_metadata.items():
         if not isinstance(model_usage, dict):
             logger.warning(
@@ -84,6 +104,9 @@ def extract_metrics_from_callback(
         metrics.input_tokens += model_usage.get("input_tokens", 0)
         metrics.output_tokens += model_usage.get("output_tokens", 0)
         metrics.total_tokens += model_usage.get("total_tokens", 0)
+        input_details = model_usage.get("input_token_details") or {}
+        metrics.cache_read_tokens += input_details.get("cache_read", 0) or 0
+        metrics.cache_write_tokens += input_details.get("cache_creation", 0) or 0
         metrics.llm_calls += 1
 
     # Validate totals (some providers may report incorrect sums)
@@ -100,15 +123,18 @@ class TokenUsageLogger:
     for session-level and workspace-level token tracking.
     """
 
-    def __init__(self, workspace_path: Path) -> None:
+    def __init__(self, workspace_path: Path, budget: "TokenBudget | None" = None) -> None:
         """Initialize the logger.
 
         Args:
             workspace_path: Path to the workspace directory.
+            budget: Token budget whose running totals are updated with every
+                logged invocation.
         """
         self._workspace_path = Path(workspace_path)
         self._log_path = self._workspace_path / str(TOKEN_USAGE_JSONL)
         self._lock = threading.Lock()
+        self._budget = budget
 
     def log(
         self,
@@ -135,10 +161,24 @@ class TokenUsageLogger:
                 "input_tokens": metrics.input_tokens,
                 "output_tokens": metrics.output_tokens,
                 "total_tokens": metrics.total_tokens,
+                "cache_read_tokens": metrics.cache_read_tokens,
+                "cache_write_tokens": metrics.cache_write_tokens,
                 "llm_calls": metrics.llm_calls,
                 "duration_ms": metrics.duration_ms,
                 "model": metrics.model,
             }
+            if metrics.time_to_first_token_ms is not None:
+                entry["time_to_first_token_ms"] = metrics.time_to_first_token_ms
+            if metrics.window_tokens_saved:
+                entry["window_tokens_saved"] = metrics.window_tokens_saved
+            if metrics.interrupt_latency_ms is not None:
+                entry["interrupt_latency_ms"] = metrics.interrupt_latency_ms
+            if metrics.elided_tokens_saved:
+                entry["elided_tokens_saved"] = metrics.elided_tokens_saved
+            if metrics.rate_limit_wait_ms:
+                entry["rate_limit_wait_ms"] = metrics.rate_limit_wait_ms
+            if metrics.route:
+                entry["route"] = metrics.route
             line = json.dumps(entry) + "\n"
 
             with self._lock:
@@ -149,6 +189,9 @@ class TokenUsageLogger:
         except Exception as e:
             logger.warning(f"Failed to log token usage: {e}")
 
+        if self._budget is not None:
+            self._budget.record(invocation_type, metrics.total_tokens)
+
 
 class TokenUsageReader:
     """Read and aggregate token usage from JSONL log."""
@@ -195,7 +238,12 @@ class TokenUsageReader:
                             aggregated.input_tokens += entry.get("input_tokens", 0)
                             aggregated.output_tokens += entry.get("output_tokens", 0)
                             aggregated.total_tokens += entry.get("total_tokens", 0)
+                            aggregated.cache_read_tokens += entry.get("cache_read_tokens", 0)
+                            aggregated.cache_write_tokens += entry.get("cache_write_tokens", 0)
                             aggregated.llm_calls += entry.get("llm_calls", 0)
+                            aggregated.window_tokens_saved += entry.get("window_tokens_saved", 0)
+                            aggregated.elided_tokens_saved += entry.get("elided_tokens_saved", 0)
+                            aggregated.rate_limit_wait_ms += entry.get("rate_limit_wait_ms", 0.0)
                             aggregated.duration_ms += entry.get("duration_ms", 0.0)
                     except (json.JSONDecodeError, KeyError, ValueError) as e:
                         logger.debug(f"Skipping malformed log entry: {e}")
@@ -239,7 +287,12 @@ class TokenUsageReader:
                             aggregated.input_tokens += entry.get("input_tokens", 0)
                             aggregated.output_tokens += entry.get("output_tokens", 0)
                             aggregated.total_tokens += entry.get("total_tokens", 0)
+                            aggregated.cache_read_tokens += entry.get("cache_read_tokens", 0)
+                            aggregated.cache_write_tokens += entry.get("cache_write_tokens", 0)
                             aggregated.llm_calls += entry.get("llm_calls", 0)
+                            aggregated.window_tokens_saved += entry.get("window_tokens_saved", 0)
+                            aggregated.elided_tokens_saved += entry.get("elided_tokens_saved", 0)
+                            aggregated.rate_limit_wait_ms += entry.get("rate_limit_wait_ms", 0.0)
                             aggregated.duration_ms += entry.get("duration_ms", 0.0)
                     except (json.JSONDecodeError, KeyError, ValueError) as e:
                         logger.debug(f"Skipping malformed log entry: {e}")
@@ -248,3 +301,57 @@ class TokenUsageReader:
             logger.warning(f"Failed to read token usage log: {e}")
 
         return aggregated
+
+    def routes_today(self, timezone_str: str = "UTC") -> dict[str, dict[str, Any]]:
+        """Aggregate today's routed invocations per model route.
+
+        Args:
+            timezone_str: IANA timezone string (e.g., "America/Denver").
+
+        Returns:
+            Dictionary mapping route name to ``model`` (latest model of the
+            route), ``runs``, ``avg_ms`` (average invocation duration) and
+            ``total_tokens``.
+        """
+        if not self._log_path.exists():
+            return {}
+
+        timezone = ZoneInfo(timezone_str)
+        today = datetime.now(timezone).date()
+        routes: dict[str, dict[str, Any]] = {}
+
+        try:
+            with open(self._log_path) as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        entry = json.loads(line)
+                        route = entry.get("route")
+                        if not route:
+                            continue
+                        timestamp = datetime.fromisoformat(entry["timestamp"])
+                        if timestamp.astimezone(timezone).date() != today:
+                            continue
+                        stats = routes.setdefault(
+                            route, {"model": "", "runs": 0, "duration_ms": 0.0, "total_tokens": 0}
+                        )
+                        stats["model"] = entry.get("model", "")
+                        stats["runs"] += 1
+                        stats["duration_ms"] += entry.get("duration_ms", 0.0)
+                        stats["total_tokens"] += entry.get("total_tokens", 0)
+                    except (json.JSONDecodeError, KeyError, ValueError) as e:
+                        logger.debug(f"Skipping malformed log entry: {e}")
+                        continue
+        except Exception as e:
+            logger.warning(f"Failed to read token usage log: {e}")
+
+        return {
+            route: {
+                "model": stats["model"],
+                "runs": stats["runs"],
+                "avg_ms": round(stats["duration_ms"] / stats["runs"]),
+                "total_tokens": stats["total_tokens"],
+            }
+            for route, stats in routes.items()
+        }
@@ -2,28 +2,54 @@
 
 Provides middleware components for:
 - Per-tool timeouts (budget protection)
+- Tool result size policy (oversized results spilled to workspace files)
 - Queue awareness (steer/interrupt modes)
 - Approval gates (human-in-the-loop)
 - LLM hooks (thinking token stripping, reasoning sanitization)
+- Prompt caching (stable system prompt prefix with provider cache breakpoints)
+- History windowing (token-budgeted conversation window per model call)
+- Tool output elision (stubs for stale tool results from older turns)
+- Model hedging (secondary model for slow or failing model calls)
+- Provider rate limits (shared request/token budgets, 429 retries)
+- Budget downgrades (cheaper model for over-budget work)
+- Model routing (per-invocation-type models, simple message classification)
 """
 
 from openpaw.agent.middleware.approval import ApprovalRequiredError, ApprovalToolMiddleware
+from openpaw.agent.middleware.budget_downgrade import BudgetDowngradeMiddleware
+from openpaw.agent.middleware.history_window import HistoryWindowMiddleware
 from openpaw.agent.middleware.llm_hooks import (
     THINKING_TAG_PATTERN,
+    ThinkingStreamFilter,
     ThinkingTokenMiddleware,
     build_post_model_hook,
     build_pre_model_hook,
 )
+from openpaw.agent.middleware.model_hedging import ModelHedgingMiddleware
+from openpaw.agent.middleware.model_routing import ModelRoutingMiddleware
+from openpaw.agent.middleware.prompt_cache import PromptCacheMiddleware
 from openpaw.agent.middleware.queue_aware import InterruptSignalError, QueueAwareToolMiddleware
+from openpaw.agent.middleware.rate_limit import ProviderRateLimitMiddleware
+from openpaw.agent.middleware.tool_elision import ToolOutputElisionMiddleware
+from openpaw.agent.middleware.tool_output_spill import ToolOutputSpillMiddleware
 from openpaw.agent.middleware.tool_timeout import ToolTimeoutMiddleware
 
 __all__ = [
     "ApprovalRequiredError",
     "ApprovalToolMiddleware",
+    "BudgetDowngradeMiddleware",
+    "HistoryWindowMiddleware",
     "InterruptSignalError",
+    "ModelHedgingMiddleware",
+    "ModelRoutingMiddleware",
+    "PromptCacheMiddleware",
+    "ProviderRateLimitMiddleware",
     "QueueAwareToolMiddleware",
     "THINKING_TAG_PATTERN",
+    "ThinkingStreamFilter",
     "ThinkingTokenMiddleware",
+    "ToolOutputElisionMiddleware",
+    "ToolOutputSpillMiddleware",
     "ToolTimeoutMiddleware",
     "build_post_model_hook",
     "build_pre_model_hook",
@@ -6,6 +6,7 @@ from typing import Any
 
 from langchain.agents.middleware import wrap_tool_call
 
+from openpaw.agent.run_context import get_run_context
 from openpaw.runtime.approval import ApprovalGateManager
 
 logger = logging.getLogger(__name__)
@@ -33,30 +34,18 @@ class ApprovalToolMiddleware:
     5. On denial: sends denial message to user
 
     Designed for composition with QueueAwareToolMiddleware in the
-    create_agent(middleware=[...]) list.
+    create_agent(middleware=[...]) list. The session and thread of a call are
+    read from the active RunContext, so one instance serves concurrent runs.
     """
 
-    def __init__(self) -> None:
-        self._manager: ApprovalGateManager | None = None
-        self._session_key: str | None = None
-        self._thread_id: str | None = None
-
-    def set_context(
-        self,
-        manager: ApprovalGateManager,
-        session_key: str,
-        thread_id: str,
-    ) -> None:
-        """Configure approval context for current invocation."""
-        self._manager = manager
-        self._session_key = session_key
-        self._thread_id = thread_id
+    def __init__(self, manager: ApprovalGateManager | None = None) -> None:
+        """Initialize the middleware.
 
-    def reset(self) -> None:
-        """Reset per-invocation state."""
-        self._manager = None
-        self._session_key = None
-        self._thread_id = None
+        Args:
+            manager: Workspace approval gate manager. Without one the
+                middleware is a pass-through.
+        """
+        self._manager = manager
 
     def get_middleware(self) -> Any:
         """Return the @wrap_tool_call compatible middleware function."""
@@ -74,9 +63,11 @@ class ApprovalToolMiddleware:
         self, request: Any, handler: Callable[[Any], Awaitable[Any]]
     ) -> Any:
         """Check if tool requires approval, otherwise execute normally."""
-        # If no manager configured, execute normally
-        if self._manager is None or self._session_key is None:
+        # If no manager configured or no session bound to this run, execute normally
+        context = get_run_context()
+        if self._manager is None or context is None or context.session_key is None:
             return await handler(request)
+        session_key = context.session_key
 
         tool_name = request.tool_call.get("name", "")
 
@@ -85,13 +76,13 @@ class ApprovalToolMiddleware:
             return await handler(request)
 
         # Check if this tool was recently approved (bypass check after user approval)
-        if self._manager.check_recent_approval(self._session_key, tool_name):
+        if self._manager.check_recent_approval(session_key, tool_name):
             logger.info(
                 f"Tool {tool_name} has recent approval, executing without prompt"
             )
             result = await handler(request)
             # Clear the approval after successful execution
-            self._manager.clear_recent_approval(self._session_key, tool_name)
+            self._manager.clear_recent_approval(session_key, tool_name)
             return result
 
         # Tool requires approval - create pending approval and raise
@@ -99,8 +90,8 @@ class ApprovalToolMiddleware:
         approval = await self._manager.request_approval(
             tool_name=tool_name,
             tool_args=tool_args,
-            session_key=self._session_key,
-            thread_id=self._thread_id or "",
+            session_key=session_key,
+            thread_id=context.thread_id or "",
         )
 
         logger.info(f"Approval required: {tool_name} (approval_id={approval.id})")
@@ -0,0 +1,76 @@
+"""Middleware that moves over-budget work to a cheaper model.
+
+When a workspace's token budget uses the downgrade policy, the lane queue
+admits over-budget work with the budget downgrade flag set (see
+openpaw.runtime.queue.budget). Model calls made while the flag is set are
+sent to the workspace's downgrade model instead of its configured model.
+
+Usage with create_agent:
+    from openpaw.agent.middleware.budget_downgrade import BudgetDowngradeMiddleware
+
+    agent = create_agent(
+        model=model,
+        tools=tools,
+        middleware=[
+            BudgetDowngradeMiddleware(
+                model_label="anthropic:claude-sonnet-4-5",
+                downgrade=cheap_model,
+                downgrade_label="anthropic:claude-haiku-4-5",
+            )
+        ],
+    )
+"""
+
+import logging
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from langchain.agents.middleware.types import AgentMiddleware
+from langchain_core.language_models import BaseChatModel
+
+from openpaw.agent.middleware.prompt_cache import cache_breakpoint_style, flatten_cached_system_message
+from openpaw.runtime.queue.budget import budget_downgrade_active
+
+logger = logging.getLogger(__name__)
+
+
+class BudgetDowngradeMiddleware(AgentMiddleware):
+    """Retarget model calls of downgraded work at the downgrade model.
+
+    Runs after PromptCacheMiddleware and before ModelHedgingMiddleware, so a
+    downgraded call is neither hedged nor paced under the configured model's
+    provider limits.
+    """
+
+    def __init__(self, model_label: str, downgrade: BaseChatModel, downgrade_label: str) -> None:
+        """Initialize the middleware.
+
+        Args:
+            model_label: The agent's own model in "provider:model" format.
+            downgrade: Cheaper model used while the downgrade flag is set.
+            downgrade_label: The downgrade model in "provider:model" format.
+        """
+        super().__init__()
+        self._downgrade = downgrade
+        self._downgrade_label = downgrade_label
+        self._restyle = cache_breakpoint_style(model_label) != cache_breakpoint_style(downgrade_label)
+
+    def _retarget(self, request: Any) -> Any:
+        """Send the request to the downgrade model when the flag is set."""
+        if not budget_downgrade_active():
+            return request
+        logger.debug(f"Token budget exceeded, using {self._downgrade_label}")
+        overrides: dict[str, Any] = {"model": self._downgrade}
+        if self._restyle and request.system_message is not None:
+            overrides["system_message"] = flatten_cached_system_message(request.system_message)
+        return request.override(**overrides)
+
+    def wrap_model_call(self, request: Any, handler: Callable[[Any], Any]) -> Any:
+        """Sync model call on the configured or downgrade model."""
+        return handler(self._retarget(request))
+
+    async def awrap_model_call(
+        self, request: Any, handler: Callable[[Any], Awaitable[Any]]
+    ) -> Any:
+        """Async model call on the configured or downgrade model."""
+        return await handler(self._retarget(request))
@@ -0,0 +1,142 @@
+"""Middleware that sends a token-budgeted window of the conversation to the model.
+
+Without a window every model call replays the whole checkpointed thread, so
+input cost and latency grow with the conversation until auto-compact fires.
+This middleware keeps the full history in the checkpointer but only sends the
+most recent turns that fit the budget, preceded by a rolling summary of the
+rest when one is available. The latest turn (the user's message and every tool
+call and result since) is always sent intact.
+
+Usage with create_agent:
+    from openpaw.agent.middleware.history_window import HistoryWindowMiddleware
+
+    agent = create_agent(
+        model=model,
+        tools=tools,
+        middleware=[HistoryWindowMiddleware(max_tokens=32000, max_turns=20)],
+    )
+"""
+
+import logging
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from langchain.agents.middleware.types import AgentMiddleware
+from langchain_core.messages import BaseMessage, HumanMessage
+from langchain_core.messages.utils import count_tokens_approximately
+
+from openpaw.agent.run_context import get_run_context
+
+logger = logging.getLogger(__name__)
+
+# Prepended to the window when earlier turns are left out
+HISTORY_SUMMARY_TEMPLATE = (
+    "[EARLIER CONVERSATION]\n\n"
+    "Older messages of this conversation are not shown. Summary of the conversation so far:\n"
+    "{summary}"
+)
+
+
+def select_window(messages: list[BaseMessage], max_tokens: int, max_turns: int) -> int:
+    """Find where the history window starts.
+
+    A turn starts at a human message and runs up to the next one, so cutting
+    at turn boundaries never separates tool results from their tool calls.
+    The latest turn is always kept; earlier turns are added newest first while
+    they fit ``max_tokens`` and the window holds fewer than ``max_turns`` turns.
+
+    Args:
+        messages: Conversation messages, oldest first (no system message).
+        max_tokens: Approximate token budget for the window.
+        max_turns: Maximum number of turns in the window.
+
+    Returns:
+        Index of the first message to send (0 when everything fits).
+    """
+    turn_starts = [i for i, message in enumerate(messages) if isinstance(message, HumanMessage)]
+    if len(turn_starts) <= 1:
+        return 0
+
+    start = turn_starts[-1]
+    used = count_tokens_approximately(messages[start:])
+    turns = 1
+    for boundary in reversed(turn_starts[:-1]):
+        if turns >= max_turns:
+            break
+        cost = count_tokens_approximately(messages[boundary:start])
+        if used + cost > max_tokens:
+            break
+        used += cost
+        start = boundary
+        turns += 1
+
+    # Nothing but a preamble before the first turn would be left out
+    if start == turn_starts[0]:
+        return 0
+    return start
+
+
+class HistoryWindowMiddleware(AgentMiddleware):
+    """Replace the model request's messages with a token-budgeted window.
+
+    Only the request is changed; the graph state and the checkpointed thread
+    keep every message. Tokens left out are recorded on the RunContext for
+    metrics and for the running context tally.
+    """
+
+    def __init__(self, max_tokens: int, max_turns: int, summary: bool = True) -> None:
+        """Initialize the middleware.
+
+        Args:
+            max_tokens: Approximate token budget for conversation messages.
+            max_turns: Maximum number of recent turns to send.
+            summary: Whether to prepend RunContext.history_summary when
+                messages are left out. Only messages the summary covers are
+                then left out; without a summary the whole thread is sent.
+        """
+        super().__init__()
+        self._max_tokens = max_tokens
+        self._max_turns = max_turns
+        self._summary = summary
+
+    def _prepare(self, request: Any) -> Any:
+        """Return the request with the history window applied."""
+        messages = list(request.messages)
+        start = select_window(messages, self._max_tokens, self._max_turns)
+        context = get_run_context()
+        summary = context.history_summary if context is not None and self._summary else None
+        if self._summary:
+            # Turns past the summary's coverage would reach neither it nor the model
+            covered = context.history_summary_covers if context is not None and summary else 0
+            start = min(start, covered)
+        if start == 0:
+            if context is not None:
+                context.window_tokens_dropped = 0
+            return request
+
+        dropped = count_tokens_approximately(messages[:start])
+        window = messages[start:]
+        saved = dropped
+        if summary:
+            summary_message = HumanMessage(content=HISTORY_SUMMARY_TEMPLATE.format(summary=summary))
+            saved -= count_tokens_approximately([summary_message])
+            window = [summary_message, *window]
+
+        if context is not None:
+            context.window_tokens_dropped = dropped
+            context.window_tokens_saved += max(saved, 0)
+        logger.debug(
+            f"History window: sending {len(window)} of {len(messages)} messages, "
+            f"~{max(saved, 0):,} tokens saved"
+        )
+        return request.override(messages=window)
+
+    def wrap_model_call(self, request: Any, handler: Callable[[Any], Any]) -> Any:
+        """Apply the history window before a sync model call."""
+        return handler(self._prepare(request))
+
+    async def awrap_model_call(
+        self, request: Any, handler: Callable[[Any], Awaitable[Any]]
+    ) -> Any:
+        """Apply the history window before an async model call."""
+        return await handler(self._prepare(request))
@@ -3,6 +3,7 @@
 Provides middleware components for:
 - Thinking token stripping (Kimi K2.5, Claude reasoning blocks)
 - Reasoning content sanitization (prevents stale thinking artifacts)
+- Incremental thinking tag filtering for streamed responses
 
 Usage with create_agent:
     from openpaw.agent.middleware.llm_hooks import ThinkingTokenMiddleware
@@ -93,6 +94,79 @@ def _strip_thinking_tokens(state: dict[str, Any]) -> dict[str, Any]:
     return state
 
 
+class ThinkingStreamFilter:
+    """Incremental counterpart of THINKING_TAG_PATTERN for streamed text.
+
+    Tokens arrive in arbitrary fragments, so an opening or closing tag may be
+    split across chunks. The filter holds back any trailing text that could
+    be the start of a tag until the next chunk disambiguates it.
+    """
+
+    _OPEN = "<think>"
+    _CLOSE = "</think>"
+
+    def __init__(self) -> None:
+        self._pending = ""
+        self._in_thinking = False
+        self._strip_leading = False
+
+    def feed(self, chunk: str) -> str:
+        """Consume a streamed fragment and return the newly visible text."""
+        self._pending += chunk
+        visible: list[str] = []
+
+        while self._pending:
+            lowered = self._pending.lower()
+            if self._in_thinking:
+                end = lowered.find(self._CLOSE)
+                if end == -1:
+                    # Keep a possible partial closing tag, drop the rest
+                    self._pending = self._pending[-(len(self._CLOSE) - 1):]
+                    break
+                self._pending = self._pending[end + len(self._CLOSE):]
+                self._in_thinking = False
+                self._strip_leading = True
+                continue
+
+            if self._strip_leading:
+                # Mirrors the trailing \s* of THINKING_TAG_PATTERN
+                self._pending = self._pending.lstrip()
+                if not self._pending:
+                    break
+                self._strip_leading = False
+                continue
+
+            start = lowered.find(self._OPEN)
+            if start != -1:
+                visible.append(self._pending[:start])
+                self._pending = self._pending[start + len(self._OPEN):]
+                self._in_thinking = True
+                continue
+
+            hold = self._partial_tag_length(lowered)
+            visible.append(self._pending[: len(self._pending) - hold])
+            self._pending = self._pending[len(self._pending) - hold:]
+            break
+
+        return "".join(visible)
+
+    def flush(self) -> str:
+        """Return held-back text once the stream has ended."""
+        if self._in_thinking:
+            remainder = ""
+        else:
+            remainder = self._pending
+        self._pending = ""
+        return remainder
+
+    def _partial_tag_length(self, lowered: str) -> int:
+        """Length of the longest suffix of ``lowered`` that starts an opening tag."""
+        for length in range(min(len(self._OPEN) - 1, len(lowered)), 0, -1):
+            if self._OPEN.startswith(lowered[-length:]):
+                return length
+        return 0
+
+
 class ThinkingTokenMiddleware(AgentMiddleware):
     """Middleware for stripping thinking tokens and reasoning content.
 
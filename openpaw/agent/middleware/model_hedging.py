@@ -0,0 +1,373 @@
+"""Middleware that hedges slow model calls and falls back on provider errors.
+
+A slow or degraded endpoint otherwise drags out every run that targets it.
+When the primary model has produced no output chunk within ``hedge_after_ms``,
+the same request is sent to a secondary model and whichever starts streaming
+first is used; the other request is cancelled. When the primary fails with a
+provider error (5xx, overload, rate limit, connection failure), the request is
+retried on the secondary instead of failing the run.
+
+Hedge rate and win rate per model endpoint are recorded process-wide, see
+get_model_hedge_stats().
+
+Usage with create_agent:
+    from openpaw.agent.middleware.model_hedging import ModelHedgingMiddleware
+
+    agent = create_agent(
+        model=primary,
+        tools=tools,
+        middleware=[
+            ModelHedgingMiddleware(
+                primary_label="anthropic:claude-sonnet-4-5",
+                secondary=secondary,
+                secondary_label="bedrock_converse:us.anthropic.claude-sonnet-4-5@us-west-2",
+                hedge_after_ms=4000,
+            )
+        ],
+    )
+"""
+
+import asyncio
+import logging
+import threading
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any
+from uuid import UUID
+
+from langchain.agents.middleware.types import AgentMiddleware
+from langchain_core.callbacks import AsyncCallbackHandler
+from langchain_core.language_models import BaseChatModel
+from langchain_core.outputs import ChatGenerationChunk, GenerationChunk
+from langchain_core.tracers.context import register_configure_hook
+
+from openpaw.agent.middleware.prompt_cache import cache_breakpoint_style, flatten_cached_system_message
+from openpaw.agent.rate_limiter import error_status_code
+
+logger = logging.getLogger(__name__)
+
+# Errors caused by the request itself; the secondary would reject it too
+_REQUEST_ERROR_STATUSES = frozenset({400, 404, 413, 422})
+
+
+class _FirstChunkHandler(AsyncCallbackHandler):
+    """Signals the first streamed chunk of one model attempt.
+
+    Defines the streaming tap methods so LangChain treats it as a streaming
+    handler: chat models then stream even in non-streaming runs, which is
+    what makes a first-chunk deadline observable.
+    """
+
+    def __init__(self, first_chunk: asyncio.Event) -> None:
+        self._first_chunk = first_chunk
+
+    async def on_llm_new_token(
+        self,
+        token: str | list[str | dict[str, Any]],
+        *,
+        chunk: GenerationChunk | ChatGenerationChunk | None = None,
+        run_id: UUID,
+        parent_run_id: UUID | None = None,
+        tags: list[str] | None = None,
+        **kwargs: Any,
+    ) -> None:
+        self._first_chunk.set()
+
+    def tap_output_aiter(self, run_id: UUID, output: AsyncIterator[Any]) -> AsyncIterator[Any]:
+        return output
+
+    def tap_output_iter(self, run_id: UUID, output: Iterator[Any]) -> Iterator[Any]:
+        return output
+
+
+# Handler of the attempt running in the current task; picked up by every
+# callback manager configured inside it
+_attempt_handler: ContextVar[_FirstChunkHandler | None] = ContextVar(
+    "openpaw_model_attempt_handler", default=None
+)
+register_configure_hook(_attempt_handler, inheritable=True)
+
+
+class _Attempt:
+    """One in-flight model request (primary or secondary)."""
+
+    def __init__(
+        self,
+        label: str,
+        handler: Callable[[Any], Awaitable[Any]],
+        request: Any,
+    ) -> None:
+        self.label = label
+        self.first_chunk = asyncio.Event()
+        token = _attempt_handler.set(_FirstChunkHandler(self.first_chunk))
+        try:
+            # The task copies the current context, handler included
+            self.task: asyncio.Future[Any] = asyncio.ensure_future(handler(request))
+        finally:
+            _attempt_handler.reset(token)
+        self.chunk_waiter: asyncio.Future[Any] = asyncio.ensure_future(self.first_chunk.wait())
+
+    @property
+    def failed(self) -> bool:
+        """Whether the request finished with an error."""
+        return self.task.done() and (self.task.cancelled() or self.task.exception() is not None)
+
+    @property
+    def error(self) -> BaseException:
+        """The error of a failed request."""
+        if self.task.cancelled():
+            return asyncio.CancelledError()
+        error = self.task.exception()
+        assert error is not None
+        return error
+
+    def cancel(self) -> None:
+        """Cancel the request, closing its connection."""
+        self.task.cancel()
+        self.chunk_waiter.cancel()
+
+
+async def _first_signal(attempts: list[_Attempt], timeout: float | None) -> _Attempt | None:
+    """Wait until an attempt streams its first chunk or finishes.
+
+    Returns:
+        The attempt that signalled, preferring a healthy one when several did
+        at once, or None on timeout.
+    """
+    waiters: dict[asyncio.Future[Any], _Attempt] = {}
+    for attempt in attempts:
+        waiters[attempt.task] = attempt
+        waiters[attempt.chunk_waiter] = attempt
+    done, _ = await asyncio.wait(waiters, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+    if not done:
+        return None
+    signalled = [waiters[future] for future in done]
+    return next((attempt for attempt in signalled if not attempt.failed), signalled[0])
+
+
+@dataclass
+class _EndpointStats:
+    """Hedging counters for one model endpoint."""
+
+    calls: int = 0
+    hedged: int = 0
+    races: int = 0
+    wins: int = 0
+    fallbacks: int = 0
+
+
+class ModelHedgeStats:
+    """Process-wide hedging and fallback counters, keyed by model endpoint."""
+
+    def __init__(self) -> None:
+        self._endpoints: dict[str, _EndpointStats] = {}
+        self._lock = threading.Lock()
+
+    def _endpoint(self, label: str) -> _EndpointStats:
+        return self._endpoints.setdefault(label, _EndpointStats())
+
+    def record_call(self, label: str) -> None:
+        """Count a model call sent to ``label`` as the primary."""
+        with self._lock:
+            self._endpoint(label).calls += 1
+
+    def record_hedge(self, label: str) -> None:
+        """Count a hedge request started because ``label`` was slow."""
+        with self._lock:
+            self._endpoint(label).hedged += 1
+
+    def record_race(self, winner: str, loser: str) -> None:
+        """Count a hedge race between two endpoints."""
+        with self._lock:
+            self._endpoint(winner).races += 1
+            self._endpoint(winner).wins += 1
+            self._endpoint(loser).races += 1
+
+    def record_fallback(self, label: str) -> None:
+        """Count a call that fell back away from ``label`` after an error."""
+        with self._lock:
+            self._endpoint(label).fallbacks += 1
+
+    def clear(self) -> None:
+        """Reset all counters."""
+        with self._lock:
+            self._endpoints.clear()
+
+    def get_stats(self) -> dict[str, dict[str, Any]]:
+        """Get per-endpoint statistics.
+
+        Returns:
+            Dictionary keyed by endpoint label with calls, hedged, hedge_rate
+            (hedged / calls), races, wins, win_rate (wins / races) and
+            fallbacks.
+        """
+        with self._lock:
+            endpoints = {label: _EndpointStats(**vars(stats)) for label, stats in self._endpoints.items()}
+        return {
+            label: {
+                "calls": stats.calls,
+                "hedged": stats.hedged,
+                "hedge_rate": stats.hedged / stats.calls if stats.calls else 0.0,
+                "races": stats.races,
+                "wins": stats.wins,
+                "win_rate": stats.wins / stats.races if stats.races else 0.0,
+                "fallbacks": stats.fallbacks,
+            }
+            for label, stats in endpoints.items()
+        }
+
+
+_stats = ModelHedgeStats()
+
+
+def get_model_hedge_stats() -> ModelHedgeStats:
+    """Get the process-wide hedging statistics shared by all workspaces."""
+    return _stats
+
+
+class ModelHedgingMiddleware(AgentMiddleware):
+    """Race a secondary model against a slow primary and fall back on errors.
+
+    Runs innermost (after PromptCacheMiddleware), so a hedge or fallback only
+    repeats the provider request, not the request preparation of other
+    middleware.
+    """
+
+    def __init__(
+        self,
+        primary_label: str,
+        secondary: BaseChatModel,
+        secondary_label: str,
+        hedge_after_ms: int | None = None,
+        fallback_on_error: bool = True,
+        stats: ModelHedgeStats | None = None,
+        primary: BaseChatModel | None = None,
+    ) -> None:
+        """Initialize the middleware.
+
+        Args:
+            primary_label: Identifies the agent's own model in stats and logs,
+                in "provider:model" format.
+            secondary: Model to hedge with and fall back to.
+            secondary_label: Identifies the secondary model in stats and logs.
+            hedge_after_ms: Start the secondary request when the primary has
+                streamed nothing after this long. None disables hedging.
+            fallback_on_error: Retry on the secondary when the primary fails
+                with a provider error.
+            stats: Counters to record into (default: process-wide stats).
+            primary: The agent's own model. When set, calls made with another
+                model (e.g. a budget downgrade) pass through unhedged.
+        """
+        super().__init__()
+        self._primary_label = primary_label
+        self._secondary = secondary
+        self._secondary_label = secondary_label
+        self._hedge_after = hedge_after_ms / 1000 if hedge_after_ms is not None else None
+        self._fallback_on_error = fallback_on_error
+        self._stats = stats or _stats
+        self._primary = primary
+        self._restyle = cache_breakpoint_style(primary_label) != cache_breakpoint_style(secondary_label)
+
+    def _should_fall_back(self, error: BaseException) -> bool:
+        """Whether a failed primary request is worth retrying on the secondary."""
+        if not self._fallback_on_error or not isinstance(error, Exception):
+            return False
+        return error_status_code(error) not in _REQUEST_ERROR_STATUSES
+
+    def _secondary_request(self, request: Any) -> Any:
+        """Retarget the request at the secondary model.
+
+        Cache breakpoints laid out for the primary's provider are flattened
+        into a plain system prompt when the secondary uses another format.
+        """
+        overrides: dict[str, Any] = {"model": self._secondary}
+        if self._restyle and request.system_message is not None:
+            overrides["system_message"] = flatten_cached_system_message(request.system_message)
+        return request.override(**overrides)
+
+    def wrap_model_call(self, request: Any, handler: Callable[[Any], Any]) -> Any:
+        """Sync model call: fallback only, no hedging."""
+        if self._primary is not None and request.model is not self._primary:
+            return handler(request)
+        self._stats.record_call(self._primary_label)
+        try:
+            return handler(request)
+        except Exception as e:
+            if not self._should_fall_back(e):
+                raise
+            self._stats.record_fallback(self._primary_label)
+            logger.warning(f"{self._primary_label} failed ({e}), falling back to {self._secondary_label}")
+            return handler(self._secondary_request(request))
+
+    async def awrap_model_call(
+        self, request: Any, handler: Callable[[Any], Awaitable[Any]]
+    ) -> Any:
+        """Async model call with hedging and fallback."""
+        if self._primary is not None and request.model is not self._primary:
+            return await handler(request)
+        self._stats.record_call(self._primary_label)
+        primary = _Attempt(self._primary_label, handler, request)
+        attempts = [primary]
+        secondary_started = False
+
+        def start_secondary() -> None:
+            nonlocal secondary_started
+            secondary_started = True
+            attempts.append(_Attempt(self._secondary_label, handler, self._secondary_request(request)))
+
+        try:
+            while True:
+                hedge_after = None if secondary_started else self._hedge_after
+                signalled = await _first_signal(attempts, hedge_after)
+
+                if signalled is None:
+                    if hedge_after is None:
+                        # Without a deadline the wait only ends when an attempt signals
+                        raise RuntimeError("Model attempts stopped without signalling")
+                    self._stats.record_hedge(self._primary_label)
+                    logger.info(
+                        f"No output from {self._primary_label} after "
+                        f"{hedge_after * 1000:.0f}ms, hedging with {self._secondary_label}"
+                    )
+                    start_secondary()
+                    continue
+
+                if signalled.failed:
+                    attempts.remove(signalled)
+                    error = signalled.error
+                    if attempts:
+                        # The other request is still running and may succeed
+                        if signalled is primary:
+                            self._stats.record_fallback(self._primary_label)
+                        continue
+                    if signalled is primary and not secondary_started and self._should_fall_back(error):
+                        self._stats.record_fallback(self._primary_label)
+                        logger.warning(
+                            f"{self._primary_label} failed ({error}), falling back to {self._secondary_label}"
+                        )
+                        start_secondary()
+                        continue
+                    raise error
+
+                # First to stream (or finish) wins; the other request is closed
+                for other in attempts:
+                    if other is not signalled:
+                        other.cancel()
+                        self._stats.record_race(signalled.label, other.label)
+                        logger.info(f"Hedge race won by {signalled.label}")
+                attempts = [signalled]
+                try:
+                    return await signalled.task
+                except Exception as e:
+                    if signalled is not primary or secondary_started or not self._should_fall_back(e):
+                        raise
+                    self._stats.record_fallback(self._primary_label)
+                    logger.warning(
+                        f"{self._primary_label} failed ({e}), falling back to {self._secondary_label}"
+                    )
+                    attempts = []
+                    start_secondary()
+        finally:
+            for attempt in attempts:
+                attempt.cancel()
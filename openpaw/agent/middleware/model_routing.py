@@ -0,0 +1,139 @@
+"""Middleware that routes model calls to per-invocation-type models.
+
+The workspace's model_routing section maps invocation types to models. Agents
+for scheduled work and sub-agents are built on their routed model by the
+AgentFactory; this middleware covers the runs of the main agent, whose route
+is set by the caller (e.g. ``summarize`` for conversation summaries) or, for
+user messages, chosen by a cheap classifier at the first model call.
+
+Usage with create_agent:
+    from openpaw.agent.middleware.model_routing import ModelRoutingMiddleware
+
+    agent = create_agent(
+        model=model,
+        tools=tools,
+        middleware=[
+            ModelRoutingMiddleware(
+                model_label="anthropic:claude-sonnet-4-5",
+                routes={"simple": (small_model, "anthropic:claude-haiku-4-5")},
+                simple_max_chars=160,
+            )
+        ],
+    )
+"""
+
+import logging
+import re
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from langchain.agents.middleware.types import AgentMiddleware
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import HumanMessage
+
+from openpaw.agent.middleware.prompt_cache import cache_breakpoint_style, flatten_cached_system_message
+from openpaw.agent.run_context import get_run_context
+
+logger = logging.getLogger(__name__)
+
+# Routes of the main agent's runs; ``simple`` is chosen by the classifier
+USER_ROUTE = "user"
+SIMPLE_ROUTE = "simple"
+SUMMARIZE_ROUTE = "summarize"
+
+# Content that needs the configured model even in a short message
+_COMPLEX_FEATURES = re.compile(r"```|https?://|\b(?:def|class|import|select|function)\b", re.IGNORECASE)
+
+
+def is_simple_message(content: Any, max_chars: int) -> bool:
+    """Classify a user message as simple enough for a small model.
+
+    Simple messages are short plain text, at most two lines, without code,
+    links or attachments: greetings, acknowledgements and quick questions.
+
+    Args:
+        content: Message content (string or content blocks).
+        max_chars: Longest message that can count as simple.
+
+    Returns:
+        True when the message can be answered by the simple route's model.
+    """
+    if not isinstance(content, str):
+        return False  # Content blocks carry images or files
+    text = content.strip()
+    if not text or len(text) > max_chars or text.count("\n") > 1:
+        return False
+    return _COMPLEX_FEATURES.search(text) is None
+
+
+class ModelRoutingMiddleware(AgentMiddleware):
+    """Send model calls of a routed run to the route's model.
+
+    The route of a run is read from the run context. Runs without one are
+    user turns: when a simple route is configured, the latest user message is
+    classified at the first model call and the route is kept for the rest of
+    the run, so a tool loop stays on one model.
+
+    Runs before BudgetDowngradeMiddleware (over-budget work still moves to the
+    downgrade model) and ModelHedgingMiddleware (routed calls are not hedged).
+    """
+
+    def __init__(
+        self,
+        model_label: str,
+        routes: dict[str, tuple[BaseChatModel, str]],
+        simple_max_chars: int = 160,
+    ) -> None:
+        """Initialize the middleware.
+
+        Args:
+            model_label: The agent's own model in "provider:model" format.
+            routes: Route name (``user``, ``summarize``, ``simple``) to the
+                model and its "provider:model" label.
+            simple_max_chars: Longest user message the classifier may route
+                to the simple model.
+        """
+        super().__init__()
+        self._routes = routes
+        self._simple_max_chars = simple_max_chars
+        style = cache_breakpoint_style(model_label)
+        self._restyle = {name: cache_breakpoint_style(label) != style for name, (_, label) in routes.items()}
+
+    def _classify(self, messages: list[Any]) -> str:
+        """Route of a user turn, from its latest user message."""
+        if SIMPLE_ROUTE in self._routes:
+            for message in reversed(messages):
+                if isinstance(message, HumanMessage):
+                    if is_simple_message(message.content, self._simple_max_chars):
+                        return SIMPLE_ROUTE
+                    break
+        return USER_ROUTE
+
+    def _route(self, request: Any) -> Any:
+        """Retarget the request at the model of the run's route, if it has one."""
+        context = get_run_context()
+        if context is None:
+            return request
+        if context.model_route is None:
+            context.model_route = self._classify(request.messages)
+        route = self._routes.get(context.model_route)
+        if route is None:
+            return request
+        model, label = route
+        if context.routed_model != label:
+            logger.debug(f"Routing {context.model_route} run to {label}")
+            context.routed_model = label
+        overrides: dict[str, Any] = {"model": model}
+        if self._restyle[context.model_route] and request.system_message is not None:
+            overrides["system_message"] = flatten_cached_system_message(request.system_message)
+        return request.override(**overrides)
+
+    def wrap_model_call(self, request: Any, handler: Callable[[Any], Any]) -> Any:
+        """Sync model call on the route's model."""
+        return handler(self._route(request))
+
+    async def awrap_model_call(
+        self, request: Any, handler: Callable[[Any], Awaitable[Any]]
+    ) -> Any:
+        """Async model call on the route's model."""
+        return await handler(self._route(request))
@@ -0,0 +1,142 @@
+"""Middleware that lays out the system prompt for provider prompt caching.
+
+Anthropic and Bedrock cache the request prefix (tools, then system prompt,
+then messages) up to an explicit breakpoint. The agent graph is compiled with
+the stable part of the system prompt only; this middleware appends the
+volatile per-turn context (current date/time, heartbeat, workspace listing)
+after a cache breakpoint on every model call, so the prefix stays
+byte-identical between turns.
+
+Usage with create_agent:
+    from openpaw.agent.middleware.prompt_cache import PromptCacheMiddleware
+
+    agent = create_agent(
+        model=model,
+        tools=tools,
+        system_prompt=workspace.build_stable_prompt(),
+        middleware=[PromptCacheMiddleware("anthropic:claude-sonnet-4-5", volatile_fn)],
+    )
+"""
+
+import logging
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from langchain.agents.middleware.types import AgentMiddleware
+from langchain_core.messages import SystemMessage
+
+logger = logging.getLogger(__name__)
+
+# Anthropic marks the end of a cached prefix on a content block
+ANTHROPIC_CACHE_CONTROL = {"type": "ephemeral"}
+
+# Bedrock Converse marks the end of a cached prefix with a standalone block
+BEDROCK_CACHE_POINT = {"cachePoint": {"type": "default"}}
+
+# Bedrock model families that accept cachePoint blocks
+_BEDROCK_CACHEABLE_MODELS = ("anthropic.", "amazon.nova")
+
+
+def cache_breakpoint_style(model_id: str) -> str | None:
+    """Determine which cache breakpoint format a model accepts.
+
+    Args:
+        model_id: Model identifier in "provider:model" format.
+
+    Returns:
+        "anthropic", "bedrock", or None when the provider has no explicit
+        breakpoints (OpenAI and xAI cache prefixes automatically).
+    """
+    if ":" not in model_id:
+        return None
+    provider, model_name = model_id.split(":", 1)
+    if provider == "anthropic":
+        return "anthropic"
+    if provider in ("bedrock_converse", "bedrock"):
+        # Inference profiles prefix the model id with a region (us., eu., global.)
+        if any(family in model_name.lower() for family in _BEDROCK_CACHEABLE_MODELS):
+            return "bedrock"
+    return None
+
+
+def build_cached_system_message(stable: str, volatile: str, style: str | None) -> SystemMessage:
+    """Build a system message with a cache breakpoint between stable and volatile parts.
+
+    Args:
+        stable: Prompt prefix that only changes on agent rebuild.
+        volatile: Per-turn suffix (may be empty).
+        style: Breakpoint format from cache_breakpoint_style().
+
+    Returns:
+        SystemMessage whose content is a list of blocks for caching providers,
+        or a plain string otherwise.
+    """
+    if style is None:
+        return SystemMessage(content="\n\n".join(part for part in (stable, volatile) if part))
+
+    blocks: list[Any] = []
+    if style == "anthropic":
+        blocks.append({"type": "text", "text": stable, "cache_control": ANTHROPIC_CACHE_CONTROL})
+    else:
+        blocks.append({"type": "text", "text": stable})
+        blocks.append(dict(BEDROCK_CACHE_POINT))
+    if volatile:
+        blocks.append({"type": "text", "text": volatile})
+    return SystemMessage(content=blocks)
+
+
+def flatten_cached_system_message(message: SystemMessage) -> SystemMessage:
+    """Join the text blocks of a cached system message into a plain prompt.
+
+    Used when a request laid out for one provider's breakpoints is sent to a
+    model that uses another format. Plain string messages are returned as is.
+    """
+    if not isinstance(message.content, list):
+        return message
+    text = "\n\n".join(
+        block["text"] for block in message.content if isinstance(block, dict) and block.get("text")
+    )
+    return SystemMessage(content=text)
+
+
+class PromptCacheMiddleware(AgentMiddleware):
+    """Append the volatile prompt suffix after a provider cache breakpoint.
+
+    The stable prefix is taken from the system message the graph was compiled
+    with. The volatile suffix is rebuilt on every model call so the date/time
+    and workspace listing are always current, even for long-lived graphs.
+    """
+
+    def __init__(self, model_id: str, volatile_context: Callable[[], str]) -> None:
+        """Initialize the middleware.
+
+        Args:
+            model_id: Model identifier, used to select the breakpoint format.
+            volatile_context: Callable returning the per-turn prompt suffix.
+        """
+        super().__init__()
+        self._style = cache_breakpoint_style(model_id)
+        self._volatile_context = volatile_context
+
+    def _prepare(self, request: Any) -> Any:
+        """Return the request with the cache-friendly system message applied."""
+        system_message = request.system_message
+        stable = system_message.text if system_message is not None else ""
+        try:
+            volatile = self._volatile_context()
+        except Exception as e:
+            logger.warning(f"Failed to build volatile prompt context: {e}")
+            volatile = ""
+        return request.override(
+            system_message=build_cached_system_message(stable, volatile, self._style)
+        )
+
+    def wrap_model_call(self, request: Any, handler: Callable[[Any], Any]) -> Any:
+        """Apply the cached system prompt layout before a sync model call."""
+        return handler(self._prepare(request))
+
+    async def awrap_model_call(
+        self, request: Any, handler: Callable[[Any], Awaitable[Any]]
+    ) -> Any:
+        """Apply the cached system prompt layout before an async model call."""
+        return await handler(self._prepare(request))
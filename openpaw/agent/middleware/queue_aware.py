@@ -7,6 +7,7 @@ from typing import Any
 from langchain.agents.middleware import wrap_tool_call
 from langchain_core.messages import ToolMessage
 
+from openpaw.agent.run_context import get_run_context
 from openpaw.core.prompts.system_events import STEER_SKIP_MESSAGE
 from openpaw.runtime.queue.lane import QueueMode
 from openpaw.runtime.queue.manager import QueueManager
@@ -32,55 +33,20 @@ class QueueAwareToolMiddleware:
     In interrupt mode: raises InterruptSignal to abort the run.
     In collect mode: no-op (tools execute normally).
 
-    Designed to be instantiated once and stored on AgentRunner. Per-invocation
-    state is managed via set_queue_awareness() and reset().
+    Designed to be instantiated once and shared by every run of the agent graph.
+    The session and queue mode come from the active RunContext, and steer
+    results are recorded on it, so concurrent sessions never see each other's
+    state.
     """
 
-    def __init__(self) -> None:
-        self._queue_manager: QueueManager | None = None
-        self._session_key: str | None = None
-        self._queue_mode: QueueMode = QueueMode.COLLECT
-        self._pending_steer_message: list[Any] | None = None
-        self._steered: bool = False  # Track if steer occurred this invocation
-
-    def set_queue_awareness(
-        self,
-        queue_manager: QueueManager,
-        session_key: str,
-        queue_mode: QueueMode,
-    ) -> None:
-        """Configure queue awareness for current invocation.
-
-        Called before each agent run to set the session context.
+    def __init__(self, queue_manager: QueueManager | None = None) -> None:
+        """Initialize the middleware.
 
         Args:
-            queue_manager: The queue manager instance.
-            session_key: Session identifier for this invocation.
-            queue_mode: Current queue mode for this invocation.
+            queue_manager: Workspace queue manager to check for pending messages.
+                Without one the middleware is a pass-through.
         """
         self._queue_manager = queue_manager
-        self._session_key = session_key
-        self._queue_mode = queue_mode
-        self._pending_steer_message = None
-        self._steered = False
-
-    def reset(self) -> None:
-        """Reset per-invocation state. Called after each agent run."""
-        self._queue_manager = None
-        self._session_key = None
-        self._queue_mode = QueueMode.COLLECT
-        self._pending_steer_message = None
-        self._steered = False
-
-    @property
-    def pending_steer_message(self) -> list[Any] | None:
-        """Get pending messages that caused a steer, if any."""
-        return self._pending_steer_message
-
-    @property
-    def was_steered(self) -> bool:
-        """Whether a steer occurred during the current invocation."""
-        return self._steered
 
     def get_middleware(self) -> Any:
         """Return the wrap_tool_call compatible middleware function.
@@ -113,25 +79,30 @@ class QueueAwareToolMiddleware:
             InterruptSignalError: When interrupt mode detects pending messages.
         """
         tool_name = request.tool_call.get("name", "unknown")
-        logger.debug(
-            f"Middleware intercepting tool '{tool_name}' "
-            f"(mode={self._queue_mode.value}, session={self._session_key})"
-        )
+        context = get_run_context()
+        queue_manager = self._queue_manager
 
-        # In collect mode or if no queue awareness set, just execute normally
+        # In collect mode or outside a session-bound run, just execute normally
         if (
-            self._queue_mode == QueueMode.COLLECT
-            or self._queue_manager is None
-            or self._session_key is None
+            context is None
+            or context.queue_mode == QueueMode.COLLECT
+            or queue_manager is None
+            or context.session_key is None
         ):
-            logger.debug(f"Middleware pass-through: mode={self._queue_mode.value}")
+            logger.debug(f"Middleware pass-through for tool '{tool_name}'")
             return await handler(request)
 
+        session_key = context.session_key
+        logger.debug(
+            f"Middleware intercepting tool '{tool_name}' "
+            f"(mode={context.queue_mode.value}, session={session_key})"
+        )
+
         # Once steered, skip ALL remaining tool calls for the entire invocation.
         # Without this, the ReAct loop re-enters after the LLM sees the skip
         # message, peek_pending() returns False (messages already consumed),
         # and subsequent tools execute normally — defeating the steer.
-        if self._steered:
+        if context.steered:
             logger.debug(f"Steer already active: skipping tool {tool_name}")
             return ToolMessage(
                 content=STEER_SKIP_MESSAGE,
@@ -139,20 +110,20 @@ class QueueAwareToolMiddleware:
             )
 
         # Check for pending messages
-        has_pending = await self._queue_manager.peek_pending(self._session_key)
-        logger.debug(f"Middleware peek_pending={has_pending} for session={self._session_key}")
+        has_pending = await queue_manager.peek_pending(session_key)
+        logger.debug(f"Middleware peek_pending={has_pending} for session={session_key}")
 
         if not has_pending:
             # No pending messages, execute normally
             return await handler(request)
 
-        if self._queue_mode == QueueMode.STEER:
+        if context.queue_mode == QueueMode.STEER:
             # Steer: skip tool, store pending messages for post-run consumption
             # Only consume messages once (on first tool skip)
-            if not self._steered:
-                pending = await self._queue_manager.consume_pending(self._session_key)
-                self._pending_steer_message = pending
-                self._steered = True
+            if not context.steered:
+                pending = await queue_manager.consume_pending(session_key)
+                context.steer_messages = pending
+                context.steered = True
                 logger.info(
                     f"Steer triggered: skipping tool {request.tool_call.get('name')} "
                     f"due to {len(pending)} pending message(s)"
@@ -164,9 +135,9 @@ class QueueAwareToolMiddleware:
                 tool_call_id=request.tool_call["id"],
             )
 
-        if self._queue_mode == QueueMode.INTERRUPT:
+        if context.queue_mode == QueueMode.INTERRUPT:
             # Interrupt: consume messages and raise signal
-            pending = await self._queue_manager.consume_pending(self._session_key)
+            pending = await queue_manager.consume_pending(session_key)
             logger.info(
                 f"Interrupt triggered: aborting tool {request.tool_call.get('name')} "
                 f"due to {len(pending)} pending message(s)"
@@ -0,0 +1,151 @@
+"""Middleware that paces model calls through the shared provider rate limiter.
+
+Workspaces sharing a provider account would otherwise exceed its requests
+and tokens per minute together and run into bursts of 429 errors. Each model
+call first waits for room in the provider's budgets; a call rejected with a
+rate limit error pauses the provider for its retry-after delay and is retried
+instead of failing the run. Time spent waiting is recorded on the RunContext.
+
+Usage with create_agent:
+    from openpaw.agent.middleware.rate_limit import ProviderRateLimitMiddleware
+
+    agent = create_agent(
+        model=model,
+        tools=tools,
+        middleware=[ProviderRateLimitMiddleware("anthropic", rate_limit_config, model)],
+    )
+"""
+
+import logging
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from langchain.agents.middleware.types import AgentMiddleware
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.messages.utils import count_tokens_approximately
+from langchain_core.runnables import RunnableConfig
+
+from openpaw.agent.rate_limiter import (
+    ProviderRateLimiter,
+    get_provider_rate_limiter,
+    is_rate_limit_error,
+    retry_after_seconds,
+)
+from openpaw.agent.run_context import get_run_context
+from openpaw.core.config.models import ProviderRateLimitConfig
+
+logger = logging.getLogger(__name__)
+
+# Backoff after a rate limit error without retry-after headers
+BACKOFF_BASE_SECONDS = 2.0
+BACKOFF_MAX_SECONDS = 60.0
+
+
+class ProviderRateLimitMiddleware(AgentMiddleware):
+    """Wait for provider budget before each model call and retry rate limit errors.
+
+    Only calls made with ``model`` are limited, so the agent's own model and
+    a hedging secondary each get a middleware for their own provider. Runs
+    innermost, so hedged and fallback requests are paced as well.
+    """
+
+    def __init__(
+        self,
+        key: str,
+        config: ProviderRateLimitConfig,
+        model: Any,
+        limiter: ProviderRateLimiter | None = None,
+    ) -> None:
+        """Initialize the middleware.
+
+        Args:
+            key: Provider catalog name the budgets are shared under.
+            config: Requests and tokens per minute of the provider.
+            model: Chat model instance whose calls are limited.
+            limiter: Limiter to use (default: the process-wide limiter).
+        """
+        super().__init__()
+        self._key = key
+        self._model = model
+        self._limiter = limiter or get_provider_rate_limiter()
+        self._limiter.configure(key, config)
+
+    @property
+    def name(self) -> str:
+        """Unique per limited model, since create_agent rejects duplicate middleware names."""
+        return f"{type(self).__name__}[{self._key}:{id(self._model):x}]"
+
+    @staticmethod
+    def _estimate_tokens(request: Any) -> int:
+        """Approximate input tokens of the request."""
+        messages = list(request.messages)
+        if request.system_message is not None:
+            messages.insert(0, request.system_message)
+        return count_tokens_approximately(messages)
+
+    @staticmethod
+    def _used_tokens(response: Any) -> int | None:
+        """Tokens the provider reported for the call, if any."""
+        messages = getattr(response, "result", None) or [response]
+        for message in messages:
+            usage = getattr(message, "usage_metadata", None)
+            if isinstance(message, AIMessage) and isinstance(usage, dict):
+                return int(usage.get("input_tokens", 0)) + int(usage.get("output_tokens", 0))
+        return None
+
+    def limits(self, model: Any) -> bool:
+        """Whether calls made with ``model`` are paced by this middleware."""
+        return model is self._model
+
+    def wrap_model_call(self, request: Any, handler: Callable[[Any], Any]) -> Any:
+        """Sync model calls are not limited."""
+        return handler(request)
+
+    async def awrap_model_call(
+        self, request: Any, handler: Callable[[Any], Awaitable[Any]]
+    ) -> Any:
+        """Pace the model call and retry it after rate limit errors."""
+        if not self.limits(request.model):
+            return await handler(request)
+        return await self._paced(self._estimate_tokens(request), lambda: handler(request))
+
+    async def ainvoke(self, messages: list[BaseMessage], config: RunnableConfig | None = None) -> BaseMessage:
+        """Invoke the limited model outside the agent, paced like the agent's calls.
+
+        Used for model calls that bypass the middleware chain, such as the
+        background thread summaries of AgentRunner.summarize_thread().
+        """
+        response: BaseMessage = await self._paced(
+            count_tokens_approximately(messages), lambda: self._model.ainvoke(messages, config=config)
+        )
+        return response
+
+    async def _paced(self, estimate: int, call: Callable[[], Awaitable[Any]]) -> Any:
+        """Run ``call`` once the provider has budget, retrying rate limit errors."""
+        context = get_run_context()
+        attempt = 0
+        while True:
+            waited = await self._limiter.acquire(self._key, estimate)
+            if context is not None:
+                context.rate_limit_wait_ms += waited * 1000
+            if waited >= 1:
+                logger.info(f"Waited {waited:.1f}s for {self._key} rate limit budget")
+            try:
+                response = await call()
+            except Exception as e:
+                if not is_rate_limit_error(e) or attempt >= self._limiter.max_retries(self._key):
+                    raise
+                delay = retry_after_seconds(e)
+                if delay is None:
+                    delay = min(BACKOFF_BASE_SECONDS * 2**attempt, BACKOFF_MAX_SECONDS)
+                self._limiter.pause(self._key, delay)
+                attempt += 1
+                logger.warning(
+                    f"Rate limited by {self._key}, retrying in {delay:.1f}s "
+                    f"(attempt {attempt}): {e}"
+                )
+                continue
+            used = self._used_tokens(response)
+            if used is not None:
+                self._limiter.settle(self._key, estimate, used)
+            return response
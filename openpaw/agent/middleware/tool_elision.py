@@ -0,0 +1,156 @@
+"""Middleware that replaces stale tool outputs in the model request with stubs.
+
+File reads, grep results, browser snapshots and shell output stay verbatim in
+the thread and would be re-sent on every later model call. This middleware
+swaps tool results from older turns for a one-line stub naming the tool, its
+arguments, the original size and how to get the output again. Results of the
+latest turn are never touched, and the checkpointed thread keeps the full
+output.
+
+Usage with create_agent:
+    from openpaw.agent.middleware.tool_elision import ToolOutputElisionMiddleware
+
+    agent = create_agent(
+        model=model,
+        tools=tools,
+        middleware=[ToolOutputElisionMiddleware(max_age_turns=4, max_chars=4000)],
+    )
+"""
+
+import json
+import logging
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from langchain.agents.middleware.types import AgentMiddleware
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, ToolMessage
+from langchain_core.messages.utils import count_tokens_approximately
+
+from openpaw.agent.run_context import get_run_context
+
+logger = logging.getLogger(__name__)
+
+# Results this short are kept even when stale; a stub would not be much smaller
+MIN_ELIDE_CHARS = 500
+
+# Longest rendering of the tool arguments inside a stub
+MAX_STUB_ARGS_CHARS = 200
+
+# Argument names that point at a file the output can be re-read from
+_PATH_ARGS = ("file_path", "path")
+
+
+def _format_args(args: dict[str, Any]) -> str:
+    """Render tool call arguments compactly for a stub."""
+    rendered = json.dumps(args, ensure_ascii=False, default=str)
+    if len(rendered) > MAX_STUB_ARGS_CHARS:
+        rendered = rendered[: MAX_STUB_ARGS_CHARS - 3] + "..."
+    return rendered
+
+
+def _refetch_hint(args: dict[str, Any]) -> str:
+    """Tell the model how to get an elided output back."""
+    for name in _PATH_ARGS:
+        path = args.get(name)
+        if isinstance(path, str) and path:
+            return f"read_file('{path}') to see the content again"
+    return "call the tool again with the same arguments if you need it"
+
+
+def build_elision_stub(tool_name: str, args: dict[str, Any], size: int) -> str:
+    """Build the text that replaces an elided tool output.
+
+    Args:
+        tool_name: Name of the tool that produced the output.
+        args: Arguments of the tool call.
+        size: Length of the original output in characters.
+
+    Returns:
+        One-line stub with tool name, arguments, size and a re-fetch hint.
+    """
+    return (
+        f"[Output of {tool_name}({_format_args(args)}) elided from an earlier turn: "
+        f"{size:,} chars. Use {_refetch_hint(args)}.]"
+    )
+
+
+class ToolOutputElisionMiddleware(AgentMiddleware):
+    """Replace tool results from older turns with short stubs in model requests.
+
+    A tool result is elided once its turn is ``max_age_turns`` turns old, or
+    as soon as a newer turn has started when it is longer than ``max_chars``.
+    Results shorter than MIN_ELIDE_CHARS are always kept. Tokens saved are
+    recorded on the RunContext for metrics and the running context tally.
+    """
+
+    def __init__(self, max_age_turns: int, max_chars: int) -> None:
+        """Initialize the middleware.
+
+        Args:
+            max_age_turns: Turns after which any sizeable tool result is elided.
+            max_chars: Size above which a tool result is elided once it is no
+                longer in the latest turn.
+        """
+        super().__init__()
+        self._max_age_turns = max_age_turns
+        self._max_chars = max_chars
+
+    def elide(self, messages: list[BaseMessage]) -> tuple[list[BaseMessage], int]:
+        """Return ``messages`` with stale tool outputs replaced by stubs.
+
+        Args:
+            messages: Conversation messages, oldest first.
+
+        Returns:
+            The rewritten message list (original message objects are not
+            modified) and the approximate number of tokens saved.
+        """
+        turns_after = sum(1 for message in messages if isinstance(message, HumanMessage))
+        calls: dict[str, tuple[str, dict[str, Any]]] = {}
+        result: list[BaseMessage] = []
+        saved = 0
+
+        for message in messages:
+            if isinstance(message, HumanMessage):
+                # Turns that start after this one; 0 for the latest turn
+                turns_after -= 1
+            elif isinstance(message, AIMessage):
+                for call in message.tool_calls:
+                    calls[call.get("id") or ""] = (call.get("name", "tool"), call.get("args") or {})
+            elif isinstance(message, ToolMessage) and turns_after > 0:
+                content = message.content if isinstance(message.content, str) else str(message.content)
+                size = len(content)
+                stale = turns_after >= self._max_age_turns or size > self._max_chars
+                if stale and size >= MIN_ELIDE_CHARS:
+                    tool_name, args = calls.get(message.tool_call_id, (message.name or "tool", {}))
+                    stub = message.model_copy(
+                        update={"content": build_elision_stub(tool_name, args, size)}
+                    )
+                    saved += count_tokens_approximately([message]) - count_tokens_approximately([stub])
+                    result.append(stub)
+                    continue
+            result.append(message)
+
+        return result, max(saved, 0)
+
+    def _prepare(self, request: Any) -> Any:
+        """Return the request with stale tool outputs elided."""
+        messages, saved = self.elide(list(request.messages))
+        context = get_run_context()
+        if context is not None:
+            context.elided_tokens_dropped = saved
+            context.elided_tokens_saved += saved
+        if not saved:
+            return request
+        logger.debug(f"Elided stale tool outputs, ~{saved:,} tokens saved")
+        return request.override(messages=messages)
+
+    def wrap_model_call(self, request: Any, handler: Callable[[Any], Any]) -> Any:
+        """Elide stale tool outputs before a sync model call."""
+        return handler(self._prepare(request))
+
+    async def awrap_model_call(
+        self, request: Any, handler: Callable[[Any], Awaitable[Any]]
+    ) -> Any:
+        """Elide stale tool outputs before an async model call."""
+        return await handler(self._prepare(request))
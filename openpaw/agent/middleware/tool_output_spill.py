@@ -0,0 +1,149 @@
+"""Tool result size policy: spill oversized results to workspace files."""
+
+import asyncio
+import logging
+import re
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from langchain.agents.middleware import wrap_tool_call
+from langchain.agents.middleware.types import ToolCallRequest
+from langchain_core.messages import ToolMessage
+from langgraph.types import Command
+
+from openpaw.core.config.models import ToolOutputSpillConfig
+from openpaw.core.paths import TOOL_OUTPUTS_DIR
+
+logger = logging.getLogger(__name__)
+
+_UNSAFE_NAME_CHARS = re.compile(r"[^A-Za-z0-9_-]+")
+
+
+class ToolOutputSpillMiddleware:
+    """Middleware that writes oversized tool results to workspace/.tool_outputs/.
+
+    Results longer than max_chars are saved to a file, and the model receives
+    a head/tail preview plus the file path to page through with read_file.
+    Keeps large grep, shell, browser and search outputs out of the model
+    context and the checkpoint database.
+
+    Runs directly inside the timeout middleware (timeout → spill → queue → approval).
+    """
+
+    def __init__(self, config: ToolOutputSpillConfig, workspace_path: Path) -> None:
+        """Initialize with spill configuration.
+
+        Args:
+            config: ToolOutputSpillConfig with size threshold, preview sizes and exclusions.
+            workspace_path: Workspace root; spill files go under workspace/.tool_outputs/.
+        """
+        self._config = config
+        self._workspace_path = workspace_path
+        self._output_dir = workspace_path / TOOL_OUTPUTS_DIR
+
+    def get_middleware(self) -> Any:
+        """Return the @wrap_tool_call compatible middleware function.
+
+        Returns:
+            Middleware function decorated with @wrap_tool_call.
+        """
+        middleware_instance = self
+
+        @wrap_tool_call
+        async def tool_output_spill_wrapper(
+            request: ToolCallRequest, handler: Callable[[ToolCallRequest], Awaitable[ToolMessage | Command[Any]]]
+        ) -> ToolMessage | Command[Any]:
+            """Middleware that spills oversized tool results to a file."""
+            return await middleware_instance._execute_with_spill(request, handler)
+
+        return tool_output_spill_wrapper
+
+    async def _execute_with_spill(
+        self, request: ToolCallRequest, handler: Callable[[ToolCallRequest], Awaitable[ToolMessage | Command[Any]]]
+    ) -> ToolMessage | Command[Any]:
+        """Execute tool and replace an oversized result with a preview.
+
+        Args:
+            request: ToolCallRequest with tool_call (name, args, id).
+            handler: Async function to execute the tool.
+
+        Returns:
+            Tool result, or a ToolMessage with preview and spill file path.
+        """
+        result = await handler(request)
+
+        tool_name: str = request.tool_call.get("name", "unknown")
+        if tool_name in self._config.exclude:
+            return result
+        if not isinstance(result, ToolMessage) or not isinstance(result.content, str):
+            return result
+        if len(result.content) <= self._config.max_chars:
+            return result
+
+        try:
+            relative_path = await asyncio.to_thread(
+                self._write_spill_file, tool_name, result.tool_call_id, result.content
+            )
+        except OSError as e:
+            logger.warning(f"Failed to spill output of '{tool_name}': {e}")
+            return result
+
+        logger.info(
+            f"Spilled {len(result.content):,} chars from '{tool_name}' to {relative_path}"
+        )
+        return result.model_copy(
+            update={"content": self._build_preview(tool_name, result.content, relative_path)}
+        )
+
+    def _write_spill_file(self, tool_name: str, tool_call_id: str, content: str) -> str:
+        """Write content to a new spill file and prune old ones.
+
+        Args:
+            tool_name: Tool that produced the output.
+            tool_call_id: ID of the tool call, used to keep file names unique.
+            content: Full tool output.
+
+        Returns:
+            Spill file path relative to the workspace root.
+        """
+        self._output_dir.mkdir(parents=True, exist_ok=True)
+        timestamp = datetime.now(UTC).strftime("%Y%m%dT%H%M%S")
+        safe_tool = _UNSAFE_NAME_CHARS.sub("_", tool_name)
+        safe_id = _UNSAFE_NAME_CHARS.sub("_", tool_call_id or "")[-12:]
+        path = self._output_dir / f"{timestamp}_{safe_tool}_{safe_id}.txt"
+        path.write_text(content, encoding="utf-8")
+        self._prune()
+        return str(path.relative_to(self._workspace_path))
+
+    def _prune(self) -> None:
+        """Delete the oldest spill files beyond max_files."""
+        files = sorted(self._output_dir.glob("*.txt"), key=lambda p: (p.stat().st_mtime_ns, p.name))
+        for stale in files[: max(len(files) - self._config.max_files, 0)]:
+            stale.unlink(missing_ok=True)
+
+    def _build_preview(self, tool_name: str, content: str, relative_path: str) -> str:
+        """Build the head/tail preview returned to the model in place of the result.
+
+        Args:
+            tool_name: Tool that produced the output.
+            content: Full tool output.
+            relative_path: Spill file path relative to the workspace root.
+
+        Returns:
+            Preview text with the spill file path and paging instructions.
+        """
+        head = content[: self._config.head_chars]
+        tail = content[-self._config.tail_chars:] if self._config.tail_chars else ""
+        line_count = content.count("\n") + 1
+        parts = [
+            f"[Output of '{tool_name}' was {len(content):,} characters ({line_count:,} lines) "
+            f"and was saved to {relative_path}. Page through it with "
+            f"read_file('{relative_path}', offset=..., limit=...).]",
+        ]
+        if head:
+            parts.append(f"--- First {len(head):,} characters ---\n{head}")
+        if tail:
+            parts.append(f"--- Last {len(tail):,} characters ---\n{tail}")
+        return "\n\n".join(parts)
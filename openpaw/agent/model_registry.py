@@ -0,0 +1,242 @@
+"""Process-wide registry of chat model clients and their connection pools."""
+
+import hashlib
+import logging
+import threading
+from dataclasses import dataclass, field
+from typing import Any
+
+from langchain_core.language_models import BaseChatModel
+
+logger = logging.getLogger(__name__)
+
+# Seconds allowed for a warm-up request before giving up
+WARM_TIMEOUT_SECONDS = 5.0
+
+# Extra kwargs that select AWS credentials for Bedrock clients
+_AWS_CREDENTIAL_KWARGS = (
+    "credentials_profile_name",
+    "aws_access_key_id",
+    "aws_secret_access_key",
+    "aws_session_token",
+    "bedrock_api_key",
+)
+
+# Bedrock models register per-model event hooks on their client when these are set
+_BEDROCK_UNSHAREABLE_KWARGS = ("client", "bedrock_client", "default_headers")
+
+
+@dataclass
+class ClientPool:
+    """Chat models sharing one provider endpoint and set of credentials.
+
+    Attributes:
+        provider: LangChain provider name (e.g., "anthropic", "bedrock_converse").
+        region: AWS region, if any.
+        base_url: Custom endpoint, if any.
+        models: Model instances created in this pool, keyed by model parameters.
+        hits: Lookups served by an existing model instance.
+        misses: Lookups that constructed a new model instance.
+        warmed: Whether a warm-up request has opened a connection.
+        shared_clients: SDK clients reused by new models in the pool (Bedrock).
+    """
+
+    provider: str
+    region: str | None
+    base_url: str | None
+    models: dict[tuple[Any, ...], BaseChatModel] = field(default_factory=dict)
+    hits: int = 0
+    misses: int = 0
+    warmed: bool = False
+    shared_clients: dict[str, Any] = field(default_factory=dict)
+
+
+def _secret_hash(value: Any) -> str | None:
+    """Hash a credential so pool keys never hold the secret itself."""
+    if value is None:
+        return None
+    return hashlib.sha256(str(value).encode()).hexdigest()[:16]
+
+
+class ChatModelRegistry:
+    """Reuses chat model instances, and with them their SDK and HTTP clients.
+
+    ``create_chat_model()`` builds a new provider client on every agent build,
+    discarding the client's connection pool and TLS sessions. The registry
+    hands out one shared model instance per distinct configuration instead,
+    grouped into pools keyed by provider, credentials, region and base URL.
+    Models are safe to share: ``create_agent()`` binds tools onto a wrapper
+    and never mutates the model itself.
+
+    Bedrock models in the same pool additionally share their boto3 clients,
+    which are expensive to construct. OpenAI-compatible and Anthropic models
+    already share httpx transports per base URL inside their LangChain
+    integrations, so reusing the model instance is enough there.
+    """
+
+    def __init__(self) -> None:
+        self._pools: dict[tuple[Any, ...], ClientPool] = {}
+        self._lock = threading.Lock()
+
+    def get_or_create(
+        self,
+        model_str: str,
+        api_key: str | None,
+        temperature: float,
+        region: str | None = None,
+        extra_kwargs: dict[str, Any] | None = None,
+    ) -> BaseChatModel:
+        """Return a shared chat model for the configuration, creating it once.
+
+        Takes the same arguments as ``create_chat_model()``.
+        """
+        from openpaw.agent.runner import create_chat_model
+
+        extra_kwargs = dict(extra_kwargs or {})
+        provider = model_str.split(":", 1)[0] if ":" in model_str else "openai"
+        pool_key = self._pool_key(provider, api_key, region, extra_kwargs)
+        model_key = (model_str, temperature, repr(sorted(extra_kwargs.items())))
+
+        with self._lock:
+            pool = self._pools.get(pool_key)
+            if pool is None:
+                pool = ClientPool(
+                    provider=provider,
+                    region=region,
+                    base_url=extra_kwargs.get("base_url") or extra_kwargs.get("endpoint_url"),
+                )
+                self._pools[pool_key] = pool
+
+            model = pool.models.get(model_key)
+            if model is not None:
+                pool.hits += 1
+                return model
+
+            pool.misses += 1
+            share_bedrock_clients = provider in ("bedrock_converse", "bedrock") and not any(
+                key in extra_kwargs for key in _BEDROCK_UNSHAREABLE_KWARGS
+            )
+            create_kwargs = dict(extra_kwargs)
+            if share_bedrock_clients:
+                create_kwargs.update(pool.shared_clients)
+
+            model = create_chat_model(model_str, api_key, temperature, region, create_kwargs)
+            pool.models[model_key] = model
+
+            if share_bedrock_clients and not pool.shared_clients:
+                for attr in ("client", "bedrock_client"):
+                    client = getattr(model, attr, None)
+                    if client is not None:
+                        pool.shared_clients[attr] = client
+
+            logger.debug(
+                f"Registered chat model {model_str} in {provider} pool "
+                f"({len(pool.models)} model(s) in pool)"
+            )
+            return model
+
+    async def warm(self, model: BaseChatModel) -> bool:
+        """Open a connection to the model's endpoint ahead of the first request.
+
+        Sends a lightweight HEAD request through the model's async HTTP
+        client so the TCP and TLS handshakes are done before a user message
+        arrives. Failures are logged and otherwise ignored.
+
+        Args:
+            model: Model instance previously returned by ``get_or_create()``.
+
+        Returns:
+            True if a connection was opened.
+        """
+        # ChatOpenAI/ChatXAI expose the SDK client directly, ChatAnthropic lazily
+        sdk_client = getattr(model, "root_async_client", None)
+        if sdk_client is None:
+            try:
+                sdk_client = getattr(model, "_async_client", None)
+            except Exception as e:
+                logger.debug(f"Skipping warm-up, could not create client: {e}")
+                return False
+        http_client = getattr(sdk_client, "_client", None)
+        base_url = getattr(sdk_client, "base_url", None)
+        if http_client is None or base_url is None or not hasattr(http_client, "head"):
+            return False
+
+        try:
+            await http_client.head(str(base_url), timeout=WARM_TIMEOUT_SECONDS)
+        except Exception as e:
+            logger.debug(f"Warm-up request to {base_url} failed: {e}")
+            return False
+
+        with self._lock:
+            for pool in self._pools.values():
+                if any(candidate is model for candidate in pool.models.values()):
+                    pool.warmed = True
+        logger.info(f"Warmed connection to {base_url}")
+        return True
+
+    def clear(self) -> None:
+        """Forget all pools (subsequent lookups construct new models)."""
+        with self._lock:
+            self._pools.clear()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get registry statistics.
+
+        Returns:
+            Dictionary with pools, models, hits, misses, hit_rate, warmed
+            (number of warmed pools) and per-pool details.
+        """
+        with self._lock:
+            pools = list(self._pools.values())
+        hits = sum(pool.hits for pool in pools)
+        misses = sum(pool.misses for pool in pools)
+        lookups = hits + misses
+        return {
+            "pools": len(pools),
+            "models": sum(len(pool.models) for pool in pools),
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / lookups if lookups else 0.0,
+            "warmed": sum(1 for pool in pools if pool.warmed),
+            "by_pool": [
+                {
+                    "provider": pool.provider,
+                    "region": pool.region,
+                    "base_url": pool.base_url,
+                    "models": len(pool.models),
+                    "hits": pool.hits,
+                    "misses": pool.misses,
+                    "warmed": pool.warmed,
+                }
+                for pool in pools
+            ],
+        }
+
+    @staticmethod
+    def _pool_key(
+        provider: str,
+        api_key: str | None,
+        region: str | None,
+        extra_kwargs: dict[str, Any],
+    ) -> tuple[Any, ...]:
+        """Key identifying a provider endpoint and set of credentials."""
+        aws_credentials = tuple(
+            (name, _secret_hash(extra_kwargs.get(name)))
+            for name in _AWS_CREDENTIAL_KWARGS
+            if name in extra_kwargs
+        )
+        return (
+            provider,
+            _secret_hash(api_key),
+            region,
+            extra_kwargs.get("base_url") or extra_kwargs.get("endpoint_url"),
+            aws_credentials,
+        )
+
+
+_registry = ChatModelRegistry()
+
+
+def get_chat_model_registry() -> ChatModelRegistry:
+    """Get the process-wide chat model registry shared by all workspaces."""
+    return _registry
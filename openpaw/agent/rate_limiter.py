@@ -0,0 +1,228 @@
+"""Process-wide provider rate limiter shared by all workspaces."""
+
+import asyncio
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from typing import Any
+
+from openpaw.core.config.models import ProviderRateLimitConfig
+
+logger = logging.getLogger(__name__)
+
+# Shorter waits are lock and bookkeeping overhead, not waits for budget
+MIN_WAIT_SECONDS = 0.001
+
+# Error codes AWS uses for throttled Bedrock requests
+_THROTTLING_ERROR_CODES = ("ThrottlingException", "TooManyRequestsException")
+
+
+def error_status_code(error: BaseException) -> int | None:
+    """HTTP status of a provider SDK error, if it carries one."""
+    status = getattr(error, "status_code", None)
+    if isinstance(status, int):
+        return status
+    # botocore ClientError
+    response = getattr(error, "response", None)
+    if isinstance(response, dict):
+        status = response.get("ResponseMetadata", {}).get("HTTPStatusCode")
+        if isinstance(status, int):
+            return status
+    return None
+
+
+def is_rate_limit_error(error: BaseException) -> bool:
+    """Whether a provider error is a rate limit rejection (HTTP 429 or Bedrock throttling)."""
+    if error_status_code(error) == 429:
+        return True
+    response = getattr(error, "response", None)
+    if isinstance(response, dict):
+        return response.get("Error", {}).get("Code") in _THROTTLING_ERROR_CODES
+    return False
+
+
+def retry_after_seconds(error: BaseException) -> float | None:
+    """Delay requested by a rate limit error's retry-after headers, if any."""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if headers is None:
+        return None
+    retry_after_ms = headers.get("retry-after-ms")
+    if retry_after_ms:
+        try:
+            return max(float(retry_after_ms) / 1000, 0.0)
+        except ValueError:
+            pass
+    retry_after = headers.get("retry-after")
+    if not retry_after:
+        return None
+    try:
+        return max(float(retry_after), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max((parsedate_to_datetime(retry_after) - datetime.now(UTC)).total_seconds(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+class _TokenBucket:
+    """Token bucket refilled continuously at ``per_minute`` units per minute."""
+
+    def __init__(self, per_minute: int) -> None:
+        self.capacity = float(per_minute)
+        self.level = float(per_minute)
+        self._rate = per_minute / 60
+        self._updated = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        self.level = min(self.capacity, self.level + (now - self._updated) * self._rate)
+        self._updated = now
+
+    def delay(self, amount: float, now: float) -> float:
+        """Seconds until ``amount`` units are available."""
+        self._refill(now)
+        return max(amount - self.level, 0.0) / self._rate
+
+    def take(self, amount: float) -> None:
+        """Consume units; the level may go negative to record overuse."""
+        self.level -= amount
+
+
+@dataclass
+class _ProviderLimit:
+    """Buckets, shared pause and counters for one catalog provider."""
+
+    config: ProviderRateLimitConfig
+    requests: _TokenBucket | None
+    tokens: _TokenBucket | None
+    paused_until: float = 0.0
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    calls: int = 0
+    waits: int = 0
+    wait_ms: float = 0.0
+    throttled: int = 0
+
+
+class ProviderRateLimiter:
+    """Token-bucket budgets for requests and tokens per minute, per provider.
+
+    Several workspaces often share one provider account, so budgets live in
+    one process-wide limiter keyed by the provider's catalog name. Calls that
+    would exceed a budget wait in FIFO order instead of failing. A rate limit
+    error pauses the provider for every workspace until its retry-after delay
+    has passed.
+    """
+
+    def __init__(self) -> None:
+        self._limits: dict[str, _ProviderLimit] = {}
+        self._lock = threading.Lock()
+
+    def configure(self, key: str, config: ProviderRateLimitConfig) -> None:
+        """Set the budgets of a provider, keeping its state when unchanged."""
+        with self._lock:
+            current = self._limits.get(key)
+            if current is not None and current.config == config:
+                return
+            self._limits[key] = _ProviderLimit(
+                config=config,
+                requests=_TokenBucket(config.requests_per_minute) if config.requests_per_minute else None,
+                tokens=_TokenBucket(config.tokens_per_minute) if config.tokens_per_minute else None,
+            )
+
+    async def acquire(self, key: str, tokens: int) -> float:
+        """Wait until a request of about ``tokens`` tokens fits the provider's budgets.
+
+        Args:
+            key: Provider catalog name passed to configure().
+            tokens: Estimated tokens of the request. Requests larger than the
+                whole token budget wait for a full bucket.
+
+        Returns:
+            Seconds spent waiting (0.0 for unknown providers).
+        """
+        limit = self._limits.get(key)
+        if limit is None:
+            return 0.0
+        start = time.monotonic()
+        async with limit.lock:
+            while True:
+                now = time.monotonic()
+                amount = min(float(tokens), limit.tokens.capacity) if limit.tokens else 0.0
+                delay = max(
+                    limit.paused_until - now,
+                    limit.requests.delay(1, now) if limit.requests else 0.0,
+                    limit.tokens.delay(amount, now) if limit.tokens else 0.0,
+                )
+                if delay <= 0:
+                    break
+                await asyncio.sleep(delay)
+            if limit.requests:
+                limit.requests.take(1)
+            if limit.tokens:
+                limit.tokens.take(amount)
+        # Time queued behind other calls counts too; ignore bookkeeping overhead
+        waited = time.monotonic() - start
+        if waited < MIN_WAIT_SECONDS:
+            waited = 0.0
+        limit.calls += 1
+        if waited:
+            limit.waits += 1
+            limit.wait_ms += waited * 1000
+        return waited
+
+    def settle(self, key: str, estimated: int, actual: int) -> None:
+        """Correct the token budget once a call's real usage is known."""
+        limit = self._limits.get(key)
+        if limit is not None and limit.tokens is not None:
+            limit.tokens.take(actual - estimated)
+
+    def pause(self, key: str, seconds: float) -> None:
+        """Hold back all calls to a provider after a rate limit error."""
+        limit = self._limits.get(key)
+        if limit is None:
+            return
+        limit.throttled += 1
+        limit.paused_until = max(limit.paused_until, time.monotonic() + seconds)
+
+    def max_retries(self, key: str) -> int:
+        """Retries of rate-limited calls configured for a provider."""
+        limit = self._limits.get(key)
+        return limit.config.max_retries if limit is not None else 0
+
+    def clear(self) -> None:
+        """Forget all providers and their state."""
+        with self._lock:
+            self._limits.clear()
+
+    def get_stats(self) -> dict[str, dict[str, Any]]:
+        """Get per-provider statistics.
+
+        Returns:
+            Dictionary keyed by provider with calls, waits (calls that had to
+            wait), wait_ms (total), avg_wait_ms (over waiting calls) and
+            throttled (rate limit errors received).
+        """
+        with self._lock:
+            limits = dict(self._limits)
+        return {
+            key: {
+                "calls": limit.calls,
+                "waits": limit.waits,
+                "wait_ms": round(limit.wait_ms),
+                "avg_wait_ms": round(limit.wait_ms / limit.waits) if limit.waits else 0,
+                "throttled": limit.throttled,
+            }
+            for key, limit in limits.items()
+        }
+
+
+_limiter = ProviderRateLimiter()
+
+
+def get_provider_rate_limiter() -> ProviderRateLimiter:
+    """Get the process-wide provider rate limiter shared by all workspaces."""
+    return _limiter
@@ -0,0 +1,127 @@
+"""Per-invocation run context shared by AgentRunner, middleware and builtin tools."""
+
+import contextvars
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any
+
+from openpaw.agent.metrics import InvocationMetrics
+from openpaw.runtime.queue.lane import QueueMode
+
+_run_context_var: contextvars.ContextVar["RunContext | None"] = contextvars.ContextVar(
+    "_run_context", default=None
+)
+
+
+@dataclass
+class RunContext:
+    """State of a single AgentRunner.run() invocation.
+
+    One compiled agent graph serves every session of a workspace, so nothing
+    that differs between invocations may live on the runner, the middleware
+    or the tool instances. Callers fill in the inputs, pass the context to
+    ``AgentRunner.run()``, and read the outputs from the returned object
+    (also after ``ApprovalRequiredError`` or ``InterruptSignalError``).
+
+    The context is bound to a context variable for the duration of the run.
+    LangGraph copies context variables into the tasks that execute nodes and
+    tools, and all of them share this object, so middleware and tools record
+    their results by mutating its fields.
+
+    Attributes:
+        session_key: Session the invocation belongs to, if any.
+        thread_id: Conversation thread being checkpointed.
+        queue_mode: Queue mode used for steer/interrupt checks.
+        channel: Channel adapter used by send_message/send_file.
+        followup_depth: Position in a followup chain (0 = original invocation).
+        stream_callback: Optional async callback receiving the visible text of
+            the current model turn each time it grows. Setting it switches the
+            run to token streaming.
+        history_summary: Rolling summary of the conversation, prepended by
+            HistoryWindowMiddleware when earlier messages are left out.
+        history_summary_covers: Number of messages from the start of the
+            thread the history summary covers. The history window never
+            leaves out messages past them.
+        interrupt_watch: Optional coroutine function that returns once a
+            message arrives that should interrupt the run. Setting it makes
+            the run cancel the in-flight model stream immediately instead of
+            waiting for the next tool boundary.
+        model_route: Model route of the invocation (e.g. ``summarize``). Set
+            by the caller, or by ModelRoutingMiddleware when it classifies the
+            user's message at the first model call.
+        response: Final response text.
+        metrics: Token usage metrics (partial when the run did not complete).
+        tools_used: Tool names invoked, in call order.
+        current_tool_name: Tool executing when the run stopped, if any.
+        steered: Whether steer mode skipped tools in favour of new messages.
+        steer_messages: Messages consumed by the steer.
+        pending_followup: Followup requested via request_followup, if any.
+        first_token_ms: Milliseconds from run start to the first visible
+            streamed token, if streaming produced any text.
+        context_tokens: Context size of the thread after the run (input plus
+            output tokens of the final model call, plus the tokens the history
+            window left out of it), if the provider reported usage metadata.
+        window_tokens_saved: Approximate input tokens the history window kept
+            out of the model calls of this run.
+        window_tokens_dropped: Approximate tokens of the messages left out of
+            the latest model call.
+        elided_tokens_saved: Approximate input tokens tool output elision kept
+            out of the model calls of this run.
+        elided_tokens_dropped: Approximate tokens elided from the latest model
+            call.
+        interrupt_latency_ms: Milliseconds from the interrupting message being
+            detected to the in-flight stream being cancelled, if interrupt_watch
+            fired.
+        rate_limit_wait_ms: Milliseconds model calls of this run waited for
+            shared provider rate limit budget.
+        routed_model: Model the calls of this run were routed to, if
+            ModelRoutingMiddleware moved them off the agent's own model.
+    """
+
+    session_key: str | None = None
+    thread_id: str | None = None
+    queue_mode: QueueMode = QueueMode.COLLECT
+    channel: Any = None
+    followup_depth: int = 0
+    stream_callback: Callable[[str], Awaitable[None]] | None = None
+    history_summary: str | None = None
+    history_summary_covers: int = 0
+    interrupt_watch: Callable[[], Awaitable[None]] | None = None
+    model_route: str | None = None
+
+    response: str = ""
+    metrics: InvocationMetrics | None = None
+    tools_used: list[str] = field(default_factory=list)
+    current_tool_name: str | None = None
+    steered: bool = False
+    steer_messages: list[Any] | None = None
+    pending_followup: Any = None
+    first_token_ms: float | None = None
+    context_tokens: int | None = None
+    window_tokens_saved: int = 0
+    window_tokens_dropped: int = 0
+    elided_tokens_saved: int = 0
+    elided_tokens_dropped: int = 0
+    interrupt_latency_ms: float | None = None
+    rate_limit_wait_ms: float = 0.0
+    routed_model: str | None = None
+
+
+def get_run_context() -> RunContext | None:
+    """Get the context of the agent run executing in the current task.
+
+    Returns:
+        The active RunContext, or None outside of AgentRunner.run().
+    """
+    return _run_context_var.get()
+
+
+@contextmanager
+def bind_run_context(context: RunContext) -> Iterator[RunContext]:
+    """Make ``context`` the active run context until the block exits."""
+    token = _run_context_var.set(context)
+    try:
+        yield context
+    finally:
+        _run_context_var.reset(token)
@@ -1,26 +1,46 @@
 """Agent runner integrating LangGraph ReAct agent with OpenPaw workspace system."""
 
 import asyncio
+import hashlib
 import logging
 import re
 import time
+from collections.abc import Awaitable, Callable
 from typing import Any
 
 from langchain.agents import create_agent
 from langchain_core.callbacks import UsageMetadataCallbackHandler
 from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessageChunk, BaseMessage
 
+from openpaw.agent.graph_cache import AgentGraphCache, CompiledAgent
 from openpaw.agent.metrics import InvocationMetrics, extract_metrics_from_callback
 from openpaw.agent.middleware.approval import ApprovalRequiredError
-from openpaw.agent.middleware.llm_hooks import THINKING_TAG_PATTERN, ThinkingTokenMiddleware
+from openpaw.agent.middleware.budget_downgrade import BudgetDowngradeMiddleware
+from openpaw.agent.middleware.history_window import HistoryWindowMiddleware
+from openpaw.agent.middleware.llm_hooks import (
+    THINKING_TAG_PATTERN,
+    ThinkingStreamFilter,
+    ThinkingTokenMiddleware,
+)
+from openpaw.agent.middleware.model_hedging import ModelHedgingMiddleware
+from openpaw.agent.middleware.model_routing import SUMMARIZE_ROUTE, ModelRoutingMiddleware
+from openpaw.agent.middleware.prompt_cache import PromptCacheMiddleware
 from openpaw.agent.middleware.queue_aware import InterruptSignalError
+from openpaw.agent.middleware.rate_limit import ProviderRateLimitMiddleware
+from openpaw.agent.middleware.tool_elision import ToolOutputElisionMiddleware
+from openpaw.agent.model_registry import ChatModelRegistry
+from openpaw.agent.run_context import RunContext, bind_run_context
 from openpaw.agent.tools.filesystem import FilesystemTools
+from openpaw.core.config.models import ProviderRateLimitConfig
+from openpaw.core.config.providers import ResolvedProvider
 from openpaw.core.prompts.system_events import (
     TIMEOUT_NOTIFICATION_GENERIC,
     TIMEOUT_NOTIFICATION_TEMPLATE,
 )
 from openpaw.core.timezone import workspace_now
 from openpaw.core.workspace import AgentWorkspace
+from openpaw.runtime.queue.budget import budget_downgrade_active
 
 logger = logging.getLogger(__name__)
 
@@ -126,6 +146,53 @@ def create_chat_model(
     )
 
 
+class _TokenStream:
+    """Turns "messages" stream chunks into visible-text snapshots for a run.
+
+    Each model call within a run is one turn. Text is accumulated per turn
+    (the final turn is the response; earlier turns precede tool calls) and
+    passed to ``context.stream_callback`` whenever it grows.
+    """
+
+    def __init__(self, context: RunContext, strip_thinking: bool, start_time: float) -> None:
+        self._context = context
+        self._strip_thinking = strip_thinking
+        self._start_time = start_time
+        self._turn_id: str | None = None
+        self._text = ""
+        self._filter = ThinkingStreamFilter()
+
+    async def feed(self, chunk: Any, metadata: dict[str, Any]) -> None:
+        """Consume one (message chunk, metadata) item from the stream."""
+        if metadata.get("langgraph_node") != "model" or not isinstance(chunk, AIMessageChunk):
+            return
+
+        if chunk.id != self._turn_id:
+            self._turn_id = chunk.id
+            self._text = ""
+            self._filter = ThinkingStreamFilter()
+
+        delta = AgentRunner._extract_text_from_content(chunk.content)
+        if self._strip_thinking:
+            delta = self._filter.feed(delta)
+        if not delta:
+            return
+
+        self._text += delta
+        if not self._text.strip():
+            return
+        if self._context.first_token_ms is None:
+            self._context.first_token_ms = (time.monotonic() - self._start_time) * 1000
+
+        callback = self._context.stream_callback
+        if callback is None:
+            return
+        try:
+            await callback(self._text.lstrip())
+        except Exception as e:
+            logger.debug(f"Stream callback failed: {e}")
+
+
 class AgentRunner:
     """Runs LangGraph agent with OpenPaw workspace configuration.
 
@@ -190,6 +257,14 @@ class AgentRunner:
         extra_model_kwargs: dict[str, Any] | None = None,
         middleware: list[Any] | None = None,
         channel_logging_enabled: bool = False,
+        graph_cache: AgentGraphCache | None = None,
+        model_registry: ChatModelRegistry | None = None,
+        hedge_model: ResolvedProvider | None = None,
+        rate_limit_key: str | None = None,
+        rate_limit: ProviderRateLimitConfig | None = None,
+        downgrade_model: ResolvedProvider | None = None,
+        routed_models: dict[str, ResolvedProvider] | None = None,
+        route: str | None = None,
     ):
         """Initialize the agent runner.
 
@@ -209,6 +284,22 @@ class AgentRunner:
                 (e.g., base_url for OpenAI-compatible APIs).
             middleware: Optional list of middleware functions for tool execution
                 (e.g., queue-aware middleware for steer/interrupt modes).
+            graph_cache: Optional cache of compiled graphs, consulted only
+                when the runner has no checkpointer (stateless invocations).
+            model_registry: Optional registry to share chat model clients and
+                connection pools with other runners.
+            hedge_model: Resolved secondary model for hedged and fallback
+                requests; used when the workspace enables model_hedging.
+            rate_limit_key: Provider catalog name the model's rate limit is
+                shared under.
+            rate_limit: Provider budgets applied to the model's calls through
+                the process-wide rate limiter.
+            downgrade_model: Resolved cheaper model for work admitted over the
+                workspace token budget with the downgrade policy.
+            routed_models: Resolved models per model route (``user``,
+                ``summarize``, ``simple``) for the runs of this agent.
+            route: Model route the runner's own model was chosen for (e.g.
+                ``cron``), recorded in the metrics of its runs.
         """
         self.workspace = workspace
         self.model_id = model
@@ -224,11 +315,17 @@ class AgentRunner:
         self.extra_model_kwargs = extra_model_kwargs or {}
         self._middleware = middleware or []
         self.channel_logging_enabled = channel_logging_enabled
-
-        # Per-invocation tracking (populated after each run)
-        self._last_metrics: InvocationMetrics | None = None
-        self._last_tools_used: list[str] = []
-        self._current_tool_name: str | None = None
+        self._graph_cache = graph_cache
+        self._model_registry = model_registry
+        self.hedge_model = hedge_model
+        self.rate_limit_key = rate_limit_key
+        self.rate_limit = rate_limit
+        self.downgrade_model = downgrade_model
+        self.routed_models = routed_models or {}
+        self.route = route
+        self._route_models: dict[str, BaseChatModel] = {}
+        self._downgrade_instance: BaseChatModel | None = None
+        self._rate_limits: list[ProviderRateLimitMiddleware] = []
 
         # Auto-enable thinking stripping for known thinking models
         if not self.strip_thinking and any(
@@ -242,24 +339,6 @@ class AgentRunner:
 
         self._agent = self._build_agent()
 
-    @property
-    def last_metrics(self) -> InvocationMetrics | None:
-        """Get token usage metrics from the most recent invocation.
-
-        Returns:
-            InvocationMetrics from the last run() call, or None if no invocations yet.
-        """
-        return self._last_metrics
-
-    @property
-    def last_tools_used(self) -> list[str]:
-        """Get list of tool names invoked during the most recent run.
-
-        Returns:
-            List of tool name strings (may contain duplicates if called multiple times).
-        """
-        return self._last_tools_used
-
     @property
     def model_instance(self) -> BaseChatModel | None:
         """Get the current model instance for profile access.
@@ -322,6 +401,14 @@ class AgentRunner:
         self._agent = self._build_agent()
         logger.info(f"Rebuilt agent with fresh workspace files: {self.workspace.name}")
 
+    @property
+    def max_input_tokens(self) -> int:
+        """Model's maximum input context window (200000 when the profile lacks it)."""
+        max_input = 200000  # fallback
+        if self._model_instance and hasattr(self._model_instance, 'profile') and self._model_instance.profile:
+            max_input = self._model_instance.profile.get("max_input_tokens", 200000)
+        return max_input
+
     async def get_context_info(self, thread_id: str) -> dict[str, Any]:
         """Get context window utilization for a conversation thread.
 
@@ -353,9 +440,7 @@ class AgentRunner:
             messages, use_usage_metadata_scaling=True
         )
 
-        max_input = 200000  # fallback
-        if self._model_instance and hasattr(self._model_instance, 'profile') and self._model_instance.profile:
-            max_input = self._model_instance.profile.get("max_input_tokens", 200000)
+        max_input = self.max_input_tokens
 
         return {
             "max_input_tokens": max_input,
@@ -364,6 +449,80 @@ class AgentRunner:
             "message_count": len(messages),
         }
 
+    async def thread_messages(self, thread_id: str) -> list[BaseMessage]:
+        """Messages currently checkpointed for a thread, oldest first.
+
+        Args:
+            thread_id: Conversation thread to read.
+
+        Returns:
+            The thread's messages (empty without state).
+        """
+        config = {"configurable": {"thread_id": thread_id}}
+        state = await self._agent.aget_state(config)
+        return list(state.values.get("messages", [])) if state and state.values else []
+
+    async def summarize_thread(
+        self, thread_id: str, prompt: str, messages: list[BaseMessage] | None = None
+    ) -> RunContext:
+        """Summarize a conversation thread without writing to it.
+
+        Calls the chat model directly with the checkpointed messages followed
+        by ``prompt``, so the summary can be prepared in the background while
+        the thread stays untouched and available to user turns. The
+        summarize model route is used when one is configured, the downgrade
+        model while the budget downgrade flag is set. The call waits for the
+        provider rate limits like the agent's own model calls.
+
+        Args:
+            thread_id: The conversation thread to summarize.
+            prompt: Summarization instruction appended as a user message.
+            messages: Part of the thread to summarize, e.g. the turns a
+                history window leaves out (default: the whole thread).
+
+        Returns:
+            Run context with the summary as ``response`` and its token metrics.
+        """
+        from langchain_core.messages import AIMessage, HumanMessage
+
+        context = RunContext(thread_id=thread_id, model_route=SUMMARIZE_ROUTE)
+        if messages is None:
+            messages = await self.thread_messages(thread_id)
+        if not messages:
+            return context
+
+        # A trailing tool call without results (interrupted run) is rejected by providers
+        if isinstance(messages[-1], AIMessage) and messages[-1].tool_calls:
+            messages = messages[:-1]
+
+        model = self._route_models.get(SUMMARIZE_ROUTE)
+        if budget_downgrade_active() and self._downgrade_instance is not None and self.downgrade_model is not None:
+            model = self._downgrade_instance
+            context.routed_model = self.downgrade_model.model_str
+        elif model is not None:
+            context.routed_model = self.routed_models[SUMMARIZE_ROUTE].model_str
+        else:
+            model = self._model_instance
+
+        # Paced under the same provider budgets as the agent's own model calls
+        limiter = next((limit for limit in self._rate_limits if limit.limits(model)), None)
+        invoke = limiter.ainvoke if limiter is not None else model.ainvoke
+        usage_callback = UsageMetadataCallbackHandler()
+        start_time = time.monotonic()
+        with bind_run_context(context):
+            async with asyncio.timeout(self.timeout_seconds):
+                result = await invoke(
+                    [*messages, HumanMessage(content=prompt)],
+                    config={"callbacks": [usage_callback]},
+                )
+        context.metrics = self._collect_metrics(context, usage_callback, (time.monotonic() - start_time) * 1000)
+
+        summary = self._extract_text_from_content(result.content)
+        if self.strip_thinking:
+            summary = self._strip_thinking_tokens(summary)
+        context.response = summary.strip()
+        return context
+
     async def resolve_orphaned_tool_calls(
         self, thread_id: str, responses: dict[str, str] | None = None
     ) -> None:
@@ -443,6 +602,62 @@ class AgentRunner:
             config, {"messages": synthetic_messages}, as_node="tools"
         )
 
+    async def thread_message_ids(self, thread_id: str) -> set[str]:
+        """IDs of the messages currently checkpointed for a thread.
+
+        Taken before a run that may be rolled back with rollback_thread().
+
+        Args:
+            thread_id: Conversation thread to inspect.
+
+        Returns:
+            Message IDs in the thread (empty without a checkpointer or state).
+        """
+        if not self.checkpointer:
+            return set()
+
+        config = {"configurable": {"thread_id": thread_id}}
+        state = await self._agent.aget_state(config)
+        if not state or not state.values:
+            return set()
+        return {msg.id for msg in state.values.get("messages", []) if msg.id}
+
+    async def rollback_thread(self, thread_id: str, keep_ids: set[str]) -> int:
+        """Remove messages added to a thread since keep_ids was taken.
+
+        Used to discard a cancelled speculative run so its restart sees the
+        thread as it was before the run started.
+
+        Args:
+            thread_id: Conversation thread to roll back.
+            keep_ids: Message IDs from thread_message_ids() before the run.
+
+        Returns:
+            Number of messages removed.
+        """
+        if not self.checkpointer:
+            return 0
+
+        from langchain_core.messages import RemoveMessage
+
+        config = {"configurable": {"thread_id": thread_id}}
+        state = await self._agent.aget_state(config)
+        if not state or not state.values:
+            return 0
+
+        removals = [
+            RemoveMessage(id=msg.id)
+            for msg in state.values.get("messages", [])
+            if msg.id and msg.id not in keep_ids
+        ]
+        if not removals:
+            return 0
+
+        # as_node="model" leaves no pending node, like a run that ended with a reply
+        await self._agent.aupdate_state(config, {"messages": removals}, as_node="model")
+        logger.info(f"Rolled back {len(removals)} message(s) in thread {thread_id}")
+        return len(removals)
+
     def _validate_tool_names(self, tools: list[Any]) -> None:
         """Validate tool names comply with Bedrock requirements.
 
@@ -475,10 +690,18 @@ class AgentRunner:
                     f"Must match pattern: [a-zA-Z0-9_-]+"
                 )
 
-    def _create_model(self) -> BaseChatModel:
+    def _create_model(
+        self,
+        model_str: str | None = None,
+        api_key: str | None = None,
+        region: str | None = None,
+        extra_kwargs: dict[str, Any] | None = None,
+    ) -> BaseChatModel:
         """Create the appropriate chat model based on provider.
 
-        Delegates to create_chat_model() module-level function.
+        Delegates to create_chat_model() module-level function, or to the
+        model registry when one is configured so that clients are shared.
+        Without arguments the runner's own model is created.
 
         Returns:
             Configured BaseChatModel instance.
@@ -486,14 +709,91 @@ class AgentRunner:
         Raises:
             ValueError: If provider is not supported.
         """
+        if model_str is None:
+            model_str = self.model_id
+            api_key = self.api_key
+            region = self.region
+            extra_kwargs = self.extra_model_kwargs
+        if self._model_registry is not None:
+            return self._model_registry.get_or_create(
+                model_str=model_str,
+                api_key=api_key,
+                temperature=self.temperature,
+                region=region,
+                extra_kwargs=extra_kwargs,
+            )
         return create_chat_model(
-            model_str=self.model_id,
-            api_key=self.api_key,
+            model_str=model_str,
+            api_key=api_key,
             temperature=self.temperature,
-            region=self.region,
-            extra_kwargs=self.extra_model_kwargs,
+            region=region,
+            extra_kwargs=extra_kwargs,
         )
 
+    def _build_provider_middleware(self, model: BaseChatModel) -> list[Any]:
+        """Build routing, downgrade, hedging and rate limit middleware for the provider requests.
+
+        Model routing is added when routed models are configured, a budget
+        downgrade when a downgrade model is configured, hedging when the
+        workspace enables model_hedging, and a rate limit middleware for each
+        of these models whose catalog provider has budgets.
+        """
+        middleware: list[Any] = []
+        limited: list[tuple[BaseChatModel, str | None, ProviderRateLimitConfig | None]] = [
+            (model, self.rate_limit_key, self.rate_limit)
+        ]
+        self._route_models = {}
+        self._downgrade_instance = None
+        if self.routed_models:
+            routes: dict[str, tuple[BaseChatModel, str]] = {}
+            for name, routed in self.routed_models.items():
+                route_model = self._create_model(routed.model_str, routed.api_key, routed.region, routed.extra_kwargs)
+                self._route_models[name] = route_model
+                routes[name] = (route_model, routed.model_str)
+                limited.append((route_model, routed.catalog_name, routed.rate_limit))
+            routing_config = self._workspace_setting("model_routing")
+            middleware.append(
+                ModelRoutingMiddleware(
+                    self.model_id,
+                    routes,
+                    simple_max_chars=routing_config.simple_max_chars if routing_config is not None else 160,
+                )
+            )
+        if self.downgrade_model is not None:
+            cheap = self.downgrade_model
+            downgrade = self._create_model(cheap.model_str, cheap.api_key, cheap.region, cheap.extra_kwargs)
+            self._downgrade_instance = downgrade
+            middleware.append(BudgetDowngradeMiddleware(self.model_id, downgrade, cheap.model_str))
+            limited.append((downgrade, cheap.catalog_name, cheap.rate_limit))
+        hedging_config = self._workspace_setting("model_hedging")
+        if hedging_config is not None and hedging_config.enabled and self.hedge_model is not None:
+            hedge = self.hedge_model
+            secondary = self._create_model(hedge.model_str, hedge.api_key, hedge.region, hedge.extra_kwargs)
+            middleware.append(
+                ModelHedgingMiddleware(
+                    primary_label=self._endpoint_label(self.model_id, self.region),
+                    secondary=secondary,
+                    secondary_label=self._endpoint_label(hedge.model_str, hedge.region),
+                    hedge_after_ms=hedging_config.hedge_after_ms,
+                    fallback_on_error=hedging_config.fallback_on_error,
+                    primary=model,
+                )
+            )
+            limited.append((secondary, hedge.catalog_name, hedge.rate_limit))
+
+        self._rate_limits = [
+            ProviderRateLimitMiddleware(key, config, limited_model)
+            for limited_model, key, config in limited
+            if key is not None and config is not None
+        ]
+        middleware.extend(self._rate_limits)
+        return middleware
+
+    @staticmethod
+    def _endpoint_label(model_str: str, region: str | None) -> str:
+        """Label a model endpoint for hedging stats (model plus AWS region)."""
+        return f"{model_str}@{region}" if region else model_str
+
     def _build_agent(self) -> Any:
         """Build the LangGraph agent with workspace configuration.
 
@@ -504,12 +804,38 @@ class AgentRunner:
         - System prompt from workspace markdown files
         - Empty middleware list (populated in future sprints for steer/interrupt)
         - Thinking token stripping handled via fallback logic in run()
+
+        Without a checkpointer and with a graph cache configured, a previously
+        compiled graph with identical inputs is reused instead of rebuilt.
         """
-        # 1. Initialize model directly via provider class
+        # 1. Get the stable system prompt from workspace. Per-turn context
+        # (current date, heartbeat, workspace listing) is appended by
+        # PromptCacheMiddleware after the provider cache breakpoint.
+        # The workspace timezone feeds the graph cache key, the per-turn
+        # prompt context and the filesystem tools; resolve it once for all
+        timezone = "UTC"
+        if self.workspace.config:
+            timezone = getattr(self.workspace.config, "timezone", "UTC") or "UTC"
+        system_prompt = self.workspace.build_stable_prompt(
+            enabled_builtins=self.enabled_builtins,
+            channel_logging_enabled=self.channel_logging_enabled,
+        )
+
+        # Stateless runners reuse a compiled graph when every input matches
+        cache_key = None
+        if self._graph_cache is not None and self.checkpointer is None:
+            cache_key = self._graph_cache_key(system_prompt, timezone)
+            cached = self._graph_cache.get(cache_key)
+            if cached is not None:
+                self._model_instance = cached.model
+                return cached.graph
+        build_start = time.monotonic()
+
+        # 2. Initialize model directly via provider class
         model = self._create_model()
         self._model_instance = model
 
-        # 2. Create FilesystemTools for workspace
+        # 3. Create FilesystemTools for workspace
         workspace_root = self.workspace.path.resolve()
         if not workspace_root.exists():
             raise ValueError(f"Workspace does not exist: {workspace_root}")
@@ -518,9 +844,6 @@ class AgentRunner:
 
         logger.debug(f"Sandboxing agent to workspace: {workspace_root}")
 
-        # Get timezone from workspace config, defaulting to UTC
-        timezone = self.workspace.config.timezone if self.workspace.config else "UTC"
-
         fs_tools_manager = FilesystemTools(
             workspace_root=workspace_root,
             timezone=timezone,
@@ -528,33 +851,53 @@ class AgentRunner:
         )
         filesystem_tools = fs_tools_manager.get_tools()
 
-        # 3. Combine all tools (filesystem + additional tools)
+        # 4. Combine all tools (filesystem + additional tools)
         all_tools = filesystem_tools + self.additional_tools
 
-        # 4. Validate tool names (especially important for Bedrock)
+        # 5. Validate tool names (especially important for Bedrock)
         if "bedrock" in self.model_id.lower():
             logger.debug("Validating tool names for Bedrock compatibility")
             self._validate_tool_names(all_tools)
 
-        # 5. Get system prompt from workspace (with dynamic current date)
-        try:
-            timezone = getattr(self.workspace.config, "timezone", "UTC") if self.workspace.config else "UTC"
-            current_dt = workspace_now(timezone).strftime("%A, %Y-%m-%d %H:%M %Z")
-        except (TypeError, AttributeError):
-            current_dt = None
-        system_prompt = self.workspace.build_system_prompt(
-            enabled_builtins=self.enabled_builtins,
-            current_datetime=current_dt,
-            channel_logging_enabled=self.channel_logging_enabled,
-        )
-
         # 6. Wire middleware in dependency order:
         #    - ThinkingTokenMiddleware (first): strips reasoning before other middleware sees it
         #    - Custom middleware (after): queue-aware, approval gates, etc.
+        #    - ToolOutputElisionMiddleware: stubs stale tool outputs in the request
+        #    - HistoryWindowMiddleware: trims the messages sent to the model
+        #    - PromptCacheMiddleware: lays out the system prompt for caching
+        #    - ModelRoutingMiddleware: per-route models (summaries, simple messages)
+        #    - BudgetDowngradeMiddleware: cheaper model for over-budget work
+        #    - ModelHedgingMiddleware: races/falls back to a secondary model
+        #    - ProviderRateLimitMiddleware (last): paces each provider request
         if self.strip_thinking:
             middleware = [ThinkingTokenMiddleware(), *self._middleware]
         else:
             middleware = list(self._middleware)
+        elision_config = self._workspace_setting("tool_output_elision")
+        if elision_config is not None and elision_config.enabled:
+            middleware.append(
+                ToolOutputElisionMiddleware(
+                    max_age_turns=elision_config.max_age_turns,
+                    max_chars=elision_config.max_chars,
+                )
+            )
+        window_config = self._workspace_setting("history_window")
+        if window_config is not None and window_config.enabled:
+            middleware.append(
+                HistoryWindowMiddleware(
+                    max_tokens=window_config.max_tokens,
+                    max_turns=window_config.max_turns,
+                    summary=window_config.summary,
+                )
+            )
+        workspace = self.workspace
+        middleware.append(
+            PromptCacheMiddleware(
+                self.model_id,
+                lambda: workspace.build_volatile_context(self._current_datetime(timezone)),
+            )
+        )
+        middleware.extend(self._build_provider_middleware(model))
 
         # 7. Call create_agent (successor to create_react_agent)
         # Note: create_agent handles tool binding internally - do NOT pre-bind
@@ -575,29 +918,86 @@ class AgentRunner:
             middleware=middleware,  # Thinking tokens + steer/interrupt + approval gates
         )
 
+        if cache_key is not None and self._graph_cache is not None:
+            build_ms = (time.monotonic() - build_start) * 1000
+            self._graph_cache.put(cache_key, CompiledAgent(graph=agent, model=model), build_ms)
+            logger.debug(f"Compiled stateless agent graph in {build_ms:.0f}ms")
+
         return agent
 
+    def _workspace_setting(self, name: str) -> Any:
+        """A section of the workspace config (e.g. history_window), if configured."""
+        if not self.workspace.config:
+            return None
+        return getattr(self.workspace.config, name, None)
+
+    @staticmethod
+    def _current_datetime(timezone: str) -> str | None:
+        """Format the current time in the workspace timezone for the prompt."""
+        try:
+            return workspace_now(timezone).strftime("%A, %Y-%m-%d %H:%M %Z")
+        except (TypeError, AttributeError):
+            return None
+
+    def _graph_cache_key(self, system_prompt: str, timezone: str) -> tuple[Any, ...]:
+        """Build the graph cache key for the runner's current configuration.
+
+        Tools and middleware are keyed by identity: the factory hands the same
+        instances to every stateless runner, and a filtered tool list (as used
+        by sub-agents) yields a different key.
+        """
+        api_key_hash = hashlib.sha256(self.api_key.encode()).hexdigest() if self.api_key else None
+        return (
+            self.model_id,
+            self.temperature,
+            self.region,
+            api_key_hash,
+            repr(sorted(self.extra_model_kwargs.items())),
+            self.strip_thinking,
+            str(self.workspace.path.resolve()),
+            str(timezone),
+            tuple(id(tool) for tool in self.additional_tools),
+            tuple(id(mw) for mw in self._middleware),
+            repr(self._workspace_setting("tool_output_elision")),
+            repr(self._workspace_setting("history_window")),
+            repr(self._workspace_setting("model_hedging")),
+            self.hedge_model.display_str if self.hedge_model else None,
+            self.downgrade_model.display_str if self.downgrade_model else None,
+            tuple(sorted((name, routed.display_str) for name, routed in self.routed_models.items())),
+            repr(self._workspace_setting("model_routing")),
+            self.route,
+            self.rate_limit_key,
+            repr(self.rate_limit),
+            hashlib.sha256(system_prompt.encode()).hexdigest(),
+        )
+
     async def run(
         self,
         message: str,
         session_id: str | None = None,
         thread_id: str | None = None,
-    ) -> str:
+        context: RunContext | None = None,
+    ) -> RunContext:
         """Run the agent with a user message.
 
         Args:
             message: User input message.
             session_id: Session identifier for checkpointing.
             thread_id: Thread identifier for multi-turn conversations.
+            context: Per-invocation context carrying session inputs for middleware
+                and tools. A fresh context is created when omitted.
 
         Returns:
-            Agent's response text. Thinking tokens are stripped by ThinkingTokenMiddleware
-            in the agent graph. Fallback stripping handles edge cases.
+            The run context with the response text, metrics and tools used.
+            Thinking tokens are stripped by ThinkingTokenMiddleware in the agent
+            graph. Fallback stripping handles edge cases. When ApprovalRequiredError
+            or InterruptSignalError propagates, the caller's context still holds
+            the partial metrics.
         """
-        # Reset per-invocation tracking
-        self._last_metrics = None
-        self._last_tools_used = []
-        self._current_tool_name = None
+        if context is None:
+            context = RunContext()
+        if thread_id and context.thread_id is None:
+            context.thread_id = thread_id
 
         # Set recursion_limit for multi-turn execution (2 supersteps per turn)
         config: dict[str, Any] = {"recursion_limit": self.max_turns * 2}
@@ -617,43 +1017,30 @@ class AgentRunner:
         start_time = time.monotonic()
 
         try:
-            # Use astream with stream_mode="updates" for behavioral parity with ainvoke
-            # Collect all messages from the stream
-            final_messages = []
-            async with asyncio.timeout(self.timeout_seconds):
-                async for update in self._agent.astream(
-                    {"messages": [{"role": "user", "content": message}]},
-                    config=config,
-                    stream_mode="updates",
-                ):
-                    # Updates come as: {"model": {"messages": [...]}} from create_agent v2
-                    if "model" in update:
-                        messages_in_update = update["model"].get("messages", [])
-                        final_messages.extend(messages_in_update)
-                        # Capture tool names from AI messages with tool_calls
-                        for msg in messages_in_update:
-                            tool_calls = getattr(msg, "tool_calls", [])
-                            if tool_calls:
-                                tool_names = [tc.get("name", "?") for tc in tool_calls]
-                                logger.info(f"[{self.workspace.name}] Tool calls: {tool_names}")
-                                # Track last tool called for timeout reporting
-                                self._current_tool_name = tool_calls[-1].get("name")
-                            for tc in tool_calls:
-                                if name := tc.get("name"):
-                                    self._last_tools_used.append(name)
-                    # Clear current tool tracking when we see tool results
-                    if "tools" in update:
-                        self._current_tool_name = None
-        except InterruptSignalError:
-            # Re-raise for WorkspaceRunner to handle
+            # Use astream with stream_mode="updates" for behavioral parity with ainvoke.
+            # Streaming runs additionally subscribe to "messages" for token chunks.
+            final_messages: list[Any] = []
+            agent_input = {"messages": [{"role": "user", "content": message}]}
+            with bind_run_context(context):
+                async with asyncio.timeout(self.timeout_seconds):
+                    stream = self._consume_stream(
+                        agent_input, config, context, final_messages, start_time
+                    )
+                    if context.interrupt_watch is None:
+                        await stream
+                    else:
+                        await self._consume_interruptible(stream, context.interrupt_watch, context)
+        except (InterruptSignalError, ApprovalRequiredError):
+            # Record partial metrics, then re-raise for MessageProcessor to handle
+            duration_ms = (time.monotonic() - start_time) * 1000
+            context.metrics = self._collect_metrics(context, usage_callback, duration_ms)
+            context.metrics.is_partial = True
             raise
         except TimeoutError:
             # Extract partial metrics even on timeout
             duration_ms = (time.monotonic() - start_time) * 1000
-            self._last_metrics = extract_metrics_from_callback(
-                usage_callback, duration_ms, self.model_id
-            )
-            self._last_metrics.is_partial = True
+            context.metrics = self._collect_metrics(context, usage_callback, duration_ms)
+            context.metrics.is_partial = True
 
             logger.warning(
                 f"Agent timed out after {self.timeout_seconds}s "
@@ -661,29 +1048,27 @@ class AgentRunner:
             )
 
             # Use rich notification if we know what tool was executing
-            if self._current_tool_name:
-                return TIMEOUT_NOTIFICATION_TEMPLATE.format(
+            if context.current_tool_name:
+                context.response = TIMEOUT_NOTIFICATION_TEMPLATE.format(
                     timeout=int(self.timeout_seconds),
-                    tool_name=self._current_tool_name,
+                    tool_name=context.current_tool_name,
                 )
             else:
-                return TIMEOUT_NOTIFICATION_GENERIC.format(
+                context.response = TIMEOUT_NOTIFICATION_GENERIC.format(
                     timeout=int(self.timeout_seconds),
                 )
-        except ApprovalRequiredError:
-            raise
-        except Exception:
-            raise
+            return context
 
         # Extract metrics after successful invocation
         duration_ms = (time.monotonic() - start_time) * 1000
-        self._last_metrics = extract_metrics_from_callback(
-            usage_callback, duration_ms, self.model_id
-        )
+        context.metrics = self._collect_metrics(context, usage_callback, duration_ms)
 
         # Extract response from final messages
         if final_messages:
             last_message = final_messages[-1]
+            context.context_tokens = self._context_tokens(last_message)
+            if context.context_tokens is not None:
+                context.context_tokens += context.window_tokens_dropped + context.elided_tokens_dropped
             if hasattr(last_message, "content"):
                 raw_response = self._extract_text_from_content(last_message.content)
             else:
@@ -695,10 +1080,126 @@ class AgentRunner:
                     f"Fallback thinking stripping triggered "
                     f"(workspace: {self.workspace.name}, model: {self.model_id})"
                 )
-                return self._strip_thinking_tokens(raw_response)
-            return raw_response
+                raw_response = self._strip_thinking_tokens(raw_response)
+            context.response = raw_response
 
-        return ""
+        return context
+
+    async def _consume_stream(
+        self,
+        agent_input: dict[str, Any],
+        config: dict[str, Any],
+        context: RunContext,
+        final_messages: list[Any],
+        start_time: float,
+    ) -> None:
+        """Drive the agent graph's astream, collecting updates and streamed tokens."""
+        if context.stream_callback is None:
+            async for update in self._agent.astream(
+                agent_input, config=config, stream_mode="updates"
+            ):
+                self._record_update(update, final_messages, context)
+        else:
+            token_stream = _TokenStream(context, self.strip_thinking, start_time)
+            async for mode, chunk in self._agent.astream(
+                agent_input, config=config, stream_mode=["updates", "messages"]
+            ):
+                if mode == "messages":
+                    await token_stream.feed(*chunk)
+                else:
+                    self._record_update(chunk, final_messages, context)
+
+    async def _consume_interruptible(
+        self,
+        stream: Awaitable[None],
+        watch: Callable[[], Awaitable[None]],
+        context: RunContext,
+    ) -> None:
+        """Run the stream until it finishes or ``watch`` returns.
+
+        When an interrupting message arrives first, the stream task is
+        cancelled, which closes the in-flight model request instead of letting
+        the generation run to completion. Checkpoints are only written between
+        graph steps, so the thread keeps its last completed step.
+
+        Raises:
+            InterruptSignalError: With no pending messages attached; the caller
+                consumes them from its queue.
+        """
+        stream_task = asyncio.ensure_future(stream)
+        watch_task = asyncio.ensure_future(watch())
+        try:
+            done, _ = await asyncio.wait(
+                {stream_task, watch_task}, return_when=asyncio.FIRST_COMPLETED
+            )
+            if stream_task in done:
+                # Also re-raises middleware signals such as ApprovalRequiredError
+                stream_task.result()
+                return
+
+            detected_at = time.monotonic()
+            stream_task.cancel()
+            await asyncio.gather(stream_task, return_exceptions=True)
+            context.interrupt_latency_ms = (time.monotonic() - detected_at) * 1000
+            logger.info(
+                f"[{self.workspace.name}] Interrupted in-flight run after "
+                f"{context.interrupt_latency_ms:.0f}ms"
+            )
+            raise InterruptSignalError([])
+        finally:
+            for task in (stream_task, watch_task):
+                if not task.done():
+                    task.cancel()
+            await asyncio.gather(stream_task, watch_task, return_exceptions=True)
+
+    def _collect_metrics(
+        self, context: RunContext, usage_callback: Any, duration_ms: float
+    ) -> InvocationMetrics:
+        """Build the run's metrics from the usage callback and the run context."""
+        metrics = extract_metrics_from_callback(usage_callback, duration_ms, context.routed_model or self.model_id)
+        metrics.route = (context.model_route or "") if context.routed_model else (self.route or "")
+        metrics.time_to_first_token_ms = context.first_token_ms
+        metrics.interrupt_latency_ms = context.interrupt_latency_ms
+        metrics.window_tokens_saved = context.window_tokens_saved
+        metrics.elided_tokens_saved = context.elided_tokens_saved
+        metrics.rate_limit_wait_ms = context.rate_limit_wait_ms
+        return metrics
+
+    @staticmethod
+    def _context_tokens(message: Any) -> int | None:
+        """Context size after a model call, from the message's usage metadata.
+
+        The final model call saw the whole thread as input, so its input plus
+        output tokens is the size of the thread once the reply is appended.
+        """
+        usage = getattr(message, "usage_metadata", None)
+        if not isinstance(usage, dict):
+            return None
+        tokens = usage.get("input_tokens", 0) + usage.get("output_tokens", 0)
+        return tokens or None
+
+    def _record_update(
+        self, update: dict[str, Any], final_messages: list[Any], context: RunContext
+    ) -> None:
+        """Collect messages and tool usage from one "updates" stream item."""
+        # Updates come as: {"model": {"messages": [...]}} from create_agent v2
+        if "model" in update:
+            messages_in_update = update["model"].get("messages", [])
+            final_messages.extend(messages_in_update)
+            # Capture tool names from AI messages with tool_calls
+            for msg in messages_in_update:
+                tool_calls = getattr(msg, "tool_calls", [])
+                if tool_calls:
+                    tool_names = [tc.get("name", "?") for tc in tool_calls]
+                    logger.info(f"[{self.workspace.name}] Tool calls: {tool_names}")
+                    # Track last tool called for timeout reporting
+                    context.current_tool_name = tool_calls[-1].get("name")
+                for tc in tool_calls:
+                    if name := tc.get("name"):
+                        context.tools_used.append(name)
+        # Clear current tool tracking when we see tool results
+        if "tools" in update:
+            context.current_tool_name = None
 
     def run_sync(
         self,
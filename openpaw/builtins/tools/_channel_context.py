@@ -1,4 +1,8 @@
-"""Shared channel context for builtin tools that need to send messages/files."""
+"""Shared channel context for builtin tools that need to send messages/files.
+
+Inside an agent run the channel and session come from the active RunContext.
+The context variables below cover code that sends outside of a run.
+"""
 
 import contextvars
 import logging
@@ -43,6 +47,11 @@ def get_channel_context() -> tuple[Any, str | None]:
     Returns:
         Tuple of (channel, session_key). Both may be None if context not set.
     """
+    from openpaw.agent.run_context import get_run_context
+
+    run_context = get_run_context()
+    if run_context is not None and run_context.channel is not None:
+        return run_context.channel, run_context.session_key
     return _channel_var.get(), _session_key_var.get()
 
 
@@ -52,6 +61,11 @@ def get_current_session_key() -> str | None:
     Returns:
         Session key string (e.g., 'telegram:123456') or None if context not set.
     """
+    from openpaw.agent.run_context import get_run_context
+
+    run_context = get_run_context()
+    if run_context is not None and run_context.session_key is not None:
+        return run_context.session_key
     return _session_key_var.get()
 
 
@@ -1,6 +1,5 @@
 """Agent self-continuation tool for multi-step autonomous workflows."""
 
-import contextvars
 import logging
 from dataclasses import dataclass
 from typing import Any
@@ -8,6 +7,7 @@ from typing import Any
 from langchain_core.tools import StructuredTool
 from pydantic import BaseModel, Field
 
+from openpaw.agent.run_context import get_run_context
 from openpaw.builtins.base import (
     BaseBuiltinTool,
     BuiltinMetadata,
@@ -26,15 +26,6 @@ class FollowupRequest:
     delay_seconds: int
 
 
-# Per-session context variables for thread-safe state isolation
-_pending_followup: contextvars.ContextVar[FollowupRequest | None] = contextvars.ContextVar(
-    '_pending_followup', default=None
-)
-_current_depth: contextvars.ContextVar[int] = contextvars.ContextVar(
-    '_current_depth', default=0
-)
-
-
 class RequestFollowupInput(BaseModel):
     """Input schema for request_followup tool."""
 
@@ -57,9 +48,10 @@ class RequestFollowupInput(BaseModel):
 class FollowupTool(BaseBuiltinTool):
     """Enables agents to request self-continuation after responding.
 
-    After the agent sends its response, WorkspaceRunner checks for pending
-    followup. If set, it re-invokes the agent with the followup prompt,
-    preserving session/thread for conversation continuity.
+    The request is stored on the active RunContext. After the agent sends its
+    response, MessageProcessor checks the context for a pending followup. If
+    set, it re-invokes the agent with the followup prompt, preserving
+    session/thread for conversation continuity.
 
     This enables multi-step autonomous workflows where the agent can
     chain actions without requiring user intervention.
@@ -78,27 +70,6 @@ class FollowupTool(BaseBuiltinTool):
         super().__init__(config)
         self._max_chain_depth = self.config.get("max_chain_depth", 5)
 
-    def get_pending_followup(self) -> FollowupRequest | None:
-        """Get and clear the pending followup request.
-
-        Called by WorkspaceRunner after each agent invocation.
-
-        Returns:
-            FollowupRequest if one was set, None otherwise.
-        """
-        followup = _pending_followup.get()
-        _pending_followup.set(None)
-        return followup
-
-    def set_chain_depth(self, depth: int) -> None:
-        """Set current followup chain depth (0 = original invocation)."""
-        _current_depth.set(depth)
-
-    def reset(self) -> None:
-        """Reset tool state between sessions."""
-        _pending_followup.set(None)
-        _current_depth.set(0)
-
     def get_langchain_tool(self) -> Any:
         """Return the request_followup LangChain tool."""
         tool_instance = self
@@ -122,9 +93,11 @@ class FollowupTool(BaseBuiltinTool):
             Returns:
                 Confirmation message.
             """
-            current_depth = _current_depth.get()
-            pending = _pending_followup.get()
+            context = get_run_context()
+            if context is None:
+                return "Error: request_followup is only available during an agent run."
 
+            current_depth = context.followup_depth
             if current_depth >= tool_instance._max_chain_depth:
                 return (
                     f"Error: Maximum followup chain depth reached "
@@ -132,17 +105,16 @@ class FollowupTool(BaseBuiltinTool):
                     f"Use schedule_at for delayed actions instead."
                 )
 
-            if pending is not None:
+            if context.pending_followup is not None:
                 return (
                     "Error: A followup is already pending for this invocation. "
                     "Only one followup per response is allowed."
                 )
 
-            followup_request = FollowupRequest(
+            context.pending_followup = FollowupRequest(
                 prompt=prompt,
                 delay_seconds=delay_seconds,
             )
-            _pending_followup.set(followup_request)
 
             logger.info(
                 f"Followup requested (depth={current_depth}, "
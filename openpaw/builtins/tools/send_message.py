@@ -42,8 +42,9 @@ class SendMessageTool(BaseBuiltinTool):
         - "Found 50 files to process, working on batch 1..."
         - "Database backup complete, now running migrations..."
 
-    The tool requires session context to be set by WorkspaceRunner before use.
-    Without context (e.g., in cron/heartbeat), it returns a clean error.
+    Messages go to the channel and session of the active RunContext (or a
+    context set via set_session_context()). Without one (e.g., in
+    cron/heartbeat), it returns a clean error.
     """
 
     metadata = BuiltinMetadata(
@@ -21,6 +21,13 @@ class ChannelAdapter(ABC):
 
     name: str = "base"
 
+    # Maximum characters per platform message; longer content is split
+    MAX_MESSAGE_LENGTH: int = 4096
+
+    # Progressive response streaming (set by the channel factory from config)
+    streaming_enabled: bool = False
+    stream_edit_interval: float = 1.0
+
     @abstractmethod
     async def start(self) -> None:
         """Start the channel adapter (connect, authenticate, etc.)."""
@@ -45,6 +52,86 @@ class ChannelAdapter(ABC):
         """
         ...
 
+    @property
+    def supports_message_edits(self) -> bool:
+        """Whether the adapter implements edit_message() and delete_message()."""
+        return type(self).edit_message is not ChannelAdapter.edit_message
+
+    async def edit_message(
+        self, session_key: str, message_id: str, content: str, final: bool = False
+    ) -> None:
+        """Replace the content of a previously sent message.
+
+        Override in implementations that support message edits. Used for
+        streaming responses, where a sent message grows as tokens arrive.
+
+        Args:
+            session_key: Session the message was sent to.
+            message_id: Platform message ID returned by send_message().
+            content: New message content (within MAX_MESSAGE_LENGTH).
+            final: True for the last edit of a stream. Intermediate edits may
+                skip rich formatting since partial markdown is often unbalanced.
+
+        Raises:
+            NotImplementedError: If the channel doesn't support message edits.
+        """
+        raise NotImplementedError(
+            f"Channel '{type(self).__name__}' does not support message edits"
+        )
+
+    async def delete_message(self, session_key: str, message_id: str) -> None:
+        """Delete a previously sent message.
+
+        Args:
+            session_key: Session the message was sent to.
+            message_id: Platform message ID returned by send_message().
+
+        Raises:
+            NotImplementedError: If the channel doesn't support message deletion.
+        """
+        raise NotImplementedError(
+            f"Channel '{type(self).__name__}' does not support message deletion"
+        )
+
+    def _split_message(self, text: str) -> list[str]:
+        """Split text into chunks that fit the platform's message limit.
+
+        Tries to break at paragraph boundaries (double newline), falls back
+        to single newlines, then hard-splits as a last resort.
+
+        Args:
+            text: The full message text.
+
+        Returns:
+            List of message chunks, each within MAX_MESSAGE_LENGTH.
+        """
+        if len(text) <= self.MAX_MESSAGE_LENGTH:
+            return [text]
+
+        chunks: list[str] = []
+        remaining = text
+
+        while remaining:
+            if len(remaining) <= self.MAX_MESSAGE_LENGTH:
+                chunks.append(remaining)
+                break
+
+            # Prefer paragraph boundary
+            split_at = remaining.rfind("\n\n", 0, self.MAX_MESSAGE_LENGTH)
+
+            # Fall back to single newline
+            if split_at == -1:
+                split_at = remaining.rfind("\n", 0, self.MAX_MESSAGE_LENGTH)
+
+            # Hard split as last resort
+            if split_at == -1:
+                split_at = self.MAX_MESSAGE_LENGTH
+
+            chunks.append(remaining[:split_at])
+            remaining = remaining[split_at:].lstrip("\n")
+
+        return chunks
+
     @abstractmethod
     def on_message(self, callback: Any) -> None:
         """Register a callback for incoming messages.
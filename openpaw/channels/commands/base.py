@@ -51,6 +51,8 @@ class CommandContext:
     subagent_store: Any = None  # SubAgentStore, for /status subagent info
     agent_factory: Any = None  # AgentFactory, for /model command
     channels: dict | None = None  # dict[str, ChannelAdapter], for /status channel info
+    message_processor: Any = None  # MessageProcessor, for /status auto-compact stats
+    checkpoint_retention: Any = None  # CheckpointRetention, for /status conversations.db stats
 
 
 @dataclass
@@ -3,6 +3,8 @@
 import logging
 from typing import TYPE_CHECKING
 
+from openpaw.agent.middleware.model_routing import SUMMARIZE_ROUTE
+from openpaw.agent.run_context import RunContext
 from openpaw.channels.commands.base import CommandDefinition, CommandHandler, CommandResult
 from openpaw.core.prompts.commands import COMPACTED_TEMPLATE, SUMMARIZE_PROMPT
 
@@ -56,12 +58,12 @@ class CompactCommand(CommandHandler):
         # Step 1: Generate summary using the agent
         summary = None
         try:
-            summary = await context.agent_runner.run(
+            summary_run = await context.agent_runner.run(
                 message=SUMMARIZE_PROMPT,
                 thread_id=old_thread_id,
+                context=RunContext(model_route=SUMMARIZE_ROUTE),
             )
-            if summary:
-                summary = summary.strip()
+            summary = summary_run.response.strip() or None
             logger.info(f"Generated summary for {old_conv_id}: {len(summary or '')} chars")
         except Exception as e:
             logger.warning(f"Failed to generate summary for {old_conv_id}: {e}")
@@ -3,6 +3,9 @@
 from typing import TYPE_CHECKING
 
 from openpaw.agent.metrics import TokenUsageReader
+from openpaw.agent.middleware.model_hedging import get_model_hedge_stats
+from openpaw.agent.model_registry import get_chat_model_registry
+from openpaw.agent.rate_limiter import get_provider_rate_limiter
 from openpaw.channels.commands.base import CommandDefinition, CommandHandler, CommandResult
 
 if TYPE_CHECKING:
@@ -79,6 +82,20 @@ class StatusCommand(CommandHandler):
             lines.append(f"Conversation: {state.conversation_id}")
             lines.append(f"Messages: {state.message_count}")
 
+        # Queue wait for this session (recent dispatches)
+        try:
+            wait_stats = context.queue_manager.lane_queue.get_session_wait_stats(session_key=message.session_key)
+            session_wait = wait_stats.get(message.session_key)
+            if session_wait:
+                lines.append(
+                    f"Queue wait: p50 {session_wait['p50_wait_ms']:,}ms, "
+                    f"p95 {session_wait['p95_wait_ms']:,}ms "
+                    f"(last {session_wait['samples']} runs)"
+                )
+        except (AttributeError, TypeError):
+            # Queue stats might not be available, skip
+            pass
+
         # Task info (if available)
         if context.task_store:
             try:
@@ -109,6 +126,118 @@ class StatusCommand(CommandHandler):
             # Subagent store might not be available, skip
             pass
 
+        # Stateless agent graph cache (cron, heartbeat, subagents)
+        try:
+            cache_stats = context.agent_factory.graph_cache_stats()
+            if isinstance(cache_stats, dict):
+                lookups = cache_stats["hits"] + cache_stats["misses"]
+                if lookups > 0:
+                    lines.append(
+                        f"Agent cache: {cache_stats['hit_rate']:.0%} hit rate "
+                        f"({cache_stats['hits']}/{lookups}), "
+                        f"avg build {cache_stats['avg_build_ms']}ms"
+                    )
+        except (AttributeError, TypeError):
+            # Agent factory might not have a graph cache, skip
+            pass
+
+        # Auto-compact swaps and background summary preparation
+        try:
+            compaction = context.message_processor.compaction_stats()
+            if isinstance(compaction, dict):
+                swaps = compaction["prepared_swaps"] + compaction["inline_swaps"]
+                if swaps > 0 or compaction["prepared"] > 0:
+                    lines.append(
+                        f"Auto-compact: {swaps} swap(s), "
+                        f"{compaction['critical_path_rate']:.0%} summarized in user turn, "
+                        f"avg {compaction['avg_swap_ms']}ms in turn "
+                        f"(background prep avg {compaction['avg_prepare_ms']}ms)"
+                    )
+        except (AttributeError, TypeError):
+            # Message processor might not be available, skip
+            pass
+
+        # Speculative starts during the debounce window
+        try:
+            speculation = context.queue_manager.get_stats()["speculation"]
+            if isinstance(speculation, dict) and speculation["starts"] > 0:
+                lines.append(
+                    f"Speculative starts: {speculation['starts']}, "
+                    f"{speculation['restarts']} restarted "
+                    f"(~{speculation['wasted_tokens']:,} tokens discarded, "
+                    f"{speculation['saved_ms'] / 1000:.1f}s debounce saved)"
+                )
+        except (AttributeError, TypeError, KeyError):
+            # Queue manager might not be available, skip
+            pass
+
+        # Shared chat model clients (process-wide)
+        registry_stats = get_chat_model_registry().get_stats()
+        if registry_stats["hits"] + registry_stats["misses"] > 0:
+            lines.append(
+                f"Model clients: {registry_stats['pools']} pool(s), "
+                f"{registry_stats['models']} model(s), "
+                f"{registry_stats['hit_rate']:.0%} reuse, "
+                f"{registry_stats['warmed']} warmed"
+            )
+
+        # Hedged and fallback model requests per endpoint (process-wide)
+        for label, hedge in get_model_hedge_stats().get_stats().items():
+            if hedge["hedged"] or hedge["races"] or hedge["fallbacks"]:
+                lines.append(
+                    f"Hedging {label}: {hedge['hedge_rate']:.0%} of calls hedged "
+                    f"({hedge['hedged']}/{hedge['calls']}), "
+                    f"{hedge['win_rate']:.0%} of races won, "
+                    f"{hedge['fallbacks']} fallback(s)"
+                )
+
+        # Shared provider rate limits (process-wide)
+        for provider, limit in get_provider_rate_limiter().get_stats().items():
+            if limit["waits"] or limit["throttled"]:
+                lines.append(
+                    f"Rate limit {provider}: {limit['waits']}/{limit['calls']} calls waited "
+                    f"(avg {limit['avg_wait_ms']:,}ms), {limit['throttled']} rate limit error(s)"
+                )
+
+        # Workspace token budgets checked at lane admission
+        try:
+            budget = context.queue_manager.lane_queue.token_budget
+            budget_stats = budget.get_stats() if budget is not None else None
+            if isinstance(budget_stats, dict):
+                for scope, usage in budget_stats["scopes"].items():
+                    parts = []
+                    if usage["hour_limit"]:
+                        parts.append(f"{usage['hour']:,}/{usage['hour_limit']:,} this hour")
+                    if usage["day_limit"]:
+                        parts.append(f"{usage['day']:,}/{usage['day_limit']:,} last 24h")
+                    if parts:
+                        lines.append(f"Token budget ({scope}): {', '.join(parts)}")
+                if budget_stats["deferred"] or budget_stats["downgraded"] or budget_stats["rejected"]:
+                    lines.append(
+                        f"Over budget: {budget_stats['deferred']} deferred, "
+                        f"{budget_stats['downgraded']} downgraded, {budget_stats['rejected']} rejected"
+                    )
+        except (AttributeError, TypeError, KeyError):
+            # Queue manager might not be available, skip
+            pass
+
+        # Conversation checkpoint storage and retention
+        try:
+            db_bytes = await context.checkpointer.adatabase_size()
+            if isinstance(db_bytes, int):
+                db_line = f"Conversations DB: {db_bytes / (1024 * 1024):.1f} MB"
+                retention = context.checkpoint_retention.get_stats() if context.checkpoint_retention else None
+                if isinstance(retention, dict) and retention["passes"] > 0:
+                    db_line += (
+                        f" ({retention['deleted_threads']} archived thread(s) deleted, "
+                        f"{retention['pruned_checkpoints']:,} checkpoint(s) pruned, "
+                        f"{retention['reclaimed_bytes'] / (1024 * 1024):.1f} MB reclaimed since start)"
+                    )
+                lines.append(db_line)
+        except (AttributeError, TypeError, RuntimeError):
+            # Checkpointer might not be pooled or open, skip
+            pass
+
         # Token usage info
         try:
             reader = TokenUsageReader(context.workspace_path)
@@ -125,6 +254,17 @@ class StatusCommand(CommandHandler):
                 )
             if session.total_tokens > 0:
                 lines.append(f"Tokens this session: {session.total_tokens:,}")
+            if today.window_tokens_saved > 0:
+                lines.append(f"History window saved today: ~{today.window_tokens_saved:,} input tokens")
+            if today.elided_tokens_saved > 0:
+                lines.append(f"Tool output elision saved today: ~{today.elided_tokens_saved:,} input tokens")
+            if today.rate_limit_wait_ms > 0:
+                lines.append(f"Rate limit wait today: {today.rate_limit_wait_ms / 1000:.1f}s")
+            for route, usage in reader.routes_today(timezone_str=context.workspace_timezone).items():
+                lines.append(
+                    f"Route {route} ({usage['model']}): {usage['runs']} run(s) today, "
+                    f"avg {usage['avg_ms'] / 1000:.1f}s, {usage['total_tokens']:,} tokens"
+                )
         except (AttributeError, TypeError):
             # Token tracking might not be available, skip
             pass
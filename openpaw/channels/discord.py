@@ -310,6 +310,39 @@ class DiscordChannel(ChannelAdapter):
             timestamp=datetime.now(UTC),
         )
 
+    async def edit_message(
+        self, session_key: str, message_id: str, content: str, final: bool = False
+    ) -> None:
+        """Edit a sent Discord message in place.
+
+        Discord renders markdown natively, so intermediate and final edits
+        are identical.
+
+        Args:
+            session_key: Session key in format 'discord:channel_id'.
+            message_id: Discord message ID (snowflake).
+            content: New message text (within MAX_MESSAGE_LENGTH).
+            final: Whether this is the last edit of a streamed response.
+        """
+        if not self._client:
+            raise RuntimeError("Discord channel not started")
+
+        channel = await self._resolve_channel(self._channel_id_from_session_key(session_key))
+        await channel.get_partial_message(int(message_id)).edit(content=content)
+
+    async def delete_message(self, session_key: str, message_id: str) -> None:
+        """Delete a sent Discord message.
+
+        Args:
+            session_key: Session key in format 'discord:channel_id'.
+            message_id: Discord message ID (snowflake).
+        """
+        if not self._client:
+            raise RuntimeError("Discord channel not started")
+
+        channel = await self._resolve_channel(self._channel_id_from_session_key(session_key))
+        await channel.get_partial_message(int(message_id)).delete()
+
     async def send_file(
         self,
         session_key: str,
@@ -686,45 +719,6 @@ class DiscordChannel(ChannelAdapter):
     # Helpers
     # ------------------------------------------------------------------
 
-    def _split_message(self, text: str) -> list[str]:
-        """Split text into chunks that fit Discord's 2000-char message limit.
-
-        Tries to break at paragraph boundaries (double newline), falls back
-        to single newlines, then hard-splits as a last resort.
-
-        Args:
-            text: The full message text.
-
-        Returns:
-            List of message chunks, each within MAX_MESSAGE_LENGTH.
-        """
-        if len(text) <= self.MAX_MESSAGE_LENGTH:
-            return [text]
-
-        chunks: list[str] = []
-        remaining = text
-
-        while remaining:
-            if len(remaining) <= self.MAX_MESSAGE_LENGTH:
-                chunks.append(remaining)
-                break
-
-            # Prefer paragraph boundary
-            split_at = remaining.rfind("\n\n", 0, self.MAX_MESSAGE_LENGTH)
-
-            # Fall back to single newline
-            if split_at == -1:
-                split_at = remaining.rfind("\n", 0, self.MAX_MESSAGE_LENGTH)
-
-            # Hard split as last resort
-            if split_at == -1:
-                split_at = self.MAX_MESSAGE_LENGTH
-
-            chunks.append(remaining[:split_at])
-            remaining = remaining[split_at:].lstrip("\n")
-
-        return chunks
-
     @staticmethod
     def _channel_id_from_session_key(session_key: str) -> int:
         """Extract the Discord channel ID from a session key.
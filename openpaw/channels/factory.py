@@ -62,4 +62,8 @@ def create_channel(
     if channel_name:
         adapter.name = channel_name
 
+    streaming = config.get("streaming") or {}
+    adapter.streaming_enabled = bool(streaming.get("enabled", False))
+    adapter.stream_edit_interval = streaming.get("edit_interval_ms", 1000) / 1000
+
     return adapter
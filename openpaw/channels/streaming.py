@@ -0,0 +1,170 @@
+"""Progressive delivery of agent responses through message edits."""
+
+import asyncio
+import logging
+import time
+
+from openpaw.channels.base import ChannelAdapter
+
+logger = logging.getLogger(__name__)
+
+# Shown while a rolled-over message waits for its first edit
+STREAM_PLACEHOLDER = "…"
+
+# Cursor appended to intermediate edits so users can tell the reply is still growing
+STREAM_CURSOR = " ▌"
+
+# Upper bound for the edit interval after repeated edit failures (rate limiting)
+MAX_EDIT_INTERVAL = 10.0
+
+
+class StreamingResponse:
+    """Mirrors a growing response into one or more platform messages.
+
+    ``update()`` only records the latest text; edits are flushed by a
+    background task no more often than ``channel.stream_edit_interval`` so
+    platform rate limits are respected however fast tokens arrive. Text longer
+    than ``channel.MAX_MESSAGE_LENGTH`` rolls over into additional messages,
+    split at the same boundaries ``send_message()`` would use. Failed edits
+    double the interval (up to MAX_EDIT_INTERVAL) instead of retrying at once.
+
+    Call ``finish()`` with the final response to apply the last edit with full
+    formatting, or ``discard()`` to remove anything that was sent when the run
+    produced no reply (steer, interrupt, approval, error). Every stream must be
+    closed with one of them, since an edit may still be on its way.
+    """
+
+    def __init__(self, channel: ChannelAdapter, session_key: str) -> None:
+        """Initialize the stream.
+
+        Args:
+            channel: Channel adapter supporting edit_message().
+            session_key: Session the response is delivered to.
+        """
+        self._channel = channel
+        self._session_key = session_key
+        self._interval = channel.stream_edit_interval
+        self._message_ids: list[str] = []
+        self._rendered: list[str] = []
+        self._latest = ""
+        self._last_edit = 0.0
+        self._flush_task: asyncio.Task[None] | None = None
+        self._lock = asyncio.Lock()
+        self._closed = False
+
+    @property
+    def started(self) -> bool:
+        """Whether at least one message has been sent for this stream."""
+        return bool(self._message_ids)
+
+    async def update(self, text: str) -> None:
+        """Record the latest visible text and schedule an edit.
+
+        Args:
+            text: Full visible text of the response so far.
+        """
+        if self._closed:
+            return
+        self._latest = text
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_later())
+
+    async def finish(self, text: str) -> None:
+        """Render the final response and close the stream.
+
+        Falls back to deleting the streamed messages and sending ``text``
+        normally if the final edit fails.
+
+        Args:
+            text: Final response text.
+        """
+        await self._close()
+        try:
+            async with self._lock:
+                await self._render(text, final=True)
+        except Exception as e:
+            logger.warning(f"Final stream edit failed for {self._session_key}, resending: {e}")
+            await self._delete_all()
+            await self._channel.send_message(self._session_key, text)
+
+    async def discard(self) -> None:
+        """Close the stream and delete any messages it sent."""
+        await self._close()
+        await self._delete_all()
+
+    async def _close(self) -> None:
+        """Stop accepting updates and cancel any scheduled edit.
+
+        An edit already being rendered is waited for instead: cancelling its
+        send could leave a message behind that the stream does not know of.
+        """
+        self._closed = True
+        if self._flush_task is not None and not self._flush_task.done():
+            if self._lock.locked():
+                await asyncio.wait({self._flush_task})
+                return
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+
+    async def _flush_later(self) -> None:
+        """Wait out the edit interval, then render the latest text."""
+        wait = self._last_edit + self._interval - time.monotonic()
+        if wait > 0 and self.started:
+            await asyncio.sleep(wait)
+        try:
+            async with self._lock:
+                await self._render(self._latest, final=False)
+            self._interval = self._channel.stream_edit_interval
+        except Exception as e:
+            self._interval = min(self._interval * 2, MAX_EDIT_INTERVAL)
+            logger.debug(
+                f"Stream edit failed for {self._session_key}, "
+                f"backing off to {self._interval:.1f}s: {e}"
+            )
+        finally:
+            self._last_edit = time.monotonic()
+
+    async def _render(self, text: str, final: bool) -> None:
+        """Bring the sent messages in line with ``text``."""
+        chunks = self._channel._split_message(text)
+        if not final:
+            chunks[-1] = self._with_cursor(chunks[-1])
+
+        for index, chunk in enumerate(chunks):
+            if index == len(self._message_ids):
+                sent = await self._channel.send_message(self._session_key, STREAM_PLACEHOLDER)
+                self._message_ids.append(sent.id)
+                self._rendered.append(STREAM_PLACEHOLDER)
+            if chunk != self._rendered[index] or final:
+                await self._channel.edit_message(
+                    self._session_key, self._message_ids[index], chunk, final=final
+                )
+                self._rendered[index] = chunk
+
+        # The final turn can be shorter than an earlier turn that rolled over
+        while len(self._message_ids) > len(chunks):
+            message_id = self._message_ids.pop()
+            self._rendered.pop()
+            await self._delete(message_id)
+
+    def _with_cursor(self, chunk: str) -> str:
+        """Append the typing cursor if it fits within the message limit."""
+        if len(chunk) + len(STREAM_CURSOR) <= self._channel.MAX_MESSAGE_LENGTH:
+            return chunk + STREAM_CURSOR
+        return chunk
+
+    async def _delete_all(self) -> None:
+        """Delete every message sent for this stream."""
+        while self._message_ids:
+            self._rendered.pop()
+            await self._delete(self._message_ids.pop())
+
+    async def _delete(self, message_id: str) -> None:
+        """Best-effort deletion of a streamed message."""
+        try:
+            await self._channel.delete_message(self._session_key, message_id)
+        except Exception as e:
+            logger.debug(f"Failed to delete streamed message {message_id}: {e}")
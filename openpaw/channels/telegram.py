@@ -209,44 +209,64 @@ class TelegramChannel(ChannelAdapter):
                     raise
         return sent
 
-    def _split_message(self, text: str) -> list[str]:
-        """Split text into chunks that fit Telegram's message limit.
+    async def edit_message(
+        self, session_key: str, message_id: str, content: str, final: bool = False
+    ) -> None:
+        """Edit a sent Telegram message in place.
 
-        Tries to break at paragraph boundaries (double newline), falls back
-        to single newlines, then hard-splits as a last resort.
+        Intermediate edits are sent as plain text because partial markdown is
+        often unbalanced. The final edit converts markdown to Telegram HTML and
+        falls back to plain text if the HTML is rejected or too long.
 
         Args:
-            text: The full message text.
-
-        Returns:
-            List of message chunks, each within MAX_MESSAGE_LENGTH.
+            session_key: Session key in format 'telegram:chat_id'.
+            message_id: Telegram message ID.
+            content: New message text (within MAX_MESSAGE_LENGTH).
+            final: Whether this is the last edit of a streamed response.
         """
-        if len(text) <= self.MAX_MESSAGE_LENGTH:
-            return [text]
-
-        chunks: list[str] = []
-        remaining = text
+        from telegram.error import BadRequest
 
-        while remaining:
-            if len(remaining) <= self.MAX_MESSAGE_LENGTH:
-                chunks.append(remaining)
-                break
+        if not self._app:
+            raise RuntimeError("Telegram channel not started")
 
-            # Try to split at paragraph boundary
-            split_at = remaining.rfind("\n\n", 0, self.MAX_MESSAGE_LENGTH)
+        chat_id = int(session_key.split(":")[1])
+        kwargs: dict[str, Any] = {}
+        text = content
+        if final:
+            from openpaw.channels.formatting import markdown_to_telegram_html
+            html_content = markdown_to_telegram_html(content)
+            if len(html_content) <= self.MAX_MESSAGE_LENGTH:
+                text = html_content
+                kwargs["parse_mode"] = "HTML"
 
-            # Fall back to single newline
-            if split_at == -1:
-                split_at = remaining.rfind("\n", 0, self.MAX_MESSAGE_LENGTH)
+        try:
+            await self._app.bot.edit_message_text(
+                chat_id=chat_id, message_id=int(message_id), text=text, **kwargs
+            )
+        except BadRequest as e:
+            error = str(e).lower()
+            if "not modified" in error:
+                return
+            if "can't parse" in error and kwargs:
+                logger.warning(f"HTML parse failed for streamed message, using plain text: {e}")
+                await self._app.bot.edit_message_text(
+                    chat_id=chat_id, message_id=int(message_id), text=content
+                )
+            else:
+                raise
 
-            # Hard split as last resort
-            if split_at == -1:
-                split_at = self.MAX_MESSAGE_LENGTH
+    async def delete_message(self, session_key: str, message_id: str) -> None:
+        """Delete a sent Telegram message.
 
-            chunks.append(remaining[:split_at])
-            remaining = remaining[split_at:].lstrip("\n")
+        Args:
+            session_key: Session key in format 'telegram:chat_id'.
+            message_id: Telegram message ID.
+        """
+        if not self._app:
+            raise RuntimeError("Telegram channel not started")
 
-        return chunks
+        chat_id = int(session_key.split(":")[1])
+        await self._app.bot.delete_message(chat_id=chat_id, message_id=int(message_id))
 
     async def send_audio(
         self,
@@ -14,6 +14,7 @@ from openpaw.core.config.loader import (
     merge_configs,
 )
 from openpaw.core.config.models import (
+    AdaptiveDebounceConfig,
     AgentConfig,
     ApprovalGatesConfig,
     BuiltinItemConfig,
@@ -26,6 +27,7 @@ from openpaw.core.config.models import (
     LoggingConfig,
     ProviderDefinition,
     QueueConfig,
+    QueuePriorityConfig,
     SendFileBuiltinConfig,
     ToolApprovalConfig,
     WorkspaceBuiltinsConfig,
@@ -38,6 +40,7 @@ from openpaw.core.config.models import (
 
 __all__ = [
     # Models
+    "AdaptiveDebounceConfig",
     "AgentConfig",
     "ApprovalGatesConfig",
     "BuiltinItemConfig",
@@ -50,6 +53,7 @@ __all__ = [
     "LoggingConfig",
     "ProviderDefinition",
     "QueueConfig",
+    "QueuePriorityConfig",
     "SendFileBuiltinConfig",
     "ToolApprovalConfig",
     "WorkspaceBuiltinsConfig",
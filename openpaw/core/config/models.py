@@ -13,6 +13,26 @@ from pydantic import BaseModel, Field, field_validator, model_validator
 from openpaw.core.paths import DOWNLOADS_DIR, SCREENSHOTS_DIR
 
 
+class AdaptiveDebounceConfig(BaseModel):
+    """Adaptive per-session debounce learned from message inter-arrival times."""
+
+    enabled: bool = Field(default=True, description="Learn debounce delays per session instead of a fixed debounce_ms")
+    min_ms: int = Field(default=0, description="Delay when a follow-up message is unlikely")
+    max_ms: int = Field(default=3000, description="Cap on latency added while waiting for a burst to finish")
+    burst_threshold: float = Field(
+        default=0.3, description="Follow-up probability below which a session flushes after min_ms"
+    )
+
+    @model_validator(mode="after")
+    def validate_bounds(self) -> "AdaptiveDebounceConfig":
+        """Validate delay bounds and burst threshold."""
+        if self.min_ms < 0 or self.max_ms < self.min_ms:
+            raise ValueError("adaptive_debounce requires 0 <= min_ms <= max_ms")
+        if not 0 <= self.burst_threshold <= 1:
+            raise ValueError("adaptive_debounce.burst_threshold must be between 0 and 1")
+        return self
+
+
 class QueueConfig(BaseModel):
     """Configuration for the command queue system."""
 
@@ -20,6 +40,20 @@ class QueueConfig(BaseModel):
     debounce_ms: int = Field(default=1000, description="Debounce delay in milliseconds")
     cap: int = Field(default=20, description="Max queued messages per session")
     drop_policy: str = Field(default="summarize", description="Overflow policy: old, new, summarize")
+    max_sessions: int = Field(
+        default=1000, description="Soft cap on in-memory per-session queue state before LRU eviction"
+    )
+    session_idle_seconds: int = Field(
+        default=3600, description="Evict quiescent per-session queue state after this many idle seconds"
+    )
+    adaptive_debounce: AdaptiveDebounceConfig = Field(
+        default_factory=AdaptiveDebounceConfig,
+        description="Adaptive per-session debounce (debounce_ms is the starting delay)",
+    )
+    speculative_start: bool = Field(
+        default=False,
+        description="Start the run on a session's first message; restart it if more arrive within the debounce window",
+    )
 
 
 class LaneConfig(BaseModel):
@@ -28,6 +62,10 @@ class LaneConfig(BaseModel):
     main_concurrency: int = Field(default=4, description="Max concurrent runs in main lane")
     subagent_concurrency: int = Field(default=8, description="Max concurrent runs in subagent lane")
     cron_concurrency: int = Field(default=2, description="Max concurrent runs in cron lane")
+    background_pause_wait_ms: int | None = Field(
+        default=None,
+        description="Pause subagent/cron lanes while interactive messages have waited longer than this (ms)",
+    )
 
 
 
@@ -43,6 +81,32 @@ class AgentConfig(BaseModel):
 
 
 
+class ProviderRateLimitConfig(BaseModel):
+    """Shared request and token budgets for one provider account."""
+
+    requests_per_minute: int | None = Field(default=None, description="Model requests per minute (null = unlimited)")
+    tokens_per_minute: int | None = Field(
+        default=None, description="Input plus output tokens per minute (null = unlimited)"
+    )
+    max_retries: int = Field(default=3, description="Retries of a call rejected with a rate limit error")
+
+    @field_validator("requests_per_minute", "tokens_per_minute")
+    @classmethod
+    def validate_positive(cls, v: int | None) -> int | None:
+        """Validate budgets are positive when set."""
+        if v is not None and v < 1:
+            raise ValueError("must be at least 1")
+        return v
+
+    @field_validator("max_retries")
+    @classmethod
+    def validate_non_negative(cls, v: int) -> int:
+        """Validate the retry count is not negative."""
+        if v < 0:
+            raise ValueError("must be non-negative")
+        return v
+
+
 class ProviderDefinition(BaseModel):
     """Named provider in the global catalog.
 
@@ -54,6 +118,10 @@ class ProviderDefinition(BaseModel):
     api_key: str | None = Field(default=None, description="API key for the provider")
     base_url: str | None = Field(default=None, description="Custom API endpoint URL")
     region: str | None = Field(default=None, description="AWS region for Bedrock models")
+    rate_limit: ProviderRateLimitConfig | None = Field(
+        default=None,
+        description="Requests/tokens per minute shared by every workspace using this provider",
+    )
 
     model_config = {"extra": "allow"}
 
@@ -105,6 +173,24 @@ class ChannelLogConfig(BaseModel):
         return v
 
 
+class ChannelStreamingConfig(BaseModel):
+    """Configuration for progressive response delivery via message edits."""
+
+    enabled: bool = Field(default=False, description="Stream agent responses by editing a sent message")
+    edit_interval_ms: int = Field(
+        default=1000,
+        description="Minimum delay between edits of a streamed message (platform rate limits)",
+    )
+
+    @field_validator("edit_interval_ms")
+    @classmethod
+    def validate_edit_interval(cls, v: int) -> int:
+        """Validate edit_interval_ms is at least 250ms."""
+        if v < 250:
+            raise ValueError("edit_interval_ms must be at least 250")
+        return v
+
+
 class WorkspaceChannelConfig(BaseModel):
     """Channel binding configuration for a workspace agent."""
 
@@ -143,6 +229,10 @@ class WorkspaceChannelConfig(BaseModel):
         default_factory=ChannelLogConfig,
         description="Persistent channel message logging configuration",
     )
+    streaming: ChannelStreamingConfig = Field(
+        default_factory=ChannelStreamingConfig,
+        description="Progressive response streaming via message edits",
+    )
 
     @field_validator("context_messages")
     @classmethod
@@ -155,14 +245,63 @@ class WorkspaceChannelConfig(BaseModel):
     model_config = {"extra": "allow"}
 
 
+class QueuePriorityConfig(BaseModel):
+    """Lane dispatch priorities for a workspace (higher dispatches first)."""
+
+    direct_message: int = Field(default=10, description="Priority for user messages in DMs")
+    group_message: int = Field(default=0, description="Priority for user messages in groups/servers")
+    steer_boost: int = Field(default=5, description="Added to user messages submitted in steer or interrupt mode")
+    system_event: int = Field(default=-5, description="Priority for injected system events")
+    channels: dict[str, int] = Field(
+        default_factory=dict,
+        description="Per-channel user message priority, overriding DM/group defaults (channel name -> priority)",
+    )
+    invocation_types: dict[str, int] = Field(
+        default_factory=dict,
+        description="Per-invocation-type system event priority (subagent, cron, heartbeat, system -> priority)",
+    )
+    aging_per_second: float = Field(
+        default=0.1,
+        description="Priority points a queued item gains per second waiting (prevents starvation)",
+    )
+
+    @field_validator("aging_per_second")
+    @classmethod
+    def validate_aging(cls, v: float) -> float:
+        """Validate aging rate is non-negative."""
+        if v < 0:
+            raise ValueError("aging_per_second must be >= 0")
+        return v
+
+
 class WorkspaceQueueConfig(BaseModel):
     """Queue configuration overrides for a workspace agent."""
 
     mode: str | None = Field(default=None, description="Queue mode: steer, followup, collect")
     debounce_ms: int | None = Field(default=None, description="Debounce delay in milliseconds")
+    speculative_start: bool | None = Field(
+        default=None, description="Start runs before the debounce window closes (null = global setting)"
+    )
+    priority: QueuePriorityConfig = Field(
+        default_factory=QueuePriorityConfig,
+        description="Lane dispatch priorities and aging",
+    )
+    channel_weights: dict[str, float] = Field(
+        default_factory=dict,
+        description="Relative share of lane concurrency per channel (channel name -> weight, default 1.0)",
+    )
 
     model_config = {"extra": "allow"}
 
+    @field_validator("channel_weights")
+    @classmethod
+    def validate_channel_weights(cls, v: dict[str, float]) -> dict[str, float]:
+        """Validate channel weights are positive."""
+        for channel, weight in v.items():
+            if weight <= 0:
+                raise ValueError(f"channel_weights[{channel!r}] must be > 0")
+        return v
+
 
 class BuiltinItemConfig(BaseModel):
     """Configuration for a single builtin capability."""
@@ -406,6 +545,62 @@ class MemoryConfig(BaseModel):
     )
 
 
+class SqliteConfig(BaseModel):
+    """Connection tuning for the workspace SQLite databases (conversations.db, vectors.db)."""
+
+    journal_mode: Literal["wal", "delete"] = Field(
+        default="wal", description="Journal mode; WAL lets readers run alongside the writer"
+    )
+    synchronous: Literal["off", "normal", "full"] = Field(
+        default="normal", description="Fsync policy (normal is durable across crashes in WAL mode)"
+    )
+    cache_size_kb: int = Field(default=16384, description="Page cache per connection in KiB")
+    mmap_size_mb: int = Field(default=64, description="Memory-mapped I/O per connection in MiB (0 = off)")
+    busy_timeout_ms: int = Field(default=5000, description="Wait this long for a lock before failing")
+    readers: int = Field(
+        default=2, description="Read-only connections per database next to the single writer (0 = share the writer)"
+    )
+
+    @field_validator("cache_size_kb", "busy_timeout_ms")
+    @classmethod
+    def validate_positive(cls, v: int) -> int:
+        """Validate sizes and timeouts are positive."""
+        if v < 1:
+            raise ValueError("must be at least 1")
+        return v
+
+    @field_validator("mmap_size_mb", "readers")
+    @classmethod
+    def validate_non_negative(cls, v: int) -> int:
+        """Validate mmap size and reader count are not negative."""
+        if v < 0:
+            raise ValueError("must not be negative")
+        return v
+
+
+class CheckpointRetentionConfig(BaseModel):
+    """Pruning and compaction of the conversation checkpoints (conversations.db)."""
+
+    enabled: bool = Field(default=False, description="Prune and compact conversations.db on a schedule (opt-in)")
+    keep_checkpoints: int = Field(
+        default=10, description="Checkpoints kept per conversation thread; older ones are deleted"
+    )
+    delete_archived: bool = Field(
+        default=False,
+        description="Delete threads of rotated conversations once they are archived to memory/conversations/ (opt-in)",
+    )
+    interval_hours: int = Field(default=6, description="Hours between maintenance passes")
+    vacuum: bool = Field(default=True, description="Return freed pages to the filesystem (incremental VACUUM)")
+
+    @field_validator("keep_checkpoints", "interval_hours")
+    @classmethod
+    def validate_positive(cls, v: int) -> int:
+        """Validate the checkpoint count and interval are positive."""
+        if v < 1:
+            raise ValueError("must be at least 1")
+        return v
+
+
 class ToolTimeoutsConfig(BaseModel):
     """Configuration for per-tool-call timeouts."""
 
@@ -419,6 +614,39 @@ class ToolTimeoutsConfig(BaseModel):
     )
 
 
+class ToolOutputSpillConfig(BaseModel):
+    """Configuration for spilling oversized tool results to workspace files."""
+
+    enabled: bool = Field(default=True, description="Write oversized tool results to workspace/.tool_outputs/")
+    max_chars: int = Field(
+        default=20000,
+        description="Tool results longer than this are spilled to a file",
+    )
+    head_chars: int = Field(default=2000, description="Characters from the start of the result kept as preview")
+    tail_chars: int = Field(default=1000, description="Characters from the end of the result kept as preview")
+    exclude: list[str] = Field(
+        default_factory=lambda: ["read_file"],
+        description="Tools whose results are never spilled (read_file pages through spill files)",
+    )
+    max_files: int = Field(default=200, description="Spill files kept per workspace; oldest are deleted first")
+
+    @field_validator("max_chars", "max_files")
+    @classmethod
+    def validate_positive(cls, v: int) -> int:
+        """Validate the size threshold and file limit are positive."""
+        if v < 1:
+            raise ValueError("must be at least 1")
+        return v
+
+    @field_validator("head_chars", "tail_chars")
+    @classmethod
+    def validate_non_negative(cls, v: int) -> int:
+        """Validate preview sizes are not negative."""
+        if v < 0:
+            raise ValueError("must not be negative")
+        return v
+
+
 class AutoCompactConfig(BaseModel):
     """Configuration for automatic context compaction."""
 
@@ -427,6 +655,21 @@ class AutoCompactConfig(BaseModel):
     summary_model: str | None = Field(
         default=None, description="Model for summary generation (null = use workspace model)"
     )
+    recount_interval: int = Field(
+        default=20,
+        description="Runs between full context recounts correcting the running token tally",
+    )
+    precompact_trigger: float | None = Field(
+        default=0.6,
+        description=(
+            "Context utilization fraction at which the summary is prepared in the background "
+            "on an idle session (null = summarize inline at the trigger)"
+        ),
+    )
+    idle_seconds: float = Field(
+        default=30.0,
+        description="Seconds a session must stay idle before background pre-compaction starts",
+    )
 
     @field_validator("trigger")
     @classmethod
@@ -436,6 +679,206 @@ class AutoCompactConfig(BaseModel):
             raise ValueError("trigger must be between 0.0 and 1.0")
         return v
 
+    @field_validator("precompact_trigger")
+    @classmethod
+    def validate_precompact_trigger(cls, v: float | None) -> float | None:
+        """Validate precompact_trigger is a fraction between 0.0 and 1.0."""
+        if v is not None and not 0.0 <= v <= 1.0:
+            raise ValueError("precompact_trigger must be between 0.0 and 1.0")
+        return v
+
+    @field_validator("idle_seconds")
+    @classmethod
+    def validate_idle_seconds(cls, v: float) -> float:
+        """Validate idle_seconds is not negative."""
+        if v < 0:
+            raise ValueError("idle_seconds must not be negative")
+        return v
+
+    @field_validator("recount_interval")
+    @classmethod
+    def validate_recount_interval(cls, v: int) -> int:
+        """Validate recount_interval is at least one run."""
+        if v < 1:
+            raise ValueError("recount_interval must be at least 1")
+        return v
+
+
+class HistoryWindowConfig(BaseModel):
+    """Configuration for the token-budgeted history window sent to the model."""
+
+    enabled: bool = Field(default=False, description="Send a token-budgeted window instead of the full history")
+    max_tokens: int = Field(
+        default=32000,
+        description="Token budget for conversation messages sent per model call (system prompt excluded)",
+    )
+    max_turns: int = Field(default=20, description="Maximum number of recent turns sent per model call")
+    summary: bool = Field(
+        default=True,
+        description="Prepend a rolling summary of the earlier conversation and only leave out the messages it covers",
+    )
+
+    @field_validator("max_tokens", "max_turns")
+    @classmethod
+    def validate_positive(cls, v: int) -> int:
+        """Validate budget and turn limits are positive."""
+        if v < 1:
+            raise ValueError("must be at least 1")
+        return v
+
+
+class ToolOutputElisionConfig(BaseModel):
+    """Configuration for replacing stale tool outputs with stubs in model requests."""
+
+    enabled: bool = Field(default=False, description="Replace tool outputs from older turns with short stubs")
+    max_age_turns: int = Field(
+        default=3,
+        description="Turns after which any sizeable tool output is replaced by a stub",
+    )
+    max_chars: int = Field(
+        default=4000,
+        description="Outputs longer than this are replaced once a newer turn starts",
+    )
+
+    @field_validator("max_age_turns", "max_chars")
+    @classmethod
+    def validate_positive(cls, v: int) -> int:
+        """Validate age and size thresholds are positive."""
+        if v < 1:
+            raise ValueError("must be at least 1")
+        return v
+
+
+class ModelHedgingConfig(BaseModel):
+    """Configuration for hedging slow model calls and falling back on provider errors."""
+
+    enabled: bool = Field(default=False, description="Race or fall back to a secondary model")
+    secondary_model: str | None = Field(
+        default=None,
+        description="Secondary model in provider:model format (catalog providers are resolved)",
+    )
+    hedge_after_ms: int | None = Field(
+        default=4000,
+        description="Send the request to the secondary when the primary has streamed nothing after this long "
+        "(null = fall back on errors only)",
+    )
+    fallback_on_error: bool = Field(
+        default=True,
+        description="Retry on the secondary when the primary fails with a provider error (5xx, 429, connection)",
+    )
+
+    @model_validator(mode="after")
+    def validate_secondary(self) -> "ModelHedgingConfig":
+        """Validate a secondary model is set when enabled and the hedge delay is positive."""
+        if self.enabled and not self.secondary_model:
+            raise ValueError("model_hedging requires secondary_model when enabled")
+        if self.hedge_after_ms is not None and self.hedge_after_ms < 1:
+            raise ValueError("model_hedging.hedge_after_ms must be at least 1")
+        return self
+
+
+BudgetPolicy = Literal["defer", "downgrade", "reject"]
+
+
+class TokenBudgetLimit(BaseModel):
+    """Token limits for one invocation type (user, cron, heartbeat, subagent, compact)."""
+
+    tokens_per_hour: int | None = Field(default=None, description="Tokens per rolling hour (null = unlimited)")
+    tokens_per_day: int | None = Field(default=None, description="Tokens per rolling 24 hours (null = unlimited)")
+    policy: BudgetPolicy | None = Field(
+        default=None, description="Policy when over these limits (null = the workspace policy)"
+    )
+
+    @field_validator("tokens_per_hour", "tokens_per_day")
+    @classmethod
+    def validate_positive(cls, v: int | None) -> int | None:
+        """Validate limits are positive when set."""
+        if v is not None and v < 1:
+            raise ValueError("must be at least 1")
+        return v
+
+
+class TokenBudgetConfig(BaseModel):
+    """Per-workspace token budgets enforced when work is admitted to a lane."""
+
+    enabled: bool = Field(default=False, description="Check token budgets before admitting work to a lane")
+    tokens_per_hour: int | None = Field(
+        default=None, description="Workspace tokens per rolling hour, all invocation types (null = unlimited)"
+    )
+    tokens_per_day: int | None = Field(
+        default=None, description="Workspace tokens per rolling 24 hours, all invocation types (null = unlimited)"
+    )
+    policy: BudgetPolicy = Field(
+        default="defer",
+        description="Over-budget work is deferred until the window has room, downgraded to "
+        "downgrade_model, or rejected",
+    )
+    downgrade_model: str | None = Field(
+        default=None,
+        description="Cheaper model in provider:model format for the downgrade policy (catalog providers are resolved)",
+    )
+    invocation_types: dict[str, TokenBudgetLimit] = Field(
+        default_factory=dict,
+        description="Limits per invocation type (user, cron, heartbeat, subagent, compact -> limits)",
+    )
+
+    @field_validator("tokens_per_hour", "tokens_per_day")
+    @classmethod
+    def validate_positive(cls, v: int | None) -> int | None:
+        """Validate limits are positive when set."""
+        if v is not None and v < 1:
+            raise ValueError("must be at least 1")
+        return v
+
+    @model_validator(mode="after")
+    def validate_downgrade_model(self) -> "TokenBudgetConfig":
+        """Validate a downgrade model is set when any policy downgrades."""
+        policies = {self.policy, *(limit.policy for limit in self.invocation_types.values())}
+        if "downgrade" in policies and not self.downgrade_model:
+            raise ValueError("token_budget requires downgrade_model for the downgrade policy")
+        return self
+
+
+# Invocation types a model route can be configured for
+ROUTED_INVOCATION_TYPES = ("user", "heartbeat", "cron", "subagent", "summarize")
+
+
+class ModelRoutingConfig(BaseModel):
+    """Per-invocation-type model routing, so background work can run on a smaller model."""
+
+    enabled: bool = Field(default=False, description="Route invocation types to their own models")
+    routes: dict[str, str] = Field(
+        default_factory=dict,
+        description="Model per invocation type (user, heartbeat, cron, subagent, summarize -> provider:model)",
+    )
+    simple_model: str | None = Field(
+        default=None,
+        description="Model for short, plain user messages such as greetings and acknowledgements "
+        "(null = no classification)",
+    )
+    simple_max_chars: int = Field(
+        default=160, description="Longest user message (in characters) that can count as simple"
+    )
+
+    @field_validator("routes")
+    @classmethod
+    def validate_routes(cls, v: dict[str, str]) -> dict[str, str]:
+        """Validate routes are keyed by known invocation types."""
+        unknown = sorted(set(v) - set(ROUTED_INVOCATION_TYPES))
+        if unknown:
+            raise ValueError(
+                f"unknown invocation type(s) {unknown}, expected one of {list(ROUTED_INVOCATION_TYPES)}"
+            )
+        return v
+
+    @field_validator("simple_max_chars")
+    @classmethod
+    def validate_simple_max_chars(cls, v: int) -> int:
+        """Validate the simple message length is positive."""
+        if v < 1:
+            raise ValueError("must be at least 1")
+        return v
+
 
 class LifecycleConfig(BaseModel):
     """Configuration for lifecycle event notifications."""
@@ -564,14 +1007,46 @@ class WorkspaceConfig(BaseModel):
         default_factory=ToolTimeoutsConfig,
         description="Per-tool-call timeout configuration",
     )
+    tool_output_spill: ToolOutputSpillConfig = Field(
+        default_factory=ToolOutputSpillConfig,
+        description="Oversized tool result spill configuration",
+    )
     memory: MemoryConfig = Field(
         default_factory=MemoryConfig,
         description="Conversation memory and vector search configuration",
     )
+    sqlite: SqliteConfig = Field(
+        default_factory=SqliteConfig,
+        description="SQLite connection tuning for the workspace databases",
+    )
+    checkpoint_retention: CheckpointRetentionConfig = Field(
+        default_factory=CheckpointRetentionConfig,
+        description="Checkpoint pruning and compaction of conversations.db",
+    )
     auto_compact: AutoCompactConfig = Field(
         default_factory=AutoCompactConfig,
         description="Auto-compact configuration",
     )
+    history_window: HistoryWindowConfig = Field(
+        default_factory=HistoryWindowConfig,
+        description="Token-budgeted history window configuration",
+    )
+    tool_output_elision: ToolOutputElisionConfig = Field(
+        default_factory=ToolOutputElisionConfig,
+        description="Stale tool output elision configuration",
+    )
+    model_hedging: ModelHedgingConfig = Field(
+        default_factory=ModelHedgingConfig,
+        description="Hedged and fallback model request configuration",
+    )
+    token_budget: TokenBudgetConfig = Field(
+        default_factory=TokenBudgetConfig,
+        description="Token budgets checked at lane admission",
+    )
+    model_routing: ModelRoutingConfig = Field(
+        default_factory=ModelRoutingConfig,
+        description="Per-invocation-type model routing configuration",
+    )
     session_ttl_minutes: int = Field(
         default=180,
         description="Auto-reset conversation after N minutes of inactivity (0 to disable)",
@@ -637,5 +1112,17 @@ class Config(BaseModel):
         default_factory=ToolTimeoutsConfig,
         description="Default tool timeout configuration",
     )
+    tool_output_spill: ToolOutputSpillConfig = Field(
+        default_factory=ToolOutputSpillConfig,
+        description="Default oversized tool result spill configuration",
+    )
+    sqlite: SqliteConfig = Field(
+        default_factory=SqliteConfig,
+        description="Default SQLite connection tuning for workspace databases",
+    )
+    checkpoint_retention: CheckpointRetentionConfig = Field(
+        default_factory=CheckpointRetentionConfig,
+        description="Default checkpoint pruning and compaction of conversations.db",
+    )
 
     model_config = {"extra": "allow"}
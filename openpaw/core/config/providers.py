@@ -7,7 +7,7 @@ connection details that AgentRunner and create_chat_model() expect.
 from dataclasses import dataclass, field
 from typing import Any
 
-from openpaw.core.config.models import ProviderDefinition
+from openpaw.core.config.models import ProviderDefinition, ProviderRateLimitConfig
 
 
 @dataclass(frozen=True)
@@ -35,6 +35,12 @@ class ResolvedProvider:
     extra_kwargs: dict[str, Any] = field(default_factory=dict)
     """base_url plus any extra provider-specific kwargs."""
 
+    catalog_name: str | None = None
+    """Catalog entry the model was resolved through, if any."""
+
+    rate_limit: ProviderRateLimitConfig | None = None
+    """Budgets shared by all models of the catalog entry, if configured."""
+
 
 def resolve_provider(
     model_input: str,
@@ -90,7 +96,7 @@ def resolve_provider(
     # then exclude None values.  This captures base_url plus any arbitrary
     # provider-specific kwargs stored via model_config extra="allow".
     extra_kwargs: dict[str, Any] = definition.model_dump(
-        exclude={"type", "api_key", "region"},
+        exclude={"type", "api_key", "region", "rate_limit"},
         exclude_none=True,
     )
 
@@ -100,4 +106,6 @@ def resolve_provider(
         api_key=definition.api_key,
         region=definition.region,
         extra_kwargs=extra_kwargs,
+        catalog_name=provider_name,
+        rate_limit=definition.rate_limit,
     )
@@ -72,6 +72,7 @@ CHANNEL_LOGS_DIR = MEMORY_LOGS_DIR / "channel"
 
 DOWNLOADS_DIR = WORKSPACE_DIR / "downloads"
 SCREENSHOTS_DIR = WORKSPACE_DIR / "screenshots"
+TOOL_OUTPUTS_DIR = WORKSPACE_DIR / ".tool_outputs"
 
 # ---------------------------------------------------------------------------
 # Access control
@@ -26,6 +26,7 @@ from openpaw.core.prompts.system_events import (
     TIMEOUT_NOTIFICATION_GENERIC,
     TIMEOUT_NOTIFICATION_TEMPLATE,
     TIMEOUT_WARNING_TEMPLATE,
+    TOKEN_BUDGET_REJECTED_NOTIFICATION,
     TOOL_DENIED_TEMPLATE,
 )
 
@@ -46,6 +47,7 @@ __all__ = [
     "TIMEOUT_NOTIFICATION_GENERIC",
     "TIMEOUT_NOTIFICATION_TEMPLATE",
     "TIMEOUT_WARNING_TEMPLATE",
+    "TOKEN_BUDGET_REJECTED_NOTIFICATION",
     "TOOL_DENIED_TEMPLATE",
     "build_capability_summary",
     "build_task_summary",
@@ -14,6 +14,20 @@ SUMMARIZE_PROMPT = (
     "Do NOT include greetings, sign-offs, or meta-commentary about the summary itself."
 )
 
+# Folds turns left out of the history window into the rolling summary; the
+# turns precede this prompt, so only they are summarized
+ROLLING_SUMMARY_TEMPLATE = PromptTemplate(
+    template=(
+        "Here is a summary of the conversation before the messages above:\n"
+        "{summary}\n\n"
+        "Update it with the messages above into one concise paragraph (3-5 sentences), "
+        "keeping the topics, decisions, ongoing tasks and context from both.\n"
+        "Write the summary as a factual overview, not as a message to the user.\n"
+        "Do NOT include greetings, sign-offs, or meta-commentary about the summary itself."
+    ),
+    input_variables=["summary"],
+)
+
 # Summary injection template for new conversation after compaction
 COMPACTED_TEMPLATE = PromptTemplate(
     template=(
@@ -48,6 +48,9 @@ SUBAGENT_COMPLETED_SHORT_TEMPLATE = PromptTemplate(
 # Interrupt mode notification (static, no variables)
 INTERRUPT_NOTIFICATION = "[Run interrupted — processing new message]"
 
+# Token budget rejection notice for user messages (static, no variables)
+TOKEN_BUDGET_REJECTED_NOTIFICATION = "[Token budget exhausted — message not processed, please try again later]"
+
 # Timeout warning for graceful shutdown (Track 3B)
 TIMEOUT_WARNING_TEMPLATE = PromptTemplate(
     template=(
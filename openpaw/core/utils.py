@@ -1,10 +1,12 @@
 """Shared utility modules for OpenPaw.
 
-Filename sanitization, deduplication, and user name resolution utilities.
+Filename sanitization, deduplication, user name resolution, and group-chat
+detection utilities.
 """
 
 import re
 from pathlib import Path
+from typing import Any
 
 
 def sanitize_filename(filename: str) -> str:
@@ -139,6 +141,26 @@ def resolve_user_name(
     return None
 
 
+def is_group_metadata(metadata: dict[str, Any] | None) -> bool:
+    """Determine whether message metadata indicates a group chat (not a DM).
+
+    Checks platform-specific group indicators:
+    - Discord: ``guild_id`` is not None
+    - Telegram: ``chat_type`` is set and not ``"private"``
+
+    Args:
+        metadata: Message metadata dict (may be None).
+
+    Returns:
+        True if the message came from a group/server, False otherwise.
+    """
+    meta = metadata or {}
+    if meta.get("guild_id") is not None:
+        return True
+    chat_type = meta.get("chat_type")
+    return bool(chat_type and chat_type != "private")
+
+
 def sanitize_error_for_user(error: Exception) -> str:
     """Convert an exception to a user-safe error message.
 
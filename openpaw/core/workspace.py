@@ -85,7 +85,9 @@ class AgentWorkspace:
         """Stitch together workspace files into a system prompt.
 
         The prompt structure follows DeepAgents conventions with clear sections.
-        Returns a string suitable for use with create_react_agent.
+        Returns the stable prefix followed by the volatile suffix, suitable for
+        use with create_react_agent. AgentRunner sends the two parts separately
+        so that provider prompt caching can hit on the prefix.
 
         Args:
             enabled_builtins: List of enabled builtin names. Used to conditionally
@@ -101,6 +103,30 @@ class AgentWorkspace:
         Returns:
             String containing workspace prompt sections and framework orientation.
         """
+        stable = self.build_stable_prompt(
+            enabled_builtins, channel_logging_enabled=channel_logging_enabled
+        )
+        volatile = self.build_volatile_context(current_datetime)
+        return "\n\n".join(part for part in (stable, volatile) if part)
+
+    def build_stable_prompt(
+        self,
+        enabled_builtins: list[str] | None = None,
+        channel_logging_enabled: bool = False,
+    ) -> str:
+        """Build the part of the system prompt that only changes on rebuild.
+
+        Contains soul, agent, user and framework sections. Nothing in here may
+        depend on wall-clock time or workspace contents, otherwise the provider
+        prompt cache prefix is invalidated on every turn.
+
+        Args:
+            enabled_builtins: List of enabled builtin names, or None to include all.
+            channel_logging_enabled: Whether persistent channel logging is active.
+
+        Returns:
+            Stable system prompt prefix.
+        """
         sections = []
 
         if self.soul_md:
@@ -112,13 +138,29 @@ class AgentWorkspace:
         if self.user_md:
             sections.append(f"<user>\n{self.user_md.strip()}\n</user>")
 
-        # Framework orientation comes before heartbeat
         framework_context = self._build_framework_context(
             enabled_builtins, channel_logging_enabled=channel_logging_enabled
         )
         if framework_context:
             sections.append(f"<framework>\n{framework_context}\n</framework>")
 
+        return "\n\n".join(sections)
+
+    def build_volatile_context(self, current_datetime: str | None = None) -> str:
+        """Build the per-turn suffix of the system prompt.
+
+        Holds the sections that change between turns: the current date/time,
+        the heartbeat checklist (editable by the agent) and the top-level
+        workspace listing.
+
+        Args:
+            current_datetime: Current date/time string to inject, if any.
+
+        Returns:
+            Volatile system prompt suffix.
+        """
+        sections = []
+
         # Workspace context — tells the agent its workspace name and top-level contents
         workspace_context = self._build_workspace_context()
         sections.append(f"<workspace_context>\n{workspace_context}\n</workspace_context>")
@@ -10,7 +10,7 @@ openpaw.core.config.models. Only the pure DynamicCronTask dataclass belongs here
 
 from openpaw.model.cron import DynamicCronTask
 from openpaw.model.message import Attachment, Message, MessageDirection
-from openpaw.model.session import SessionState
+from openpaw.model.session import PreparedCompaction, SessionState
 from openpaw.model.subagent import SubAgentRequest, SubAgentResult, SubAgentStatus
 from openpaw.model.task import Task, TaskPriority, TaskStatus, TaskType
 
@@ -25,6 +25,7 @@ __all__ = [
     "TaskStatus",
     "TaskType",
     # Session
+    "PreparedCompaction",
     "SessionState",
     # Sub-agent
     "SubAgentRequest",
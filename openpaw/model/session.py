@@ -14,12 +14,19 @@ class SessionState:
         started_at: When this conversation began.
         message_count: Number of messages in this conversation.
         last_active_at: Last time a message was sent in this conversation.
+        context_tokens: Running tally of the conversation's context size in tokens,
+            taken from the usage metadata of the latest agent run. None until
+            the first run or full recount.
+        runs_since_recount: Runs recorded since the tally was last corrected
+            by a full recount of the checkpointed messages.
     """
 
     conversation_id: str
     started_at: datetime
     message_count: int = 0
     last_active_at: datetime | None = None
+    context_tokens: int | None = None
+    runs_since_recount: int = 0
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary with ISO 8601 datetime strings.
@@ -32,6 +39,8 @@ class SessionState:
             "started_at": self.started_at.isoformat(),
             "message_count": self.message_count,
             "last_active_at": self.last_active_at.isoformat() if self.last_active_at else None,
+            "context_tokens": self.context_tokens,
+            "runs_since_recount": self.runs_since_recount,
         }
 
     @classmethod
@@ -49,4 +58,34 @@ class SessionState:
             started_at=datetime.fromisoformat(data["started_at"]),
             message_count=data.get("message_count", 0),
             last_active_at=datetime.fromisoformat(data["last_active_at"]) if data.get("last_active_at") else None,
+            context_tokens=data.get("context_tokens"),
+            runs_since_recount=data.get("runs_since_recount", 0),
         )
+
+
+@dataclass
+class PreparedCompaction:
+    """A conversation summary prepared ahead of an auto-compact swap.
+
+    Attributes:
+        thread_id: Thread the summary was generated from.
+        summary: Summary text injected into the next conversation.
+        message_count: Number of messages from the start of the thread the
+            summary covers.
+        last_message_id: ID of the last covered message. The summary is
+            stale once the thread no longer ends with it.
+        prepared_at: When the summary was generated.
+        duration_ms: How long generating the summary took.
+    """
+
+    thread_id: str
+    summary: str
+    message_count: int
+    last_message_id: str | None
+    prepared_at: datetime
+    duration_ms: float = 0.0
+
+    def covers(self, messages: list[Any]) -> bool:
+        """Whether the summary covers the first ``message_count`` of ``messages``."""
+        count = self.message_count
+        return 0 < count <= len(messages) and messages[count - 1].id == self.last_message_id
@@ -6,7 +6,7 @@ This package provides orchestration, scheduling, queueing, and session managemen
 # Note: OpenPawOrchestrator not imported here to avoid circular dependency
 # Import it directly: from openpaw.runtime.orchestrator import OpenPawOrchestrator
 
-from openpaw.runtime.queue.lane import Lane, LaneQueue, QueueItem, QueueMode
+from openpaw.runtime.queue.lane import Lane, LaneBuffer, LaneQueue, QueueItem, QueueMode
 from openpaw.runtime.queue.manager import QueueManager, SessionQueue
 from openpaw.runtime.scheduling.cron import CronScheduler
 from openpaw.runtime.scheduling.heartbeat import HeartbeatScheduler
@@ -17,6 +17,7 @@ from openpaw.runtime.session.manager import SessionManager
 __all__ = [
     # OpenPawOrchestrator deliberately excluded - import directly from .orchestrator
     "Lane",
+    "LaneBuffer",
     "LaneQueue",
     "QueueItem",
     "QueueMode",
@@ -3,7 +3,23 @@
 Provides lane-based queueing and message management.
 """
 
-from openpaw.runtime.queue.lane import Lane, LaneQueue, QueueItem, QueueMode
+from openpaw.runtime.queue.budget import BudgetAction, TokenBudget, TokenBudgetExceededError
+from openpaw.runtime.queue.debounce import AdaptiveDebounce
+from openpaw.runtime.queue.lane import Lane, LaneBuffer, LaneQueue, QueueItem, QueueMode
 from openpaw.runtime.queue.manager import QueueManager, SessionQueue
+from openpaw.runtime.queue.priority import PriorityPolicy
 
-__all__ = ["Lane", "LaneQueue", "QueueItem", "QueueMode", "QueueManager", "SessionQueue"]
+__all__ = [
+    "AdaptiveDebounce",
+    "BudgetAction",
+    "Lane",
+    "LaneBuffer",
+    "LaneQueue",
+    "PriorityPolicy",
+    "QueueItem",
+    "QueueMode",
+    "QueueManager",
+    "SessionQueue",
+    "TokenBudget",
+    "TokenBudgetExceededError",
+]
@@ -0,0 +1,290 @@
+"""Per-workspace token budgets checked when work is admitted to a lane."""
+
+import contextvars
+import json
+import logging
+import threading
+import time
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+from pathlib import Path
+from typing import Any
+
+from openpaw.core.config.models import TokenBudgetConfig, TokenBudgetLimit
+
+logger = logging.getLogger(__name__)
+
+# Scope of the workspace-wide limits in stats (invocation types use their name)
+WORKSPACE_SCOPE = "workspace"
+
+HOUR_SECONDS = 3600.0
+DAY_SECONDS = 86400.0
+
+# Time buckets per rolling window; usage expires one bucket at a time
+WINDOW_BUCKETS = 60
+
+# Strictest action wins when several limits are exceeded at once
+_SEVERITY = {"downgrade": 1, "defer": 2, "reject": 3}
+
+
+class BudgetAction(Enum):
+    """What to do with work when it is admitted to a lane."""
+
+    ADMIT = "admit"
+    DEFER = "defer"
+    DOWNGRADE = "downgrade"
+    REJECT = "reject"
+
+
+class TokenBudgetExceededError(Exception):
+    """Raised to a lane slot caller whose work was rejected by the token budget."""
+
+
+@dataclass
+class BudgetDecision:
+    """Outcome of a budget check.
+
+    Attributes:
+        action: Admit, defer, downgrade or reject the work.
+        reason: Exceeded limit, e.g. ``cron tokens/hour`` (empty when admitted).
+        retry_after: Seconds until the exceeded windows have room again.
+    """
+
+    action: BudgetAction
+    reason: str = ""
+    retry_after: float = 0.0
+
+
+class _RollingWindow:
+    """Token total over a sliding time window, kept in fixed-size buckets.
+
+    Usage is added to the newest bucket and expires a whole bucket at a time,
+    so the running total is exact to within one bucket and updates in
+    constant amortized time.
+    """
+
+    def __init__(self, seconds: float) -> None:
+        self.seconds = seconds
+        self._bucket_seconds = seconds / WINDOW_BUCKETS
+        self._buckets: deque[list[float]] = deque()  # [bucket start, tokens]
+        self._total = 0.0
+
+    def _expire(self, now: float) -> None:
+        while self._buckets and self._buckets[0][0] + self.seconds <= now:
+            self._total -= self._buckets.popleft()[1]
+
+    def add(self, tokens: int, at: float) -> None:
+        start = at - at % self._bucket_seconds
+        if self._buckets and start <= self._buckets[-1][0]:
+            self._buckets[-1][1] += tokens
+        else:
+            self._buckets.append([start, float(tokens)])
+        self._total += tokens
+
+    def usage(self, now: float) -> int:
+        """Tokens used within the window ending at ``now``."""
+        self._expire(now)
+        return round(self._total)
+
+    def seconds_until_below(self, limit: int, now: float) -> float:
+        """Seconds until usage drops below ``limit`` as old buckets expire."""
+        self._expire(now)
+        remaining = self._total
+        wait = 0.0
+        for start, tokens in self._buckets:
+            if remaining < limit:
+                break
+            remaining -= tokens
+            wait = start + self.seconds - now
+        return max(wait, 0.0)
+
+
+class _Usage:
+    """Hourly and daily usage of one scope."""
+
+    def __init__(self) -> None:
+        self.hour = _RollingWindow(HOUR_SECONDS)
+        self.day = _RollingWindow(DAY_SECONDS)
+
+    def add(self, tokens: int, at: float) -> None:
+        self.hour.add(tokens, at)
+        self.day.add(tokens, at)
+
+
+class TokenBudget:
+    """Running token totals of a workspace, checked against its budgets.
+
+    Usage is recorded as invocations finish (see ``TokenUsageLogger``) into
+    rolling hour and day windows, per invocation type and for the workspace
+    as a whole, so checks never rescan ``token_usage.jsonl``. The log is read
+    once at startup by ``load()`` so a restart does not reset the budgets.
+    The lane queue checks the budget of each item before dispatching it.
+    """
+
+    def __init__(self, config: TokenBudgetConfig) -> None:
+        self._config = config
+        self._usage: dict[str, _Usage] = {WORKSPACE_SCOPE: _Usage()}
+        self._counts = {action: 0 for action in (BudgetAction.DEFER, BudgetAction.DOWNGRADE, BudgetAction.REJECT)}
+        self._lock = threading.Lock()
+
+    @property
+    def config(self) -> TokenBudgetConfig:
+        """The budgets being enforced."""
+        return self._config
+
+    def _scope(self, name: str) -> _Usage:
+        usage = self._usage.get(name)
+        if usage is None:
+            usage = self._usage[name] = _Usage()
+        return usage
+
+    def record(self, invocation_type: str, tokens: int, at: float | None = None) -> None:
+        """Add the tokens of a finished invocation to the running totals.
+
+        Args:
+            invocation_type: Type the invocation was logged under.
+            tokens: Total tokens the invocation used.
+            at: Wall-clock time of the usage (default: now).
+        """
+        if tokens <= 0:
+            return
+        at = time.time() if at is None else at
+        with self._lock:
+            self._usage[WORKSPACE_SCOPE].add(tokens, at)
+            self._scope(invocation_type).add(tokens, at)
+
+    def load(self, log_path: Path) -> int:
+        """Seed the running totals from the last day of a token usage log.
+
+        Args:
+            log_path: Path of the workspace's token_usage.jsonl.
+
+        Returns:
+            Number of entries loaded.
+        """
+        if not log_path.exists():
+            return 0
+        since = time.time() - DAY_SECONDS
+        loaded = 0
+        try:
+            with open(log_path) as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        entry = json.loads(line)
+                        at = datetime.fromisoformat(entry["timestamp"]).timestamp()
+                    except (json.JSONDecodeError, KeyError, ValueError):
+                        continue
+                    if at >= since:
+                        self.record(entry.get("invocation_type", "user"), entry.get("total_tokens", 0), at)
+                        loaded += 1
+        except OSError as e:
+            logger.warning(f"Failed to load token usage for budgets: {e}")
+        return loaded
+
+    def _workspace_limit(self) -> TokenBudgetLimit:
+        """Workspace-wide limits, across all invocation types."""
+        return TokenBudgetLimit(
+            tokens_per_hour=self._config.tokens_per_hour, tokens_per_day=self._config.tokens_per_day
+        )
+
+    def _limits(self, invocation_type: str) -> list[tuple[str, TokenBudgetLimit, str]]:
+        """Limits that apply to an invocation type, with their scope and policy."""
+        config = self._config
+        limits: list[tuple[str, TokenBudgetLimit, str]] = [(WORKSPACE_SCOPE, self._workspace_limit(), config.policy)]
+        type_limit = config.invocation_types.get(invocation_type)
+        if type_limit is not None:
+            limits.append((invocation_type, type_limit, type_limit.policy or config.policy))
+        return limits
+
+    def check(self, invocation_type: str) -> BudgetDecision:
+        """Decide how to admit work of an invocation type.
+
+        Args:
+            invocation_type: ``user``, ``cron``, ``heartbeat``, ``subagent``, ...
+
+        Returns:
+            ADMIT when every applicable limit has room, otherwise the
+            strictest policy among the exceeded limits.
+        """
+        if not self._config.enabled:
+            return BudgetDecision(BudgetAction.ADMIT)
+        now = time.time()
+        worst: BudgetDecision | None = None
+        with self._lock:
+            for scope, limit, policy in self._limits(invocation_type):
+                usage = self._scope(scope)
+                for window, value, unit in (
+                    (usage.hour, limit.tokens_per_hour, "hour"),
+                    (usage.day, limit.tokens_per_day, "day"),
+                ):
+                    if value is None or window.usage(now) < value:
+                        continue
+                    decision = BudgetDecision(
+                        action=BudgetAction(policy),
+                        reason=f"{scope} tokens/{unit}",
+                        retry_after=window.seconds_until_below(value, now),
+                    )
+                    if worst is None or _SEVERITY[policy] > _SEVERITY[worst.action.value]:
+                        worst = decision
+                    elif decision.action is worst.action:
+                        worst.retry_after = max(worst.retry_after, decision.retry_after)
+        return worst or BudgetDecision(BudgetAction.ADMIT)
+
+    def count(self, action: BudgetAction) -> None:
+        """Count work that was deferred, downgraded or rejected."""
+        with self._lock:
+            if action in self._counts:
+                self._counts[action] += 1
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get usage against limits and enforcement counts.
+
+        Returns:
+            Dictionary with ``scopes`` (scope -> hour, day, hour_limit,
+            day_limit) for the workspace and every invocation type with
+            limits, plus ``deferred``, ``downgraded`` and ``rejected`` counts.
+        """
+        now = time.time()
+        limits = {WORKSPACE_SCOPE: self._workspace_limit(), **self._config.invocation_types}
+        with self._lock:
+            scopes = {
+                scope: {
+                    "hour": self._scope(scope).hour.usage(now),
+                    "day": self._scope(scope).day.usage(now),
+                    "hour_limit": limit.tokens_per_hour,
+                    "day_limit": limit.tokens_per_day,
+                }
+                for scope, limit in limits.items()
+            }
+            return {
+                "scopes": scopes,
+                "deferred": self._counts[BudgetAction.DEFER],
+                "downgraded": self._counts[BudgetAction.DOWNGRADE],
+                "rejected": self._counts[BudgetAction.REJECT],
+            }
+
+
+# Set while work admitted with the downgrade policy runs; read by the agent's
+# model middleware
+_downgraded: contextvars.ContextVar[bool] = contextvars.ContextVar("openpaw_budget_downgraded", default=False)
+
+
+def budget_downgrade_active() -> bool:
+    """Whether the current work was admitted with the downgrade policy."""
+    return _downgraded.get()
+
+
+@contextmanager
+def budget_downgrade(active: bool = True) -> Iterator[None]:
+    """Run the block (and tasks it starts) on the workspace's downgrade model."""
+    token = _downgraded.set(active)
+    try:
+        yield
+    finally:
+        _downgraded.reset(token)
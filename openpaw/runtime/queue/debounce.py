@@ -0,0 +1,83 @@
+"""Adaptive per-session debounce for collected messages."""
+
+from dataclasses import dataclass
+
+
+@dataclass
+class ArrivalStats:
+    """Learned inter-arrival pattern of one session's messages.
+
+    Attributes:
+        last_arrival: Monotonic time of the most recent message.
+        gap_ms: Smoothed gap between consecutive messages of a burst, or None
+            until a burst has been observed.
+        gap_dev_ms: Smoothed mean deviation of ``gap_ms``.
+        burst_rate: Smoothed probability that a message is followed by another
+            within the burst window.
+    """
+
+    last_arrival: float | None = None
+    gap_ms: float | None = None
+    gap_dev_ms: float = 0.0
+    burst_rate: float = 0.5
+
+
+@dataclass
+class AdaptiveDebounce:
+    """Chooses a debounce delay per message from the session's arrival history.
+
+    Gaps are smoothed the way TCP estimates retransmission timeouts: the
+    session waits for its typical gap plus four deviations, so a fast typist
+    stays in one batch while a slow one is not held longer than needed.
+    Sessions that rarely send follow-ups (``burst_rate`` below
+    ``burst_threshold``) are flushed after ``min_ms``. The total time the
+    first buffered message waits is capped at ``max_ms``, which is also the
+    window for counting a message as part of a burst.
+
+    Attributes:
+        min_ms: Delay used when a burst is unlikely.
+        max_ms: Cap on added latency for a batch.
+        burst_threshold: Burst probability below which batches flush at
+            ``min_ms``.
+        smoothing: Weight of the newest observation in the moving averages.
+    """
+
+    min_ms: int = 0
+    max_ms: int = 3000
+    burst_threshold: float = 0.3
+    smoothing: float = 0.25
+
+    def observe(self, stats: ArrivalStats, now: float) -> None:
+        """Update a session's arrival statistics with a new message."""
+        if stats.last_arrival is not None:
+            gap_ms = (now - stats.last_arrival) * 1000
+            in_burst = gap_ms <= self.max_ms
+            stats.burst_rate += self.smoothing * (float(in_burst) - stats.burst_rate)
+            if in_burst:
+                if stats.gap_ms is None:
+                    stats.gap_ms = gap_ms
+                    stats.gap_dev_ms = gap_ms / 2
+                else:
+                    stats.gap_dev_ms += self.smoothing * (abs(gap_ms - stats.gap_ms) - stats.gap_dev_ms)
+                    stats.gap_ms += self.smoothing * (gap_ms - stats.gap_ms)
+        stats.last_arrival = now
+
+    def delay_ms(self, stats: ArrivalStats, default_ms: float, waited_ms: float) -> float:
+        """Debounce delay for the latest message of a batch.
+
+        Args:
+            stats: The session's arrival statistics (already updated).
+            default_ms: Delay to use before any burst has been observed.
+            waited_ms: How long the batch's first message has been buffered.
+
+        Returns:
+            Milliseconds to wait before flushing, never negative.
+        """
+        if stats.burst_rate < self.burst_threshold:
+            delay = float(self.min_ms)
+        elif stats.gap_ms is None:
+            delay = default_ms
+        else:
+            delay = stats.gap_ms + 4 * stats.gap_dev_ms
+        delay = max(float(self.min_ms), min(delay, float(self.max_ms)))
+        return max(0.0, min(delay, self.max_ms - waited_ms))
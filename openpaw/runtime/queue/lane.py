@@ -1,12 +1,34 @@
 """Lane-based queue system inspired by OpenClaw's architecture."""
 
 import asyncio
-from collections import deque
-from collections.abc import Callable, Coroutine
+import contextlib
+import heapq
+import logging
+import math
+import time
+from collections import OrderedDict, deque
+from collections.abc import AsyncIterator, Callable, Coroutine, Iterator
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
 
+from openpaw.runtime.queue.budget import BudgetAction, TokenBudget, TokenBudgetExceededError, budget_downgrade
+
+logger = logging.getLogger(__name__)
+
+# Recent queue-wait samples kept per session and per lane for percentiles
+WAIT_SAMPLES_PER_SESSION = 100
+WAIT_SAMPLES_PER_LANE = 1000
+
+# Lanes for scheduled and spawned work, as opposed to the interactive main lane
+BACKGROUND_LANES = ("subagent", "cron")
+
+# How often a paused background lane re-checks interactive wait time
+PAUSE_POLL_SECONDS = 0.5
+
+# How often a lane holding budget-deferred work re-checks the token budget
+BUDGET_POLL_SECONDS = 5.0
+
 
 class QueueMode(Enum):
     """Queue modes for handling inbound messages.
@@ -35,28 +57,268 @@ class QueueItem:
     mode: QueueMode = QueueMode.COLLECT
     priority: int = 0
     steer_eligible: bool = True
+    enqueued_at: float = field(default_factory=time.monotonic)
+    invocation_type: str = "user"
+    budget_action: BudgetAction = BudgetAction.ADMIT
+
+
+def channel_of(session_key: str) -> str:
+    """Fairness group of a session key: the channel prefix of ``channel:id``."""
+    return session_key.split(":", 1)[0]
+
+
+class LaneBuffer:
+    """Priority-ordered pending items with per-session and per-channel indexes.
+
+    Dispatch order is by effective priority, ``priority + aging_per_second *
+    seconds_waited``, with arrival order breaking ties. Because every item ages
+    at the same rate, the relative order of two items never changes over time,
+    so a plain heap keyed on ``aging_per_second * arrived_at - priority`` is
+    sufficient, and any low-priority item eventually overtakes newer
+    high-priority traffic (no starvation).
+
+    Items are heaped per channel (see ``channel_of``) so the lane's fair-share
+    dispatcher can pick the best item of a given channel. ``restart_session``
+    moves a session's remaining backlog to the back of its channel's order
+    once the session has been served, which gives round-robin between
+    equal-priority sessions instead of letting one session's old backlog win
+    every slot.
+
+    Iteration and indexing follow arrival order. The per-session index and
+    steer-eligible counters make session lookups and removals independent of
+    the total number of queued items, which keeps the steer/interrupt
+    middleware's per-tool-call checks cheap under heavy group traffic.
+    """
+
+    def __init__(self, aging_per_second: float = 0.0) -> None:
+        self.aging_per_second = aging_per_second
+        self._items: dict[int, QueueItem] = {}  # seq -> item, arrival order
+        self._seq_of: dict[int, int] = {}  # id(item) -> seq for buffered items
+        self._key_of: dict[int, tuple[float, float]] = {}  # seq -> current heap key
+        # channel -> heap of (rank, arrived_at, seq); removals and re-keys are lazy
+        self._heaps: dict[str, list[tuple[float, float, int]]] = {}
+        self._channel_counts: dict[str, int] = {}
+        self._next_seq = 0
+        self._by_session: dict[str, dict[int, QueueItem]] = {}
+        self._steer_eligible: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __bool__(self) -> bool:
+        return bool(self._items)
+
+    def __iter__(self) -> Iterator[QueueItem]:
+        return iter(list(self._items.values()))
+
+    def __getitem__(self, index: int) -> QueueItem:
+        items = list(self._items.values())
+        return items[index]
+
+    def _push(self, seq: int, item: QueueItem, arrived_at: float) -> None:
+        """Push a heap entry for an item; lower ranks dispatch first."""
+        key = (self.aging_per_second * arrived_at - item.priority, arrived_at)
+        self._key_of[seq] = key
+        heapq.heappush(self._heaps.setdefault(channel_of(item.session_key), []), (*key, seq))
+
+    def sort_key(self, item: QueueItem) -> tuple[float, float, int]:
+        """Current dispatch order key of a buffered item (lower runs first)."""
+        seq = self._seq_of[id(item)]
+        return (*self._key_of[seq], seq)
+
+    def _is_live(self, entry: tuple[float, float, int]) -> bool:
+        """Whether a heap entry still reflects a buffered item's current key."""
+        return self._key_of.get(entry[2]) == entry[:2]
+
+    def append(self, item: QueueItem) -> None:
+        """Add an item to the buffer."""
+        seq = self._next_seq
+        self._next_seq += 1
+        self._items[seq] = item
+        self._seq_of[id(item)] = seq
+        self._push(seq, item, item.enqueued_at)
+        channel = channel_of(item.session_key)
+        self._channel_counts[channel] = self._channel_counts.get(channel, 0) + 1
+        self._by_session.setdefault(item.session_key, {})[seq] = item
+        if item.steer_eligible:
+            self._steer_eligible[item.session_key] = self._steer_eligible.get(item.session_key, 0) + 1
+
+    def remove(self, item: QueueItem) -> None:
+        """Remove a specific item. Raises KeyError if it is not buffered."""
+        seq = self._seq_of.pop(id(item))
+        del self._items[seq]
+        del self._key_of[seq]
+        session_items = self._by_session[item.session_key]
+        del session_items[seq]
+        if not session_items:
+            del self._by_session[item.session_key]
+        if item.steer_eligible:
+            remaining = self._steer_eligible[item.session_key] - 1
+            if remaining:
+                self._steer_eligible[item.session_key] = remaining
+            else:
+                del self._steer_eligible[item.session_key]
+
+        channel = channel_of(item.session_key)
+        remaining = self._channel_counts[channel] - 1
+        if remaining:
+            self._channel_counts[channel] = remaining
+            self._compact(channel)
+        else:
+            del self._channel_counts[channel]
+            del self._heaps[channel]
+
+    def _compact(self, channel: str) -> None:
+        """Drop stale heap entries once they dominate a channel's heap."""
+        heap = self._heaps[channel]
+        if len(heap) > 2 * self._channel_counts[channel] + 64:
+            heap[:] = [entry for entry in heap if self._is_live(entry)]
+            heapq.heapify(heap)
+
+    def oldest_enqueued_at(self, exclude_sessions: set[str]) -> float | None:
+        """Enqueue time of the oldest item whose session is not excluded."""
+        for item in self._items.values():
+            if item.session_key not in exclude_sessions:
+                return item.enqueued_at
+        return None
+
+    def popleft(self) -> QueueItem:
+        """Remove and return the oldest item. Raises IndexError if empty."""
+        if not self._items:
+            raise IndexError("pop from an empty LaneBuffer")
+        item = next(iter(self._items.values()))
+        self.remove(item)
+        return item
+
+    def channels(self) -> list[str]:
+        """Channels that currently have buffered items."""
+        return list(self._channel_counts)
+
+    def peek_next(self, exclude_sessions: set[str], channel: str | None = None) -> QueueItem | None:
+        """Return the highest-priority item whose session is not excluded.
+
+        Does not remove the item. Entries for excluded sessions are set aside
+        and restored, so the cost is proportional to the number of skipped
+        items rather than the whole buffer.
+
+        Args:
+            exclude_sessions: Sessions whose items must be skipped.
+            channel: Restrict the search to one channel. When omitted, the
+                best item across all channels is returned.
+        """
+        if channel is not None:
+            entry = self._peek_channel(channel, exclude_sessions)
+            return self._items[entry[2]] if entry else None
+
+        best: tuple[float, float, int] | None = None
+        for name in self._channel_counts:
+            entry = self._peek_channel(name, exclude_sessions)
+            if entry is not None and (best is None or entry < best):
+                best = entry
+        return self._items[best[2]] if best else None
+
+    def _peek_channel(self, channel: str, exclude_sessions: set[str]) -> tuple[float, float, int] | None:
+        """Best live heap entry of one channel, skipping excluded sessions."""
+        heap = self._heaps.get(channel)
+        if not heap:
+            return None
+        skipped: list[tuple[float, float, int]] = []
+        found: tuple[float, float, int] | None = None
+        while heap:
+            entry = heap[0]
+            if not self._is_live(entry):
+                heapq.heappop(heap)  # removed or re-keyed since it was pushed
+                continue
+            if self._items[entry[2]].session_key in exclude_sessions:
+                skipped.append(heapq.heappop(heap))
+                continue
+            found = entry
+            break
+        for entry in skipped:
+            heapq.heappush(heap, entry)
+        return found
+
+    def restart_session(self, session_key: str, now: float | None = None) -> None:
+        """Re-rank a session's buffered items as if they arrived ``now``.
+
+        Called when the session is dispatched so its remaining backlog queues
+        behind sessions that have been waiting, rather than keeping the age it
+        accumulated while the session was already being served. Items never
+        move earlier than their real arrival. Queue-wait statistics still use
+        ``enqueued_at``.
+        """
+        session_items = self._by_session.get(session_key)
+        if not session_items:
+            return
+        now = time.monotonic() if now is None else now
+        for seq, item in session_items.items():
+            if now > self._key_of[seq][1]:
+                self._push(seq, item, now)
+        self._compact(channel_of(session_key))
+
+    def has_steer_eligible(self, session_key: str) -> bool:
+        """Whether a session has at least one steer-eligible item buffered."""
+        return session_key in self._steer_eligible
+
+    def pop_session(self, session_key: str) -> list[QueueItem]:
+        """Remove and return all items for a session in arrival order."""
+        session_items = list(self._by_session.get(session_key, {}).values())
+        for item in session_items:
+            self.remove(item)
+        return session_items
+
+    def session_count(self, session_key: str) -> int:
+        """Number of items buffered for a session."""
+        return len(self._by_session.get(session_key, {}))
+
+
+@dataclass
+class SlotGrant:
+    """Payload of a queue item that admits a caller into a lane (see ``LaneQueue.slot``)."""
+
+    granted: asyncio.Future[None]
+    released: asyncio.Event = field(default_factory=asyncio.Event)
 
 
 @dataclass
 class Lane:
     """A processing lane with configurable concurrency.
 
-    Each lane maintains a FIFO queue and tracks active tasks.
+    Each lane maintains a priority buffer (indexed by session and channel)
+    and tracks active tasks, the sessions and channels they belong to (for
+    fair sharing between channels), and queue-wait statistics.
     """
 
     name: str
     max_concurrency: int = 1
-    queue: deque[QueueItem] = field(default_factory=deque)
+    queue: LaneBuffer = field(default_factory=LaneBuffer)
+    channel_weights: dict[str, float] = field(default_factory=dict)
     active_count: int = 0
+    active_sessions: set[str] = field(default_factory=set)
+    active_channels: dict[str, int] = field(default_factory=dict)
+    dispatched_count: int = 0
+    total_wait_ms: float = 0.0
+    max_wait_ms: float = 0.0
+    recent_waits: deque[float] = field(default_factory=lambda: deque(maxlen=WAIT_SAMPLES_PER_LANE))
+    paused_since: float | None = None
+    pause_count: int = 0
+    paused_seconds: float = 0.0
+    budget_deferred: bool = False
+    session_waits: OrderedDict[str, deque[float]] = field(default_factory=OrderedDict)
     _lock: asyncio.Lock = field(default_factory=asyncio.Lock)
     _item_available: asyncio.Event = field(default_factory=asyncio.Event)
+    _tasks: set[asyncio.Task[None]] = field(default_factory=set)
 
     def __hash__(self) -> int:
         return hash(self.name)
 
+    def weight(self, channel: str) -> float:
+        """Fair-share weight of a channel (1.0 unless configured)."""
+        return self.channel_weights.get(channel, 1.0)
+
 
 class LaneQueue:
-    """Lane-aware FIFO queue that drains each lane with configurable concurrency.
+    """Lane-aware priority queue that drains each lane with configurable concurrency.
 
     Architecture based on OpenClaw:
     - Session-specific lanes (session:<key>) ensure one active run per session
@@ -69,6 +331,11 @@ class LaneQueue:
         main_concurrency: int = 4,
         subagent_concurrency: int = 8,
         cron_concurrency: int = 2,
+        max_session_locks: int = 1000,
+        aging_per_second: float = 0.1,
+        channel_weights: dict[str, float] | None = None,
+        background_pause_wait_ms: float | None = None,
+        token_budget: TokenBudget | None = None,
     ):
         """Initialize the lane queue system.
 
@@ -76,27 +343,89 @@ class LaneQueue:
             main_concurrency: Max concurrent tasks in main lane.
             subagent_concurrency: Max concurrent tasks in subagent lane.
             cron_concurrency: Max concurrent tasks in cron lane.
+            max_session_locks: Soft cap on cached per-session locks. Unused
+                locks are evicted least-recently-used first beyond this. Also
+                bounds the number of sessions with tracked wait samples.
+            aging_per_second: Priority points a queued item gains per second
+                of waiting, so low-priority work is never starved.
+            channel_weights: Relative share of each lane's concurrency per
+                channel (channel name -> weight, default 1.0).
+            background_pause_wait_ms: Hold background lanes (subagent, cron)
+                while a runnable main-lane item has waited longer than this.
+                None disables pausing.
+            token_budget: Workspace token budget checked before each item
+                is dispatched. Over-budget items are held in the queue,
+                dispatched for the downgrade model, or dispatched as
+                rejected, according to the budget's policy.
         """
+        self._aging_per_second = aging_per_second
+        self._channel_weights = dict(channel_weights or {})
+        self._background_pause_wait_ms = background_pause_wait_ms
+        self.token_budget = token_budget
         self._lanes: dict[str, Lane] = {
-            "main": Lane("main", main_concurrency),
-            "subagent": Lane("subagent", subagent_concurrency),
-            "cron": Lane("cron", cron_concurrency),
+            "main": self._new_lane("main", main_concurrency),
+            "subagent": self._new_lane("subagent", subagent_concurrency),
+            "cron": self._new_lane("cron", cron_concurrency),
         }
-        self._session_locks: dict[str, asyncio.Lock] = {}
+        # LRU order: least recently used first
+        self._session_locks: OrderedDict[str, asyncio.Lock] = OrderedDict()
+        self._max_session_locks = max_session_locks
+        self._evicted_locks = 0
         self._global_lock = asyncio.Lock()
 
     def get_lane(self, name: str) -> Lane:
         """Get or create a lane by name."""
         if name not in self._lanes:
-            self._lanes[name] = Lane(name, max_concurrency=1)
+            self._lanes[name] = self._new_lane(name, max_concurrency=1)
         return self._lanes[name]
 
+    def _new_lane(self, name: str, max_concurrency: int) -> Lane:
+        """Create a lane using this queue's aging rate and channel weights."""
+        return Lane(
+            name,
+            max_concurrency,
+            queue=LaneBuffer(self._aging_per_second),
+            channel_weights=self._channel_weights,
+        )
+
     async def get_session_lock(self, session_key: str) -> asyncio.Lock:
         """Get or create a lock for a specific session."""
         async with self._global_lock:
-            if session_key not in self._session_locks:
-                self._session_locks[session_key] = asyncio.Lock()
-            return self._session_locks[session_key]
+            lock = self._session_locks.get(session_key)
+            if lock is not None:
+                self._session_locks.move_to_end(session_key)
+                return lock
+
+            lock = asyncio.Lock()
+            self._session_locks[session_key] = lock
+            self._evict_session_locks(keep=session_key)
+            return lock
+
+    def _session_in_use(self, session_key: str) -> bool:
+        """Whether any lane has an active run or queued item for a session."""
+        return any(
+            session_key in lane.active_sessions or lane.queue.session_count(session_key)
+            for lane in self._lanes.values()
+        )
+
+    def _evict_session_locks(self, keep: str) -> None:
+        """Drop least recently used locks beyond the cap.
+
+        Must be called with the global lock held. Held locks and locks for
+        sessions with active or queued lane work are never evicted, so
+        per-session serialization is preserved.
+        """
+        for key, lock in list(self._session_locks.items()):
+            if len(self._session_locks) <= self._max_session_locks:
+                break
+            if key == keep or lock.locked() or self._session_in_use(key):
+                continue
+            del self._session_locks[key]
+            self._evicted_locks += 1
+
+    def get_lock_stats(self) -> dict[str, int]:
+        """Get live and evicted counts for cached session locks."""
+        return {"live": len(self._session_locks), "evicted": self._evicted_locks}
 
     async def enqueue(
         self,
@@ -121,7 +450,13 @@ class LaneQueue:
     ) -> None:
         """Process items from a lane using the provided handler.
 
-        Respects concurrency limits and session serialization.
+        Dispatches up to ``max_concurrency`` handlers as concurrent tasks.
+        Items for the same session run one at a time (guarded by the session
+        lock), but a busy session never blocks other sessions queued behind it.
+        Each channel is held to its weighted share of the slots while other
+        channels are waiting, so one busy channel cannot monopolize the lane.
+
+        Cancelling this coroutine cancels all in-flight handlers.
 
         Args:
             lane_name: Which lane to process.
@@ -129,37 +464,270 @@ class LaneQueue:
         """
         lane = self.get_lane(lane_name)
 
-        while True:
-            item: QueueItem | None = None
-
-            async with lane._lock:
-                if lane.queue and lane.active_count < lane.max_concurrency:
-                    item = lane.queue.popleft()
-                    lane.active_count += 1
-
-                # Clear event if queue is now empty (after potentially dequeuing)
-                if not lane.queue:
+        try:
+            while True:
+                async with lane._lock:
+                    # Clear before checking so a concurrent enqueue/completion re-arms it
                     lane._item_available.clear()
+                    item = self._pop_dispatchable(lane)
+
+                if item is None:
+                    # Wait for a new item, a free slot, or a released session.
+                    # A paused lane also polls, since the main lane draining
+                    # does not signal it, and so does a lane holding work
+                    # deferred until the token budget has room.
+                    if lane.paused_since is not None:
+                        poll: float | None = PAUSE_POLL_SECONDS
+                    elif lane.budget_deferred:
+                        poll = BUDGET_POLL_SECONDS
+                    else:
+                        poll = None
+                    with contextlib.suppress(TimeoutError):
+                        async with asyncio.timeout(poll):
+                            await lane._item_available.wait()
+                    continue
+
+                task = asyncio.create_task(self._run_item(lane, item, handler))
+                lane._tasks.add(task)
+                task.add_done_callback(lane._tasks.discard)
+        finally:
+            for task in list(lane._tasks):
+                task.cancel()
+
+    def _pop_dispatchable(self, lane: Lane) -> QueueItem | None:
+        """Remove and return the next item to run, or None.
+
+        Must be called with the lane lock held. Each channel's candidate is
+        its highest-ranked item from a free session (a busy session never
+        causes head-of-line blocking) that the token budget admits. Channels
+        already at their fair share of the lane are passed over while other
+        channels have runnable work; among the rest, the best-ranked
+        candidate wins.
 
-            if item is None:
-                # Wait for signal that an item is available instead of polling
-                await lane._item_available.wait()
-                continue
+        Returns:
+            The dispatched item, or None if at capacity or nothing is runnable.
+        """
+        if lane.active_count >= lane.max_concurrency:
+            return None
+        if self._update_pause(lane) or not lane.queue:
+            return None
+
+        lane.budget_deferred = False
+        candidates: dict[str, QueueItem] = {}
+        for channel in lane.queue.channels():
+            item = self._peek_admitted(lane, channel)
+            if item is not None:
+                candidates[channel] = item
+        if not candidates:
+            return None
+
+        eligible = [item for channel, item in candidates.items() if self._below_fair_share(lane, channel)]
+        item = min(eligible or candidates.values(), key=lane.queue.sort_key)
+        if item.budget_action is not BudgetAction.ADMIT and self.token_budget is not None:
+            self.token_budget.count(item.budget_action)
+        lane.queue.remove(item)
+        lane.queue.restart_session(item.session_key)
+        lane.active_count += 1
+        lane.active_sessions.add(item.session_key)
+        channel = channel_of(item.session_key)
+        lane.active_channels[channel] = lane.active_channels.get(channel, 0) + 1
+        self._record_wait(lane, item)
+        return item
+
+    def _peek_admitted(self, lane: Lane, channel: str) -> QueueItem | None:
+        """Best item of a channel from a free session that the token budget admits.
+
+        Must be called with the lane lock held. A deferred item holds back
+        the rest of its session (preserving per-session order) but not other
+        sessions of the channel. Sets the item's ``budget_action``.
+        """
+        exclude = lane.active_sessions
+        while True:
+            item = lane.queue.peek_next(exclude_sessions=exclude, channel=channel)
+            if item is None or self.token_budget is None:
+                return item
+            decision = self.token_budget.check(item.invocation_type)
+            if decision.action is not BudgetAction.DEFER:
+                item.budget_action = decision.action
+                return item
+            if item.budget_action is not BudgetAction.DEFER:
+                item.budget_action = BudgetAction.DEFER
+                self.token_budget.count(BudgetAction.DEFER)
+                logger.info(
+                    f"Deferring {item.invocation_type} work for {item.session_key} in lane '{lane.name}': "
+                    f"{decision.reason} exhausted (room in ~{decision.retry_after:.0f}s)"
+                )
+            lane.budget_deferred = True
+            exclude = exclude | {item.session_key}
+
+    def interactive_wait_ms(self) -> float:
+        """How long the oldest runnable main-lane item has been waiting."""
+        main = self._lanes["main"]
+        oldest = main.queue.oldest_enqueued_at(exclude_sessions=main.active_sessions)
+        return (time.monotonic() - oldest) * 1000 if oldest is not None else 0.0
+
+    def _update_pause(self, lane: Lane) -> bool:
+        """Pause or resume a background lane based on interactive wait time.
+
+        Must be called with the lane lock held. A lane only pauses while it
+        has queued work. Returns True while paused.
+        """
+        if self._background_pause_wait_ms is None or lane.name not in BACKGROUND_LANES:
+            return False
+        now = time.monotonic()
+        if lane.queue and self.interactive_wait_ms() > self._background_pause_wait_ms:
+            if lane.paused_since is None:
+                lane.paused_since = now
+                lane.pause_count += 1
+                logger.info(f"Pausing lane '{lane.name}': interactive queue wait above threshold")
+            return True
+        if lane.paused_since is not None:
+            lane.paused_seconds += now - lane.paused_since
+            lane.paused_since = None
+            logger.info(f"Resuming lane '{lane.name}'")
+        return False
+
+    @staticmethod
+    def _below_fair_share(lane: Lane, channel: str) -> bool:
+        """Whether a channel has fewer active runs than its weighted share.
+
+        The share is the channel's weight over the total weight of channels
+        with queued or active work, times the lane's concurrency (rounded up,
+        at least one slot).
+        """
+        demand = set(lane.queue.channels()) | set(lane.active_channels)
+        total_weight = sum(lane.weight(name) for name in demand)
+        share = max(1, math.ceil(lane.max_concurrency * lane.weight(channel) / total_weight))
+        return lane.active_channels.get(channel, 0) < share
+
+    def _record_wait(self, lane: Lane, item: QueueItem) -> None:
+        """Accumulate queue-wait statistics for a dispatched item."""
+        wait_ms = (time.monotonic() - item.enqueued_at) * 1000
+        lane.dispatched_count += 1
+        lane.total_wait_ms += wait_ms
+        lane.max_wait_ms = max(lane.max_wait_ms, wait_ms)
+        lane.recent_waits.append(wait_ms)
+
+        samples = lane.session_waits.get(item.session_key)
+        if samples is None:
+            samples = deque(maxlen=WAIT_SAMPLES_PER_SESSION)
+            lane.session_waits[item.session_key] = samples
+            while len(lane.session_waits) > self._max_session_locks:
+                lane.session_waits.popitem(last=False)
+        else:
+            lane.session_waits.move_to_end(item.session_key)
+        samples.append(wait_ms)
+
+    async def _run_item(
+        self,
+        lane: Lane,
+        item: QueueItem,
+        handler: Callable[[QueueItem], Coroutine[Any, Any, Any]],
+    ) -> None:
+        """Run a single dispatched item under its session lock.
 
+        Items admitted with the downgrade policy run with the budget
+        downgrade flag set, so their model calls use the downgrade model.
+        """
+        try:
             session_lock = await self.get_session_lock(item.session_key)
-
-            try:
-                async with session_lock:
+            async with session_lock:
+                with budget_downgrade(item.budget_action is BudgetAction.DOWNGRADE):
                     await handler(item)
-            finally:
-                async with lane._lock:
-                    lane.active_count -= 1
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(
+                f"Lane '{lane.name}' handler failed for session {item.session_key}: {e}",
+                exc_info=True,
+            )
+        finally:
+            async with lane._lock:
+                lane.active_count -= 1
+                lane.active_sessions.discard(item.session_key)
+                channel = channel_of(item.session_key)
+                lane.active_channels[channel] -= 1
+                if not lane.active_channels[channel]:
+                    del lane.active_channels[channel]
+                # Wake the dispatcher: a slot and possibly a session just freed up
+                lane._item_available.set()
+
+    @contextlib.asynccontextmanager
+    async def slot(
+        self,
+        lane_name: str,
+        session_key: str,
+        priority: int = 0,
+        invocation_type: str = "user",
+    ) -> AsyncIterator[None]:
+        """Hold one of a lane's concurrency slots for the duration of the block.
+
+        The caller queues like any other item and is admitted by the lane's
+        dispatcher, so background work obeys the lane's cap, priority,
+        fair-share and pause rules while keeping its own control flow
+        (timeouts, cancellation, error handling). The lane must be drained
+        by ``process_slots()``.
+
+        Args:
+            lane_name: Lane to run in (typically ``subagent`` or ``cron``).
+            session_key: Serialization key; blocks with the same key run one
+                at a time.
+            priority: Dispatch priority within the lane.
+            invocation_type: Budget the work is checked against (e.g. ``cron``).
+
+        Raises:
+            TokenBudgetExceededError: The token budget rejected the work.
+        """
+        grant = SlotGrant(granted=asyncio.get_running_loop().create_future())
+        item = QueueItem(
+            session_key=session_key,
+            payload=grant,
+            priority=priority,
+            steer_eligible=False,
+            invocation_type=invocation_type,
+        )
+        await self.enqueue(item, lane_name)
+        try:
+            await grant.granted
+        except asyncio.CancelledError:
+            # Withdraw if still queued; otherwise free the slot we were given
+            lane = self.get_lane(lane_name)
+            async with lane._lock:
+                with contextlib.suppress(KeyError):
+                    lane.queue.remove(item)
+            grant.granted.cancel()
+            grant.released.set()
+            raise
+        try:
+            with budget_downgrade(item.budget_action is BudgetAction.DOWNGRADE):
+                yield
+        finally:
+            grant.released.set()
+
+    async def process_slots(self, lane_name: str) -> None:
+        """Drain a lane whose items are ``slot()`` admissions."""
+        await self.process(lane_name, self._grant_slot)
+
+    @staticmethod
+    async def _grant_slot(item: QueueItem) -> None:
+        """Admit a waiting ``slot()`` caller and hold the slot until it exits."""
+        grant: SlotGrant = item.payload
+        if grant.granted.done():
+            return  # Caller gave up while queued
+        if item.budget_action is BudgetAction.REJECT:
+            grant.granted.set_exception(
+                TokenBudgetExceededError(f"Token budget exhausted for {item.invocation_type} work")
+            )
+            return
+        grant.granted.set_result(None)
+        await grant.released.wait()
 
     async def peek_session_pending(self, session_key: str, lane_name: str = "main") -> bool:
         """Check if a session has steer-eligible pending items in a lane queue.
 
         Non-destructive check for use by steer/interrupt middleware.
         Only counts items with steer_eligible=True (excludes system events).
+        Constant-time via the lane's per-session steer-eligible counter.
 
         Args:
             session_key: Session to check for.
@@ -170,15 +738,13 @@ class LaneQueue:
         """
         lane = self.get_lane(lane_name)
         async with lane._lock:
-            return any(
-                item.session_key == session_key and item.steer_eligible
-                for item in lane.queue
-            )
+            return lane.queue.has_steer_eligible(session_key)
 
     async def consume_session_pending(self, session_key: str, lane_name: str = "main") -> list[QueueItem]:
         """Remove and return all pending items for a session from a lane queue.
 
-        Destructive operation for steer/interrupt middleware.
+        Destructive operation for steer/interrupt middleware. Cost scales with
+        the session's own pending items, not the whole lane.
 
         Args:
             session_key: Session to consume for.
@@ -189,25 +755,74 @@ class LaneQueue:
         """
         lane = self.get_lane(lane_name)
         async with lane._lock:
-            remaining = deque()
-            consumed = []
-            for item in lane.queue:
-                if item.session_key == session_key:
-                    consumed.append(item)
-                else:
-                    remaining.append(item)
-            lane.queue = remaining
-            if not lane.queue:
-                lane._item_available.clear()
-            return consumed
+            return lane.queue.pop_session(session_key)
 
     def get_stats(self) -> dict[str, dict[str, int]]:
-        """Get current queue statistics."""
-        return {
-            name: {
+        """Get current queue statistics.
+
+        Wait times are measured from enqueue to dispatch and reported in
+        whole milliseconds. Percentiles cover the most recent dispatches.
+        ``paused``/``pause_count``/``paused_ms`` describe background lanes
+        held back for interactive traffic.
+        """
+        now = time.monotonic()
+        stats: dict[str, dict[str, int]] = {}
+        for name, lane in self._lanes.items():
+            paused_seconds = lane.paused_seconds
+            if lane.paused_since is not None:
+                paused_seconds += now - lane.paused_since
+            stats[name] = {
                 "queued": len(lane.queue),
                 "active": lane.active_count,
                 "max_concurrency": lane.max_concurrency,
+                "dispatched": lane.dispatched_count,
+                "avg_wait_ms": round(lane.total_wait_ms / lane.dispatched_count) if lane.dispatched_count else 0,
+                "max_wait_ms": round(lane.max_wait_ms),
+                **_wait_percentiles(lane.recent_waits),
+                "paused": int(lane.paused_since is not None),
+                "pause_count": lane.pause_count,
+                "paused_ms": round(paused_seconds * 1000),
             }
-            for name, lane in self._lanes.items()
+        return stats
+
+    def get_session_wait_stats(
+        self,
+        lane_name: str = "main",
+        session_key: str | None = None,
+    ) -> dict[str, dict[str, int]]:
+        """Get recent queue-wait percentiles per session for a lane.
+
+        Args:
+            lane_name: Lane to report on (default: main).
+            session_key: Restrict the report to one session.
+
+        Returns:
+            Mapping of session key to ``samples``, ``p50_wait_ms``,
+            ``p95_wait_ms``, ``p99_wait_ms`` and ``max_wait_ms``.
+        """
+        lane = self.get_lane(lane_name)
+        if session_key is not None:
+            sessions = [session_key] if session_key in lane.session_waits else []
+        else:
+            sessions = list(lane.session_waits)
+        return {
+            key: {
+                "samples": len(lane.session_waits[key]),
+                **_wait_percentiles(lane.session_waits[key]),
+                "max_wait_ms": round(max(lane.session_waits[key])),
+            }
+            for key in sessions
         }
+
+
+def _wait_percentiles(samples: deque[float]) -> dict[str, int]:
+    """Nearest-rank p50/p95/p99 of wait samples in whole milliseconds."""
+    ordered = sorted(samples)
+    result: dict[str, int] = {}
+    for pct in (50, 95, 99):
+        if ordered:
+            index = max(0, math.ceil(pct / 100 * len(ordered)) - 1)
+            result[f"p{pct}_wait_ms"] = round(ordered[index])
+        else:
+            result[f"p{pct}_wait_ms"] = 0
+    return result
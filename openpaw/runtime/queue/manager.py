@@ -2,12 +2,15 @@
 
 import asyncio
 import logging
-from collections import deque
+import time
+from collections import OrderedDict, deque
 from collections.abc import Callable, Coroutine
 from dataclasses import dataclass, field
 from typing import Any
 
+from openpaw.runtime.queue.debounce import AdaptiveDebounce, ArrivalStats
 from openpaw.runtime.queue.lane import LaneQueue, QueueItem, QueueMode
+from openpaw.runtime.queue.priority import USER_INVOCATION, PriorityPolicy
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +25,11 @@ class SessionQueue:
     debounce_ms: int = 1000
     cap: int = 20
     drop_policy: str = "summarize"
+    last_active: float = field(default_factory=time.monotonic)
+    priority: int | None = None  # Highest priority among buffered messages
+    batch_started_at: float | None = None  # When the first buffered message arrived
+    arrivals: ArrivalStats = field(default_factory=ArrivalStats)
+    speculative_deadline: float | None = None  # End of the speculative batch's debounce window
     _debounce_task: asyncio.Task[None] | None = None
 
 
@@ -30,9 +38,12 @@ class QueueManager:
 
     Handles:
     - Per-session message collection and coalescing
-    - Debouncing for rapid message sequences
+    - Debouncing for rapid message sequences (fixed or adaptive per session)
     - Overflow policies (cap exceeded)
     - Delegation to lane queue for execution
+    - Bounded session state (LRU + idle eviction of quiescent sessions)
+    - Optional speculative start: the first message of an idle session is
+      flushed at once and the run restarts if more arrive within the window
     """
 
     def __init__(
@@ -42,6 +53,11 @@ class QueueManager:
         default_debounce_ms: int = 1000,
         default_cap: int = 20,
         default_drop_policy: str = "summarize",
+        max_sessions: int = 1000,
+        session_idle_seconds: float = 3600.0,
+        priority_policy: PriorityPolicy | None = None,
+        adaptive_debounce: AdaptiveDebounce | None = None,
+        speculative_start: bool = False,
     ):
         """Initialize the queue manager.
 
@@ -51,6 +67,18 @@ class QueueManager:
             default_debounce_ms: Default debounce delay.
             default_cap: Default max messages per session.
             default_drop_policy: Default overflow policy.
+            max_sessions: Soft cap on live SessionQueue entries. Least recently
+                used quiescent sessions are evicted beyond this.
+            session_idle_seconds: Quiescent sessions idle this long are evicted
+                even when under the cap.
+            priority_policy: Maps messages and system events to lane
+                priorities. Defaults to equal priority for everything (FIFO).
+            adaptive_debounce: Learns each session's inter-arrival pattern to
+                pick its debounce delay. When None, ``debounce_ms`` is fixed.
+            speculative_start: Flush the first collected message of an idle
+                session immediately instead of after the debounce delay. The
+                delay becomes a window in which further messages restart the
+                run with the coalesced input (see ``speculation_deadline``).
         """
         self.lane_queue = lane_queue
         self.default_mode = default_mode
@@ -58,8 +86,30 @@ class QueueManager:
         self.default_cap = default_cap
         self.default_drop_policy = default_drop_policy
 
-        self._sessions: dict[str, SessionQueue] = {}
+        self.priority_policy = priority_policy or PriorityPolicy()
+        self.adaptive_debounce = adaptive_debounce
+        self.max_sessions = max_sessions
+        self.session_idle_seconds = session_idle_seconds
+        self.speculative_start = speculative_start
+
+        # LRU order: least recently used first
+        self._sessions: OrderedDict[str, SessionQueue] = OrderedDict()
+        # /queue overrides survive eviction of the SessionQueue itself
+        self._mode_overrides: dict[str, QueueMode] = {}
+        self._evicted_sessions = 0
+        # Debounce outcomes: batches flushed, messages in them, added latency
+        self._debounce_flushes = 0
+        self._debounce_messages = 0
+        self._debounce_total_ms = 0.0
+        self._debounce_max_ms = 0.0
+        # Speculative starts: runs started early, restarted, and their cost/benefit
+        self._speculative_starts = 0
+        self._speculative_restarts = 0
+        self._speculative_wasted_tokens = 0
+        self._speculative_saved_ms = 0.0
         self._handlers: dict[str, Callable[[str, list[Any]], Coroutine[Any, Any, Any]]] = {}
+        # Set when a steer-eligible message arrives for a session being watched
+        self._arrival_events: dict[str, asyncio.Event] = {}
         self._lock = asyncio.Lock()
 
     async def register_handler(
@@ -76,17 +126,70 @@ class QueueManager:
         self._handlers[channel_name] = handler
 
     async def _get_or_create_session(self, session_key: str) -> SessionQueue:
-        """Get or create a session queue."""
+        """Get or create a session queue, marking it most recently used."""
         async with self._lock:
-            if session_key not in self._sessions:
-                self._sessions[session_key] = SessionQueue(
-                    session_key=session_key,
-                    mode=self.default_mode,
-                    debounce_ms=self.default_debounce_ms,
-                    cap=self.default_cap,
-                    drop_policy=self.default_drop_policy,
-                )
-            return self._sessions[session_key]
+            session = self._sessions.get(session_key)
+            if session is not None:
+                self._sessions.move_to_end(session_key)
+                session.last_active = time.monotonic()
+                return session
+
+            session = SessionQueue(
+                session_key=session_key,
+                mode=self._mode_overrides.get(session_key, self.default_mode),
+                debounce_ms=self.default_debounce_ms,
+                cap=self.default_cap,
+                drop_policy=self.default_drop_policy,
+            )
+            self._sessions[session_key] = session
+            self._evict_sessions(keep=session_key)
+            return session
+
+    def _is_evictable(self, session: SessionQueue) -> bool:
+        """Whether a session holds no state that would be lost on eviction.
+
+        Sessions with buffered messages, a live debounce task, an open
+        speculative window, or per-session config overrides are never
+        evicted. Mode overrides are safe because they are kept in the
+        ``_mode_overrides`` side table.
+        """
+        if session.messages:
+            return False
+        if session._debounce_task is not None and not session._debounce_task.done():
+            return False
+        if self._speculating(session, time.monotonic()):
+            return False
+        return (
+            session.debounce_ms == self.default_debounce_ms
+            and session.cap == self.default_cap
+            and session.drop_policy == self.default_drop_policy
+        )
+
+    def _evict_sessions(self, keep: str) -> None:
+        """Evict quiescent sessions that are over capacity or idle.
+
+        Must be called with ``self._lock`` held. Pops from the least recently
+        used end and stops at the first session that is neither over capacity
+        nor idle. Sessions that are still busy are moved to the most recently
+        used end instead, so each call only touches the sessions it evicts or
+        skips, plus one.
+
+        Args:
+            keep: Session key that must not be evicted (the one just created).
+        """
+        now = time.monotonic()
+        for _ in range(len(self._sessions)):
+            key, session = next(iter(self._sessions.items()))
+            over_capacity = len(self._sessions) > self.max_sessions
+            idle = now - session.last_active >= self.session_idle_seconds
+            if key == keep or (not over_capacity and not idle):
+                break
+            if not self._is_evictable(session):
+                self._sessions.move_to_end(key)
+                continue
+            del self._sessions[key]
+            self._evicted_sessions += 1
+            logger.debug(f"Evicted idle session queue: {key}")
 
     async def submit(
         self,
@@ -95,6 +198,7 @@ class QueueManager:
         message: Any,
         mode: QueueMode | None = None,
         steer_eligible: bool = True,
+        invocation_type: str = USER_INVOCATION,
     ) -> None:
         """Submit a message for processing.
 
@@ -105,6 +209,9 @@ class QueueManager:
             mode: Override queue mode for this message.
             steer_eligible: Whether this message can trigger steer/interrupt.
                 System events should pass False to avoid disrupting active runs.
+            invocation_type: ``user`` for user messages, otherwise the source of
+                a system event (e.g. ``subagent``, ``cron``). Used for priority
+                and the token budget check at lane admission.
         """
         # Non-steer-eligible items bypass session buffer and debounce
         if not steer_eligible:
@@ -112,46 +219,164 @@ class QueueManager:
                 session_key=session_key,
                 payload=(channel_name, [message]),
                 mode=QueueMode.COLLECT,
+                priority=self.priority_policy.resolve(
+                    channel_name, message, QueueMode.COLLECT, invocation_type
+                ),
                 steer_eligible=False,
+                invocation_type=invocation_type,
             )
             await self.lane_queue.enqueue(item, lane_name="main")
             return
 
         session = await self._get_or_create_session(session_key)
         effective_mode = mode or session.mode
+        priority = self.priority_policy.resolve(channel_name, message, effective_mode, invocation_type)
 
         if effective_mode == QueueMode.STEER:
-            await self._handle_steer(session_key, channel_name, message)
+            await self._handle_steer(session_key, channel_name, message, priority)
         elif effective_mode == QueueMode.INTERRUPT:
-            await self._handle_interrupt(session_key, channel_name, message)
+            await self._handle_interrupt(session_key, channel_name, message, priority)
         else:
-            await self._collect_message(session, channel_name, message)
+            await self._collect_message(session, channel_name, message, priority)
+
+        arrival = self._arrival_events.get(session_key)
+        if arrival is not None:
+            arrival.set()
 
-    async def _handle_steer(self, session_key: str, channel_name: str, message: Any) -> None:
+    async def _handle_steer(self, session_key: str, channel_name: str, message: Any, priority: int = 0) -> None:
         """Handle steer mode - immediate injection."""
         handler = self._handlers.get(channel_name)
         if handler:
-            item = QueueItem(session_key=session_key, payload=(channel_name, [message]), mode=QueueMode.STEER)
+            item = QueueItem(
+                session_key=session_key,
+                payload=(channel_name, [message]),
+                mode=QueueMode.STEER,
+                priority=priority,
+            )
             await self.lane_queue.enqueue(item, lane_name="main")
 
-    async def _handle_interrupt(self, session_key: str, channel_name: str, message: Any) -> None:
+    async def _handle_interrupt(self, session_key: str, channel_name: str, message: Any, priority: int = 0) -> None:
         """Handle interrupt mode - abort and execute newest."""
         handler = self._handlers.get(channel_name)
         if handler:
-            item = QueueItem(session_key=session_key, payload=(channel_name, [message]), mode=QueueMode.INTERRUPT)
+            item = QueueItem(
+                session_key=session_key,
+                payload=(channel_name, [message]),
+                mode=QueueMode.INTERRUPT,
+                priority=priority,
+            )
             await self.lane_queue.enqueue(item, lane_name="main")
 
-    async def _collect_message(self, session: SessionQueue, channel_name: str, message: Any) -> None:
+    async def _collect_message(
+        self, session: SessionQueue, channel_name: str, message: Any, priority: int = 0
+    ) -> None:
         """Collect message for coalescing."""
+        now = time.monotonic()
+        if self.speculative_start and session.mode == QueueMode.COLLECT:
+            if await self._start_speculative(session, channel_name, message, priority, now):
+                return
+
         if len(session.messages) >= session.cap:
             self._apply_drop_policy(session)
 
+        if not session.messages:
+            session.batch_started_at = now
         session.messages.append((channel_name, message))
+        session.priority = priority if session.priority is None else max(session.priority, priority)
 
         if session._debounce_task:
             session._debounce_task.cancel()
 
-        session._debounce_task = asyncio.create_task(self._debounce_flush(session))
+        delay_ms = self._debounce_delay_ms(session, now)
+        if self._speculating(session, now):
+            session.speculative_deadline = now + delay_ms / 1000.0
+        session._debounce_task = asyncio.create_task(self._debounce_flush(session, delay_ms))
+
+    async def _start_speculative(
+        self, session: SessionQueue, channel_name: str, message: Any, priority: int, now: float
+    ) -> bool:
+        """Flush the first message of an idle session without waiting for the debounce.
+
+        Messages arriving inside an open speculative window are buffered as
+        usual (extending the window), so the running batch can pick them up
+        when it restarts.
+
+        Returns:
+            True if the message was flushed without waiting for the debounce.
+        """
+        if session.messages or self._speculating(session, now):
+            return False
+
+        delay_ms = self._debounce_delay_ms(session, now)
+        if delay_ms > 0:
+            session.speculative_deadline = now + delay_ms / 1000.0
+            self._speculative_starts += 1
+        item = QueueItem(
+            session_key=session.session_key,
+            payload=(channel_name, [message]),
+            mode=session.mode,
+            priority=priority,
+        )
+        await self.lane_queue.enqueue(item, lane_name="main")
+        return True
+
+    @staticmethod
+    def _speculating(session: SessionQueue, now: float) -> bool:
+        """Whether the session's speculative window is still open."""
+        return session.speculative_deadline is not None and now < session.speculative_deadline
+
+    def speculation_deadline(self, session_key: str) -> float | None:
+        """End of the session's open speculative window, if any.
+
+        While the window is open, a run started from the speculative batch may
+        be cancelled and restarted with messages that arrive in it.
+
+        Args:
+            session_key: The session to check.
+
+        Returns:
+            Monotonic deadline, or None when no window is open.
+        """
+        session = self._sessions.get(session_key)
+        if session is None or not self._speculating(session, time.monotonic()):
+            return None
+        return session.speculative_deadline
+
+    def record_speculation(
+        self,
+        session_key: str,
+        run_started_at: float,
+        restarted: bool,
+        wasted_tokens: int = 0,
+    ) -> None:
+        """Record the outcome of a run started inside a speculative window.
+
+        Args:
+            session_key: The session whose speculative batch ran.
+            run_started_at: Monotonic time the run started.
+            restarted: True if the run was cancelled for newer messages;
+                False once it committed, which closes the window.
+            wasted_tokens: Tokens spent by a cancelled run.
+        """
+        if restarted:
+            self._speculative_restarts += 1
+            self._speculative_wasted_tokens += wasted_tokens
+            return
+
+        session = self._sessions.get(session_key)
+        if session is None or session.speculative_deadline is None:
+            return
+        # Without speculation the batch would have started at the deadline
+        self._speculative_saved_ms += max(session.speculative_deadline - run_started_at, 0.0) * 1000
+        session.speculative_deadline = None
+
+    def _debounce_delay_ms(self, session: SessionQueue, now: float) -> float:
+        """Delay before flushing a session's batch after its latest message."""
+        if self.adaptive_debounce is None:
+            return float(session.debounce_ms)
+        self.adaptive_debounce.observe(session.arrivals, now)
+        waited_ms = (now - session.batch_started_at) * 1000 if session.batch_started_at else 0.0
+        return self.adaptive_debounce.delay_ms(session.arrivals, session.debounce_ms, waited_ms)
 
     def _apply_drop_policy(self, session: SessionQueue) -> None:
         """Apply overflow policy when cap is exceeded."""
@@ -162,10 +387,10 @@ class QueueManager:
         elif session.drop_policy == "summarize":
             session.messages.popleft()
 
-    async def _debounce_flush(self, session: SessionQueue) -> None:
-        """Wait for debounce period then flush collected messages."""
+    async def _debounce_flush(self, session: SessionQueue, delay_ms: float) -> None:
+        """Wait for the debounce delay then flush collected messages."""
         try:
-            await asyncio.sleep(session.debounce_ms / 1000.0)
+            await asyncio.sleep(delay_ms / 1000.0)
             await self._flush_session(session)
         except asyncio.CancelledError:
             pass
@@ -175,6 +400,10 @@ class QueueManager:
         if not session.messages:
             return
 
+        priority = session.priority or 0
+        session.priority = None
+        self._record_flush(session)
+
         messages_by_channel: dict[str, list[Any]] = {}
         while session.messages:
             channel_name, msg = session.messages.popleft()
@@ -187,9 +416,19 @@ class QueueManager:
                 session_key=session.session_key,
                 payload=(channel_name, msgs),
                 mode=session.mode,
+                priority=priority,
             )
             await self.lane_queue.enqueue(item, lane_name="main")
 
+    def _record_flush(self, session: SessionQueue) -> None:
+        """Accumulate debounce statistics for a batch about to be flushed."""
+        added_ms = (time.monotonic() - session.batch_started_at) * 1000 if session.batch_started_at else 0.0
+        session.batch_started_at = None
+        self._debounce_flushes += 1
+        self._debounce_messages += len(session.messages)
+        self._debounce_total_ms += added_ms
+        self._debounce_max_ms = max(self._debounce_max_ms, added_ms)
+
     def get_handler(
         self, channel_name: str
     ) -> Callable[[str, list[Any]], Coroutine[Any, Any, Any]] | None:
@@ -212,13 +451,24 @@ class QueueManager:
         Returns:
             Current QueueMode for the session.
         """
-        session = await self._get_or_create_session(session_key)
-        return session.mode
+        async with self._lock:
+            session = self._sessions.get(session_key)
+            if session is not None:
+                return session.mode
+            return self._mode_overrides.get(session_key, self.default_mode)
 
     async def set_session_mode(self, session_key: str, mode: QueueMode) -> None:
-        """Update queue mode for a session."""
+        """Update queue mode for a session.
+
+        The override is also recorded in a side table so it survives
+        eviction of the session's queue state.
+        """
         session = await self._get_or_create_session(session_key)
         session.mode = mode
+        if mode == self.default_mode:
+            self._mode_overrides.pop(session_key, None)
+        else:
+            self._mode_overrides[session_key] = mode
 
     async def set_session_config(
         self,
@@ -263,6 +513,28 @@ class QueueManager:
         logger.debug(f"peek_pending: lane_queue has_pending={lane_pending} for {session_key}")
         return lane_pending
 
+    async def wait_pending(self, session_key: str) -> None:
+        """Wait until a session has steer-eligible pending messages.
+
+        Returns immediately when messages are already pending. Used to cancel
+        an in-flight run as soon as a message arrives in interrupt mode. Only
+        one waiter per session is supported, matching one active run per
+        session.
+
+        Args:
+            session_key: The session to watch.
+        """
+        arrival = self._arrival_events.setdefault(session_key, asyncio.Event())
+        try:
+            while True:
+                arrival.clear()
+                if await self.peek_pending(session_key):
+                    return
+                await arrival.wait()
+        finally:
+            if self._arrival_events.get(session_key) is arrival:
+                del self._arrival_events[session_key]
+
     async def consume_pending(self, session_key: str) -> list[Any]:
         """Remove and return all pending messages for a session.
 
@@ -292,6 +564,8 @@ class QueueManager:
 
                 messages.extend(list(session.messages))
                 session.messages.clear()
+                session.priority = None
+                session.batch_started_at = None
 
         # Drain lane queue for already-flushed items
         lane_items = await self.lane_queue.consume_session_pending(session_key)
@@ -308,3 +582,40 @@ class QueueManager:
                 messages.append(("unknown", item.payload))
 
         return messages
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get queue statistics: session state bounds, debounce and per-lane stats.
+
+        Returns:
+            Dict with ``sessions`` (live/evicted/mode_overrides counts),
+            ``debounce`` (batches flushed, messages coalesced into them and
+            the latency debouncing added), ``speculation`` (speculative
+            starts, restarts, tokens wasted on restarted runs and debounce
+            latency saved), ``session_locks`` (live/evicted counts), and
+            ``lanes``.
+        """
+        flushes = self._debounce_flushes
+        return {
+            "sessions": {
+                "live": len(self._sessions),
+                "evicted": self._evicted_sessions,
+                "mode_overrides": len(self._mode_overrides),
+            },
+            "debounce": {
+                "adaptive": self.adaptive_debounce is not None,
+                "flushes": flushes,
+                "messages": self._debounce_messages,
+                "coalesced": self._debounce_messages - flushes,
+                "avg_added_ms": round(self._debounce_total_ms / flushes) if flushes else 0,
+                "max_added_ms": round(self._debounce_max_ms),
+            },
+            "speculation": {
+                "enabled": self.speculative_start,
+                "starts": self._speculative_starts,
+                "restarts": self._speculative_restarts,
+                "wasted_tokens": self._speculative_wasted_tokens,
+                "saved_ms": round(self._speculative_saved_ms),
+            },
+            "session_locks": self.lane_queue.get_lock_stats(),
+            "lanes": self.lane_queue.get_stats(),
+        }
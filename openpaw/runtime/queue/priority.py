@@ -0,0 +1,70 @@
+"""Priority policy for lane queue items."""
+
+from dataclasses import dataclass, field
+from typing import Any
+
+from openpaw.core.utils import is_group_metadata
+from openpaw.runtime.queue.lane import QueueMode
+
+# Invocation type used for messages typed by users (as opposed to system events)
+USER_INVOCATION = "user"
+
+
+@dataclass
+class PriorityPolicy:
+    """Maps inbound messages and system events to lane queue priorities.
+
+    Higher values dispatch first. Lane aging guarantees that low-priority
+    items (bulk group traffic, system events) still run eventually.
+
+    Attributes:
+        direct_message: Priority for user messages in DMs.
+        group_message: Priority for user messages in groups/servers.
+        steer_boost: Added to user messages submitted in steer or interrupt mode.
+        system_event: Priority for injected system events without a specific
+            invocation-type override.
+        channels: Per-channel priority for user messages, overriding the
+            DM/group defaults (channel name -> priority).
+        invocation_types: Per-invocation-type priority for system events
+            (e.g. ``subagent``, ``cron``, ``heartbeat`` -> priority).
+    """
+
+    direct_message: int = 0
+    group_message: int = 0
+    steer_boost: int = 0
+    system_event: int = 0
+    channels: dict[str, int] = field(default_factory=dict)
+    invocation_types: dict[str, int] = field(default_factory=dict)
+
+    def resolve(
+        self,
+        channel_name: str,
+        message: Any,
+        mode: QueueMode,
+        invocation_type: str = USER_INVOCATION,
+    ) -> int:
+        """Compute the priority for a queued message.
+
+        Args:
+            channel_name: Channel the message belongs to.
+            message: The message payload (metadata is inspected when present).
+            mode: Effective queue mode for the message.
+            invocation_type: ``user`` for user messages, otherwise the source
+                of an injected system event.
+
+        Returns:
+            Integer priority (higher dispatches first).
+        """
+        if invocation_type != USER_INVOCATION:
+            return self.invocation_types.get(invocation_type, self.system_event)
+
+        if channel_name in self.channels:
+            priority = self.channels[channel_name]
+        elif is_group_metadata(getattr(message, "metadata", None)):
+            priority = self.group_message
+        else:
+            priority = self.direct_message
+
+        if mode in (QueueMode.STEER, QueueMode.INTERRUPT):
+            priority += self.steer_boost
+        return priority
@@ -1,8 +1,10 @@
 """APScheduler-based cron execution for OpenPaw."""
 
+import contextlib
 import logging
 import time as time_module
 from collections.abc import Awaitable, Callable, Mapping
+from contextlib import AbstractAsyncContextManager
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
@@ -24,6 +26,8 @@ from openpaw.core.prompts.system_events import (
     INJECTION_TRUNCATION_LIMIT,
 )
 from openpaw.model.cron import DynamicCronTask
+from openpaw.runtime.queue.budget import TokenBudgetExceededError
+from openpaw.runtime.queue.lane import LaneQueue
 from openpaw.runtime.scheduling.loader import CronLoader
 from openpaw.stores.cron import DynamicCronStore
 
@@ -37,6 +41,7 @@ class CronScheduler:
     - Run with fresh agent context (no checkpointer)
     - Inject the cron prompt as user message
     - Route response to configured channel/chat
+    - Run in the lane queue's ``cron`` lane when one is provided
     """
 
     def __init__(
@@ -49,6 +54,7 @@ class CronScheduler:
         timezone: str = "UTC",
         result_callback: Callable[[str, str], Awaitable[None]] | None = None,
         session_logger: SessionLogger | None = None,
+        lane_queue: LaneQueue | None = None,
     ):
         """Initialize the cron scheduler.
 
@@ -61,6 +67,8 @@ class CronScheduler:
             timezone: IANA timezone string for cron schedules (e.g., "America/New_York").
             result_callback: Optional callback for queue injection of results.
             session_logger: Optional SessionLogger for writing session logs.
+            lane_queue: Optional lane queue whose ``cron`` lane caps how many
+                jobs run at once. Without it, jobs run as soon as they fire.
         """
         self.workspace_path = Path(workspace_path)
         self.agent_factory = agent_factory
@@ -71,6 +79,7 @@ class CronScheduler:
         self._tz = ZoneInfo(timezone)
         self._result_callback = result_callback
         self._session_logger = session_logger
+        self._lane_queue = lane_queue
         self._scheduler: AsyncIOScheduler | None = None
         self._jobs: dict[str, Any] = {}
         self._dynamic_store = DynamicCronStore(workspace_path)
@@ -105,8 +114,26 @@ class CronScheduler:
             self._scheduler.shutdown(wait=True)
             logger.info("Cron scheduler stopped")
 
+    def _lane_slot(self, session_key: str) -> AbstractAsyncContextManager[Any]:
+        """Cron lane slot for one job run (no-op without a lane queue)."""
+        if self._lane_queue is None:
+            return contextlib.nullcontext()
+        return self._lane_queue.slot("cron", session_key, invocation_type="cron")
+
     async def _execute_cron(self, cron: CronDefinition) -> None:
-        """Execute a cron job.
+        """Execute a cron job once a cron lane slot is available.
+
+        Args:
+            cron: The cron definition to execute.
+        """
+        try:
+            async with self._lane_slot(f"cron:{cron.name}"):
+                await self._run_cron(cron)
+        except TokenBudgetExceededError as e:
+            logger.warning(f"Skipped cron job {cron.name}: {e}")
+
+    async def _run_cron(self, cron: CronDefinition) -> None:
+        """Run a cron job's agent and route its response.
 
         Args:
             cron: The cron definition to execute.
@@ -118,7 +145,8 @@ class CronScheduler:
             agent_runner = self.agent_factory()
 
             start_time = time_module.monotonic()
-            response = await agent_runner.run(message=cron.prompt)
+            result = await agent_runner.run(message=cron.prompt)
+            response = result.response
             duration_ms = (time_module.monotonic() - start_time) * 1000
 
             # Write session log
@@ -129,8 +157,8 @@ class CronScheduler:
                         name=cron.name,
                         prompt=cron.prompt,
                         response=response,
-                        tools_used=agent_runner.last_tools_used or [],
-                        metrics=agent_runner.last_metrics,
+                        tools_used=result.tools_used,
+                        metrics=result.metrics,
                         duration_ms=duration_ms,
                     )
                 except Exception as e:
@@ -172,9 +200,9 @@ class CronScheduler:
                     logger.warning(f"Failed to inject cron result for {cron.name}: {e}")
 
             # Log token usage for cron invocation
-            if self._token_logger and self._workspace_name and agent_runner.last_metrics:
+            if self._token_logger and self._workspace_name and result.metrics:
                 self._token_logger.log(
-                    metrics=agent_runner.last_metrics,
+                    metrics=result.metrics,
                     workspace=self._workspace_name,
                     invocation_type="cron",
                     session_key=None,
@@ -297,11 +325,23 @@ class CronScheduler:
         return False
 
     async def _execute_dynamic_task(self, task: DynamicCronTask) -> None:
-        """Execute a dynamic task.
+        """Execute a dynamic task once a cron lane slot is available.
 
         For one-shot tasks: remove after execution.
         For interval tasks: continue recurring.
 
+        Args:
+            task: DynamicCronTask to execute.
+        """
+        try:
+            async with self._lane_slot(f"cron:dynamic:{task.id}"):
+                await self._run_dynamic_task(task)
+        except TokenBudgetExceededError as e:
+            logger.warning(f"Skipped dynamic task {task.id}: {e}")
+
+    async def _run_dynamic_task(self, task: DynamicCronTask) -> None:
+        """Run a dynamic task's agent and route its response.
+
         Args:
             task: DynamicCronTask to execute.
         """
@@ -311,7 +351,8 @@ class CronScheduler:
         try:
             agent_runner = self.agent_factory()
             start_time = time_module.monotonic()
-            response = await agent_runner.run(message=task.prompt)
+            result = await agent_runner.run(message=task.prompt)
+            response = result.response
             duration_ms = (time_module.monotonic() - start_time) * 1000
 
             # Write session log (audit only, no delivery routing for dynamic tasks)
@@ -321,17 +362,17 @@ class CronScheduler:
                         name=f"dynamic_{task.id}",
                         prompt=task.prompt,
                         response=response,
-                        tools_used=agent_runner.last_tools_used or [],
-                        metrics=agent_runner.last_metrics,
+                        tools_used=result.tools_used,
+                        metrics=result.metrics,
                         duration_ms=duration_ms,
                     )
                 except Exception as e:
                     logger.warning(f"Failed to write session log for dynamic task {task.id}: {e}")
 
             # Log token usage for dynamic cron invocation
-            if self._token_logger and self._workspace_name and agent_runner.last_metrics:
+            if self._token_logger and self._workspace_name and result.metrics:
                 self._token_logger.log(
-                    metrics=agent_runner.last_metrics,
+                    metrics=result.metrics,
                     workspace=self._workspace_name,
                     invocation_type="cron",
                     session_key=None,
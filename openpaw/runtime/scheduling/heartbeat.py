@@ -1,5 +1,6 @@
 """HeartbeatScheduler for periodic agent task evaluation."""
 
+import contextlib
 import json
 import logging
 from collections.abc import Awaitable, Callable, Mapping
@@ -26,6 +27,8 @@ from openpaw.core.prompts.system_events import (
     INJECTION_TRUNCATION_LIMIT,
 )
 from openpaw.core.timezone import workspace_now
+from openpaw.runtime.queue.budget import TokenBudgetExceededError
+from openpaw.runtime.queue.lane import LaneQueue
 
 if TYPE_CHECKING:
     pass
@@ -52,6 +55,7 @@ class HeartbeatScheduler:
         token_logger: Any | None = None,
         result_callback: Callable[[str, str], Awaitable[None]] | None = None,
         session_logger: SessionLogger | None = None,
+        lane_queue: LaneQueue | None = None,
     ):
         """Initialize the heartbeat scheduler.
 
@@ -65,6 +69,8 @@ class HeartbeatScheduler:
             token_logger: Optional TokenUsageLogger for logging token metrics.
             result_callback: Optional callback for queue injection of results.
             session_logger: Optional SessionLogger for writing session logs.
+            lane_queue: Optional lane queue. Heartbeat agent runs take a slot
+                in its ``cron`` lane alongside scheduled jobs.
         """
         self.workspace_name = workspace_name
         self.workspace_path = workspace_path
@@ -75,6 +81,7 @@ class HeartbeatScheduler:
         self._token_logger = token_logger
         self._result_callback = result_callback
         self._session_logger = session_logger
+        self._lane_queue = lane_queue
         self._scheduler: AsyncIOScheduler | None = None
         self._job: Any = None
 
@@ -326,10 +333,14 @@ class HeartbeatScheduler:
             self._scheduler.shutdown(wait=True)
             logger.info(f"Heartbeat scheduler stopped for workspace: {self.workspace_name}")
 
+    def _lane_slot(self) -> contextlib.AbstractAsyncContextManager[Any]:
+        """Cron lane slot for one heartbeat run (no-op without a lane queue)."""
+        if self._lane_queue is None:
+            return contextlib.nullcontext()
+        return self._lane_queue.slot("cron", f"heartbeat:{self.workspace_name}", invocation_type="heartbeat")
+
     async def _run_heartbeat(self) -> None:
         """Execute a heartbeat check with pre-flight skip and event logging."""
-        import time as time_module
-
         # Check active hours
         if not self._is_within_active_hours():
             logger.debug(
@@ -347,22 +358,34 @@ class HeartbeatScheduler:
             self._record_heartbeat_event("skipped", reason=reason, task_count=0)
             return
 
+        try:
+            async with self._lane_slot():
+                await self._invoke_heartbeat(task_summary, task_count)
+        except TokenBudgetExceededError as e:
+            logger.warning(f"Heartbeat skipped for '{self.workspace_name}': {e}")
+            self._record_heartbeat_event("skipped", reason="token budget exhausted", task_count=task_count)
+
+    async def _invoke_heartbeat(self, task_summary: str | None, task_count: int) -> None:
+        """Run the heartbeat agent, route its response and record the outcome."""
+        import time as time_module
+
         logger.info(f"Running heartbeat check for workspace: {self.workspace_name}")
         start_time = time_module.monotonic()
 
         try:
             agent_runner = self.agent_factory()
             heartbeat_prompt = self._build_heartbeat_prompt(task_summary=task_summary)
-            response = await agent_runner.run(message=heartbeat_prompt)
+            result = await agent_runner.run(message=heartbeat_prompt)
+            response = result.response
             duration_ms = (time_module.monotonic() - start_time) * 1000
 
-            # Extract metrics and activity from agent runner
-            metrics = agent_runner.last_metrics
+            # Extract metrics and activity from the run
+            metrics = result.metrics
             input_tokens = metrics.input_tokens if metrics else None
             output_tokens = metrics.output_tokens if metrics else None
             total_tokens = metrics.total_tokens if metrics else None
             llm_calls = metrics.llm_calls if metrics else None
-            tools_used = agent_runner.last_tools_used or None
+            tools_used = result.tools_used or None
 
             # Write session log (for all outcomes - audit trail)
             session_path: str | None = None
@@ -372,8 +395,8 @@ class HeartbeatScheduler:
                         name="heartbeat",
                         prompt=heartbeat_prompt,
                         response=response,
-                        tools_used=agent_runner.last_tools_used or [],
-                        metrics=agent_runner.last_metrics,
+                        tools_used=result.tools_used,
+                        metrics=metrics,
                         duration_ms=duration_ms,
                     )
                 except Exception as e:
@@ -1,9 +1,10 @@
 """Session subsystem for OpenPaw.
 
-Provides session management and conversation archiving.
+Provides session management, conversation archiving and checkpoint retention.
 """
 
 from openpaw.runtime.session.archiver import ConversationArchive, ConversationArchiver
 from openpaw.runtime.session.manager import SessionManager
+from openpaw.runtime.session.retention import CheckpointRetention
 
-__all__ = ["ConversationArchive", "ConversationArchiver", "SessionManager"]
+__all__ = ["CheckpointRetention", "ConversationArchive", "ConversationArchiver", "SessionManager"]
@@ -354,6 +354,26 @@ class ConversationArchiver:
             encoding="utf-8"
         )
 
+    def get_archive(self, conversation_id: str) -> ConversationArchive | None:
+        """Load the metadata of one archived conversation.
+
+        Args:
+            conversation_id: Conversation ID the archive was written for.
+
+        Returns:
+            ConversationArchive, or None if there is no readable archive.
+        """
+        json_path = self._archive_dir / f"{conversation_id}.json"
+        if not json_path.exists():
+            return None
+        try:
+            with json_path.open("r", encoding="utf-8") as f:
+                data = json.load(f)
+            return ConversationArchive.from_json(data, self._workspace_path)
+        except Exception as e:
+            logger.error(f"Failed to load archive {json_path.name}: {e}")
+            return None
+
     def list_archives(self, limit: int = 50) -> list[ConversationArchive]:
         """List archived conversations, most recent first.
 
@@ -213,6 +213,36 @@ class SessionManager:
             else:
                 logger.warning(f"Attempted to increment message count for unknown session: {session_key}")
 
+    def record_context_tokens(
+        self,
+        session_key: str,
+        thread_id: str,
+        tokens: int | None,
+        recount: bool = False,
+    ) -> None:
+        """Update the running context token tally of a conversation.
+
+        Ignored when the session has rotated to another conversation since
+        ``thread_id`` was resolved, so a late run never overwrites the tally of
+        a fresh thread.
+
+        Args:
+            session_key: Session identifier.
+            thread_id: Thread the token count was measured on.
+            tokens: Context size in tokens, or None to invalidate the tally
+                (forces a full recount on the next check).
+            recount: Whether the count comes from a full recount of the
+                checkpointed messages (resets the drift counter).
+        """
+        with self._lock:
+            state = self._sessions.get(session_key)
+            if state is None or thread_id != f"{session_key}:{state.conversation_id}":
+                logger.debug(f"Skipping context tally for stale thread: {thread_id}")
+                return
+            state.context_tokens = tokens
+            state.runs_since_recount = 0 if recount else state.runs_since_recount + 1
+            self._save()
+
     def is_session_expired(self, session_key: str, ttl_minutes: int) -> bool:
         """Check if a session has exceeded its TTL based on last_active_at.
 
@@ -0,0 +1,145 @@
+"""Checkpoint retention for conversations.db.
+
+LangGraph keeps every checkpoint of every thread forever, including threads
+whose conversation was rotated by /new, /compact, auto-compact or the session
+TTL and already archived to memory/conversations/. A maintenance pass prunes
+old checkpoints of the remaining threads, deletes archived threads and gives
+the freed pages back to the filesystem.
+"""
+
+import logging
+import time
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+
+from openpaw.core.config.models import CheckpointRetentionConfig
+
+if TYPE_CHECKING:
+    from openpaw.runtime.session.archiver import ConversationArchiver
+    from openpaw.runtime.session.manager import SessionManager
+    from openpaw.stores.checkpoint import PooledSqliteSaver
+
+logger = logging.getLogger(__name__)
+
+
+class CheckpointRetention:
+    """Prunes and compacts the checkpoints of one workspace.
+
+    A thread is only deleted when it is no longer the active conversation of
+    any session and its archive was written after its last checkpoint, so a
+    conversation archived on shutdown and continued after a restart is kept.
+    """
+
+    def __init__(
+        self,
+        checkpointer: "PooledSqliteSaver",
+        session_manager: "SessionManager",
+        archiver: "ConversationArchiver | None",
+        config: CheckpointRetentionConfig,
+    ) -> None:
+        """Initialize checkpoint retention.
+
+        Args:
+            checkpointer: Checkpointer of conversations.db.
+            session_manager: Session manager, to tell active threads apart.
+            archiver: Conversation archiver, to find archived threads (None disables deletion).
+            config: Retention settings.
+        """
+        self._checkpointer = checkpointer
+        self._session_manager = session_manager
+        self._archiver = archiver
+        self._config = config
+        self._passes = 0
+        self._pruned_checkpoints = 0
+        self._deleted_threads = 0
+        self._reclaimed_bytes = 0
+        self._db_bytes = 0
+        self._last_pass_ms = 0
+
+    @property
+    def config(self) -> CheckpointRetentionConfig:
+        """Retention settings."""
+        return self._config
+
+    async def run(self) -> dict[str, int]:
+        """Run one maintenance pass.
+
+        Returns:
+            Dictionary with ``deleted_threads``, ``pruned_checkpoints``,
+            ``reclaimed_bytes`` and ``db_bytes`` of this pass.
+        """
+        start = time.monotonic()
+        deleted = await self._delete_archived_threads() if self._config.delete_archived else 0
+        pruned = await self._checkpointer.aprune_checkpoints(self._config.keep_checkpoints)
+        reclaimed = await self._checkpointer.avacuum() if self._config.vacuum else 0
+        db_bytes = await self._checkpointer.adatabase_size()
+
+        self._passes += 1
+        self._deleted_threads += deleted
+        self._pruned_checkpoints += pruned
+        self._reclaimed_bytes += reclaimed
+        self._db_bytes = db_bytes
+        self._last_pass_ms = round((time.monotonic() - start) * 1000)
+
+        if deleted or pruned or reclaimed:
+            logger.info(
+                f"Checkpoint retention: deleted {deleted} archived thread(s), pruned {pruned} checkpoint(s), "
+                f"reclaimed {reclaimed:,} bytes ({db_bytes:,} bytes left, {self._last_pass_ms}ms)"
+            )
+        return {
+            "deleted_threads": deleted,
+            "pruned_checkpoints": pruned,
+            "reclaimed_bytes": reclaimed,
+            "db_bytes": db_bytes,
+        }
+
+    async def _delete_archived_threads(self) -> int:
+        """Delete threads of rotated conversations that are safely archived."""
+        archiver = self._archiver
+        if archiver is None:
+            return 0
+        active = {
+            f"{session_key}:{state.conversation_id}"
+            for session_key, state in self._session_manager.list_sessions().items()
+        }
+        deleted = 0
+        for thread_id in await self._checkpointer.alist_thread_ids():
+            if thread_id in active or ":" not in thread_id:
+                continue
+            if await self._is_archived(archiver, thread_id):
+                await self._checkpointer.adelete_thread(thread_id)
+                deleted += 1
+        return deleted
+
+    async def _is_archived(self, archiver: "ConversationArchiver", thread_id: str) -> bool:
+        """Check the thread's archive exists and holds its latest checkpoint."""
+        session_key, conversation_id = thread_id.rsplit(":", 1)
+        archive = archiver.get_archive(conversation_id)
+        if archive is None or archive.session_key != session_key:
+            return False
+
+        checkpoint_tuple = await self._checkpointer.aget_tuple({"configurable": {"thread_id": thread_id}})
+        if checkpoint_tuple is None:
+            return True
+        try:
+            last_checkpoint_at = datetime.fromisoformat(checkpoint_tuple.checkpoint["ts"])
+        except (KeyError, TypeError, ValueError):
+            return False
+        return archive.ended_at >= last_checkpoint_at
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get retention statistics since startup.
+
+        Returns:
+            Dictionary with ``passes``, ``deleted_threads``,
+            ``pruned_checkpoints``, ``reclaimed_bytes``, ``db_bytes`` (after
+            the last pass) and ``last_pass_ms``.
+        """
+        return {
+            "passes": self._passes,
+            "deleted_threads": self._deleted_threads,
+            "pruned_checkpoints": self._pruned_checkpoints,
+            "reclaimed_bytes": self._reclaimed_bytes,
+            "db_bytes": self._db_bytes,
+            "last_pass_ms": self._last_pass_ms,
+        }
@@ -4,6 +4,7 @@ import asyncio
 import logging
 import time
 from collections.abc import Awaitable, Callable, Mapping
+from contextlib import AbstractAsyncContextManager
 from datetime import UTC, datetime
 from typing import Any
 
@@ -19,6 +20,7 @@ from openpaw.core.prompts.system_events import (
     SUBAGENT_TIMED_OUT_TEMPLATE,
 )
 from openpaw.model.subagent import SubAgentRequest, SubAgentResult, SubAgentStatus
+from openpaw.runtime.queue.lane import LaneQueue
 from openpaw.stores.subagent import SubAgentStore
 
 logger = logging.getLogger(__name__)
@@ -160,6 +162,7 @@ class SubAgentRunner:
         max_concurrent: int = 8,
         result_callback: Callable[[str, str], Awaitable[None]] | None = None,
         session_logger: SessionLogger | None = None,
+        lane_queue: LaneQueue | None = None,
     ):
         """Initialize the sub-agent runner.
 
@@ -169,10 +172,13 @@ class SubAgentRunner:
             channels: Mapping of channel names to channel instances for notifications.
             token_logger: Optional token usage logger for tracking invocations.
             workspace_name: Workspace name for logging context.
-            max_concurrent: Maximum simultaneous sub-agents (default: 8).
+            max_concurrent: Maximum outstanding (queued or running) sub-agents (default: 8).
             result_callback: Optional callback for queue injection of results.
                 If provided, called with (session_key, content) instead of direct channel send.
             session_logger: Optional SessionLogger for writing session logs.
+            lane_queue: Optional lane queue. When provided, sub-agents run in
+                its ``subagent`` lane (sharing its cap, metrics and pause
+                policy) instead of behind a local semaphore.
         """
         self._agent_factory = agent_factory
         self._store = store
@@ -183,6 +189,7 @@ class SubAgentRunner:
         self._result_callback = result_callback
         self._session_logger = session_logger
         self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._lane_queue = lane_queue
         self._active_tasks: dict[str, asyncio.Task] = {}
 
     async def spawn(self, request: SubAgentRequest) -> str:
@@ -318,17 +325,23 @@ class SubAgentRunner:
 
         logger.info("Sub-agent runner shutdown complete")
 
+    def _concurrency_slot(self, request: SubAgentRequest) -> AbstractAsyncContextManager[Any]:
+        """Concurrency guard for one sub-agent run."""
+        if self._lane_queue is not None:
+            return self._lane_queue.slot("subagent", f"subagent:{request.id}", invocation_type="subagent")
+        return self._semaphore
+
     async def _execute_subagent(self, request: SubAgentRequest) -> None:
         """Execute a sub-agent request in the background.
 
         This is the main execution loop for a sub-agent. It:
-        1. Acquires semaphore for concurrency control
+        1. Acquires a subagent lane slot (or the local semaphore)
         2. Creates fresh AgentRunner with filtered tools
         3. Runs the agent with the request task
         4. Saves result to store
         5. Sends notification if requested
         6. Logs token usage
-        7. Always releases semaphore in finally block
+        7. Always releases the slot when done
 
         Args:
             request: SubAgentRequest to execute.
@@ -336,8 +349,8 @@ class SubAgentRunner:
         start_time = time.monotonic()
 
         try:
-            # Acquire semaphore for concurrency control
-            async with self._semaphore:
+            # Acquire a concurrency slot
+            async with self._concurrency_slot(request):
                 logger.info(f"Executing sub-agent: {request.id} ('{request.label}')")
 
                 # Create fresh agent instance
@@ -369,7 +382,8 @@ class SubAgentRunner:
                 # Run the agent with timeout
                 try:
                     async with asyncio.timeout(request.timeout_minutes * 60):
-                        response = await runner.run(message=request.task)
+                        run_result = await runner.run(message=request.task)
+                    response = run_result.response
 
                     # Check if we were cancelled during execution
                     # (cancel() sets status to CANCELLED before task.cancel())
@@ -422,10 +436,10 @@ class SubAgentRunner:
                 # Success: save result
                 duration_ms = (time.monotonic() - start_time) * 1000
 
-                # Get token count from runner
+                # Get token count from the run
                 token_count = 0
-                if runner.last_metrics:
-                    token_count = runner.last_metrics.total_tokens
+                if run_result.metrics:
+                    token_count = run_result.metrics.total_tokens
 
                 result = SubAgentResult(
                     request_id=request.id,
@@ -442,8 +456,8 @@ class SubAgentRunner:
                             name=f"subagent_{request.label}",
                             prompt=request.task,
                             response=response,
-                            tools_used=runner.last_tools_used or [],
-                            metrics=runner.last_metrics,
+                            tools_used=run_result.tools_used,
+                            metrics=run_result.metrics,
                             duration_ms=duration_ms,
                         )
                     except Exception as e:
@@ -464,9 +478,9 @@ class SubAgentRunner:
                     await self._send_notification(request, result)
 
                 # Log token usage
-                if self._token_logger and runner.last_metrics:
+                if self._token_logger and run_result.metrics:
                     self._token_logger.log(
-                        metrics=runner.last_metrics,
+                        metrics=run_result.metrics,
                         workspace=self._workspace_name,
                         invocation_type="subagent",
                         session_key=request.session_key,
@@ -0,0 +1,196 @@
+"""LangGraph checkpointer that reads through a SQLite reader pool."""
+
+from collections.abc import AsyncIterator, Mapping, Sequence
+from typing import Any
+
+import aiosqlite
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import CheckpointTuple
+from langgraph.checkpoint.serde.base import SerializerProtocol
+from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
+
+from openpaw.stores.sqlite import SqliteConnectionPool
+
+# Delete every checkpoint past the newest ``keep`` of its thread and namespace.
+# Checkpoint IDs are time-ordered (uuid6), the same order LangGraph lists them in.
+_PRUNE_CHECKPOINTS_SQL = """
+DELETE FROM checkpoints WHERE rowid IN (
+    SELECT rowid FROM (
+        SELECT rowid, ROW_NUMBER() OVER (
+            PARTITION BY thread_id, checkpoint_ns ORDER BY checkpoint_id DESC
+        ) AS position
+        FROM checkpoints
+    )
+    WHERE position > ?
+)
+"""
+
+# Pending writes belong to one checkpoint and are useless once it is gone
+_PRUNE_WRITES_SQL = """
+DELETE FROM writes WHERE NOT EXISTS (
+    SELECT 1 FROM checkpoints
+    WHERE checkpoints.thread_id = writes.thread_id
+      AND checkpoints.checkpoint_ns = writes.checkpoint_ns
+      AND checkpoints.checkpoint_id = writes.checkpoint_id
+)
+"""
+
+
+async def _pragma_value(conn: aiosqlite.Connection, name: str) -> int:
+    """Read a single integer pragma."""
+    async with conn.execute(f"PRAGMA {name}") as cursor:
+        row = await cursor.fetchone()
+    if row is None:
+        raise RuntimeError(f"PRAGMA {name} returned no value")
+    return int(row[0])
+
+
+async def _database_size(conn: aiosqlite.Connection) -> int:
+    """Size of the main database file in bytes (excluding the WAL)."""
+    return await _pragma_value(conn, "page_count") * await _pragma_value(conn, "page_size")
+
+
+class PooledSqliteSaver(AsyncSqliteSaver):
+    """AsyncSqliteSaver whose reads run on the pool's reader connections.
+
+    AsyncSqliteSaver serializes every query on one connection behind one
+    lock, so loading a thread waits for whatever checkpoint another session
+    is writing. Here writes keep that connection (the pool's writer) and its
+    lock, while ``aget_tuple``, ``alist`` and the delta channel history run
+    on a borrowed reader, concurrently with writes and with each other.
+
+    Reads are delegated to a plain AsyncSqliteSaver bound to the reader
+    connection, so the queries stay LangGraph's own. The maintenance queries
+    used by CheckpointRetention (pruning, incremental VACUUM) run on the
+    writer under the same lock as checkpoint writes.
+    """
+
+    def __init__(self, pool: SqliteConnectionPool, *, serde: SerializerProtocol | None = None) -> None:
+        """Initialize the checkpointer.
+
+        Args:
+            pool: Open connection pool of conversations.db.
+            serde: Optional serializer (LangGraph's default when omitted).
+        """
+        super().__init__(pool.writer, serde=serde)
+        self._pool = pool
+        self._reader_savers: dict[int, AsyncSqliteSaver] = {}
+
+    async def setup(self) -> None:
+        """Create the checkpoint tables once.
+
+        AsyncSqliteSaver checks ``is_setup`` under the writer lock on every
+        call, which would make reads wait for writes again.
+        """
+        if self.is_setup:
+            return
+        await super().setup()
+
+    def _reader_saver(self, conn: aiosqlite.Connection) -> AsyncSqliteSaver:
+        """Saver bound to a reader connection, sharing this saver's serializer."""
+        saver = self._reader_savers.get(id(conn))
+        if saver is None:
+            saver = AsyncSqliteSaver(conn, serde=self.serde)
+            saver.is_setup = True  # Tables are created through the writer
+            # Newer releases record during setup() whether writes has task_path
+            if hasattr(self, "_has_task_path"):
+                saver._has_task_path = self._has_task_path
+            self._reader_savers[id(conn)] = saver
+        return saver
+
+    async def aget_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
+        """Get a checkpoint tuple on a reader connection."""
+        if not self._pool.readers:
+            return await super().aget_tuple(config)
+        await self.setup()
+        async with self._pool.reader() as conn:
+            return await self._reader_saver(conn).aget_tuple(config)
+
+    async def alist(
+        self,
+        config: RunnableConfig | None,
+        *,
+        filter: dict[str, Any] | None = None,
+        before: RunnableConfig | None = None,
+        limit: int | None = None,
+    ) -> AsyncIterator[CheckpointTuple]:
+        """List checkpoints on a reader connection, held until iteration ends."""
+        if not self._pool.readers:
+            async for item in super().alist(config, filter=filter, before=before, limit=limit):
+                yield item
+            return
+        await self.setup()
+        async with self._pool.reader() as conn:
+            async for item in self._reader_saver(conn).alist(config, filter=filter, before=before, limit=limit):
+                yield item
+
+    async def aget_delta_channel_history(
+        self, *, config: RunnableConfig, channels: Sequence[str]
+    ) -> Mapping[str, Any]:
+        """Get the delta channel history on a reader connection."""
+        if not self._pool.readers:
+            return await super().aget_delta_channel_history(config=config, channels=channels)
+        await self.setup()
+        async with self._pool.reader() as conn:
+            return await self._reader_saver(conn).aget_delta_channel_history(config=config, channels=channels)
+
+    async def alist_thread_ids(self) -> list[str]:
+        """List the IDs of all threads that have checkpoints."""
+        await self.setup()
+        async with self._pool.reader() as conn, conn.execute("SELECT DISTINCT thread_id FROM checkpoints") as cursor:
+            return [row[0] for row in await cursor.fetchall()]
+
+    async def adatabase_size(self) -> int:
+        """Size of conversations.db in bytes, excluding the WAL."""
+        async with self._pool.reader() as conn:
+            return await _database_size(conn)
+
+    async def aprune_checkpoints(self, keep: int) -> int:
+        """Delete all but the newest ``keep`` checkpoints of every thread.
+
+        Writes attached to the deleted checkpoints are deleted with them.
+        Resuming a thread only needs its latest checkpoint; the ones kept
+        before it are history for debugging.
+
+        Args:
+            keep: Checkpoints kept per thread and namespace (at least 1).
+
+        Returns:
+            Number of checkpoints deleted.
+        """
+        if keep < 1:
+            raise ValueError("keep must be at least 1")
+        await self.setup()
+        async with self.lock, self.conn.cursor() as cur:
+            await cur.execute(_PRUNE_CHECKPOINTS_SQL, (keep,))
+            pruned = cur.rowcount
+            await cur.execute(_PRUNE_WRITES_SQL)
+            await self.conn.commit()
+        return pruned
+
+    async def avacuum(self) -> int:
+        """Return free pages of conversations.db to the filesystem.
+
+        Databases created without ``auto_vacuum`` are switched to incremental
+        mode, which takes one full VACUUM; afterwards each call only releases
+        the pages freed since the last one.
+
+        Returns:
+            Bytes by which the database file shrank.
+        """
+        await self.setup()
+        async with self.lock:
+            size_before = await _database_size(self.conn)
+            if await _pragma_value(self.conn, "auto_vacuum") == 0:
+                await self.conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+                await self.conn.execute("VACUUM")
+            else:
+                await self.conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+                # Each result row is one freed page, so drain the cursor
+                async with self.conn.execute("PRAGMA incremental_vacuum") as cursor:
+                    await cursor.fetchall()
+            # Apply the freed pages to the database file and shrink the WAL
+            async with self.conn.execute("PRAGMA wal_checkpoint(TRUNCATE)") as cursor:
+                await cursor.fetchall()
+            size_after = await _database_size(self.conn)
+        return max(size_before - size_after, 0)
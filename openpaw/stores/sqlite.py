@@ -0,0 +1,153 @@
+"""Tuned SQLite connections with a single writer and a pool of readers.
+
+Each workspace database (conversations.db, vectors.db) is opened through a
+SqliteConnectionPool. Every connection gets the pragmas from SqliteConfig. In
+WAL mode, readers see the last committed state while the writer appends to the
+log, so reads such as the next turn's checkpoint load, /status or archiving do
+not wait for writes in progress.
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any
+
+import aiosqlite
+
+from openpaw.core.config.models import SqliteConfig
+
+logger = logging.getLogger(__name__)
+
+
+async def apply_pragmas(conn: aiosqlite.Connection, config: SqliteConfig, readonly: bool = False) -> None:
+    """Apply the connection tuning of ``config`` to an open connection.
+
+    Args:
+        conn: Open aiosqlite connection.
+        config: Journal mode, synchronous, cache, mmap and busy timeout settings.
+        readonly: Make the connection refuse writes (reader connections).
+    """
+    await conn.execute(f"PRAGMA busy_timeout = {config.busy_timeout_ms}")
+    if not readonly:
+        # Journal mode is stored in the database file, so the writer sets it for all
+        await conn.execute(f"PRAGMA journal_mode = {config.journal_mode.upper()}")
+    await conn.execute(f"PRAGMA synchronous = {config.synchronous.upper()}")
+    await conn.execute(f"PRAGMA cache_size = -{config.cache_size_kb}")
+    await conn.execute(f"PRAGMA mmap_size = {config.mmap_size_mb * 1024 * 1024}")
+    await conn.execute("PRAGMA temp_store = MEMORY")
+    if readonly:
+        await conn.execute("PRAGMA query_only = ON")
+
+
+class SqliteConnectionPool:
+    """One writer and a fixed set of reader connections to a SQLite database.
+
+    The writer is shared by everything that modifies the database; callers
+    serialize their own transactions on it. Readers are lent out one task at a
+    time through ``reader()``. Without readers (``readers: 0``, or WAL
+    disabled, where readers would block behind the writer anyway) ``reader()``
+    lends the writer, so callers do not need a separate code path.
+    """
+
+    def __init__(self, db_path: Path, config: SqliteConfig | None = None) -> None:
+        """Initialize the pool.
+
+        Args:
+            db_path: Path to the SQLite database file.
+            config: Connection tuning (defaults to SqliteConfig()).
+        """
+        self._db_path = Path(db_path)
+        self._config = config or SqliteConfig()
+        self._writer: aiosqlite.Connection | None = None
+        self._readers: list[aiosqlite.Connection] = []
+        self._idle: asyncio.Queue[aiosqlite.Connection] = asyncio.Queue()
+        self._reads = 0
+        self._reader_waits = 0
+        self._reader_wait_ms = 0.0
+
+    @property
+    def db_path(self) -> Path:
+        """Path of the database file."""
+        return self._db_path
+
+    @property
+    def writer(self) -> aiosqlite.Connection:
+        """The single connection used for writes."""
+        if self._writer is None:
+            raise RuntimeError(f"Connection pool for {self._db_path} is not open")
+        return self._writer
+
+    @property
+    def readers(self) -> int:
+        """Number of dedicated reader connections."""
+        return len(self._readers)
+
+    async def open(self, on_connect: Callable[[aiosqlite.Connection], Awaitable[None]] | None = None) -> None:
+        """Open the writer and reader connections.
+
+        Args:
+            on_connect: Optional coroutine run on every new connection before
+                the pragmas, e.g. to load a SQLite extension.
+        """
+        timeout = self._config.busy_timeout_ms / 1000
+        self._writer = await aiosqlite.connect(str(self._db_path), timeout=timeout)
+        if on_connect is not None:
+            await on_connect(self._writer)
+        await apply_pragmas(self._writer, self._config)
+
+        reader_count = self._config.readers if self._config.journal_mode == "wal" else 0
+        for _ in range(reader_count):
+            conn = await aiosqlite.connect(str(self._db_path), timeout=timeout)
+            if on_connect is not None:
+                await on_connect(conn)
+            await apply_pragmas(conn, self._config, readonly=True)
+            self._readers.append(conn)
+            self._idle.put_nowait(conn)
+        logger.debug(f"Opened {self._db_path.name} with 1 writer and {reader_count} reader(s)")
+
+    @asynccontextmanager
+    async def reader(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Borrow a read-only connection for the duration of the block."""
+        if not self._readers:
+            yield self.writer
+            return
+        try:
+            conn = self._idle.get_nowait()
+        except asyncio.QueueEmpty:
+            self._reader_waits += 1
+            wait_start = time.monotonic()
+            conn = await self._idle.get()
+            self._reader_wait_ms += (time.monotonic() - wait_start) * 1000
+        self._reads += 1
+        try:
+            yield conn
+        finally:
+            self._idle.put_nowait(conn)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get reader pool statistics.
+
+        Returns:
+            Dictionary with ``readers``, ``reads`` (reader checkouts),
+            ``reader_waits`` (checkouts that waited for a free reader) and
+            ``avg_reader_wait_ms``.
+        """
+        return {
+            "readers": len(self._readers),
+            "reads": self._reads,
+            "reader_waits": self._reader_waits,
+            "avg_reader_wait_ms": round(self._reader_wait_ms / self._reader_waits) if self._reader_waits else 0,
+        }
+
+    async def close(self) -> None:
+        """Close all connections."""
+        for conn in self._readers:
+            await conn.close()
+        self._readers.clear()
+        self._idle = asyncio.Queue()
+        if self._writer is not None:
+            await self._writer.close()
+            self._writer = None
@@ -4,6 +4,7 @@ import logging
 from pathlib import Path
 from typing import Any
 
+from openpaw.core.config.models import SqliteConfig
 from openpaw.core.paths import VECTORS_DB
 from openpaw.stores.vector.base import BaseVectorStore
 from openpaw.stores.vector.embeddings import BaseEmbeddingProvider
@@ -11,13 +12,19 @@ from openpaw.stores.vector.embeddings import BaseEmbeddingProvider
 logger = logging.getLogger(__name__)
 
 
-def create_vector_store(provider: str, config: dict[str, Any], workspace_path: Path) -> BaseVectorStore:
+def create_vector_store(
+    provider: str,
+    config: dict[str, Any],
+    workspace_path: Path,
+    sqlite_config: SqliteConfig | None = None,
+) -> BaseVectorStore:
     """Create a vector store from provider string and configuration.
 
     Args:
         provider: Vector store provider identifier (e.g., "sqlite_vec").
         config: Provider-specific configuration dict.
         workspace_path: Path to workspace root (for storage location).
+        sqlite_config: Connection tuning for SQLite-backed stores.
 
     Returns:
         Configured BaseVectorStore instance.
@@ -34,6 +41,7 @@ def create_vector_store(provider: str, config: dict[str, Any], workspace_path: P
         return SqliteVecStore(
             db_path=db_path,
             dimensions=config.get("dimensions", 1536),
+            sqlite_config=sqlite_config,
         )
 
     raise ValueError(f"Unknown vector store provider: {provider}")
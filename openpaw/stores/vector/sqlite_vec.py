@@ -8,6 +8,8 @@ from typing import Any
 
 import aiosqlite
 
+from openpaw.core.config.models import SqliteConfig
+from openpaw.stores.sqlite import SqliteConnectionPool
 from openpaw.stores.vector.base import (
     BaseVectorStore,
     VectorDocument,
@@ -22,21 +24,25 @@ class SqliteVecStore(BaseVectorStore):
 
     Storage: {workspace}/data/vectors.db
     Uses aiosqlite + sqlite-vec extension for vector similarity search.
+    Writes go through a single connection; searches and counts run on the
+    pooled reader connections (see SqliteConnectionPool).
 
     Tables:
     - documents: Standard table for document content and metadata
     - vec_documents: Virtual table for vector similarity search
     """
 
-    def __init__(self, db_path: Path, dimensions: int = 1536):
+    def __init__(self, db_path: Path, dimensions: int = 1536, sqlite_config: SqliteConfig | None = None):
         """Initialize the sqlite-vec store.
 
         Args:
             db_path: Path to the SQLite database file.
             dimensions: Dimensionality of embedding vectors (default: 1536).
+            sqlite_config: Connection tuning (defaults to SqliteConfig()).
         """
         self._db_path = Path(db_path)
         self._dimensions = dimensions
+        self._pool = SqliteConnectionPool(self._db_path, sqlite_config)
         self._conn: aiosqlite.Connection | None = None
 
         logger.info(f"SqliteVecStore initialized (db: {db_path}, dims: {dimensions})")
@@ -44,16 +50,18 @@ class SqliteVecStore(BaseVectorStore):
     async def initialize(self) -> None:
         """Initialize the database and create tables.
 
-        Loads the sqlite-vec extension and creates the necessary tables.
+        Loads the sqlite-vec extension on every pooled connection and creates
+        the necessary tables.
         """
         import sqlite_vec
 
-        self._conn = await aiosqlite.connect(str(self._db_path))
+        async def load_sqlite_vec(conn: aiosqlite.Connection) -> None:
+            await conn.enable_load_extension(True)
+            await conn.load_extension(sqlite_vec.loadable_path())
+            await conn.enable_load_extension(False)
 
-        # Enable sqlite-vec extension
-        await self._conn.enable_load_extension(True)
-        await self._conn.load_extension(sqlite_vec.loadable_path())
-        await self._conn.enable_load_extension(False)
+        await self._pool.open(on_connect=load_sqlite_vec)
+        self._conn = self._pool.writer
 
         # Create documents table for content and metadata
         await self._conn.execute("""
@@ -142,22 +150,22 @@ class SqliteVecStore(BaseVectorStore):
         fetch_limit = limit * 3 if metadata_filter else limit
 
         # Vector similarity search: CTE with k= constraint, then JOIN to documents
-        cursor = await self._conn.execute(
-            """
-            WITH knn_matches AS (
-                SELECT id, distance
-                FROM vec_documents
-                WHERE embedding MATCH ? AND k = ?
+        async with self._pool.reader() as conn:
+            cursor = await conn.execute(
+                """
+                WITH knn_matches AS (
+                    SELECT id, distance
+                    FROM vec_documents
+                    WHERE embedding MATCH ? AND k = ?
+                )
+                SELECT d.id, d.content, d.metadata_json, d.conversation_id, knn.distance
+                FROM knn_matches knn
+                JOIN documents d ON d.id = knn.id
+                ORDER BY knn.distance
+                """,
+                (query_bytes, fetch_limit)
             )
-            SELECT d.id, d.content, d.metadata_json, d.conversation_id, knn.distance
-            FROM knn_matches knn
-            JOIN documents d ON d.id = knn.id
-            ORDER BY knn.distance
-            """,
-            (query_bytes, fetch_limit)
-        )
-
-        rows = await cursor.fetchall()
+            rows = await cursor.fetchall()
 
         results = []
         for row in rows:
@@ -221,13 +229,14 @@ class SqliteVecStore(BaseVectorStore):
         if not self._conn:
             return 0
 
-        cursor = await self._conn.execute("SELECT COUNT(*) FROM documents")
-        row = await cursor.fetchone()
+        async with self._pool.reader() as conn:
+            cursor = await conn.execute("SELECT COUNT(*) FROM documents")
+            row = await cursor.fetchone()
         return row[0] if row else 0
 
     async def close(self) -> None:
-        """Close the database connection."""
+        """Close the database connections."""
         if self._conn:
-            await self._conn.close()
+            await self._pool.close()
             self._conn = None
-            logger.info("SqliteVecStore connection closed")
+            logger.info("SqliteVecStore connections closed")
@@ -2,12 +2,19 @@
 
 import logging
 from collections.abc import Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from typing import Any
 
 from openpaw.agent import AgentRunner
+from openpaw.agent.graph_cache import AgentGraphCache
+from openpaw.agent.model_registry import get_chat_model_registry
 from openpaw.core.config import WorkspaceToolsConfig
-from openpaw.core.config.models import ProviderDefinition
+from openpaw.core.config.models import (
+    ModelHedgingConfig,
+    ModelRoutingConfig,
+    ProviderDefinition,
+    TokenBudgetConfig,
+)
 from openpaw.core.config.providers import ResolvedProvider, resolve_provider
 
 
@@ -86,6 +93,7 @@ class AgentFactory:
         self._provider_catalog: dict[str, ProviderDefinition] = provider_catalog or {}
         self._runtime_override: RuntimeModelOverride | None = None
         self._channel_logging_enabled = channel_logging_enabled
+        self._graph_cache = AgentGraphCache()
 
     # ------------------------------------------------------------------
     # Public properties
@@ -116,10 +124,24 @@ class AgentFactory:
     def set_runtime_override(self, override: RuntimeModelOverride) -> None:
         """Apply a runtime model override for the main agent."""
         self._runtime_override = override
+        self._graph_cache.invalidate("model override")
 
     def clear_runtime_override(self) -> None:
         """Clear runtime override, reverting to configured model."""
         self._runtime_override = None
+        self._graph_cache.invalidate("model override cleared")
+
+    # ------------------------------------------------------------------
+    # Graph cache
+    # ------------------------------------------------------------------
+
+    def invalidate_graph_cache(self, reason: str = "") -> None:
+        """Drop compiled stateless graphs (e.g., after a workspace reload)."""
+        self._graph_cache.invalidate(reason)
+
+    def graph_cache_stats(self) -> dict[str, Any]:
+        """Return hit rate and build time statistics of the stateless graph cache."""
+        return self._graph_cache.get_stats()
 
     # ------------------------------------------------------------------
     # Internal resolution helpers
@@ -137,6 +159,69 @@ class AgentFactory:
         """
         return resolve_provider(model_str, self._provider_catalog)
 
+    def _resolve_hedge_model(self) -> ResolvedProvider | None:
+        """Resolve the workspace's secondary model for hedged requests, if enabled."""
+        config = getattr(self._workspace, "config", None)
+        hedging = getattr(config, "model_hedging", None) if config else None
+        if not isinstance(hedging, ModelHedgingConfig) or not hedging.enabled or not hedging.secondary_model:
+            return None
+        return self._resolve_auxiliary_model(hedging.secondary_model)
+
+    def _resolve_downgrade_model(self) -> ResolvedProvider | None:
+        """Resolve the workspace's cheaper model for over-budget work, if configured."""
+        config = getattr(self._workspace, "config", None)
+        budget = getattr(config, "token_budget", None) if config else None
+        if not isinstance(budget, TokenBudgetConfig) or not budget.enabled or not budget.downgrade_model:
+            return None
+        return self._resolve_auxiliary_model(budget.downgrade_model)
+
+    def _model_routing(self) -> ModelRoutingConfig | None:
+        """The workspace's model routing policy, if enabled."""
+        config = getattr(self._workspace, "config", None)
+        routing = getattr(config, "model_routing", None) if config else None
+        if not isinstance(routing, ModelRoutingConfig) or not routing.enabled:
+            return None
+        return routing
+
+    def _resolve_route_model(self, invocation_type: str) -> ResolvedProvider | None:
+        """Resolve the model routed to an invocation type, if one is configured."""
+        routing = self._model_routing()
+        if routing is None or invocation_type not in routing.routes:
+            return None
+        return self._resolve_auxiliary_model(routing.routes[invocation_type])
+
+    def _resolve_main_routes(self) -> dict[str, ResolvedProvider]:
+        """Resolve the model routes of the main agent's runs.
+
+        A runtime model override is an explicit choice for user turns, so
+        only the summarize route applies while one is set.
+        """
+        routing = self._model_routing()
+        if routing is None:
+            return {}
+        routes: dict[str, ResolvedProvider] = {}
+        overridden = self._runtime_override is not None and self._runtime_override.model is not None
+        for name in ("summarize",) if overridden else ("user", "summarize"):
+            resolved = self._resolve_route_model(name)
+            if resolved is not None:
+                routes[name] = resolved
+        if routing.simple_model and not overridden:
+            routes["simple"] = self._resolve_auxiliary_model(routing.simple_model)
+        return routes
+
+    def _resolve_auxiliary_model(self, model_str: str) -> ResolvedProvider:
+        """Resolve a model used alongside the agent's own (hedging, downgrades, routes).
+
+        Only the catalog entry's connection details apply to it;
+        workspace-level extra kwargs belong to the primary model.
+        """
+        resolved = self._resolve_for_model(model_str)
+        if resolved.api_key is None:
+            resolved = replace(resolved, api_key=self._resolve_api_key(model_str))
+        if resolved.region is None:
+            resolved = replace(resolved, region=self._region)
+        return resolved
+
     def _resolve_api_key(self, model_str: str) -> str | None:
         """Resolve API key for the given model's provider.
 
@@ -262,22 +347,42 @@ class AgentFactory:
             extra_model_kwargs=merged_extra,
             middleware=self._middleware,
             channel_logging_enabled=self._channel_logging_enabled,
+            model_registry=get_chat_model_registry(),
+            hedge_model=self._resolve_hedge_model(),
+            rate_limit_key=resolved.catalog_name,
+            rate_limit=resolved.rate_limit,
+            downgrade_model=self._resolve_downgrade_model(),
+            routed_models=self._resolve_main_routes(),
         )
 
-    def create_stateless_agent(self) -> AgentRunner:
+    def create_stateless_agent(self, invocation_type: str | None = None) -> AgentRunner:
         """Create a stateless agent for scheduled tasks (no checkpointer).
 
-        Always uses configured model, ignoring runtime overrides.
+        Uses the model routed to ``invocation_type`` when the workspace's
+        model routing configures one, otherwise the configured model; runtime
+        overrides are ignored. The compiled graph is shared through the
+        factory's graph cache, so repeated cron, heartbeat and sub-agent runs
+        skip the graph build.
+
+        Args:
+            invocation_type: ``heartbeat``, ``cron`` or ``subagent``.
 
         Returns:
             AgentRunner without conversation state.
         """
         all_tools = list(self._builtin_tools) + list(self._workspace_tools)
 
-        resolved = self._resolve_for_model(self._configured_model)
-        api_key = resolved.api_key if resolved.api_key is not None else self._api_key
-        merged_extra = {**resolved.extra_kwargs, **self._extra_model_kwargs}
-        region = resolved.region or self._region
+        routed = self._resolve_route_model(invocation_type) if invocation_type else None
+        if routed is not None:
+            resolved = routed
+            api_key = routed.api_key
+            merged_extra = dict(routed.extra_kwargs)
+            region = routed.region
+        else:
+            resolved = self._resolve_for_model(self._configured_model)
+            api_key = resolved.api_key if resolved.api_key is not None else self._api_key
+            merged_extra = {**resolved.extra_kwargs, **self._extra_model_kwargs}
+            region = resolved.region or self._region
 
         return AgentRunner(
             workspace=self._workspace,
@@ -293,6 +398,13 @@ class AgentFactory:
             extra_model_kwargs=merged_extra,
             middleware=[],  # No middleware for stateless agents
             channel_logging_enabled=self._channel_logging_enabled,
+            graph_cache=self._graph_cache,
+            model_registry=get_chat_model_registry(),
+            hedge_model=self._resolve_hedge_model(),
+            rate_limit_key=resolved.catalog_name,
+            rate_limit=resolved.rate_limit,
+            downgrade_model=self._resolve_downgrade_model(),
+            route=invocation_type if routed is not None else None,
         )
 
     # ------------------------------------------------------------------
@@ -312,6 +424,7 @@ class AgentFactory:
         self._builtin_tools = [t for t in self._builtin_tools if t.name not in tool_names]
         removed = before_count - len(self._builtin_tools)
         if removed:
+            self._graph_cache.invalidate("builtin tools removed")
             self._logger.info(f"Removed {removed} builtin tool(s): {tool_names}")
         else:
             self._logger.debug(f"No matching builtin tools found to remove: {tool_names}")
@@ -327,13 +440,17 @@ class AgentFactory:
         if name in self._enabled_builtin_names:
             self._enabled_builtin_names.remove(name)
 
-    def get_agent_factory_closure(self) -> Callable[[], AgentRunner]:
+    def get_agent_factory_closure(self, invocation_type: str | None = None) -> Callable[[], AgentRunner]:
         """Create a closure for spawning stateless agents.
 
+        Args:
+            invocation_type: Invocation type the agents are routed for
+                (``heartbeat``, ``cron`` or ``subagent``).
+
         Returns:
             Callable that creates fresh AgentRunner instances.
         """
-        return lambda: self.create_stateless_agent()
+        return lambda: self.create_stateless_agent(invocation_type)
 
 
 def filter_workspace_tools(
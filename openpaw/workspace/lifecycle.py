@@ -1,5 +1,6 @@
 """Lifecycle management for WorkspaceRunner components."""
 
+import functools
 import logging
 from collections.abc import Awaitable, Callable
 from pathlib import Path
@@ -37,7 +38,7 @@ class LifecycleManager:
         session_manager: SessionManager,
         approval_handler: Callable[[str, bool], Awaitable[None]],
         logger: logging.Logger,
-        result_callback: Callable[[str, str], Awaitable[None]] | None = None,
+        result_callback: Callable[..., Awaitable[None]] | None = None,
     ):
         """Initialize lifecycle manager.
 
@@ -56,6 +57,7 @@ class LifecycleManager:
             approval_handler: Approval resolution callback.
             logger: Logger instance.
             result_callback: Optional callback for queue injection of scheduled results.
+                Called as ``(session_key, content, invocation_type=...)``.
         """
         self._workspace_name = workspace_name
         self._workspace_path = workspace_path
@@ -240,8 +242,9 @@ class LifecycleManager:
                 token_logger=token_logger,
                 workspace_name=self._workspace_name,
                 timezone=self._workspace_timezone,
-                result_callback=self._result_callback,
+                result_callback=self._scoped_result_callback("cron"),
                 session_logger=session_logger,
+                lane_queue=self._queue_manager.lane_queue,
             )
 
             await self._cron_scheduler.start()
@@ -290,8 +293,9 @@ class LifecycleManager:
                 config=heartbeat_config,
                 timezone=self._workspace_timezone,
                 token_logger=token_logger,
-                result_callback=self._result_callback,
+                result_callback=self._scoped_result_callback("heartbeat"),
                 session_logger=session_logger,
+                lane_queue=self._queue_manager.lane_queue,
             )
 
             await self._heartbeat_scheduler.start()
@@ -308,6 +312,21 @@ class LifecycleManager:
             await self._heartbeat_scheduler.stop()
             self._logger.info("Stopped heartbeat scheduler")
 
+    def _scoped_result_callback(
+        self, invocation_type: str
+    ) -> Callable[[str, str], Awaitable[None]] | None:
+        """Bind an invocation type to the result callback for queue priority.
+
+        Args:
+            invocation_type: Source of injected results (cron, heartbeat).
+
+        Returns:
+            A (session_key, content) callback, or None if no callback is set.
+        """
+        if self._result_callback is None:
+            return None
+        return functools.partial(self._result_callback, invocation_type=invocation_type)
+
     def _connect_cron_tool_to_scheduler(self) -> None:
         """Connect CronTool builtin to the live CronScheduler."""
         try:
@@ -1,29 +1,51 @@
 """Message processing logic for WorkspaceRunner."""
 
+import asyncio
 import logging
 import time
+from datetime import UTC, datetime
+from functools import partial
 from typing import Any
 
+from langchain_core.messages import AIMessage, BaseMessage
+
 from openpaw.agent import AgentRunner
 from openpaw.agent.middleware import (
     ApprovalRequiredError,
     InterruptSignalError,
 )
+from openpaw.agent.middleware.history_window import select_window
+from openpaw.agent.middleware.model_routing import SUMMARIZE_ROUTE
+from openpaw.agent.run_context import RunContext
 from openpaw.builtins.loader import BuiltinLoader
 from openpaw.channels.base import ChannelAdapter
+from openpaw.channels.streaming import StreamingResponse
 from openpaw.core.prompts.system_events import (
     FOLLOWUP_TEMPLATE,
     INTERRUPT_NOTIFICATION,
     TOOL_DENIED_TEMPLATE,
 )
-from openpaw.core.utils import resolve_user_name, sanitize_error_for_user
+from openpaw.core.utils import is_group_metadata, resolve_user_name, sanitize_error_for_user
 from openpaw.model.message import Message
+from openpaw.model.session import PreparedCompaction
 from openpaw.runtime.approval import ApprovalGateManager
+from openpaw.runtime.queue.budget import BudgetAction, TokenBudget, budget_downgrade
 from openpaw.runtime.queue.lane import QueueMode
 from openpaw.runtime.queue.manager import QueueManager
 from openpaw.runtime.session.manager import SessionManager
 
 
+def _summarizable(messages: list[BaseMessage]) -> list[BaseMessage]:
+    """Thread messages without a trailing tool call that has no results yet.
+
+    Providers reject such a call (left by an interrupted run), and its
+    results would otherwise start the next incremental summary.
+    """
+    if messages and isinstance(messages[-1], AIMessage) and messages[-1].tool_calls:
+        return messages[:-1]
+    return messages
+
+
 class MessageProcessor:
     """Handles message processing with queue awareness, approval, and followup support."""
 
@@ -33,8 +55,6 @@ class MessageProcessor:
         session_manager: SessionManager,
         queue_manager: QueueManager,
         builtin_loader: BuiltinLoader,
-        queue_middleware: Any,
-        approval_middleware: Any,
         approval_manager: ApprovalGateManager | None,
         workspace_name: str,
         token_logger: Any,
@@ -44,6 +64,9 @@ class MessageProcessor:
         user_aliases: dict[int, str] | None = None,
         session_ttl_minutes: int = 0,
         lifecycle_config: Any = None,
+        history_window_config: Any = None,
+        speculative_start: bool = False,
+        token_budget: TokenBudget | None = None,
     ):
         """Initialize message processor.
 
@@ -52,8 +75,6 @@ class MessageProcessor:
             session_manager: Session tracking.
             queue_manager: Queue management.
             builtin_loader: Builtin tool/processor loader.
-            queue_middleware: Queue-aware middleware instance.
-            approval_middleware: Approval middleware instance.
             approval_manager: Optional approval gate manager.
             workspace_name: Name of the workspace.
             token_logger: Token usage logger.
@@ -64,13 +85,18 @@ class MessageProcessor:
             session_ttl_minutes: Auto-reset conversation after N minutes of
                 inactivity. 0 disables TTL checking.
             lifecycle_config: LifecycleConfig instance for notification flags.
+            history_window_config: HistoryWindowConfig instance. When the window
+                is enabled, idle sessions get a rolling summary of the thread.
+            speculative_start: Whether the queue manager starts runs before the
+                debounce window closes. Runs inside an open window are rolled
+                back and restarted when more messages arrive in it.
+            token_budget: Workspace token budget. Background summaries are
+                checked against it as ``compact`` work.
         """
         self._agent_runner = agent_runner
         self._session_manager = session_manager
         self._queue_manager = queue_manager
         self._builtin_loader = builtin_loader
-        self._queue_middleware = queue_middleware
-        self._approval_middleware = approval_middleware
         self._approval_manager = approval_manager
         self._workspace_name = workspace_name
         self._token_logger = token_logger
@@ -80,6 +106,22 @@ class MessageProcessor:
         self._user_aliases = user_aliases or {}
         self._session_ttl_minutes = session_ttl_minutes
         self._lifecycle_config = lifecycle_config
+        self._history_window_config = history_window_config
+        self._speculative_start = speculative_start
+        self._token_budget = token_budget
+
+        # Background summary state (see _schedule_precompact)
+        self._prepared_compactions: dict[str, PreparedCompaction] = {}
+        self._precompact_tasks: dict[str, asyncio.Task[None]] = {}
+        self._summarizing: set[str] = set()
+        self._pending_summaries: dict[str, tuple[str, str]] = {}
+        # Session -> (thread_id, summary, messages covered from the thread's start)
+        self._rolling_summaries: dict[str, tuple[str, str, int]] = {}
+        self._background_tasks: set[asyncio.Task[Any]] = set()
+        self._compaction_counts = {"prepared": 0, "prepared_swaps": 0, "inline_swaps": 0}
+        self._prepare_ms_total = 0.0
+        self._swap_ms_total = 0.0
+        self._last_swap_ms = 0.0
 
     def update_agent_runner(self, runner: "AgentRunner") -> None:
         """Update the agent runner instance.
@@ -154,6 +196,9 @@ class MessageProcessor:
         followup_depth = 0
         max_followup_depth = 5
 
+        # The session is no longer idle; drop a pre-compaction still waiting to start
+        self._cancel_idle_precompact(session_key)
+
         # Check session TTL first — may rotate conversation before any further checks
         # TTL only applies to group sessions (not DMs)
         ttl_thread_id = await self._check_session_ttl(session_key, thread_id, channel, messages)
@@ -165,37 +210,47 @@ class MessageProcessor:
         if new_thread_id:
             thread_id = new_thread_id
 
+        # A compacted conversation starts with the summary ahead of the user's message
+        pending_summary = self._pending_summaries.pop(session_key, None)
+        if pending_summary and pending_summary[0] == thread_id:
+            combined_content = f"{pending_summary[1]}\n\n{combined_content}"
+
+        # A batch flushed without debouncing restarts if more messages arrive in its window
+        speculation_deadline = (
+            self._queue_manager.speculation_deadline(session_key) if self._speculative_start else None
+        )
+
         while True:
-            # Capture steer state before finally block resets it
+            # Each pass of the loop is one agent run with its own context
+            history_summary, history_summary_covers = self._rolling_summary(session_key, thread_id)
+            session_mode = await self._queue_manager.get_session_mode(session_key)
+            speculative = speculation_deadline is not None and session_mode == QueueMode.COLLECT
+            run_context = RunContext(
+                session_key=session_key,
+                thread_id=thread_id,
+                queue_mode=session_mode,
+                channel=channel,
+                followup_depth=followup_depth,
+                history_summary=history_summary,
+                history_summary_covers=history_summary_covers,
+            )
+            stream = self._start_stream(channel, session_key)
+            if stream is not None:
+                run_context.stream_callback = stream.update
+            if session_mode == QueueMode.INTERRUPT:
+                # Cancel the in-flight model call as soon as a new message arrives
+                run_context.interrupt_watch = partial(self._queue_manager.wait_pending, session_key)
+            keep_ids: set[str] = set()
+            if speculative and speculation_deadline is not None:
+                keep_ids = await self._agent_runner.thread_message_ids(thread_id)
+                run_context.interrupt_watch = partial(
+                    self._speculation_watch, session_key, run_context, speculation_deadline
+                )
+            speculation_deadline = None
             steered = False
             steer_messages = None
 
             try:
-                # Set queue awareness on middleware before each run
-                session_mode = await self._queue_manager.get_session_mode(session_key)
-                self._queue_middleware.set_queue_awareness(
-                    queue_manager=self._queue_manager,
-                    session_key=session_key,
-                    queue_mode=session_mode,
-                )
-
-                # Set approval context on middleware before each run
-                if self._approval_manager:
-                    self._approval_middleware.set_context(
-                        manager=self._approval_manager,
-                        session_key=session_key,
-                        thread_id=thread_id,
-                    )
-
-                # Set session context for send_message tool
-                if channel:
-                    self._connect_send_message_tool(channel, session_key)
-
-                # Set followup chain depth
-                followup_tool = self._builtin_loader.get_tool_instance("followup")
-                if followup_tool:
-                    followup_tool.set_chain_depth(followup_depth)
-
                 content_preview = combined_content[:100].replace("\n", " ")
                 self._logger.info(
                     f"Processing message for {session_key} "
@@ -203,14 +258,17 @@ class MessageProcessor:
                 )
                 run_start = time.monotonic()
 
-                response = await self._agent_runner.run(
+                await self._agent_runner.run(
                     message=combined_content,
                     thread_id=thread_id,
+                    context=run_context,
                 )
+                response = run_context.response
+                if speculative:
+                    self._queue_manager.record_speculation(session_key, run_start, restarted=False)
 
-                # Capture steer state BEFORE reset
-                steered = self._queue_middleware.was_steered
-                steer_messages = self._queue_middleware.pending_steer_message
+                steered = run_context.steered
+                steer_messages = run_context.steer_messages
 
                 # Post-run steer/interrupt check
                 if not steered and session_mode in (QueueMode.STEER, QueueMode.INTERRUPT):
@@ -235,7 +293,7 @@ class MessageProcessor:
 
                 # Log token usage and processing summary
                 run_duration_ms = (time.monotonic() - run_start) * 1000
-                metrics = self._agent_runner.last_metrics
+                metrics = run_context.metrics
                 if metrics:
                     self._token_logger.log(
                         metrics=metrics,
@@ -243,17 +301,28 @@ class MessageProcessor:
                         invocation_type="user",
                         session_key=session_key,
                     )
-                    tools_used = self._agent_runner.last_tools_used
+                    tools_used = run_context.tools_used
                     tools_summary = f", tools: {tools_used}" if tools_used else ""
+                    ttft = metrics.time_to_first_token_ms
+                    ttft_summary = f", first token {ttft:.0f}ms" if ttft is not None else ""
+                    saved = metrics.window_tokens_saved
+                    window_summary = f", window saved ~{saved}" if saved else ""
+                    elided = metrics.elided_tokens_saved
+                    window_summary += f", elided ~{elided}" if elided else ""
+                    waited = metrics.rate_limit_wait_ms
+                    window_summary += f", rate limit wait {waited:.0f}ms" if waited else ""
                     self._logger.info(
                         f"Agent run complete in {run_duration_ms:.0f}ms — "
-                        f"tokens: {metrics.input_tokens}in/{metrics.output_tokens}out "
-                        f"({metrics.llm_calls} LLM calls{tools_summary})"
+                        f"tokens: {metrics.input_tokens}in/{metrics.output_tokens}out{window_summary} "
+                        f"({metrics.llm_calls} LLM calls{tools_summary}{ttft_summary})"
                     )
                 else:
                     self._logger.info(
                         f"Agent run complete in {run_duration_ms:.0f}ms (no metrics)"
                     )
+                self._session_manager.record_context_tokens(
+                    session_key, thread_id, run_context.context_tokens
+                )
 
                 # Send response if not steered
                 if not steered and channel:
@@ -262,24 +331,32 @@ class MessageProcessor:
                         self._logger.info(
                             f"Sending response ({len(response)} chars): {resp_preview}..."
                         )
-                        await channel.send_message(session_key, response)
+                        if stream is not None:
+                            await stream.finish(response)
+                        else:
+                            await channel.send_message(session_key, response)
                         self._session_manager.increment_message_count(session_key)
                         await self._send_pending_audio(channel, session_key)
                     else:
+                        if stream is not None:
+                            await stream.discard()
                         self._logger.warning(f"Agent produced empty response for {session_key}, sending fallback")
                         fallback = "I processed your message but my response was empty. Please try again."
                         await channel.send_message(session_key, fallback)
+                elif stream is not None:
+                    await stream.discard()
 
             except ApprovalRequiredError as e:
+                if stream is not None:
+                    await stream.discard()
                 # Log partial metrics if available
-                if self._agent_runner.last_metrics:
+                if run_context.metrics:
                     self._token_logger.log(
-                        metrics=self._agent_runner.last_metrics,
+                        metrics=run_context.metrics,
                         workspace=self._workspace_name,
                         invocation_type="user",
                         session_key=session_key,
                     )
-
                 # Send approval request to user
                 if channel and self._approval_manager:
                     tool_config = self._approval_manager.get_tool_config(e.tool_name)
@@ -330,21 +407,55 @@ class MessageProcessor:
                 break
 
             except InterruptSignalError as e:
+                if stream is not None:
+                    await stream.discard()
                 # Log partial metrics if available
-                if self._agent_runner.last_metrics:
+                if run_context.metrics:
                     self._token_logger.log(
-                        metrics=self._agent_runner.last_metrics,
+                        metrics=run_context.metrics,
                         workspace=self._workspace_name,
                         invocation_type="user",
                         session_key=session_key,
                     )
+                if speculative and not e.pending_messages:
+                    # More messages arrived inside the speculative window: discard
+                    # the run and restart with the coalesced input
+                    wasted = run_context.metrics.total_tokens if run_context.metrics else 0
+                    self._queue_manager.record_speculation(
+                        session_key, run_start, restarted=True, wasted_tokens=wasted
+                    )
+                    try:
+                        await self._agent_runner.rollback_thread(thread_id, keep_ids)
+                    except Exception as rollback_err:
+                        self._logger.error(f"Failed to roll back speculative run: {rollback_err}", exc_info=True)
+                    pending_msgs = await self._queue_manager.consume_pending(session_key)
+                    if pending_msgs:
+                        new_content = self._build_combined_content_from_tuples(pending_msgs)
+                        combined_content = f"{combined_content}\n{new_content}"
+                    self._logger.info(
+                        f"Speculative run for {session_key} restarted with "
+                        f"{len(pending_msgs)} new message(s), ~{wasted} tokens discarded"
+                    )
+                    speculation_deadline = self._queue_manager.speculation_deadline(session_key)
+                    continue
 
+                if run_context.interrupt_latency_ms is not None:
+                    self._logger.info(
+                        f"Interrupted in-flight run for {session_key} "
+                        f"in {run_context.interrupt_latency_ms:.0f}ms"
+                    )
+                # A cancelled tool step leaves tool_calls without results in the checkpoint
+                try:
+                    await self._agent_runner.resolve_orphaned_tool_calls(thread_id)
+                except Exception as resolve_err:
+                    self._logger.error(f"Failed to resolve orphaned tool calls: {resolve_err}", exc_info=True)
                 # Notify user that run was interrupted
                 if channel:
                     await channel.send_message(session_key, INTERRUPT_NOTIFICATION)
 
-                # Use the pending messages as the new input
-                pending_msgs = e.pending_messages
+                # Use the pending messages as the new input; a cancelled stream
+                # leaves them in the queue
+                pending_msgs = e.pending_messages or await self._queue_manager.consume_pending(session_key)
                 if pending_msgs:
                     combined_content = self._build_combined_content_from_tuples(pending_msgs)
 
@@ -353,17 +464,13 @@ class MessageProcessor:
 
             except Exception as e:
                 self._logger.error(f"Error processing messages for {session_key}: {e}", exc_info=True)
+                if stream is not None:
+                    await stream.discard()
                 if channel:
                     await channel.send_message(session_key, sanitize_error_for_user(e))
                 break  # Don't continue followup chain on error
 
-            finally:
-                self._disconnect_send_message_tool()
-                self._queue_middleware.reset()
-                if self._approval_manager:
-                    self._approval_middleware.reset()
-
-            # Check steer (captured before reset)
+            # Check steer
             if steered and steer_messages:
                 combined_content = self._build_combined_content_from_tuples(steer_messages)
                 followup_depth = 0  # Reset followup depth on steer
@@ -371,38 +478,64 @@ class MessageProcessor:
                 continue
 
             # Check for followup request
-            if followup_tool:
-                followup = followup_tool.get_pending_followup()
-                if followup and followup.delay_seconds == 0:
-                    followup_depth += 1
-                    if followup_depth > max_followup_depth:
-                        self._logger.warning(
-                            f"Followup chain depth exceeded ({max_followup_depth}) "
-                            f"for session {session_key}"
-                        )
-                        break
-
-                    self._logger.info(
-                        f"Processing immediate followup (depth={followup_depth}): "
-                        f"{followup.prompt[:100]}"
-                    )
-                    combined_content = FOLLOWUP_TEMPLATE.format(
-                        depth=followup_depth, prompt=followup.prompt
-                    )
-                    continue
-                elif followup and followup.delay_seconds > 0:
-                    self._logger.info(
-                        f"Scheduling delayed followup ({followup.delay_seconds}s): "
-                        f"{followup.prompt[:100]}"
+            followup = run_context.pending_followup
+            if followup and followup.delay_seconds == 0:
+                followup_depth += 1
+                if followup_depth > max_followup_depth:
+                    self._logger.warning(
+                        f"Followup chain depth exceeded ({max_followup_depth}) "
+                        f"for session {session_key}"
                     )
-                    self._schedule_delayed_followup(followup, session_key)
+                    break
+
+                self._logger.info(
+                    f"Processing immediate followup (depth={followup_depth}): "
+                    f"{followup.prompt[:100]}"
+                )
+                combined_content = FOLLOWUP_TEMPLATE.format(
+                    depth=followup_depth, prompt=followup.prompt
+                )
+                continue
+            elif followup and followup.delay_seconds > 0:
+                self._logger.info(
+                    f"Scheduling delayed followup ({followup.delay_seconds}s): "
+                    f"{followup.prompt[:100]}"
+                )
+                self._schedule_delayed_followup(followup, session_key)
 
             break  # No followup or delayed followup scheduled, exit loop
 
-        # Reset followup state after loop exits
-        followup_tool = self._builtin_loader.get_tool_instance("followup")
-        if followup_tool:
-            followup_tool.reset()
+        self._schedule_precompact(session_key, thread_id)
+
+    async def _speculation_watch(
+        self, session_key: str, context: RunContext, deadline: float
+    ) -> None:
+        """Return when a message arrives inside a speculative run's window.
+
+        Never returns once the window has closed or the run has called a
+        tool, since tool side effects cannot be rolled back. The run then
+        commits and later messages are processed after it.
+        """
+        try:
+            async with asyncio.timeout(max(deadline - time.monotonic(), 0.0)):
+                await self._queue_manager.wait_pending(session_key)
+        except TimeoutError:
+            pass
+        else:
+            if not context.tools_used:
+                return
+        await asyncio.Event().wait()
+
+    @staticmethod
+    def _start_stream(
+        channel: ChannelAdapter | None, session_key: str
+    ) -> StreamingResponse | None:
+        """Create a streaming response when the channel has streaming enabled."""
+        if channel is None or not channel.streaming_enabled:
+            return None
+        if not channel.supports_message_edits:
+            return None
+        return StreamingResponse(channel, session_key)
 
     @staticmethod
     def _is_group_session(messages: list[Message] | None) -> bool:
@@ -414,16 +547,7 @@ class MessageProcessor:
         """
         if not messages:
             return False
-        for msg in messages:
-            meta = msg.metadata or {}
-            # Discord: guild_id present means server (group) message
-            if meta.get("guild_id") is not None:
-                return True
-            # Telegram: chat_type "group" or "supergroup"
-            chat_type = meta.get("chat_type")
-            if chat_type and chat_type != "private":
-                return True
-        return False
+        return any(is_group_metadata(msg.metadata) for msg in messages)
 
     async def _check_session_ttl(
         self,
@@ -498,6 +622,11 @@ class MessageProcessor:
     ) -> str | None:
         """Check if auto-compact should trigger and perform it if needed.
 
+        Swaps to a new conversation at once when a summary of the unchanged
+        thread was prepared in the background; its summary is prepended to
+        the first message of the new conversation. Otherwise the thread is
+        summarized and the summary injected inline, within the user's turn.
+
         Returns:
             New thread_id if compaction occurred, None otherwise.
         """
@@ -507,7 +636,7 @@ class MessageProcessor:
             return None
 
         try:
-            context_info = await self._agent_runner.get_context_info(thread_id)
+            context_info = await self._context_utilization(session_key, thread_id)
             utilization = context_info.get("utilization", 0.0)
 
             if utilization < self._auto_compact_config.trigger:
@@ -518,39 +647,60 @@ class MessageProcessor:
                 f"(threshold: {self._auto_compact_config.trigger:.0%}) "
                 f"for session {session_key}"
             )
+            swap_start = time.monotonic()
 
             # Parse conversation_id from thread_id (format: "{session_key}:{conversation_id}")
             # session_key contains one colon (e.g., "telegram:123"), so split from the right
             parts = thread_id.rsplit(":", 1)
             conversation_id = parts[-1] if len(parts) == 2 else thread_id
 
-            # Archive the current conversation
-            await self._conversation_archiver.archive(
-                checkpointer=self._agent_runner.checkpointer,
-                thread_id=thread_id,
-                session_key=session_key,
-                conversation_id=conversation_id,
-                tags=["auto-compact"],
-            )
+            prepared = await self._take_prepared_compaction(session_key, thread_id)
+            if prepared is not None:
+                summary = prepared.summary
+                # The old thread is no longer written to, so archiving can trail the swap
+                self._spawn_background(
+                    self._archive_compacted(session_key, thread_id, conversation_id, summary)
+                )
+            else:
+                # Archive the current conversation
+                await self._conversation_archiver.archive(
+                    checkpointer=self._agent_runner.checkpointer,
+                    thread_id=thread_id,
+                    session_key=session_key,
+                    conversation_id=conversation_id,
+                    tags=["auto-compact"],
+                )
 
-            # Generate summary using agent
-            from openpaw.core.prompts.commands import SUMMARIZE_PROMPT
-            summary = await self._agent_runner.run(
-                message=SUMMARIZE_PROMPT,
-                thread_id=thread_id,
-            )
+                # Generate summary using agent
+                from openpaw.core.prompts.commands import SUMMARIZE_PROMPT
+                summary_run = await self._agent_runner.run(
+                    message=SUMMARIZE_PROMPT,
+                    thread_id=thread_id,
+                    context=RunContext(model_route=SUMMARIZE_ROUTE),
+                )
+                summary = summary_run.response
 
             # Rotate to new conversation
             new_conversation_id = self._session_manager.new_conversation(session_key)
             new_thread_id = f"{session_key}:{new_conversation_id}"
 
-            # Inject summary into new thread
             from openpaw.core.prompts.commands import AUTO_COMPACT_TEMPLATE
             summary_message = AUTO_COMPACT_TEMPLATE.format(summary=summary)
-            await self._agent_runner.run(
-                message=summary_message,
-                thread_id=new_thread_id,
-            )
+            if prepared is not None:
+                # Inject summary ahead of the user's message instead of in a run of its own
+                self._pending_summaries[session_key] = (new_thread_id, summary_message)
+            else:
+                # Inject summary into new thread
+                injection_run = await self._agent_runner.run(
+                    message=summary_message,
+                    thread_id=new_thread_id,
+                )
+                self._session_manager.record_context_tokens(
+                    session_key, new_thread_id, injection_run.context_tokens
+                )
+
+            swap_ms = (time.monotonic() - swap_start) * 1000
+            self._record_swap(swap_ms, prepared=prepared is not None)
 
             # Notify user if configured
             if channel:
@@ -562,10 +712,16 @@ class MessageProcessor:
                     f"Summary preserved in new conversation."
                 )
 
+            source = (
+                f"prepared summary from {prepared.duration_ms / 1000:.1f}s background run"
+                if prepared is not None
+                else "inline summary"
+            )
             self._logger.info(
                 f"Auto-compact complete: {conversation_id} -> {new_conversation_id} "
                 f"({context_info.get('message_count', 0)} messages, "
-                f"~{context_info.get('approximate_tokens', 0):,} tokens)"
+                f"~{context_info.get('approximate_tokens', 0):,} tokens) — "
+                f"{swap_ms:.0f}ms in user turn, {source}"
             )
 
             return new_thread_id
@@ -574,6 +730,312 @@ class MessageProcessor:
             self._logger.error(f"Auto-compact failed for {session_key}: {e}", exc_info=True)
             return None
 
+    async def _context_utilization(self, session_key: str, thread_id: str) -> dict[str, Any]:
+        """Context utilization of a thread, from the session's running token tally.
+
+        The tally is updated from usage metadata after every run, so the check
+        is O(1). The checkpointed messages are only recounted when there is no
+        tally yet (new thread, provider without usage metadata, timed-out run)
+        or every ``recount_interval`` runs to correct drift.
+
+        Returns:
+            Dict in the shape of AgentRunner.get_context_info().
+        """
+        state = self._session_manager.get_state(session_key)
+        tokens = getattr(state, "context_tokens", None)
+        runs = getattr(state, "runs_since_recount", 0)
+        if (
+            state is not None
+            and isinstance(tokens, int)
+            and isinstance(runs, int)
+            and runs < self._auto_compact_config.recount_interval
+        ):
+            max_input = self._agent_runner.max_input_tokens
+            return {
+                "max_input_tokens": max_input,
+                "approximate_tokens": tokens,
+                "utilization": tokens / max_input if max_input > 0 else 0.0,
+                "message_count": state.message_count,
+            }
+
+        context_info = await self._agent_runner.get_context_info(thread_id)
+        self._session_manager.record_context_tokens(
+            session_key, thread_id, context_info.get("approximate_tokens", 0), recount=True
+        )
+        return context_info
+
+    def _schedule_precompact(self, session_key: str, thread_id: str) -> None:
+        """Prepare a summary of the thread in the background when one is useful.
+
+        Runs after a user turn finished. The summary is generated from the
+        checkpointed thread after the session stayed idle for ``idle_seconds``.
+        It is needed once the thread passes the auto-compact low watermark, so
+        the swap at the hard trigger does not need an LLM call, and once the
+        history window leaves messages out, as the window's rolling summary.
+
+        Both summaries are built incrementally: each idle period only folds
+        the turns since the previous summary into it.
+        """
+        state = self._session_manager.get_state(session_key)
+        tokens = getattr(state, "context_tokens", None)
+        if not isinstance(tokens, int):
+            return
+        compaction = self._wants_compaction_summary(tokens)
+        rolling = self._wants_rolling_summary(tokens)
+        if not (compaction or rolling):
+            return
+
+        idle_seconds = self._auto_compact_config.idle_seconds if self._auto_compact_config else 30.0
+        previous = self._precompact_tasks.pop(session_key, None)
+        if previous is not None and not previous.done():
+            previous.cancel()
+        self._precompact_tasks[session_key] = asyncio.create_task(
+            self._precompact(session_key, thread_id, idle_seconds, compaction=compaction, rolling=rolling)
+        )
+
+    def _wants_compaction_summary(self, tokens: int) -> bool:
+        """Whether a thread of ``tokens`` is past the auto-compact low watermark."""
+        config = self._auto_compact_config
+        if not config or not config.enabled or config.precompact_trigger is None:
+            return False
+        if not self._conversation_archiver:
+            return False
+        max_input = self._agent_runner.max_input_tokens
+        return max_input > 0 and tokens / max_input >= config.precompact_trigger
+
+    def _wants_rolling_summary(self, tokens: int) -> bool:
+        """Whether the history window leaves messages of a thread of ``tokens`` out."""
+        config = self._history_window_config
+        if not config or not config.enabled or not config.summary:
+            return False
+        return tokens > int(config.max_tokens)
+
+    def _rolling_summary(self, session_key: str, thread_id: str) -> tuple[str | None, int]:
+        """Rolling summary of the turns the history window leaves out of a thread.
+
+        Returns:
+            The summary (None when there is none yet) and the number of
+            messages from the start of the thread it covers.
+        """
+        rolling = self._rolling_summaries.get(session_key)
+        if rolling is None or rolling[0] != thread_id:
+            return None, 0
+        return rolling[1], rolling[2]
+
+    def _cancel_idle_precompact(self, session_key: str) -> None:
+        """Cancel a pre-compaction that has not started summarizing yet.
+
+        A summary already being generated is left to finish: the hard-trigger
+        check may still use it before the next run starts.
+        """
+        task = self._precompact_tasks.get(session_key)
+        if task is not None and not task.done() and session_key not in self._summarizing:
+            task.cancel()
+            del self._precompact_tasks[session_key]
+
+    async def _precompact(
+        self,
+        session_key: str,
+        thread_id: str,
+        idle_seconds: float,
+        compaction: bool = True,
+        rolling: bool = False,
+    ) -> None:
+        """Generate the background summaries of an idle session's thread.
+
+        ``compaction`` brings the summary for the auto-compact swap up to
+        date. ``rolling`` folds the turns the history window newly leaves out
+        into its rolling summary.
+        """
+        try:
+            await asyncio.sleep(idle_seconds)
+            if await self._queue_manager.peek_pending(session_key):
+                return  # Not idle; the next turn reschedules
+
+            action = BudgetAction.ADMIT
+            if self._token_budget is not None:
+                decision = self._token_budget.check("compact")
+                action = decision.action
+                if action is not BudgetAction.ADMIT:
+                    self._token_budget.count(action)
+                if action in (BudgetAction.DEFER, BudgetAction.REJECT):
+                    self._logger.info(
+                        f"Skipping background summary for {session_key}: {decision.reason} exhausted"
+                    )
+                    return  # The hard trigger still summarizes inline
+
+            self._summarizing.add(session_key)
+            with budget_downgrade(action is BudgetAction.DOWNGRADE):
+                if compaction:
+                    await self._prepare_compaction(session_key, thread_id)
+                if rolling:
+                    await self._update_rolling_summary(session_key, thread_id)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self._logger.warning(f"Background pre-compaction failed for {session_key}: {e}")
+        finally:
+            self._summarizing.discard(session_key)
+            if self._precompact_tasks.get(session_key) is asyncio.current_task():
+                del self._precompact_tasks[session_key]
+
+    async def _prepare_compaction(self, session_key: str, thread_id: str) -> None:
+        """Bring the summary for the swap at the auto-compact trigger up to date.
+
+        When the previous prepared summary still covers the start of the
+        thread, only the turns since are summarized and folded into it;
+        otherwise the whole thread is summarized.
+        """
+        from openpaw.core.prompts.commands import ROLLING_SUMMARY_TEMPLATE, SUMMARIZE_PROMPT
+
+        messages = _summarizable(await self._agent_runner.thread_messages(thread_id))
+        previous = self._prepared_compactions.get(session_key)
+        if previous is not None and (previous.thread_id != thread_id or not previous.covers(messages)):
+            previous = None
+        covered = previous.message_count if previous is not None else 0
+        if not messages or covered == len(messages):
+            return  # Nothing new since the previous summary
+
+        prompt = (
+            ROLLING_SUMMARY_TEMPLATE.format(summary=previous.summary) if previous is not None else SUMMARIZE_PROMPT
+        )
+        start = time.monotonic()
+        summary_run = await self._agent_runner.summarize_thread(thread_id, prompt, messages=messages[covered:])
+        duration_ms = (time.monotonic() - start) * 1000
+        self._log_summary_metrics(session_key, summary_run)
+        if not summary_run.response:
+            return
+
+        self._prepared_compactions[session_key] = PreparedCompaction(
+            thread_id=thread_id,
+            summary=summary_run.response,
+            message_count=len(messages),
+            last_message_id=messages[-1].id,
+            prepared_at=datetime.now(UTC),
+            duration_ms=duration_ms,
+        )
+        self._compaction_counts["prepared"] += 1
+        self._prepare_ms_total += duration_ms
+        self._logger.info(
+            f"Pre-compaction summary prepared for {session_key} in {duration_ms:.0f}ms "
+            f"({len(messages) - covered} new message(s))"
+        )
+
+    async def _update_rolling_summary(self, session_key: str, thread_id: str) -> None:
+        """Fold the turns the history window newly leaves out into the rolling summary.
+
+        Only the messages dropped since the last update are sent, together
+        with the previous summary, so an update costs the newly dropped turns
+        instead of the whole thread.
+        """
+        from openpaw.core.prompts.commands import ROLLING_SUMMARY_TEMPLATE, SUMMARIZE_PROMPT
+
+        config = self._history_window_config
+        messages = await self._agent_runner.thread_messages(thread_id)
+        window_start = select_window(messages, config.max_tokens, config.max_turns)
+        previous = self._rolling_summaries.get(session_key)
+        if previous is not None and previous[0] != thread_id:
+            previous = None
+        covered = previous[2] if previous is not None else 0
+        if window_start <= covered:
+            return  # No turns left the window since the last update
+
+        prompt = (
+            ROLLING_SUMMARY_TEMPLATE.format(summary=previous[1]) if previous is not None else SUMMARIZE_PROMPT
+        )
+        summary_run = await self._agent_runner.summarize_thread(
+            thread_id, prompt, messages=messages[covered:window_start]
+        )
+        self._log_summary_metrics(session_key, summary_run)
+        if summary_run.response:
+            self._rolling_summaries[session_key] = (thread_id, summary_run.response, window_start)
+
+    def _log_summary_metrics(self, session_key: str, summary_run: RunContext) -> None:
+        """Log the token usage of a background summary."""
+        if summary_run.metrics:
+            self._token_logger.log(
+                metrics=summary_run.metrics,
+                workspace=self._workspace_name,
+                invocation_type="compact",
+                session_key=session_key,
+            )
+
+    async def _take_prepared_compaction(
+        self, session_key: str, thread_id: str
+    ) -> PreparedCompaction | None:
+        """Pop the prepared summary for a thread if it still covers the whole thread.
+
+        Waits for a summary that is being generated right now, which is still
+        faster than starting one.
+        """
+        task = self._precompact_tasks.get(session_key)
+        if task is not None and session_key in self._summarizing:
+            await asyncio.wait({task})
+
+        prepared = self._prepared_compactions.pop(session_key, None)
+        if prepared is None or prepared.thread_id != thread_id:
+            return None
+        messages = _summarizable(await self._agent_runner.thread_messages(thread_id))
+        if len(messages) != prepared.message_count or not prepared.covers(messages):
+            return None
+        return prepared
+
+    async def _archive_compacted(
+        self, session_key: str, thread_id: str, conversation_id: str, summary: str
+    ) -> None:
+        """Archive a conversation that was swapped out by auto-compact."""
+        try:
+            await self._conversation_archiver.archive(
+                checkpointer=self._agent_runner.checkpointer,
+                thread_id=thread_id,
+                session_key=session_key,
+                conversation_id=conversation_id,
+                summary=summary,
+                tags=["auto-compact"],
+            )
+        except Exception as e:
+            self._logger.error(f"Failed to archive compacted conversation {conversation_id}: {e}")
+
+    def _spawn_background(self, coro: Any) -> None:
+        """Run a coroutine in the background, keeping a reference until it finishes."""
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    def _record_swap(self, swap_ms: float, prepared: bool) -> None:
+        """Count an auto-compact swap and the time it added to the user's turn."""
+        self._compaction_counts["prepared_swaps" if prepared else "inline_swaps"] += 1
+        self._swap_ms_total += swap_ms
+        self._last_swap_ms = swap_ms
+
+    def compaction_stats(self) -> dict[str, Any]:
+        """Return auto-compact statistics.
+
+        Returns:
+            Dictionary with prepared (background summaries generated),
+            prepared_swaps and inline_swaps, critical_path_rate (fraction of
+            swaps that summarized inside a user turn), avg_prepare_ms,
+            avg_swap_ms and last_swap_ms (time added to the user's turn).
+        """
+        counts = self._compaction_counts
+        swaps = counts["prepared_swaps"] + counts["inline_swaps"]
+        return {
+            **counts,
+            "critical_path_rate": counts["inline_swaps"] / swaps if swaps else 0.0,
+            "avg_prepare_ms": round(self._prepare_ms_total / counts["prepared"]) if counts["prepared"] else 0,
+            "avg_swap_ms": round(self._swap_ms_total / swaps) if swaps else 0,
+            "last_swap_ms": round(self._last_swap_ms),
+        }
+
+    async def shutdown(self) -> None:
+        """Cancel pending pre-compactions and wait for background archiving."""
+        for task in self._precompact_tasks.values():
+            task.cancel()
+        await asyncio.gather(*self._precompact_tasks.values(), return_exceptions=True)
+        self._precompact_tasks.clear()
+        if self._background_tasks:
+            await asyncio.gather(*self._background_tasks, return_exceptions=True)
+
     async def _send_pending_audio(self, channel: ChannelAdapter, session_key: str) -> None:
         """Check for and send any pending TTS audio."""
         if not hasattr(channel, "send_audio"):
@@ -617,23 +1079,3 @@ class MessageProcessor:
         cron_tool.store.add_task(task)
         cron_tool._add_to_live_scheduler(task)
         self._logger.info(f"Delayed followup scheduled as cron task {task.id}")
-
-    def _connect_send_message_tool(self, channel: Any, session_key: str) -> None:
-        """Connect send_message tool to active session context."""
-        try:
-            send_message_tool = self._builtin_loader.get_tool_instance("send_message")
-            if send_message_tool:
-                send_message_tool.set_session_context(channel, session_key)
-                self._logger.debug(f"Connected send_message tool for session: {session_key}")
-        except Exception as e:
-            self._logger.debug(f"Failed to connect send_message tool: {e}")
-
-    def _disconnect_send_message_tool(self) -> None:
-        """Disconnect send_message tool from session context."""
-        try:
-            send_message_tool = self._builtin_loader.get_tool_instance("send_message")
-            if send_message_tool:
-                send_message_tool.clear_session_context()
-                self._logger.debug("Disconnected send_message tool")
-        except Exception as e:
-            self._logger.debug(f"Failed to disconnect send_message tool: {e}")
@@ -1,21 +1,22 @@
 """Workspace runner for OpenPaw."""
 
 import asyncio
+import functools
 import logging
 from pathlib import Path
 from typing import Any
 from uuid import uuid4
 
-import aiosqlite
 from dotenv import load_dotenv
-from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
 
 from openpaw.agent.metrics import TokenUsageLogger
 from openpaw.agent.middleware import (
     ApprovalToolMiddleware,
     QueueAwareToolMiddleware,
+    ToolOutputSpillMiddleware,
     ToolTimeoutMiddleware,
 )
+from openpaw.agent.model_registry import get_chat_model_registry
 from openpaw.agent.session_logger import SessionLogger
 from openpaw.builtins.base import BaseBuiltinProcessor
 from openpaw.builtins.loader import BuiltinLoader
@@ -25,17 +26,32 @@ from openpaw.channels.commands.handlers import get_framework_commands
 from openpaw.channels.commands.router import CommandRouter
 from openpaw.core.channel_context import format_channel_context
 from openpaw.core.config import Config, merge_configs
-from openpaw.core.config.models import ApprovalGatesConfig, ToolTimeoutsConfig
+from openpaw.core.config.models import (
+    AdaptiveDebounceConfig,
+    ApprovalGatesConfig,
+    CheckpointRetentionConfig,
+    SqliteConfig,
+    ToolOutputSpillConfig,
+    ToolTimeoutsConfig,
+    WorkspaceQueueConfig,
+)
 from openpaw.core.logging import setup_workspace_logger
-from openpaw.core.paths import CONVERSATIONS_DB, DOT_ENV
+from openpaw.core.paths import CONVERSATIONS_DB, DOT_ENV, TOKEN_USAGE_JSONL
+from openpaw.core.prompts.system_events import TOKEN_BUDGET_REJECTED_NOTIFICATION
 from openpaw.core.utils import resolve_user_name
 from openpaw.model.message import Message, MessageDirection
 from openpaw.runtime.approval import ApprovalGateManager
-from openpaw.runtime.queue.lane import LaneQueue, QueueItem, QueueMode
+from openpaw.runtime.queue.budget import BudgetAction, TokenBudget
+from openpaw.runtime.queue.debounce import AdaptiveDebounce
+from openpaw.runtime.queue.lane import BACKGROUND_LANES, LaneQueue, QueueItem, QueueMode
 from openpaw.runtime.queue.manager import QueueManager
+from openpaw.runtime.queue.priority import PriorityPolicy
 from openpaw.runtime.session.archiver import ConversationArchiver
 from openpaw.runtime.session.manager import SessionManager
+from openpaw.runtime.session.retention import CheckpointRetention
 from openpaw.runtime.subagent import SubAgentRunner
+from openpaw.stores.checkpoint import PooledSqliteSaver
+from openpaw.stores.sqlite import SqliteConnectionPool
 from openpaw.stores.subagent import SubAgentStore
 from openpaw.stores.task import TaskStore
 from openpaw.workspace.agent_factory import AgentFactory, filter_workspace_tools
@@ -86,10 +102,17 @@ class WorkspaceRunner:
         self._init_stores()
 
         # Initialize queue system
+        workspace_queue = self._workspace.config.queue if self._workspace.config else WorkspaceQueueConfig()
+        priority_config = workspace_queue.priority
         self._lane_queue = LaneQueue(
             main_concurrency=config.lanes.main_concurrency,
             subagent_concurrency=config.lanes.subagent_concurrency,
             cron_concurrency=config.lanes.cron_concurrency,
+            max_session_locks=config.queue.max_sessions,
+            aging_per_second=priority_config.aging_per_second,
+            channel_weights=workspace_queue.channel_weights,
+            background_pause_wait_ms=config.lanes.background_pause_wait_ms,
+            token_budget=self._token_budget,
         )
         queue_config = self._merged_config.get("queue", {})
         self._queue_manager = QueueManager(
@@ -98,13 +121,26 @@ class WorkspaceRunner:
             default_debounce_ms=queue_config.get("debounce_ms", config.queue.debounce_ms),
             default_cap=queue_config.get("cap", config.queue.cap),
             default_drop_policy=queue_config.get("drop_policy", config.queue.drop_policy),
+            max_sessions=config.queue.max_sessions,
+            session_idle_seconds=config.queue.session_idle_seconds,
+            adaptive_debounce=self._build_adaptive_debounce(config),
+            speculative_start=queue_config.get("speculative_start", config.queue.speculative_start),
+            priority_policy=PriorityPolicy(
+                direct_message=priority_config.direct_message,
+                group_message=priority_config.group_message,
+                steer_boost=priority_config.steer_boost,
+                system_event=priority_config.system_event,
+                channels=dict(priority_config.channels),
+                invocation_types=dict(priority_config.invocation_types),
+            ),
         )
 
         # Checkpointer placeholder (initialized in start())
         self._db_path = self._workspace.path / str(CONVERSATIONS_DB)
         self._db_path.parent.mkdir(parents=True, exist_ok=True)
-        self._db_conn: aiosqlite.Connection | None = None
+        self._db_pool: SqliteConnectionPool | None = None
         self._checkpointer: Any | None = None
+        self._checkpoint_retention: CheckpointRetention | None = None
 
         # Session manager
         self._session_manager = SessionManager(self._workspace.path)
@@ -158,15 +194,25 @@ class WorkspaceRunner:
         self._channels: dict[str, ChannelAdapter] = {}
         self._subagent_runner: SubAgentRunner | None = None
         self._queue_processor_task: asyncio.Task[None] | None = None
+        self._background_lane_tasks: list[asyncio.Task[None]] = []
         self._cleanup_task: asyncio.Task[None] | None = None
+        self._retention_task: asyncio.Task[None] | None = None
+        self._warmup_task: asyncio.Task[bool] | None = None
         self._running = False
 
     def _init_stores(self) -> None:
-        """Initialize persistence stores and token logger."""
+        """Initialize persistence stores, token budget and token logger."""
         self._task_store = TaskStore(self._workspace.path)
         self._cleanup_old_tasks()
         self._subagent_store = SubAgentStore(self._workspace.path)
-        self._token_logger = TokenUsageLogger(self._workspace.path)
+
+        budget_config = self._workspace.config.token_budget if self._workspace.config else None
+        self._token_budget: TokenBudget | None = None
+        if budget_config and budget_config.enabled:
+            self._token_budget = TokenBudget(budget_config)
+            loaded = self._token_budget.load(self._workspace.path / str(TOKEN_USAGE_JSONL))
+            self.logger.info(f"Token budget enabled ({loaded} usage entries from the last day)")
+        self._token_logger = TokenUsageLogger(self._workspace.path, budget=self._token_budget)
 
     def _init_memory(self) -> None:
         """Initialize memory search infrastructure and conversation archiver."""
@@ -187,6 +233,7 @@ class WorkspaceRunner:
                     provider=memory_config.vector_store.provider,
                     config=memory_config.vector_store.model_dump(),
                     workspace_path=self._workspace.path,
+                    sqlite_config=self._get_sqlite_config(),
                 )
                 self._embedding_provider = create_embedding_provider(
                     provider=memory_config.embedding.provider,
@@ -268,9 +315,7 @@ class WorkspaceRunner:
 
     def _init_agent(self) -> None:
         """Set up middleware, agent factory, agent runner, and message processor."""
-        # Create middleware
-        self._queue_middleware = QueueAwareToolMiddleware()
-        self._approval_middleware = ApprovalToolMiddleware()
+        # Create middleware (shared by all runs; per-run state lives on RunContext)
         self._approval_manager: ApprovalGateManager | None = None
 
         approval_config = self._get_approval_config()
@@ -278,6 +323,9 @@ class WorkspaceRunner:
             self._approval_manager = ApprovalGateManager(approval_config)
             self.logger.info("Approval gates enabled")
 
+        self._queue_middleware = QueueAwareToolMiddleware(self._queue_manager)
+        self._approval_middleware = ApprovalToolMiddleware(self._approval_manager)
+
         # Resolve model string from merged config
         agent_config = self._merged_config.get("model", {})
         model_str = agent_config.get("model", self.config.agent.model)
@@ -295,13 +343,17 @@ class WorkspaceRunner:
         if extra_model_kwargs:
             self.logger.info(f"Passing extra model kwargs: {list(extra_model_kwargs.keys())}")
 
-        # Build middleware list (order matters: timeout → queue → approval)
+        # Build middleware list (order matters: timeout → spill → queue → approval)
         tool_timeouts_config = self._get_tool_timeouts_config()
         self._tool_timeout_middleware = ToolTimeoutMiddleware(tool_timeouts_config)
-        middlewares = [
-            self._tool_timeout_middleware.get_middleware(),
-            self._queue_middleware.get_middleware(),
-        ]
+        middlewares = [self._tool_timeout_middleware.get_middleware()]
+        spill_config = self._get_tool_output_spill_config()
+        if spill_config.enabled:
+            self._tool_output_spill_middleware = ToolOutputSpillMiddleware(
+                spill_config, self._workspace.path
+            )
+            middlewares.append(self._tool_output_spill_middleware.get_middleware())
+        middlewares.append(self._queue_middleware.get_middleware())
         if self._approval_manager:
             middlewares.append(self._approval_middleware.get_middleware())
 
@@ -331,8 +383,6 @@ class WorkspaceRunner:
             session_manager=self._session_manager,
             queue_manager=self._queue_manager,
             builtin_loader=self._builtin_loader,
-            queue_middleware=self._queue_middleware,
-            approval_middleware=self._approval_middleware,
             approval_manager=self._approval_manager,
             workspace_name=self.workspace_name,
             token_logger=self._token_logger,
@@ -342,6 +392,9 @@ class WorkspaceRunner:
             user_aliases=self._user_aliases,
             session_ttl_minutes=self._merged_config.get("session_ttl_minutes", 180),
             lifecycle_config=self._workspace.config.lifecycle if self._workspace.config else None,
+            history_window_config=self._workspace.config.history_window if self._workspace.config else None,
+            speculative_start=self._queue_manager.speculative_start,
+            token_budget=self._token_budget,
         )
 
     @property
@@ -349,6 +402,23 @@ class WorkspaceRunner:
         """Get the token usage logger for this workspace."""
         return self._token_logger
 
+    def _build_adaptive_debounce(self, config: Config) -> AdaptiveDebounce | None:
+        """Build the adaptive debounce policy, or None for a fixed debounce_ms.
+
+        Workspace ``queue.adaptive_debounce`` settings override the global ones.
+        """
+        settings = config.queue.adaptive_debounce
+        overrides = self._merged_config.get("queue", {}).get("adaptive_debounce")
+        if overrides:
+            settings = AdaptiveDebounceConfig.model_validate({**settings.model_dump(), **overrides})
+        if not settings.enabled:
+            return None
+        return AdaptiveDebounce(
+            min_ms=settings.min_ms,
+            max_ms=settings.max_ms,
+            burst_threshold=settings.burst_threshold,
+        )
+
     def _merge_workspace_config(self, global_config: Config, workspace: Any) -> dict[str, Any]:
         """Merge workspace config over global config."""
         if not workspace.config:
@@ -416,6 +486,36 @@ class WorkspaceRunner:
             return self._workspace.config.tool_timeouts
         return self.config.tool_timeouts
 
+    def _get_tool_output_spill_config(self) -> ToolOutputSpillConfig:
+        """Get tool output spill config from workspace or global.
+
+        Returns:
+            ToolOutputSpillConfig (always returns a valid config, uses defaults if not configured).
+        """
+        if self._workspace.config:
+            return self._workspace.config.tool_output_spill
+        return self.config.tool_output_spill
+
+    def _get_sqlite_config(self) -> SqliteConfig:
+        """Get SQLite connection tuning from workspace or global.
+
+        Returns:
+            SqliteConfig (always returns a valid config, uses defaults if not configured).
+        """
+        if self._workspace.config:
+            return self._workspace.config.sqlite
+        return self.config.sqlite
+
+    def _get_checkpoint_retention_config(self) -> CheckpointRetentionConfig:
+        """Get checkpoint retention config from workspace or global.
+
+        Returns:
+            CheckpointRetentionConfig (always returns a valid config, uses defaults if not configured).
+        """
+        if self._workspace.config:
+            return self._workspace.config.checkpoint_retention
+        return self.config.checkpoint_retention
+
     async def _handle_approval_resolution(
         self, approval_id: str, approved: bool
     ) -> None:
@@ -475,6 +575,8 @@ class WorkspaceRunner:
             subagent_store=self._subagent_store,
             agent_factory=self._agent_factory,
             channels=self._channels,
+            message_processor=self._message_processor,
+            checkpoint_retention=self._checkpoint_retention,
         )
 
     async def _handle_inbound_message(self, message: Message) -> None:
@@ -493,6 +595,8 @@ class WorkspaceRunner:
                 # so the agent picks up any workspace file changes (AGENT.md, etc.)
                 if command_result.new_thread_id:
                     self._agent_runner.rebuild_agent()
+                    if self._agent_factory:
+                        self._agent_factory.invalidate_graph_cache("workspace reload")
                     # Prime the new session with orientation message
                     user_name = self._resolve_user_name(message)
                     await self._inject_new_session_prompt(
@@ -618,12 +722,26 @@ class WorkspaceRunner:
         """Background task processing the lane queue."""
         async def handler(item: QueueItem) -> None:
             channel_name, messages = item.payload
+            if item.budget_action is BudgetAction.REJECT:
+                await self._reject_over_budget(item.session_key, channel_name, item.steer_eligible)
+                return
             handler_func = self._queue_manager.get_handler(channel_name)
             if handler_func:
                 await handler_func(item.session_key, messages)
 
         await self._lane_queue.process("main", handler)
 
+    async def _reject_over_budget(self, session_key: str, channel_name: str, notify: bool) -> None:
+        """Drop work rejected by the token budget, telling the user for their own messages."""
+        self.logger.warning(f"Token budget exhausted, rejected queued work for session {session_key}")
+        channel = self._channels.get(channel_name)
+        if not notify or channel is None:
+            return
+        try:
+            await channel.send_message(session_key, TOKEN_BUDGET_REJECTED_NOTIFICATION)
+        except Exception as e:
+            self.logger.debug(f"Failed to send token budget notice: {e}")
+
     async def _periodic_task_cleanup(self) -> None:
         """Run task cleanup every 6 hours."""
         while self._running:
@@ -637,16 +755,47 @@ class WorkspaceRunner:
             except Exception as e:
                 self.logger.warning(f"Periodic task cleanup failed: {e}")
 
+    async def _periodic_checkpoint_retention(self) -> None:
+        """Prune and compact conversations.db, first shortly after startup, then every interval."""
+        if not self._checkpoint_retention:
+            return
+        delay = 300  # Let startup traffic settle before the first pass
+        while self._running:
+            await asyncio.sleep(delay)
+            if not self._running:
+                break
+            try:
+                await self._checkpoint_retention.run()
+            except Exception as e:
+                self.logger.warning(f"Checkpoint retention failed: {e}")
+            delay = self._checkpoint_retention.config.interval_hours * 3600
+
     async def start(self) -> None:
         """Start workspace runner."""
         self.logger.info(f"Starting workspace runner: {self.workspace_name}")
 
-        # Initialize SQLite checkpointer
-        self._db_conn = await aiosqlite.connect(str(self._db_path))
-        self._checkpointer = AsyncSqliteSaver(self._db_conn)
+        # Initialize SQLite checkpointer (single writer, pooled readers)
+        self._db_pool = SqliteConnectionPool(self._db_path, self._get_sqlite_config())
+        await self._db_pool.open()
+        self._checkpointer = PooledSqliteSaver(self._db_pool)
         await self._checkpointer.setup()
         self._agent_runner.update_checkpointer(self._checkpointer)
-        self.logger.info(f"Initialized SQLite checkpointer: {self._db_path}")
+        self.logger.info(
+            f"Initialized SQLite checkpointer: {self._db_path} ({self._db_pool.readers} reader connection(s))"
+        )
+        retention_config = self._get_checkpoint_retention_config()
+        if retention_config.enabled:
+            self._checkpoint_retention = CheckpointRetention(
+                checkpointer=self._checkpointer,
+                session_manager=self._session_manager,
+                archiver=self._conversation_archiver,
+                config=retention_config,
+            )
+
+        # Open the model provider connection while channels and schedulers start
+        model = self._agent_runner.model_instance
+        if model is not None:
+            self._warmup_task = asyncio.create_task(get_chat_model_registry().warm(model))
 
         # Initialize vector store if memory search is enabled
         if self._vector_store:
@@ -665,10 +814,15 @@ class WorkspaceRunner:
         for channel in self._channels.values():
             await channel.register_commands(command_defs)
 
+        # Drain background lanes before anything can submit to them
+        self._background_lane_tasks = [
+            asyncio.create_task(self._lane_queue.process_slots(lane_name)) for lane_name in BACKGROUND_LANES
+        ]
+
         # Start schedulers if needed
         cron_tool_loaded = self._builtin_loader.get_tool_instance("cron") is not None
         if self._workspace.crons or cron_tool_loaded:
-            agent_factory = self._agent_factory.get_agent_factory_closure()
+            agent_factory = self._agent_factory.get_agent_factory_closure("cron")
             await self._lifecycle_manager.setup_cron_scheduler(
                 self._workspace.crons,
                 agent_factory,
@@ -676,27 +830,29 @@ class WorkspaceRunner:
             )
 
         await self._lifecycle_manager.setup_heartbeat_scheduler(
-            self._agent_factory.get_agent_factory_closure(),
+            self._agent_factory.get_agent_factory_closure("heartbeat"),
             self._token_logger,
         )
 
         # Start sub-agent runner
         subagent_session_logger = SessionLogger(self._workspace.path, session_type="subagent")
         self._subagent_runner = SubAgentRunner(
-            agent_factory=self._agent_factory.get_agent_factory_closure(),
+            agent_factory=self._agent_factory.get_agent_factory_closure("subagent"),
             store=self._subagent_store,
             channels=self._channels,
             token_logger=self._token_logger,
             workspace_name=self.workspace_name,
             max_concurrent=8,
-            result_callback=self._inject_system_event,
+            result_callback=functools.partial(self._inject_system_event, invocation_type="subagent"),
             session_logger=subagent_session_logger,
+            lane_queue=self._lane_queue,
         )
         self._connect_spawn_tool_to_runner()
 
         self._running = True
         self._queue_processor_task = asyncio.create_task(self._queue_processor())
         self._cleanup_task = asyncio.create_task(self._periodic_task_cleanup())
+        self._retention_task = asyncio.create_task(self._periodic_checkpoint_retention())
 
         self.logger.info(f"Workspace runner '{self.workspace_name}' is running")
 
@@ -770,8 +926,17 @@ class WorkspaceRunner:
         )
         await self._inject_system_event(session_key, content)
 
-    async def _inject_system_event(self, session_key: str, content: str) -> None:
-        """Inject a system event into the queue for agent processing."""
+    async def _inject_system_event(
+        self, session_key: str, content: str, invocation_type: str = "system"
+    ) -> None:
+        """Inject a system event into the queue for agent processing.
+
+        Args:
+            session_key: Target session.
+            content: Event text delivered to the agent.
+            invocation_type: Event source (system, subagent, cron, heartbeat),
+                used to pick the lane priority.
+        """
         parts = session_key.split(":", 1)
         if len(parts) != 2 or not parts[0]:
             self.logger.error(f"Invalid session_key format for system event: {session_key}")
@@ -795,6 +960,7 @@ class WorkspaceRunner:
                 message=msg,
                 mode=QueueMode.COLLECT,
                 steer_eligible=False,
+                invocation_type=invocation_type,
             )
 
             self.logger.info(f"Injected system event into queue for session: {session_key}")
@@ -927,15 +1093,39 @@ class WorkspaceRunner:
                 pass
             self._cleanup_task = None
 
+        # Stop checkpoint retention before the database closes
+        if self._retention_task:
+            self._retention_task.cancel()
+            try:
+                await self._retention_task
+            except asyncio.CancelledError:
+                pass
+            self._retention_task = None
+
         # Stop schedulers
         await self._lifecycle_manager.stop_cron_scheduler()
         await self._lifecycle_manager.stop_heartbeat_scheduler()
 
+        # Cancel background pre-compactions, finish pending archives
+        if self._message_processor:
+            await self._message_processor.shutdown()
+
         # Shutdown sub-agent runner
         if self._subagent_runner:
             await self._subagent_runner.shutdown()
             self.logger.info("Stopped sub-agent runner")
 
+        # Cancel model connection warm-up if still pending
+        if self._warmup_task and not self._warmup_task.done():
+            self._warmup_task.cancel()
+        self._warmup_task = None
+
+        # Stop background lane processors
+        for task in self._background_lane_tasks:
+            task.cancel()
+        await asyncio.gather(*self._background_lane_tasks, return_exceptions=True)
+        self._background_lane_tasks = []
+
         # Close browser session
         browser_builtin = self._get_browser_builtin()
         if browser_builtin:
@@ -959,9 +1149,9 @@ class WorkspaceRunner:
             self.logger.info("Closed vector store connection")
 
         # Close database
-        if self._db_conn:
-            await self._db_conn.close()
-            self._db_conn = None
-            self.logger.info("Closed checkpointer database connection")
+        if self._db_pool:
+            await self._db_pool.close()
+            self._db_pool = None
+            self.logger.info("Closed checkpointer database connections")
 
         self.logger.info(f"Workspace runner '{self.workspace_name}' stopped")
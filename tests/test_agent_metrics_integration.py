@@ -1,11 +1,14 @@
 """Integration tests for AgentRunner token tracking."""
 
+import asyncio
 from pathlib import Path
 from unittest.mock import Mock
 
 import pytest
 
 from openpaw.agent.metrics import InvocationMetrics
+from openpaw.agent.middleware import InterruptSignalError
+from openpaw.agent.run_context import RunContext, get_run_context
 from openpaw.agent.runner import AgentRunner
 from openpaw.core.workspace import AgentWorkspace
 
@@ -28,32 +31,86 @@ def mock_workspace(tmp_path: Path) -> AgentWorkspace:
     workspace.name = "test_workspace"
     workspace.path = workspace_dir
     workspace.build_system_prompt = Mock(return_value="Test system prompt")
+    workspace.build_stable_prompt = Mock(return_value="Test system prompt")
+    workspace.build_volatile_context = Mock(return_value="")
 
     return workspace
 
 
-def test_agent_runner_initializes_with_none_metrics(mock_workspace: AgentWorkspace) -> None:
-    """Test that AgentRunner initializes with None metrics."""
+def test_agent_runner_keeps_no_per_invocation_state(mock_workspace: AgentWorkspace) -> None:
+    """Test that AgentRunner has no last-run fields to leak between sessions."""
     runner = AgentRunner(
         workspace=mock_workspace,
         model="anthropic:claude-sonnet-4-20250514",
         api_key="test-key",
     )
 
-    assert runner.last_metrics is None
+    assert not hasattr(runner, "last_metrics")
+    assert not hasattr(runner, "last_tools_used")
+    assert not hasattr(runner, "_current_tool_name")
 
 
-def test_agent_runner_exposes_last_metrics_property(mock_workspace: AgentWorkspace) -> None:
-    """Test that last_metrics property is accessible."""
+@pytest.mark.asyncio
+async def test_concurrent_runs_keep_separate_contexts(mock_workspace: AgentWorkspace) -> None:
+    """Test that parallel runs on one runner record their own tools and responses."""
+    runner = AgentRunner(
+        workspace=mock_workspace,
+        model="anthropic:claude-sonnet-4-20250514",
+        api_key="test-key",
+    )
+
+    async def mock_astream(inputs, **kwargs):
+        text = inputs["messages"][0]["content"]
+        assert get_run_context().session_key == text
+        tool_msg = Mock(content="", tool_calls=[{"name": f"tool_{text}", "id": "1"}])
+        yield {"model": {"messages": [tool_msg]}}
+        await asyncio.sleep(0.01)
+        yield {"tools": {"messages": []}}
+        yield {"model": {"messages": [Mock(content=f"reply {text}", tool_calls=[])]}}
+
+    runner._agent = Mock()
+    runner._agent.astream = mock_astream
+
+    context_a = RunContext(session_key="a")
+    context_b = RunContext(session_key="b")
+    result_a, result_b = await asyncio.gather(
+        runner.run("a", context=context_a),
+        runner.run("b", context=context_b),
+    )
+
+    assert result_a is context_a
+    assert result_b is context_b
+    assert context_a.response == "reply a"
+    assert context_b.response == "reply b"
+    assert context_a.tools_used == ["tool_a"]
+    assert context_b.tools_used == ["tool_b"]
+    assert context_a.metrics is not context_b.metrics
+
+
+@pytest.mark.asyncio
+async def test_partial_metrics_recorded_on_interrupt(mock_workspace: AgentWorkspace) -> None:
+    """Test that the caller's context holds partial metrics when a run is interrupted."""
     runner = AgentRunner(
         workspace=mock_workspace,
         model="anthropic:claude-sonnet-4-20250514",
         api_key="test-key",
     )
 
-    # Should not raise AttributeError
-    metrics = runner.last_metrics
-    assert metrics is None
+    async def interrupted_astream(*args, **kwargs):
+        yield {"model": {"messages": [Mock(content="", tool_calls=[{"name": "shell", "id": "1"}])]}}
+        raise InterruptSignalError([("telegram", "new message")])
+
+    runner._agent = Mock()
+    runner._agent.astream = interrupted_astream
+
+    context = RunContext(session_key="telegram:1")
+    with pytest.raises(InterruptSignalError):
+        await runner.run("Test message", context=context)
+
+    assert context.metrics is not None
+    assert context.metrics.is_partial is True
+    assert context.tools_used == ["shell"]
+    assert get_run_context() is None
 
 
 @pytest.mark.asyncio
@@ -75,12 +132,13 @@ async def test_agent_runner_populates_metrics_after_run(mock_workspace: AgentWor
     runner._agent.astream = mock_astream
 
     # Run the agent
-    response = await runner.run("Test message")
+    result = await runner.run("Test message")
 
     # Verify metrics were populated (even if zeros due to mock callback)
-    assert runner.last_metrics is not None
-    assert isinstance(runner.last_metrics, InvocationMetrics)
-    assert runner.last_metrics.duration_ms > 0  # Duration should be captured
+    assert result.response == "Test response"
+    assert result.metrics is not None
+    assert isinstance(result.metrics, InvocationMetrics)
+    assert result.metrics.duration_ms > 0  # Duration should be captured
 
 
 @pytest.mark.asyncio
@@ -100,12 +158,12 @@ async def test_agent_runner_metrics_include_duration(mock_workspace: AgentWorksp
     runner._agent.astream = mock_astream
 
     # Run the agent
-    await runner.run("Test message")
+    result = await runner.run("Test message")
 
     # Verify duration is positive
-    assert runner.last_metrics is not None
-    assert runner.last_metrics.duration_ms > 0
-    assert runner.last_metrics.model == "anthropic:claude-sonnet-4-20250514"
+    assert result.metrics is not None
+    assert result.metrics.duration_ms > 0
+    assert result.metrics.model == "anthropic:claude-sonnet-4-20250514"
 
 
 @pytest.mark.asyncio
@@ -128,12 +186,13 @@ async def test_agent_runner_metrics_on_timeout(mock_workspace: AgentWorkspace) -
     runner._agent.astream = slow_astream
 
     # Run the agent (should timeout)
-    response = await runner.run("Test message")
+    result = await runner.run("Test message")
 
     # Should return timeout message
-    assert "ran out of time" in response.lower()
+    assert "ran out of time" in result.response.lower()
 
     # Metrics should still be extracted (partial)
-    assert runner.last_metrics is not None
-    assert isinstance(runner.last_metrics, InvocationMetrics)
-    assert runner.last_metrics.duration_ms > 0
+    assert result.metrics is not None
+    assert isinstance(result.metrics, InvocationMetrics)
+    assert result.metrics.is_partial is True
+    assert result.metrics.duration_ms > 0
@@ -6,6 +6,7 @@ from unittest.mock import AsyncMock, MagicMock
 import pytest
 
 from openpaw.agent.middleware.approval import ApprovalRequiredError, ApprovalToolMiddleware
+from openpaw.agent.run_context import RunContext, bind_run_context
 from openpaw.agent.runner import AgentRunner
 from openpaw.core.config.models import ApprovalGatesConfig, ToolApprovalConfig
 from openpaw.runtime.approval import ApprovalGateManager
@@ -248,7 +249,7 @@ class TestApprovalToolMiddleware:
     """Test approval tool middleware."""
 
     async def test_middleware_no_manager_executes_normally(self):
-        """When no manager set, tools run normally."""
+        """When no manager is configured, tools run normally."""
         middleware = ApprovalToolMiddleware()
 
         # Create mock request and handler
@@ -269,14 +270,15 @@ class TestApprovalToolMiddleware:
         )
         manager = ApprovalGateManager(config)
 
-        middleware = ApprovalToolMiddleware()
-        middleware.set_context(manager, "session:123", "thread1")
+        middleware = ApprovalToolMiddleware(manager)
+        context = RunContext(session_key="session:123", thread_id="thread1")
 
         mock_request = MagicMock()
         mock_request.tool_call = {"name": "safe_tool", "args": {}}
         mock_handler = AsyncMock(return_value="tool_result")
 
-        result = await middleware._check_and_execute(mock_request, mock_handler)
+        with bind_run_context(context):
+            result = await middleware._check_and_execute(mock_request, mock_handler)
         assert result == "tool_result"
         mock_handler.assert_called_once()
 
@@ -288,15 +290,16 @@ class TestApprovalToolMiddleware:
         )
         manager = ApprovalGateManager(config)
 
-        middleware = ApprovalToolMiddleware()
-        middleware.set_context(manager, "session:123", "thread1")
+        middleware = ApprovalToolMiddleware(manager)
+        context = RunContext(session_key="session:123", thread_id="thread1")
 
         mock_request = MagicMock()
         mock_request.tool_call = {"name": "dangerous_tool", "args": {"arg": "value"}, "id": "call_abc123"}
         mock_handler = AsyncMock()
 
         with pytest.raises(ApprovalRequiredError) as exc_info:
-            await middleware._check_and_execute(mock_request, mock_handler)
+            with bind_run_context(context):
+                await middleware._check_and_execute(mock_request, mock_handler)
 
         assert exc_info.value.tool_name == "dangerous_tool"
         assert exc_info.value.tool_args == {"arg": "value"}
@@ -320,15 +323,16 @@ class TestApprovalToolMiddleware:
         )
         manager.resolve(approval.id, approved=True)
 
-        middleware = ApprovalToolMiddleware()
-        middleware.set_context(manager, "session:123", "thread1")
+        middleware = ApprovalToolMiddleware(manager)
+        context = RunContext(session_key="session:123", thread_id="thread1")
 
         mock_request = MagicMock()
         mock_request.tool_call = {"name": "dangerous_tool", "args": {"arg": "value"}}
         mock_handler = AsyncMock(return_value="tool_result")
 
         # Should execute without raising (recent approval exists)
-        result = await middleware._check_and_execute(mock_request, mock_handler)
+        with bind_run_context(context):
+            result = await middleware._check_and_execute(mock_request, mock_handler)
         assert result == "tool_result"
         mock_handler.assert_called_once()
 
@@ -4,6 +4,7 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from openpaw.agent.run_context import RunContext
 from openpaw.core.config.models import AutoCompactConfig
 from openpaw.workspace.message_processor import MessageProcessor
 
@@ -16,8 +17,6 @@ def mock_processor():
         session_manager=MagicMock(),
         queue_manager=MagicMock(),
         builtin_loader=MagicMock(),
-        queue_middleware=MagicMock(),
-        approval_middleware=MagicMock(),
         approval_manager=None,
         workspace_name="test_workspace",
         token_logger=MagicMock(),
@@ -103,7 +102,7 @@ async def test_auto_compact_triggers_above_threshold(mock_processor):
 
     # Mock agent run for summary
     mock_processor._agent_runner.run = AsyncMock(
-        return_value="Summary of conversation"
+        return_value=RunContext(response="Summary of conversation")
     )
     mock_processor._agent_runner.checkpointer = MagicMock()
 
@@ -154,7 +153,7 @@ async def test_auto_compact_generates_summary(mock_processor):
 
     # Mock agent run
     summary_text = "This is a conversation summary"
-    mock_processor._agent_runner.run = AsyncMock(return_value=summary_text)
+    mock_processor._agent_runner.run = AsyncMock(return_value=RunContext(response=summary_text))
     mock_processor._agent_runner.checkpointer = MagicMock()
 
     # Mock session manager
@@ -200,7 +199,7 @@ async def test_auto_compact_notifies_user(mock_processor):
     )
 
     # Mock agent run
-    mock_processor._agent_runner.run = AsyncMock(return_value="Summary")
+    mock_processor._agent_runner.run = AsyncMock(return_value=RunContext(response="Summary"))
     mock_processor._agent_runner.checkpointer = MagicMock()
 
     # Mock session manager
@@ -260,3 +259,218 @@ async def test_auto_compact_no_config_returns_none(mock_processor):
     assert result is None
     # Ensure get_context_info was never called
     mock_processor._agent_runner.get_context_info.assert_not_called()
+
+
+def _thread(turns, start=0):
+    """Checkpointed messages of ``turns`` user turns with stable IDs."""
+    from langchain_core.messages import AIMessage, HumanMessage
+
+    messages = []
+    for index in range(start, start + turns):
+        messages.append(HumanMessage(content=f"question {index}", id=f"h{index}"))
+        messages.append(AIMessage(content=f"answer {index}", id=f"a{index}"))
+    return messages
+
+
+def _prepare(processor, messages, thread_id="telegram:123:conv_old", summary="Prepared summary"):
+    """Store a prepared compaction covering ``messages``."""
+    from datetime import UTC, datetime
+
+    from openpaw.model.session import PreparedCompaction
+
+    processor._prepared_compactions["telegram:123"] = PreparedCompaction(
+        thread_id=thread_id,
+        summary=summary,
+        message_count=len(messages),
+        last_message_id=messages[-1].id,
+        prepared_at=datetime.now(UTC),
+        duration_ms=4200.0,
+    )
+
+
+def _over_threshold(processor):
+    """Mock high utilization and the collaborators of a swap."""
+    processor._agent_runner.get_context_info = AsyncMock(
+        return_value={
+            "max_input_tokens": 200000,
+            "approximate_tokens": 170000,
+            "utilization": 0.85,
+            "message_count": 150,
+        }
+    )
+    processor._conversation_archiver.archive = AsyncMock(return_value=MagicMock())
+    processor._agent_runner.run = AsyncMock(return_value=RunContext(response="Inline summary"))
+    processor._agent_runner.checkpointer = MagicMock()
+    processor._session_manager.new_conversation = MagicMock(return_value="conv_new")
+
+
+@pytest.mark.asyncio
+async def test_auto_compact_swaps_prepared_summary_without_llm_call(mock_processor):
+    """A current prepared summary swaps threads without running the agent."""
+    import asyncio
+
+    _over_threshold(mock_processor)
+    messages = _thread(3)
+    mock_processor._agent_runner.thread_messages = AsyncMock(return_value=messages)
+    _prepare(mock_processor, messages)
+
+    result = await mock_processor._check_auto_compact(
+        "telegram:123", "telegram:123:conv_old", AsyncMock()
+    )
+
+    assert result == "telegram:123:conv_new"
+    mock_processor._agent_runner.run.assert_not_called()
+    thread_id, message = mock_processor._pending_summaries["telegram:123"]
+    assert thread_id == "telegram:123:conv_new"
+    assert "Prepared summary" in message
+
+    # Archiving trails the swap in the background
+    await asyncio.sleep(0)
+    archive_call = mock_processor._conversation_archiver.archive.call_args
+    assert archive_call.kwargs["summary"] == "Prepared summary"
+
+    stats = mock_processor.compaction_stats()
+    assert stats["prepared_swaps"] == 1
+    assert stats["inline_swaps"] == 0
+    assert stats["critical_path_rate"] == 0.0
+
+
+@pytest.mark.asyncio
+async def test_auto_compact_ignores_stale_prepared_summary(mock_processor):
+    """A summary missing the latest turn falls back to inline compaction."""
+    _over_threshold(mock_processor)
+    messages = _thread(3)
+    _prepare(mock_processor, messages)
+    mock_processor._agent_runner.thread_messages = AsyncMock(return_value=messages + _thread(1, start=3))
+
+    result = await mock_processor._check_auto_compact(
+        "telegram:123", "telegram:123:conv_old", AsyncMock()
+    )
+
+    assert result == "telegram:123:conv_new"
+    assert mock_processor._agent_runner.run.call_count == 2
+    assert "telegram:123" not in mock_processor._pending_summaries
+    assert mock_processor.compaction_stats()["inline_swaps"] == 1
+
+
+@pytest.mark.asyncio
+async def test_precompact_prepares_summary_for_idle_session(mock_processor):
+    """The background job summarizes the thread without running the agent."""
+    from openpaw.core.prompts.commands import SUMMARIZE_PROMPT
+
+    messages = _thread(3)
+    mock_processor._queue_manager.peek_pending = AsyncMock(return_value=False)
+    mock_processor._agent_runner.thread_messages = AsyncMock(return_value=messages)
+    mock_processor._agent_runner.summarize_thread = AsyncMock(
+        return_value=RunContext(response="Background summary")
+    )
+
+    await mock_processor._precompact("telegram:123", "telegram:123:conv_old", idle_seconds=0)
+
+    mock_processor._agent_runner.summarize_thread.assert_called_once_with(
+        "telegram:123:conv_old", SUMMARIZE_PROMPT, messages=messages
+    )
+    prepared = mock_processor._prepared_compactions["telegram:123"]
+    assert prepared.summary == "Background summary"
+    assert prepared.message_count == 6
+    assert prepared.last_message_id == "a2"
+    assert prepared.thread_id == "telegram:123:conv_old"
+    mock_processor._agent_runner.run.assert_not_called()
+    assert mock_processor.compaction_stats()["prepared"] == 1
+
+
+@pytest.mark.asyncio
+async def test_precompact_skips_busy_session(mock_processor):
+    """Pending messages mean the session is not idle; nothing is prepared."""
+    mock_processor._queue_manager.peek_pending = AsyncMock(return_value=True)
+    mock_processor._agent_runner.summarize_thread = AsyncMock()
+
+    await mock_processor._precompact("telegram:123", "telegram:123:conv_old", idle_seconds=0)
+
+    mock_processor._agent_runner.summarize_thread.assert_not_called()
+    assert "telegram:123" not in mock_processor._prepared_compactions
+
+
+def _past_precompact_trigger(processor, tokens=150000):
+    """Session state of a thread past the 0.6 low watermark of 200k tokens."""
+    processor._session_manager.get_state = MagicMock(return_value=MagicMock(context_tokens=tokens))
+    processor._agent_runner.max_input_tokens = 200000
+    processor._queue_manager.peek_pending = AsyncMock(return_value=False)
+    processor._agent_runner.summarize_thread = AsyncMock(
+        return_value=RunContext(response="Background summary")
+    )
+
+
+@pytest.mark.asyncio
+async def test_precompact_folds_new_turns_into_prepared_summary(mock_processor):
+    """Each idle period summarizes only the turns since the previous summary."""
+    thread_id = "telegram:123:conv_old"
+    _past_precompact_trigger(mock_processor)
+    messages = _thread(3)
+    mock_processor._agent_runner.thread_messages = AsyncMock(return_value=messages)
+    await mock_processor._precompact("telegram:123", thread_id, idle_seconds=0)
+
+    # The next turn reschedules the summary, which folds in only that turn
+    messages = messages + _thread(1, start=3)
+    mock_processor._agent_runner.thread_messages = AsyncMock(return_value=messages)
+    mock_processor._agent_runner.summarize_thread.return_value = RunContext(response="Updated summary")
+    mock_processor._schedule_precompact("telegram:123", thread_id)
+    mock_processor._precompact_tasks.pop("telegram:123").cancel()
+    await mock_processor._precompact("telegram:123", thread_id, idle_seconds=0)
+
+    call = mock_processor._agent_runner.summarize_thread.call_args
+    assert call.kwargs["messages"] == messages[6:]
+    assert "Background summary" in call.args[1]
+    prepared = await mock_processor._take_prepared_compaction("telegram:123", thread_id)
+    assert prepared is not None
+    assert prepared.summary == "Updated summary"
+    assert prepared.message_count == 8
+
+
+@pytest.mark.asyncio
+async def test_precompact_skips_thread_without_new_messages(mock_processor):
+    """A prepared summary that covers the whole thread is not made again."""
+    _past_precompact_trigger(mock_processor)
+    messages = _thread(3)
+    mock_processor._agent_runner.thread_messages = AsyncMock(return_value=messages)
+    _prepare(mock_processor, messages)
+
+    await mock_processor._precompact("telegram:123", "telegram:123:conv_old", idle_seconds=0)
+
+    mock_processor._agent_runner.summarize_thread.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_precompact_leaves_out_trailing_tool_call(mock_processor):
+    """A tool call without results is not covered, so its results start the next summary."""
+    from langchain_core.messages import AIMessage
+
+    _past_precompact_trigger(mock_processor)
+    interrupted = AIMessage(
+        content="", id="call", tool_calls=[{"name": "read_file", "args": {}, "id": "call_1"}]
+    )
+    mock_processor._agent_runner.thread_messages = AsyncMock(return_value=[*_thread(2), interrupted])
+
+    await mock_processor._precompact("telegram:123", "telegram:123:conv_old", idle_seconds=0)
+
+    prepared = mock_processor._prepared_compactions["telegram:123"]
+    assert prepared.message_count == 4
+    assert prepared.last_message_id == "a1"
+
+
+@pytest.mark.asyncio
+async def test_precompact_respects_token_budget(mock_processor):
+    """Background summaries are compact work under the workspace token budget."""
+    from openpaw.core.config.models import TokenBudgetConfig
+    from openpaw.runtime.queue.budget import TokenBudget
+
+    _past_precompact_trigger(mock_processor)
+    budget = TokenBudget(TokenBudgetConfig(enabled=True, tokens_per_hour=1000, policy="defer"))
+    budget.record("user", 5000)
+    mock_processor._token_budget = budget
+
+    await mock_processor._precompact("telegram:123", "telegram:123:conv_old", idle_seconds=0)
+
+    mock_processor._agent_runner.summarize_thread.assert_not_called()
+    assert "telegram:123" not in mock_processor._prepared_compactions
+    assert budget.get_stats()["deferred"] == 1
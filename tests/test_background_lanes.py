@@ -0,0 +1,154 @@
+"""Tests for routing background work through the subagent and cron lanes."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from openpaw.core.config.models import CronDefinition, CronOutputConfig
+from openpaw.runtime.queue.lane import LaneQueue, QueueItem
+from openpaw.runtime.scheduling.cron import CronScheduler
+from openpaw.runtime.subagent.runner import SubAgentRunner
+
+
+async def _stop(task: asyncio.Task[None]) -> None:
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
+
+
+@pytest.mark.asyncio
+async def test_slot_enforces_lane_cap():
+    lane_queue = LaneQueue(cron_concurrency=2)
+    processor = asyncio.create_task(lane_queue.process_slots("cron"))
+    running = 0
+    peak = 0
+    release = asyncio.Event()
+
+    async def job(name: str) -> None:
+        nonlocal running, peak
+        async with lane_queue.slot("cron", f"cron:{name}"):
+            running += 1
+            peak = max(peak, running)
+            await release.wait()
+            running -= 1
+
+    jobs = [asyncio.create_task(job(str(i))) for i in range(4)]
+    await asyncio.sleep(0.05)
+
+    stats = lane_queue.get_stats()["cron"]
+    assert peak == 2
+    assert stats["active"] == 2
+    assert stats["queued"] == 2
+
+    release.set()
+    await asyncio.gather(*jobs)
+    assert lane_queue.get_stats()["cron"]["dispatched"] == 4
+    await _stop(processor)
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_is_withdrawn():
+    """A caller cancelled while queued leaves no item or held slot behind."""
+    lane_queue = LaneQueue(subagent_concurrency=1)
+    processor = asyncio.create_task(lane_queue.process_slots("subagent"))
+    release = asyncio.Event()
+
+    async def hold() -> None:
+        async with lane_queue.slot("subagent", "subagent:a"):
+            await release.wait()
+
+    async def waiter() -> None:
+        async with lane_queue.slot("subagent", "subagent:b"):
+            pass
+
+    holder = asyncio.create_task(hold())
+    await asyncio.sleep(0.01)
+    blocked = asyncio.create_task(waiter())
+    await asyncio.sleep(0.01)
+    await _stop(blocked)
+
+    assert lane_queue.get_stats()["subagent"]["queued"] == 0
+    release.set()
+    await holder
+    await asyncio.sleep(0.01)
+    assert lane_queue.get_stats()["subagent"]["active"] == 0
+    await _stop(processor)
+
+
+@pytest.mark.asyncio
+async def test_background_lane_pauses_while_interactive_traffic_waits():
+    lane_queue = LaneQueue(background_pause_wait_ms=10)
+    processor = asyncio.create_task(lane_queue.process_slots("cron"))
+    # A runnable main-lane item with nothing draining the main lane
+    interactive = QueueItem(session_key="telegram:1", payload=None)
+    await lane_queue.enqueue(interactive)
+    await asyncio.sleep(0.02)
+
+    ran = asyncio.Event()
+
+    async def job() -> None:
+        async with lane_queue.slot("cron", "cron:report"):
+            ran.set()
+
+    task = asyncio.create_task(job())
+    await asyncio.sleep(0.05)
+    assert not ran.is_set()
+    assert lane_queue.get_stats()["cron"]["paused"] == 1
+
+    # Interactive backlog drains; the lane resumes on its next poll
+    await lane_queue.consume_session_pending("telegram:1")
+    await asyncio.wait_for(ran.wait(), timeout=2)
+    await task
+
+    stats = lane_queue.get_stats()["cron"]
+    assert stats["paused"] == 0
+    assert stats["pause_count"] == 1
+    assert stats["paused_ms"] > 0
+    assert lane_queue.get_stats()["main"]["paused"] == 0
+    await _stop(processor)
+
+
+@pytest.mark.asyncio
+async def test_cron_job_runs_in_cron_lane(tmp_path):
+    lane_queue = LaneQueue()
+    processor = asyncio.create_task(lane_queue.process_slots("cron"))
+    scheduler = CronScheduler(
+        workspace_path=tmp_path,
+        agent_factory=MagicMock(),
+        channels={},
+        lane_queue=lane_queue,
+    )
+    scheduler._run_cron = AsyncMock()
+    cron = CronDefinition(
+        name="daily",
+        schedule="0 9 * * *",
+        prompt="Summarize",
+        output=CronOutputConfig(channel="telegram", chat_id=1),
+    )
+
+    await scheduler._execute_cron(cron)
+
+    scheduler._run_cron.assert_awaited_once_with(cron)
+    assert lane_queue.get_stats()["cron"]["dispatched"] == 1
+    assert "cron:daily" in lane_queue.get_session_wait_stats("cron")
+    await _stop(processor)
+
+
+@pytest.mark.asyncio
+async def test_subagent_uses_lane_slot_when_available():
+    lane_queue = LaneQueue()
+    runner = SubAgentRunner(
+        agent_factory=MagicMock(),
+        store=MagicMock(),
+        channels={},
+        lane_queue=lane_queue,
+    )
+    request = MagicMock(id="abc123")
+
+    processor = asyncio.create_task(lane_queue.process_slots("subagent"))
+    async with runner._concurrency_slot(request):
+        assert lane_queue.get_stats()["subagent"]["active"] == 1
+    await _stop(processor)
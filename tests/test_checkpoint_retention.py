@@ -0,0 +1,111 @@
+"""Tests for checkpoint pruning and compaction of conversations.db."""
+
+import pytest
+from langchain_core.messages import HumanMessage
+from langgraph.checkpoint.base import empty_checkpoint
+
+from openpaw.core.config.models import CheckpointRetentionConfig, SqliteConfig
+from openpaw.runtime.session.archiver import ConversationArchiver
+from openpaw.runtime.session.manager import SessionManager
+from openpaw.runtime.session.retention import CheckpointRetention
+from openpaw.stores.checkpoint import PooledSqliteSaver
+from openpaw.stores.sqlite import SqliteConnectionPool
+
+
+@pytest.fixture
+async def saver(tmp_path):
+    pool = SqliteConnectionPool(tmp_path / "conversations.db", SqliteConfig(readers=1))
+    await pool.open()
+    saver = PooledSqliteSaver(pool)
+    await saver.setup()
+    yield saver
+    await pool.close()
+
+
+async def _put(saver: PooledSqliteSaver, thread_id: str, count: int = 1, content: str = "hello") -> list[str]:
+    """Store ``count`` checkpoints on a thread, each with one pending write."""
+    config = {"configurable": {"thread_id": thread_id, "checkpoint_ns": ""}}
+    ids = []
+    for step in range(count):
+        checkpoint = empty_checkpoint()
+        checkpoint["channel_values"] = {"messages": [HumanMessage(content=content)]}
+        config = await saver.aput(config, checkpoint, {"step": step}, {})
+        await saver.aput_writes(config, [("messages", content)], task_id=f"task-{step}")
+        ids.append(config["configurable"]["checkpoint_id"])
+    return ids
+
+
+async def _count(saver: PooledSqliteSaver, table: str, thread_id: str) -> int:
+    async with saver.conn.execute(f"SELECT COUNT(*) FROM {table} WHERE thread_id = ?", (thread_id,)) as cursor:
+        row = await cursor.fetchone()
+    return row[0]
+
+
+@pytest.mark.asyncio
+async def test_prune_keeps_newest_checkpoints_and_their_writes(saver):
+    ids = await _put(saver, "telegram:1:conv_a", count=5)
+    await _put(saver, "telegram:2:conv_b", count=1)
+
+    pruned = await saver.aprune_checkpoints(keep=2)
+
+    listed = [item.config["configurable"]["checkpoint_id"] async for item in saver.alist(
+        {"configurable": {"thread_id": "telegram:1:conv_a"}}
+    )]
+    assert pruned == 3
+    assert listed == ids[:-3:-1]
+    assert await _count(saver, "writes", "telegram:1:conv_a") == 2
+    assert await _count(saver, "checkpoints", "telegram:2:conv_b") == 1
+
+
+@pytest.mark.asyncio
+async def test_retention_deletes_only_archived_inactive_threads(saver, tmp_path):
+    sessions = SessionManager(tmp_path)
+    archiver = ConversationArchiver(tmp_path, "ws")
+    active_thread = sessions.get_thread_id("telegram:1")
+    archived_thread = "telegram:1:conv_2026-01-01T00-00-00"
+    continued_thread = "telegram:2:conv_2026-01-02T00-00-00"
+    unarchived_thread = "telegram:3:conv_2026-01-03T00-00-00"
+
+    for thread_id in (active_thread, archived_thread, continued_thread, unarchived_thread):
+        await _put(saver, thread_id)
+    for thread_id in (active_thread, archived_thread, continued_thread):
+        session_key, conversation_id = thread_id.rsplit(":", 1)
+        await archiver.archive(saver, thread_id, session_key, conversation_id)
+    # Written to after its archive, e.g. archived on shutdown and resumed
+    await _put(saver, continued_thread)
+
+    config = CheckpointRetentionConfig(enabled=True, keep_checkpoints=1, delete_archived=True)
+    retention = CheckpointRetention(saver, sessions, archiver, config)
+    result = await retention.run()
+
+    remaining = set(await saver.alist_thread_ids())
+    assert remaining == {active_thread, continued_thread, unarchived_thread}
+    assert result["deleted_threads"] == 1
+    assert result["pruned_checkpoints"] == 1
+    assert retention.get_stats()["passes"] == 1
+
+
+def test_retention_is_opt_in():
+    config = CheckpointRetentionConfig()
+    assert config.enabled is False
+    assert config.delete_archived is False
+
+
+@pytest.mark.asyncio
+async def test_vacuum_reclaims_deleted_threads(saver):
+    for index in range(20):
+        await _put(saver, f"telegram:{index}:conv", count=3, content="x" * 20000)
+    size_before = await saver.adatabase_size()
+
+    for index in range(20):
+        await saver.adelete_thread(f"telegram:{index}:conv")
+    first = await saver.avacuum()
+    assert first > 0
+    assert await saver.adatabase_size() == size_before - first
+
+    # Converted once; later passes only release newly freed pages
+    async with saver.conn.execute("PRAGMA auto_vacuum") as cursor:
+        assert (await cursor.fetchone())[0] == 2
+    await _put(saver, "telegram:0:conv", count=3, content="x" * 20000)
+    await saver.adelete_thread("telegram:0:conv")
+    assert await saver.avacuum() > 0
@@ -4,6 +4,7 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from openpaw.agent.run_context import RunContext
 from openpaw.channels.commands.base import CommandContext
 from openpaw.channels.commands.handlers import (
     CompactCommand,
@@ -38,6 +39,8 @@ def mock_context(tmp_path):
     context.channel = AsyncMock()
     context.session_manager = MagicMock()
     context.queue_manager = AsyncMock()
+    context.queue_manager.lane_queue = MagicMock()
+    context.queue_manager.get_stats = MagicMock(return_value={})
     context.agent_runner = MagicMock()
     context.agent_runner.model_id = "anthropic:claude-sonnet-4-20250514"
     context.command_router = MagicMock()
@@ -274,6 +277,25 @@ class TestStatusCommand:
         assert "Messages: 42" in result.response
         assert result.new_thread_id is None
 
+    @pytest.mark.asyncio
+    async def test_status_command_shows_queue_wait(self, mock_message, mock_context):
+        """Test /status command reports this session's queue-wait percentiles."""
+        mock_context.session_manager.get_state.return_value = None
+        mock_context.queue_manager.lane_queue.get_session_wait_stats.return_value = {
+            mock_message.session_key: {
+                "samples": 12,
+                "p50_wait_ms": 40,
+                "p95_wait_ms": 1250,
+                "p99_wait_ms": 1400,
+                "max_wait_ms": 1500,
+            }
+        }
+
+        handler = StatusCommand()
+        result = await handler.handle(mock_message, "", mock_context)
+
+        assert "Queue wait: p50 40ms, p95 1,250ms (last 12 runs)" in result.response
+
     @pytest.mark.asyncio
     async def test_status_command_no_session(self, mock_message, mock_context):
         """Test /status command when no session exists."""
@@ -365,7 +387,7 @@ class TestCompactCommand:
         ]
 
         # Mock agent runner to return summary
-        mock_context.agent_runner.run = AsyncMock(side_effect=[summary_text, None])
+        mock_context.agent_runner.run = AsyncMock(side_effect=[RunContext(response=summary_text), RunContext()])
 
         # Mock archiver
         mock_archive = MagicMock()
@@ -405,7 +427,7 @@ class TestCompactCommand:
         ]
 
         # Mock agent runner
-        mock_context.agent_runner.run = AsyncMock(side_effect=[summary_text, None])
+        mock_context.agent_runner.run = AsyncMock(side_effect=[RunContext(response=summary_text), RunContext()])
 
         # Mock archiver
         mock_archive = MagicMock()
@@ -442,7 +464,7 @@ class TestCompactCommand:
         ]
 
         # Mock agent runner
-        mock_context.agent_runner.run = AsyncMock(return_value="Test summary")
+        mock_context.agent_runner.run = AsyncMock(return_value=RunContext(response="Test summary"))
 
         # Mock archiver
         mock_archive = MagicMock()
@@ -478,7 +500,7 @@ class TestCompactCommand:
         ]
 
         # Mock agent runner
-        mock_context.agent_runner.run = AsyncMock(side_effect=[summary_text, None])
+        mock_context.agent_runner.run = AsyncMock(side_effect=[RunContext(response=summary_text), RunContext()])
 
         # Mock archiver
         mock_archive = MagicMock()
@@ -577,7 +599,7 @@ class TestCompactCommand:
         ]
 
         # Mock agent runner
-        mock_context.agent_runner.run = AsyncMock(side_effect=[summary_text, None])
+        mock_context.agent_runner.run = AsyncMock(side_effect=[RunContext(response=summary_text), RunContext()])
 
         # Mock archiver to raise exception
         mock_context.conversation_archiver.archive = AsyncMock(
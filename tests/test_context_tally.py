@@ -0,0 +1,132 @@
+"""Tests for the per-thread running context token tally."""
+
+from datetime import UTC, datetime
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from langchain_core.messages import AIMessage
+
+from openpaw.agent.runner import AgentRunner
+from openpaw.core.config.models import AutoCompactConfig
+from openpaw.model.session import SessionState
+from openpaw.runtime.session.manager import SessionManager
+from openpaw.workspace.message_processor import MessageProcessor
+
+
+def test_session_state_tally_roundtrip():
+    """Tally fields survive serialization and default for old state files."""
+    original = SessionState(
+        conversation_id="conv_2026-02-07T14-30-00",
+        started_at=datetime(2026, 2, 7, 14, 30, 0, tzinfo=UTC),
+        context_tokens=42000,
+        runs_since_recount=3,
+    )
+    restored = SessionState.from_dict(original.to_dict())
+    assert restored.context_tokens == 42000
+    assert restored.runs_since_recount == 3
+
+    legacy = SessionState.from_dict({
+        "conversation_id": "conv_old",
+        "started_at": "2026-02-07T14:30:00+00:00",
+    })
+    assert legacy.context_tokens is None
+    assert legacy.runs_since_recount == 0
+
+
+def test_record_context_tokens_counts_runs(tmp_path: Path):
+    """Usage updates advance the drift counter; recounts reset it."""
+    manager = SessionManager(tmp_path)
+    thread_id = manager.get_thread_id("telegram:1")
+
+    manager.record_context_tokens("telegram:1", thread_id, 1000)
+    manager.record_context_tokens("telegram:1", thread_id, 1500)
+    state = manager.get_state("telegram:1")
+    assert state.context_tokens == 1500
+    assert state.runs_since_recount == 2
+
+    manager.record_context_tokens("telegram:1", thread_id, 1400, recount=True)
+    assert state.runs_since_recount == 0
+
+    # Persisted alongside the rest of the session state
+    reloaded = SessionManager(tmp_path).get_state("telegram:1")
+    assert reloaded.context_tokens == 1400
+
+
+def test_record_context_tokens_ignores_rotated_thread(tmp_path: Path):
+    """A late run on an old thread does not overwrite the new thread's tally."""
+    manager = SessionManager(tmp_path)
+    old_thread_id = manager.get_thread_id("telegram:1")
+    manager.new_conversation("telegram:1")
+
+    manager.record_context_tokens("telegram:1", old_thread_id, 90000)
+
+    state = manager.get_state("telegram:1")
+    assert state.context_tokens is None
+    assert state.runs_since_recount == 0
+
+
+def test_context_tokens_from_usage_metadata():
+    """Context size is input plus output tokens of the final model call."""
+    message = AIMessage(
+        content="Done",
+        usage_metadata={"input_tokens": 1200, "output_tokens": 80, "total_tokens": 1280},
+    )
+    assert AgentRunner._context_tokens(message) == 1280
+    assert AgentRunner._context_tokens(AIMessage(content="No usage")) is None
+
+
+@pytest.fixture
+def processor(tmp_path: Path):
+    """MessageProcessor with a real SessionManager and a mocked runner."""
+    agent_runner = AsyncMock()
+    agent_runner.max_input_tokens = 100000
+    agent_runner.get_context_info = AsyncMock(
+        return_value={
+            "max_input_tokens": 100000,
+            "approximate_tokens": 30000,
+            "utilization": 0.3,
+            "message_count": 12,
+        }
+    )
+    return MessageProcessor(
+        agent_runner=agent_runner,
+        session_manager=SessionManager(tmp_path),
+        queue_manager=MagicMock(),
+        builtin_loader=MagicMock(),
+        approval_manager=None,
+        workspace_name="test_workspace",
+        token_logger=MagicMock(),
+        logger=MagicMock(),
+        conversation_archiver=AsyncMock(),
+        auto_compact_config=AutoCompactConfig(enabled=True, trigger=0.8, recount_interval=2),
+    )
+
+
+async def test_utilization_recounts_without_tally(processor):
+    """The first check recounts the thread and seeds the tally."""
+    thread_id = processor._session_manager.get_thread_id("telegram:1")
+
+    info = await processor._context_utilization("telegram:1", thread_id)
+
+    assert info["utilization"] == 0.3
+    processor._agent_runner.get_context_info.assert_awaited_once_with(thread_id)
+    assert processor._session_manager.get_state("telegram:1").context_tokens == 30000
+
+
+async def test_utilization_uses_tally_until_recount_interval(processor):
+    """Checks read the tally and only recount every recount_interval runs."""
+    manager = processor._session_manager
+    thread_id = manager.get_thread_id("telegram:1")
+    manager.record_context_tokens("telegram:1", thread_id, 50000)
+
+    info = await processor._context_utilization("telegram:1", thread_id)
+    assert info["utilization"] == 0.5
+    assert info["approximate_tokens"] == 50000
+    processor._agent_runner.get_context_info.assert_not_called()
+
+    manager.record_context_tokens("telegram:1", thread_id, 60000)
+    info = await processor._context_utilization("telegram:1", thread_id)
+    assert info["utilization"] == 0.3
+    processor._agent_runner.get_context_info.assert_awaited_once()
+    assert manager.get_state("telegram:1").runs_since_recount == 0
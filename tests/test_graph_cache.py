@@ -0,0 +1,197 @@
+"""Tests for the compiled agent graph cache."""
+
+import logging
+from pathlib import Path
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+
+from openpaw.agent import AgentRunner
+from openpaw.agent.graph_cache import AgentGraphCache, CompiledAgent
+from openpaw.core.workspace import AgentWorkspace
+from openpaw.workspace.agent_factory import AgentFactory, RuntimeModelOverride
+
+
+@pytest.fixture
+def workspace(tmp_path: Path) -> AgentWorkspace:
+    """Create a minimal workspace on disk."""
+    agent_path = tmp_path / "cache_ws" / "agent"
+    agent_path.mkdir(parents=True)
+    for name in ("AGENT.md", "USER.md", "SOUL.md", "HEARTBEAT.md"):
+        (agent_path / name).write_text(f"# {name}")
+
+    from openpaw.workspace.loader import WorkspaceLoader
+
+    return WorkspaceLoader(tmp_path).load("cache_ws")
+
+
+@pytest.fixture
+def fixed_prompt():
+    """Pin the prompt timestamp so repeated builds see the same system prompt."""
+    with patch("openpaw.agent.runner.workspace_now") as mock_now:
+        mock_now.return_value.strftime.return_value = "Monday, 2026-01-05 09:00 UTC"
+        yield
+
+
+def _factory(workspace: AgentWorkspace, tools: list | None = None) -> AgentFactory:
+    return AgentFactory(
+        workspace=workspace,
+        model="anthropic:claude-test",
+        api_key="key",
+        max_turns=50,
+        temperature=0.7,
+        region=None,
+        timeout_seconds=300.0,
+        builtin_tools=tools or [],
+        workspace_tools=[],
+        enabled_builtin_names=[],
+        extra_model_kwargs={},
+        middleware=[],
+        logger=logging.getLogger("test"),
+    )
+
+
+class TestAgentGraphCache:
+    """Bookkeeping of the LRU cache itself."""
+
+    def test_hit_and_miss_counting(self):
+        cache = AgentGraphCache()
+        entry = CompiledAgent(graph="g", model="m")
+
+        assert cache.get("k") is None
+        cache.put("k", entry, build_ms=40.0)
+        assert cache.get("k") is entry
+
+        stats = cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+        assert stats["builds"] == 1
+        assert stats["avg_build_ms"] == 40
+        assert stats["entries"] == 1
+
+    def test_evicts_least_recently_used(self):
+        cache = AgentGraphCache(max_entries=2)
+        cache.put("a", CompiledAgent(graph="a", model=None), 1.0)
+        cache.put("b", CompiledAgent(graph="b", model=None), 1.0)
+        cache.get("a")
+        cache.put("c", CompiledAgent(graph="c", model=None), 1.0)
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+
+    def test_invalidate_drops_entries(self):
+        cache = AgentGraphCache()
+        cache.put("k", CompiledAgent(graph="g", model="m"), 1.0)
+        cache.invalidate("test")
+
+        assert cache.get("k") is None
+        assert cache.get_stats()["invalidations"] == 1
+
+
+@patch("openpaw.agent.runner.create_agent")
+@patch("openpaw.agent.runner.AgentRunner._create_model")
+class TestRunnerCaching:
+    """AgentRunner consults the cache only for stateless builds."""
+
+    def test_stateless_runners_share_compiled_graph(
+        self, mock_create_model: Mock, mock_create_agent: Mock, workspace, fixed_prompt
+    ):
+        mock_create_agent.side_effect = lambda **kwargs: Mock()
+        cache = AgentGraphCache()
+
+        first = AgentRunner(workspace=workspace, api_key="key", graph_cache=cache)
+        second = AgentRunner(workspace=workspace, api_key="key", graph_cache=cache)
+
+        assert second._agent is first._agent
+        assert second.model_instance is first.model_instance
+        assert mock_create_agent.call_count == 1
+        assert cache.get_stats()["hits"] == 1
+
+    def test_checkpointed_runner_bypasses_cache(
+        self, mock_create_model: Mock, mock_create_agent: Mock, workspace, fixed_prompt
+    ):
+        cache = AgentGraphCache()
+
+        AgentRunner(workspace=workspace, checkpointer=Mock(), graph_cache=cache)
+        AgentRunner(workspace=workspace, checkpointer=Mock(), graph_cache=cache)
+
+        assert mock_create_agent.call_count == 2
+        assert cache.get_stats()["misses"] == 0
+
+    def test_prompt_change_misses(
+        self, mock_create_model: Mock, mock_create_agent: Mock, workspace, fixed_prompt
+    ):
+        cache = AgentGraphCache()
+        AgentRunner(workspace=workspace, graph_cache=cache)
+
+        (workspace.path / "agent" / "AGENT.md").write_text("# Edited agent")
+        workspace.reload_files()
+        AgentRunner(workspace=workspace, graph_cache=cache)
+
+        assert mock_create_agent.call_count == 2
+
+    def test_filtered_tools_use_separate_entry(
+        self, mock_create_model: Mock, mock_create_agent: Mock, workspace, fixed_prompt
+    ):
+        tool_a, tool_b = MagicMock(), MagicMock()
+        tool_a.name, tool_b.name = "tool_a", "tool_b"
+        cache = AgentGraphCache()
+
+        runner = AgentRunner(workspace=workspace, tools=[tool_a, tool_b], graph_cache=cache)
+        runner.additional_tools = [tool_a]
+        runner._agent = runner._build_agent()
+        runner.additional_tools = [tool_a]
+        runner._agent = runner._build_agent()
+
+        assert mock_create_agent.call_count == 2
+        assert cache.get_stats()["hits"] == 1
+
+
+@patch("openpaw.agent.runner.create_agent")
+@patch("openpaw.agent.runner.AgentRunner._create_model")
+class TestFactoryGraphCache:
+    """AgentFactory owns the cache and invalidates it on configuration changes."""
+
+    def test_stateless_agents_reuse_graph(
+        self, mock_create_model: Mock, mock_create_agent: Mock, workspace, fixed_prompt
+    ):
+        factory = _factory(workspace)
+        factory.create_stateless_agent()
+        factory.create_stateless_agent()
+
+        stats = factory.graph_cache_stats()
+        assert mock_create_agent.call_count == 1
+        assert stats["hits"] == 1
+        assert stats["builds"] == 1
+
+    def test_model_override_invalidates(
+        self, mock_create_model: Mock, mock_create_agent: Mock, workspace, fixed_prompt
+    ):
+        factory = _factory(workspace)
+        factory.create_stateless_agent()
+        factory.set_runtime_override(RuntimeModelOverride(model="anthropic:other"))
+        factory.create_stateless_agent()
+
+        assert mock_create_agent.call_count == 2
+        assert factory.graph_cache_stats()["invalidations"] == 1
+
+    def test_removing_tools_invalidates(
+        self, mock_create_model: Mock, mock_create_agent: Mock, workspace, fixed_prompt
+    ):
+        tool = MagicMock()
+        tool.name = "search_conversations"
+        factory = _factory(workspace, tools=[tool])
+        factory.create_stateless_agent()
+        factory.remove_builtin_tools({"search_conversations"})
+
+        assert factory.graph_cache_stats()["entries"] == 0
+
+    def test_main_agent_not_cached(
+        self, mock_create_model: Mock, mock_create_agent: Mock, workspace, fixed_prompt
+    ):
+        factory = _factory(workspace)
+        factory.create_agent(checkpointer=Mock())
+
+        assert factory.graph_cache_stats()["misses"] == 0
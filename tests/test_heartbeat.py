@@ -6,6 +6,7 @@ from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
+from openpaw.agent.run_context import RunContext
 from openpaw.core.config import HeartbeatConfig
 from openpaw.runtime.scheduling.heartbeat import HEARTBEAT_PROMPT, HeartbeatScheduler
 
@@ -731,7 +732,7 @@ class TestRunHeartbeat:
         mock_workspace_now.return_value = mock_dt
 
         mock_agent_runner = AsyncMock()
-        mock_agent_runner.run.return_value = "HEARTBEAT_OK"
+        mock_agent_runner.run.return_value = RunContext(response="HEARTBEAT_OK")
         mock_agent_factory = Mock(return_value=mock_agent_runner)
 
         config = HeartbeatConfig(
@@ -758,7 +759,7 @@ class TestRunHeartbeat:
     async def test_run_heartbeat_passes_prompt_to_agent(self, tmp_workspace) -> None:
         """Test heartbeat passes generated prompt to agent."""
         mock_agent_runner = AsyncMock()
-        mock_agent_runner.run.return_value = "HEARTBEAT_OK"
+        mock_agent_runner.run.return_value = RunContext(response="HEARTBEAT_OK")
         mock_agent_factory = Mock(return_value=mock_agent_runner)
 
         config = HeartbeatConfig(enabled=True, suppress_ok=True)
@@ -785,7 +786,7 @@ class TestRunHeartbeat:
     async def test_run_heartbeat_suppresses_ok_response(self, tmp_workspace) -> None:
         """Test HEARTBEAT_OK response is suppressed from channel."""
         mock_agent_runner = AsyncMock()
-        mock_agent_runner.run.return_value = "HEARTBEAT_OK"
+        mock_agent_runner.run.return_value = RunContext(response="HEARTBEAT_OK")
         mock_agent_factory = Mock(return_value=mock_agent_runner)
 
         mock_channel = AsyncMock()
@@ -813,7 +814,7 @@ class TestRunHeartbeat:
         """Test non-OK response is sent to channel."""
         response_text = "Found issues requiring attention"
         mock_agent_runner = AsyncMock()
-        mock_agent_runner.run.return_value = response_text
+        mock_agent_runner.run.return_value = RunContext(response=response_text)
         mock_agent_factory = Mock(return_value=mock_agent_runner)
 
         mock_channel = Mock()
@@ -849,7 +850,7 @@ class TestRunHeartbeat:
     async def test_run_heartbeat_sends_ok_when_not_suppressed(self, tmp_workspace) -> None:
         """Test HEARTBEAT_OK is sent when suppress_ok=False."""
         mock_agent_runner = AsyncMock()
-        mock_agent_runner.run.return_value = "HEARTBEAT_OK"
+        mock_agent_runner.run.return_value = RunContext(response="HEARTBEAT_OK")
         mock_agent_factory = Mock(return_value=mock_agent_runner)
 
         mock_channel = Mock()
@@ -884,7 +885,7 @@ class TestRunHeartbeat:
     async def test_run_heartbeat_logs_error_when_channel_not_found(self, tmp_workspace) -> None:
         """Test error logged when target channel not found."""
         mock_agent_runner = AsyncMock()
-        mock_agent_runner.run.return_value = "Important alert"
+        mock_agent_runner.run.return_value = RunContext(response="Important alert")
         mock_agent_factory = Mock(return_value=mock_agent_runner)
 
         channels: dict[str, Any] = {}  # No channels configured
@@ -908,7 +909,7 @@ class TestRunHeartbeat:
     async def test_run_heartbeat_warns_when_no_routing_config(self, tmp_workspace) -> None:
         """Test warning when response generated but no routing configured."""
         mock_agent_runner = AsyncMock()
-        mock_agent_runner.run.return_value = "Important message"
+        mock_agent_runner.run.return_value = RunContext(response="Important message")
         mock_agent_factory = Mock(return_value=mock_agent_runner)
 
         mock_channel = Mock()
@@ -951,7 +952,7 @@ class TestRunHeartbeat:
     async def test_run_heartbeat_no_active_hours_always_runs(self, tmp_workspace) -> None:
         """Test heartbeat always runs when no active hours set."""
         mock_agent_runner = AsyncMock()
-        mock_agent_runner.run.return_value = "HEARTBEAT_OK"
+        mock_agent_runner.run.return_value = RunContext(response="HEARTBEAT_OK")
         mock_agent_factory = Mock(return_value=mock_agent_runner)
 
         config = HeartbeatConfig(
@@ -8,6 +8,7 @@ import pytest
 import yaml
 
 from openpaw.agent.metrics import InvocationMetrics
+from openpaw.agent.run_context import RunContext
 from openpaw.core.config import HeartbeatConfig
 from openpaw.runtime.scheduling.heartbeat import HeartbeatScheduler
 
@@ -34,16 +35,19 @@ def heartbeat_config() -> HeartbeatConfig:
 def mock_agent_runner() -> Mock:
     """Create a mock agent runner with metrics."""
     runner = Mock()
-    runner.run = AsyncMock(return_value="Test response")
-    runner.last_metrics = InvocationMetrics(
-        input_tokens=4500,
-        output_tokens=650,
-        total_tokens=5150,
-        llm_calls=2,
-        duration_ms=3200.0,
-        model="anthropic:claude-sonnet-4-20250514",
+    runner.run = AsyncMock(
+        return_value=RunContext(
+            response="Test response",
+            metrics=InvocationMetrics(
+                input_tokens=4500,
+                output_tokens=650,
+                total_tokens=5150,
+                llm_calls=2,
+                duration_ms=3200.0,
+                model="anthropic:claude-sonnet-4-20250514",
+            ),
+        )
     )
-    runner.last_tools_used = []
     return runner
 
 
@@ -174,7 +178,7 @@ class TestHeartbeatJSONLEnrichment:
         )
 
         # Make agent return HEARTBEAT_OK
-        mock_agent_runner.run.return_value = "HEARTBEAT_OK"
+        mock_agent_runner.run.return_value.response = "HEARTBEAT_OK"
 
         # Run heartbeat
         await scheduler._run_heartbeat()
@@ -296,8 +300,8 @@ class TestHeartbeatJSONLEnrichment:
             ],
         )
 
-        # Remove metrics from agent runner
-        mock_agent_runner.last_metrics = None
+        # Remove metrics from the run result
+        mock_agent_runner.run.return_value.metrics = None
 
         # Run heartbeat
         await scheduler._run_heartbeat()
@@ -0,0 +1,185 @@
+"""Tests for the token-budgeted history window middleware."""
+
+from types import SimpleNamespace
+
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+
+from openpaw.agent.middleware.history_window import (
+    HistoryWindowMiddleware,
+    select_window,
+)
+from openpaw.agent.run_context import RunContext, bind_run_context
+
+
+class FakeRequest(SimpleNamespace):
+    """Minimal ModelRequest stand-in supporting override()."""
+
+    def override(self, **overrides):
+        return FakeRequest(**{**vars(self), **overrides})
+
+
+def _turn(index: int, size: int = 400) -> list:
+    """One user turn with a tool round trip and a reply."""
+    return [
+        HumanMessage(content=f"question {index} " + "x" * size),
+        AIMessage(
+            content="",
+            tool_calls=[{"name": "read_file", "args": {"path": "a.md"}, "id": f"call_{index}"}],
+        ),
+        ToolMessage(content="y" * size, tool_call_id=f"call_{index}"),
+        AIMessage(content=f"answer {index}"),
+    ]
+
+
+def _conversation(turns: int, size: int = 400) -> list:
+    return [message for index in range(turns) for message in _turn(index, size)]
+
+
+class TestSelectWindow:
+    """Turn-boundary window selection."""
+
+    def test_everything_fits(self) -> None:
+        assert select_window(_conversation(3), max_tokens=100000, max_turns=20) == 0
+
+    def test_max_turns_limits_window(self) -> None:
+        messages = _conversation(5)
+        start = select_window(messages, max_tokens=100000, max_turns=2)
+        assert start == 12
+        assert isinstance(messages[start], HumanMessage)
+
+    def test_budget_limits_window(self) -> None:
+        messages = _conversation(10)
+        start = select_window(messages, max_tokens=700, max_turns=20)
+        assert 0 < start < len(messages)
+        assert isinstance(messages[start], HumanMessage)
+
+    def test_latest_turn_always_kept(self) -> None:
+        """The current turn's tool results are sent even when over budget."""
+        messages = _conversation(3, size=4000)
+        assert select_window(messages, max_tokens=10, max_turns=20) == 8
+
+
+class TestHistoryWindowMiddleware:
+    """Request rewriting and token accounting."""
+
+    def test_window_applied_and_savings_recorded(self) -> None:
+        middleware = HistoryWindowMiddleware(max_tokens=100000, max_turns=2, summary=False)
+        messages = _conversation(5)
+        context = RunContext()
+
+        with bind_run_context(context):
+            request = middleware._prepare(FakeRequest(messages=messages))
+
+        assert request.messages == messages[12:]
+        assert context.window_tokens_dropped > 0
+        assert context.window_tokens_saved == context.window_tokens_dropped
+
+    def test_rolling_summary_prepended(self) -> None:
+        middleware = HistoryWindowMiddleware(max_tokens=100000, max_turns=1)
+        messages = _conversation(3)
+        context = RunContext(history_summary="We discussed the quarterly report.", history_summary_covers=8)
+
+        with bind_run_context(context):
+            request = middleware._prepare(FakeRequest(messages=messages))
+
+        assert "quarterly report" in request.messages[0].content
+        assert request.messages[1:] == messages[8:]
+        assert context.window_tokens_saved < context.window_tokens_dropped
+
+    def test_turns_past_summary_coverage_are_sent(self) -> None:
+        """Turns newer than the summary stay in the window; without a summary nothing is left out."""
+        middleware = HistoryWindowMiddleware(max_tokens=100000, max_turns=1)
+        messages = _conversation(3)
+        context = RunContext(history_summary="We discussed the quarterly report.", history_summary_covers=4)
+
+        with bind_run_context(context):
+            request = middleware._prepare(FakeRequest(messages=messages))
+        assert request.messages[1:] == messages[4:]
+
+        original = FakeRequest(messages=messages)
+        with bind_run_context(RunContext()):
+            assert middleware._prepare(original) is original
+
+    def test_short_conversation_untouched(self) -> None:
+        middleware = HistoryWindowMiddleware(max_tokens=100000, max_turns=20)
+        original = FakeRequest(messages=_conversation(2))
+        context = RunContext()
+
+        with bind_run_context(context):
+            request = middleware._prepare(original)
+
+        assert request is original
+        assert context.window_tokens_saved == 0
+
+
+def _window_processor(tmp_path):
+    """MessageProcessor with the history window summary and a mocked agent runner."""
+    from unittest.mock import AsyncMock, MagicMock
+
+    from openpaw.core.config.models import HistoryWindowConfig
+    from openpaw.runtime.session.manager import SessionManager
+    from openpaw.workspace.message_processor import MessageProcessor
+
+    agent_runner = AsyncMock()
+    agent_runner.summarize_thread = AsyncMock(return_value=RunContext(response="Rolling summary"))
+    queue_manager = MagicMock()
+    queue_manager.peek_pending = AsyncMock(return_value=False)
+    return MessageProcessor(
+        agent_runner=agent_runner,
+        session_manager=SessionManager(tmp_path),
+        queue_manager=queue_manager,
+        builtin_loader=MagicMock(),
+        approval_manager=None,
+        workspace_name="test_workspace",
+        token_logger=MagicMock(),
+        logger=MagicMock(),
+        history_window_config=HistoryWindowConfig(enabled=True, max_tokens=1000),
+    )
+
+
+async def test_idle_session_gets_rolling_summary(tmp_path) -> None:
+    """Threads larger than the window get a background summary for later runs."""
+    from unittest.mock import AsyncMock
+
+    processor = _window_processor(tmp_path)
+    messages = [message for index in range(10) for message in _turn(index)]
+    processor._agent_runner.thread_messages = AsyncMock(return_value=messages)
+    thread_id = processor._session_manager.get_thread_id("telegram:1")
+    processor._session_manager.record_context_tokens("telegram:1", thread_id, 5000)
+
+    processor._schedule_precompact("telegram:1", thread_id)
+    task = processor._precompact_tasks["telegram:1"]
+    task.cancel()  # Skip the idle wait; run the job directly
+    await processor._precompact("telegram:1", thread_id, idle_seconds=0, compaction=False, rolling=True)
+
+    start = select_window(messages, 1000, 20)
+    assert processor._agent_runner.summarize_thread.call_args.kwargs["messages"] == messages[:start]
+    assert processor._rolling_summary("telegram:1", thread_id) == ("Rolling summary", start)
+    assert processor._rolling_summary("telegram:1", "telegram:1:conv_other") == (None, 0)
+
+
+async def test_rolling_summary_folds_only_newly_dropped_turns(tmp_path) -> None:
+    """Later updates send the turns that left the window plus the previous summary."""
+    from unittest.mock import AsyncMock
+
+    processor = _window_processor(tmp_path)
+    thread_id = "telegram:1:conv_a"
+    messages = [message for index in range(10) for message in _turn(index)]
+    processor._agent_runner.thread_messages = AsyncMock(return_value=messages)
+    await processor._update_rolling_summary("telegram:1", thread_id)
+    first_start = select_window(messages, 1000, 20)
+
+    messages = messages + [message for index in range(10, 13) for message in _turn(index)]
+    processor._agent_runner.thread_messages = AsyncMock(return_value=messages)
+    await processor._update_rolling_summary("telegram:1", thread_id)
+    second_start = select_window(messages, 1000, 20)
+    assert 0 < first_start < second_start
+
+    call = processor._agent_runner.summarize_thread.call_args
+    assert call.kwargs["messages"] == messages[first_start:second_start]
+    assert "Rolling summary" in call.args[1]
+    assert processor._rolling_summaries["telegram:1"][2] == second_start
+
+    # Nothing new left the window: no model call
+    await processor._update_rolling_summary("telegram:1", thread_id)
+    assert processor._agent_runner.summarize_thread.call_count == 2
@@ -0,0 +1,233 @@
+"""Tests for LaneQueue concurrent dispatch."""
+
+import asyncio
+
+import pytest
+
+from openpaw.runtime.queue.lane import LaneBuffer, LaneQueue, QueueItem
+
+
+async def _start_processor(
+    lane_queue: LaneQueue, handler, lane_name: str = "main"
+) -> asyncio.Task[None]:
+    """Start a lane processor task and yield once so it begins waiting."""
+    task = asyncio.create_task(lane_queue.process(lane_name, handler))
+    await asyncio.sleep(0)
+    return task
+
+
+async def _stop_processor(task: asyncio.Task[None]) -> None:
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
+
+
+@pytest.mark.asyncio
+async def test_process_runs_up_to_max_concurrency():
+    """Handlers for different sessions run concurrently up to the lane cap."""
+    lane_queue = LaneQueue(main_concurrency=2)
+    running = 0
+    peak = 0
+    release = asyncio.Event()
+
+    async def handler(item: QueueItem) -> None:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await release.wait()
+        running -= 1
+
+    processor = await _start_processor(lane_queue, handler)
+    for i in range(4):
+        await lane_queue.enqueue(QueueItem(session_key=f"s{i}", payload=i))
+    await asyncio.sleep(0.05)
+
+    assert peak == 2
+    assert lane_queue.get_stats()["main"]["active"] == 2
+    assert lane_queue.get_stats()["main"]["queued"] == 2
+
+    release.set()
+    await asyncio.sleep(0.05)
+    assert lane_queue.get_stats()["main"]["active"] == 0
+    assert lane_queue.get_stats()["main"]["dispatched"] == 4
+    await _stop_processor(processor)
+
+
+@pytest.mark.asyncio
+async def test_same_session_items_are_serialized():
+    """Two items for one session never run at the same time and keep order."""
+    lane_queue = LaneQueue(main_concurrency=4)
+    order: list[str] = []
+
+    async def handler(item: QueueItem) -> None:
+        order.append(f"start-{item.payload}")
+        await asyncio.sleep(0.02)
+        order.append(f"end-{item.payload}")
+
+    processor = await _start_processor(lane_queue, handler)
+    await lane_queue.enqueue(QueueItem(session_key="a", payload=1))
+    await lane_queue.enqueue(QueueItem(session_key="a", payload=2))
+    await asyncio.sleep(0.1)
+
+    assert order == ["start-1", "end-1", "start-2", "end-2"]
+    await _stop_processor(processor)
+
+
+@pytest.mark.asyncio
+async def test_busy_session_does_not_block_other_sessions():
+    """A queued item for a busy session is skipped in favour of a free session."""
+    lane_queue = LaneQueue(main_concurrency=2)
+    release_a = asyncio.Event()
+    handled: list[tuple[str, int]] = []
+
+    async def handler(item: QueueItem) -> None:
+        handled.append((item.session_key, item.payload))
+        if item.session_key == "a":
+            await release_a.wait()
+
+    processor = await _start_processor(lane_queue, handler)
+    await lane_queue.enqueue(QueueItem(session_key="a", payload=1))
+    await lane_queue.enqueue(QueueItem(session_key="a", payload=2))
+    await lane_queue.enqueue(QueueItem(session_key="b", payload=3))
+    await asyncio.sleep(0.05)
+
+    assert ("b", 3) in handled
+    assert ("a", 2) not in handled
+
+    release_a.set()
+    await asyncio.sleep(0.05)
+    assert ("a", 2) in handled
+    await _stop_processor(processor)
+
+
+@pytest.mark.asyncio
+async def test_handler_error_does_not_stop_processing():
+    """An exception in one handler is logged and the lane keeps draining."""
+    lane_queue = LaneQueue(main_concurrency=1)
+    handled: list[int] = []
+
+    async def handler(item: QueueItem) -> None:
+        if item.payload == 1:
+            raise RuntimeError("boom")
+        handled.append(item.payload)
+
+    processor = await _start_processor(lane_queue, handler)
+    await lane_queue.enqueue(QueueItem(session_key="a", payload=1))
+    await lane_queue.enqueue(QueueItem(session_key="a", payload=2))
+    await asyncio.sleep(0.05)
+
+    assert handled == [2]
+    assert lane_queue.get_stats()["main"]["active"] == 0
+    await _stop_processor(processor)
+
+
+@pytest.mark.asyncio
+async def test_cancelling_processor_cancels_inflight_handlers():
+    """Stopping the processor cancels handlers that are still running."""
+    lane_queue = LaneQueue(main_concurrency=2)
+    cancelled = asyncio.Event()
+
+    async def handler(item: QueueItem) -> None:
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    processor = await _start_processor(lane_queue, handler)
+    await lane_queue.enqueue(QueueItem(session_key="a", payload=1))
+    await asyncio.sleep(0.01)
+
+    await _stop_processor(processor)
+    await asyncio.sleep(0)
+    assert cancelled.is_set()
+
+
+@pytest.mark.asyncio
+async def test_stats_track_queue_wait():
+    """Wait time from enqueue to dispatch is recorded per lane."""
+    lane_queue = LaneQueue(main_concurrency=1)
+    await lane_queue.enqueue(QueueItem(session_key="a", payload=1))
+    await asyncio.sleep(0.03)
+
+    async def handler(item: QueueItem) -> None:
+        return None
+
+    processor = await _start_processor(lane_queue, handler)
+    await asyncio.sleep(0.01)
+
+    stats = lane_queue.get_stats()["main"]
+    assert stats["dispatched"] == 1
+    assert stats["max_wait_ms"] >= 25
+    assert stats["avg_wait_ms"] >= 25
+    await _stop_processor(processor)
+
+
+class TestLaneBuffer:
+    """Per-session index behaviour of LaneBuffer."""
+
+    def test_preserves_global_arrival_order(self):
+        buffer = LaneBuffer()
+        items = [QueueItem(session_key=key, payload=i) for i, key in enumerate(["a", "b", "a", "c"])]
+        for item in items:
+            buffer.append(item)
+
+        assert list(buffer) == items
+        assert buffer[0] is items[0]
+        assert buffer.popleft() is items[0]
+        assert len(buffer) == 3
+
+    def test_pop_session_removes_only_that_session(self):
+        buffer = LaneBuffer()
+        a1 = QueueItem(session_key="a", payload=1)
+        b1 = QueueItem(session_key="b", payload=2)
+        a2 = QueueItem(session_key="a", payload=3)
+        for item in (a1, b1, a2):
+            buffer.append(item)
+
+        assert buffer.pop_session("a") == [a1, a2]
+        assert list(buffer) == [b1]
+        assert buffer.session_count("a") == 0
+        assert buffer.pop_session("a") == []
+
+    def test_steer_eligible_counter_tracks_add_and_remove(self):
+        buffer = LaneBuffer()
+        system = QueueItem(session_key="a", payload="sys", steer_eligible=False)
+        user = QueueItem(session_key="a", payload="hi")
+        buffer.append(system)
+        assert buffer.has_steer_eligible("a") is False
+
+        buffer.append(user)
+        assert buffer.has_steer_eligible("a") is True
+
+        buffer.remove(user)
+        assert buffer.has_steer_eligible("a") is False
+        assert buffer.session_count("a") == 1
+
+    def test_peek_next_skips_excluded_sessions(self):
+        buffer = LaneBuffer()
+        a1 = QueueItem(session_key="a", payload=1)
+        b1 = QueueItem(session_key="b", payload=2)
+        buffer.append(a1)
+        buffer.append(b1)
+
+        assert buffer.peek_next(exclude_sessions=set()) is a1
+        assert buffer.peek_next(exclude_sessions={"a"}) is b1
+        assert buffer.peek_next(exclude_sessions={"a", "b"}) is None
+
+
+@pytest.mark.asyncio
+async def test_consume_session_pending_keeps_other_sessions_in_order():
+    """Consuming one session's items leaves the rest of the lane untouched."""
+    lane_queue = LaneQueue()
+    for i, key in enumerate(["a", "b", "a", "c", "b"]):
+        await lane_queue.enqueue(QueueItem(session_key=key, payload=i))
+
+    consumed = await lane_queue.consume_session_pending("b")
+
+    assert [item.payload for item in consumed] == [1, 4]
+    assert await lane_queue.peek_session_pending("b") is False
+    assert await lane_queue.peek_session_pending("a") is True
+    assert [item.payload for item in lane_queue.get_lane("main").queue] == [0, 2, 3]
@@ -0,0 +1,139 @@
+"""Tests for hedged and fallback model requests."""
+
+import asyncio
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from langchain_core.language_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
+
+from openpaw.agent.middleware.model_hedging import ModelHedgeStats, ModelHedgingMiddleware
+from openpaw.agent.middleware.prompt_cache import build_cached_system_message
+
+
+class FakeRequest(SimpleNamespace):
+    """Minimal ModelRequest stand-in supporting override()."""
+
+    def override(self, **overrides):
+        return FakeRequest(**{**vars(self), **overrides})
+
+
+class FakeAPIError(Exception):
+    """Provider error carrying an HTTP status like the SDK exceptions."""
+
+    def __init__(self, status_code: int):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+
+
+class SlowChatModel(GenericFakeChatModel):
+    """Fake chat model that waits before its first chunk, or fails."""
+
+    delay: float = 0.0
+    status_code: int | None = None
+    started: int = 0
+
+    async def _astream(self, *args: Any, **kwargs: Any):
+        self.started += 1
+        await asyncio.sleep(self.delay)
+        if self.status_code is not None:
+            raise FakeAPIError(self.status_code)
+        async for chunk in super()._astream(*args, **kwargs):
+            yield chunk
+
+
+def _model(reply: str, **kwargs: Any) -> SlowChatModel:
+    return SlowChatModel(messages=iter([AIMessage(content=reply)]), **kwargs)
+
+
+async def _handler(request: FakeRequest) -> Any:
+    return await request.model.ainvoke(request.messages)
+
+
+def _middleware(secondary: SlowChatModel, stats: ModelHedgeStats, **kwargs: Any) -> ModelHedgingMiddleware:
+    return ModelHedgingMiddleware(
+        primary_label="anthropic:primary",
+        secondary=secondary,
+        secondary_label="anthropic:secondary",
+        stats=stats,
+        **kwargs,
+    )
+
+
+def _request(primary: SlowChatModel) -> FakeRequest:
+    return FakeRequest(model=primary, messages=[HumanMessage(content="hi")], system_message=None)
+
+
+@pytest.mark.asyncio
+async def test_fast_primary_is_not_hedged():
+    stats = ModelHedgeStats()
+    secondary = _model("from secondary")
+    middleware = _middleware(secondary, stats, hedge_after_ms=200)
+
+    result = await middleware.awrap_model_call(_request(_model("from primary")), _handler)
+
+    assert result.content == "from primary"
+    assert secondary.started == 0
+    assert stats.get_stats()["anthropic:primary"]["calls"] == 1
+    assert stats.get_stats()["anthropic:primary"]["hedged"] == 0
+
+
+@pytest.mark.asyncio
+async def test_slow_primary_hedged_and_secondary_wins():
+    """No first chunk within hedge_after_ms races the secondary; the first to stream wins."""
+    stats = ModelHedgeStats()
+    primary = _model("from primary", delay=5)
+    middleware = _middleware(_model("from secondary"), stats, hedge_after_ms=20)
+
+    result = await asyncio.wait_for(middleware.awrap_model_call(_request(primary), _handler), timeout=2)
+
+    assert result.content == "from secondary"
+    by_endpoint = stats.get_stats()
+    assert by_endpoint["anthropic:primary"]["hedge_rate"] == 1.0
+    assert by_endpoint["anthropic:primary"]["win_rate"] == 0.0
+    assert by_endpoint["anthropic:secondary"]["wins"] == 1
+
+
+@pytest.mark.asyncio
+async def test_server_error_falls_back():
+    stats = ModelHedgeStats()
+    primary = _model("unused", status_code=503)
+    middleware = _middleware(_model("from secondary"), stats, hedge_after_ms=None)
+
+    result = await middleware.awrap_model_call(_request(primary), _handler)
+
+    assert result.content == "from secondary"
+    assert stats.get_stats()["anthropic:primary"]["fallbacks"] == 1
+
+
+@pytest.mark.asyncio
+async def test_request_error_not_retried():
+    """A rejected request (400) would be rejected by the secondary too."""
+    stats = ModelHedgeStats()
+    secondary = _model("from secondary")
+    middleware = _middleware(secondary, stats, hedge_after_ms=None)
+
+    with pytest.raises(FakeAPIError):
+        await middleware.awrap_model_call(_request(_model("unused", status_code=400)), _handler)
+
+    assert secondary.started == 0
+
+
+def test_cache_breakpoints_flattened_for_other_provider():
+    middleware = ModelHedgingMiddleware(
+        primary_label="anthropic:primary",
+        secondary=_model("x"),
+        secondary_label="openai:secondary",
+        stats=ModelHedgeStats(),
+    )
+    request = FakeRequest(
+        model=_model("y"),
+        messages=[],
+        system_message=build_cached_system_message("stable", "volatile", "anthropic"),
+    )
+
+    retargeted = middleware._secondary_request(request)
+
+    assert retargeted.system_message == SystemMessage(content="stable\n\nvolatile")
+    assert request.system_message.content[0]["cache_control"]
@@ -0,0 +1,131 @@
+"""Tests for the process-wide chat model registry."""
+
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from openpaw.agent.model_registry import ChatModelRegistry
+
+_PATCH_CREATE = "openpaw.agent.runner.create_chat_model"
+
+
+@pytest.fixture
+def create_model():
+    """Patch model construction to return a distinct mock per call."""
+    with patch(_PATCH_CREATE) as mock_create:
+        mock_create.side_effect = lambda *args, **kwargs: Mock(client=None, bedrock_client=None)
+        yield mock_create
+
+
+class TestGetOrCreate:
+    """Model reuse and pool grouping."""
+
+    def test_same_configuration_reuses_instance(self, create_model):
+        registry = ChatModelRegistry()
+
+        first = registry.get_or_create("anthropic:claude-test", "key", 0.7)
+        second = registry.get_or_create("anthropic:claude-test", "key", 0.7)
+
+        assert first is second
+        assert create_model.call_count == 1
+        stats = registry.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+
+    def test_models_with_same_credentials_share_pool(self, create_model):
+        registry = ChatModelRegistry()
+
+        registry.get_or_create("anthropic:claude-a", "key", 0.7)
+        registry.get_or_create("anthropic:claude-b", "key", 0.2)
+
+        stats = registry.get_stats()
+        assert stats["pools"] == 1
+        assert stats["models"] == 2
+
+    def test_credentials_and_base_url_separate_pools(self, create_model):
+        registry = ChatModelRegistry()
+
+        registry.get_or_create("openai:gpt-test", "key-1", 0.7)
+        registry.get_or_create("openai:gpt-test", "key-2", 0.7)
+        registry.get_or_create("openai:gpt-test", "key-1", 0.7, extra_kwargs={"base_url": "https://example.com/v1"})
+
+        assert registry.get_stats()["pools"] == 3
+
+    def test_pool_stats_do_not_expose_api_key(self, create_model):
+        registry = ChatModelRegistry()
+        registry.get_or_create("openai:gpt-test", "secret-key", 0.7)
+
+        assert "secret-key" not in repr(registry.get_stats())
+        assert "secret-key" not in repr(list(registry._pools))
+
+    def test_bedrock_models_share_boto_clients(self, create_model):
+        runtime_client, control_client = Mock(), Mock()
+        create_model.side_effect = [
+            Mock(client=runtime_client, bedrock_client=control_client),
+            Mock(client=runtime_client, bedrock_client=control_client),
+        ]
+        registry = ChatModelRegistry()
+
+        registry.get_or_create("bedrock_converse:model-a", None, 0.7, region="us-east-1")
+        registry.get_or_create("bedrock_converse:model-b", None, 0.7, region="us-east-1")
+
+        first_kwargs = create_model.call_args_list[0].args[4]
+        second_kwargs = create_model.call_args_list[1].args[4]
+        assert "client" not in first_kwargs
+        assert second_kwargs["client"] is runtime_client
+        assert second_kwargs["bedrock_client"] is control_client
+
+    def test_bedrock_custom_headers_disable_client_sharing(self, create_model):
+        registry = ChatModelRegistry()
+        extra = {"default_headers": {"x-team": "a"}}
+
+        registry.get_or_create("bedrock_converse:model-a", None, 0.7, "us-east-1", extra)
+        registry.get_or_create("bedrock_converse:model-b", None, 0.7, "us-east-1", extra)
+
+        assert "client" not in create_model.call_args_list[1].args[4]
+
+
+class TestWarm:
+    """Connection warm-up through the model's async HTTP client."""
+
+    @pytest.mark.asyncio
+    async def test_warm_sends_head_request(self, create_model):
+        registry = ChatModelRegistry()
+        model = registry.get_or_create("openai:gpt-test", "key", 0.7)
+        model.root_async_client = Mock(base_url="https://api.example.com/v1/")
+        model.root_async_client._client.head = AsyncMock()
+
+        assert await registry.warm(model) is True
+        model.root_async_client._client.head.assert_awaited_once()
+        assert registry.get_stats()["warmed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_warm_failure_is_ignored(self, create_model):
+        registry = ChatModelRegistry()
+        model = registry.get_or_create("openai:gpt-test", "key", 0.7)
+        model.root_async_client = Mock(base_url="https://api.example.com/v1/")
+        model.root_async_client._client.head = AsyncMock(side_effect=OSError("unreachable"))
+
+        assert await registry.warm(model) is False
+        assert registry.get_stats()["warmed"] == 0
+
+
+@patch("openpaw.agent.runner.create_agent")
+@patch("openpaw.agent.runner.FilesystemTools")
+def test_agent_runners_share_model_through_registry(mock_fs, mock_create_agent, create_model, tmp_path):
+    """Runners given the same registry reuse one model instance."""
+    from openpaw.agent import AgentRunner
+
+    workspace = Mock()
+    workspace.path = tmp_path
+    workspace.name = "ws"
+    workspace.config = None
+    workspace.build_system_prompt = Mock(return_value="prompt")
+    registry = ChatModelRegistry()
+
+    first = AgentRunner(workspace=workspace, model="anthropic:claude-test", api_key="key", model_registry=registry)
+    second = AgentRunner(workspace=workspace, model="anthropic:claude-test", api_key="key", model_registry=registry)
+
+    assert first.model_instance is second.model_instance
+    assert create_model.call_count == 1
@@ -0,0 +1,185 @@
+"""Tests for per-invocation-type model routing."""
+
+import logging
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+
+from openpaw.agent.metrics import InvocationMetrics, TokenUsageLogger, TokenUsageReader
+from openpaw.agent.middleware.model_routing import ModelRoutingMiddleware, is_simple_message
+from openpaw.agent.middleware.prompt_cache import build_cached_system_message
+from openpaw.agent.run_context import RunContext, bind_run_context
+from openpaw.core.config.models import ModelRoutingConfig
+from openpaw.core.workspace import AgentWorkspace
+from openpaw.workspace.agent_factory import AgentFactory, RuntimeModelOverride
+
+ROUTING_YAML = """
+model_routing:
+  enabled: true
+  routes:
+    cron: anthropic:claude-haiku-4-5
+    summarize: openai:gpt-4.1-mini
+  simple_model: anthropic:claude-haiku-4-5
+"""
+
+
+class FakeRequest(SimpleNamespace):
+    def override(self, **overrides):
+        return FakeRequest(**{**vars(self), **overrides})
+
+
+def _request(*messages) -> FakeRequest:
+    return FakeRequest(
+        model=object(),
+        messages=list(messages),
+        system_message=build_cached_system_message("stable", "volatile", "anthropic"),
+    )
+
+
+@pytest.fixture
+def workspace(tmp_path: Path) -> AgentWorkspace:
+    """Create a workspace with model routing enabled."""
+    workspace_path = tmp_path / "routing_ws"
+    agent_path = workspace_path / "agent"
+    agent_path.mkdir(parents=True)
+    for name in ("AGENT.md", "USER.md", "SOUL.md", "HEARTBEAT.md"):
+        (agent_path / name).write_text(f"# {name}")
+    (workspace_path / "config").mkdir()
+    (workspace_path / "config" / "agent.yaml").write_text(ROUTING_YAML)
+
+    from openpaw.workspace.loader import WorkspaceLoader
+
+    return WorkspaceLoader(tmp_path).load("routing_ws")
+
+
+def _factory(workspace: AgentWorkspace) -> AgentFactory:
+    return AgentFactory(
+        workspace=workspace,
+        model="anthropic:claude-sonnet-4-5",
+        api_key="key",
+        max_turns=50,
+        temperature=0.7,
+        region=None,
+        timeout_seconds=300.0,
+        builtin_tools=[],
+        workspace_tools=[],
+        enabled_builtin_names=[],
+        extra_model_kwargs={"max_tokens": 8192},
+        middleware=[],
+        logger=logging.getLogger("test"),
+    )
+
+
+@pytest.mark.parametrize(
+    ("content", "simple"),
+    [
+        ("thanks!", True),
+        ("good morning, anything on my calendar today?", True),
+        ("x" * 161, False),
+        ("summarize https://example.com/post", False),
+        ("fix this:\n```\nprint(1)\n```", False),
+        ("one\ntwo\nthree", False),
+        ([{"type": "image", "url": "https://example.com/a.png"}], False),
+    ],
+)
+def test_simple_message_classifier(content, simple):
+    assert is_simple_message(content, max_chars=160) is simple
+
+
+def test_unknown_route_rejected():
+    with pytest.raises(ValueError, match="unknown invocation type"):
+        ModelRoutingConfig(routes={"compact": "anthropic:claude-haiku-4-5"})
+
+
+def test_simple_route_is_kept_for_the_whole_run():
+    small = object()
+    middleware = ModelRoutingMiddleware(
+        "anthropic:claude-sonnet-4-5", {"simple": (small, "openai:gpt-4.1-mini")}
+    )
+    calls: list = []
+    context = RunContext()
+
+    with bind_run_context(context):
+        middleware.wrap_model_call(_request(HumanMessage(content="thanks!")), calls.append)
+        tool_loop = _request(
+            HumanMessage(content="thanks!"),
+            AIMessage(content="", tool_calls=[{"name": "read_file", "args": {}, "id": "t1"}]),
+            ToolMessage(content="x" * 5000, tool_call_id="t1"),
+        )
+        middleware.wrap_model_call(tool_loop, calls.append)
+
+    assert [call.model for call in calls] == [small, small]
+    assert calls[0].system_message.content == "stable\n\nvolatile"
+    assert context.model_route == "simple"
+    assert context.routed_model == "openai:gpt-4.1-mini"
+
+
+def test_complex_and_unrouted_runs_stay_on_agent_model():
+    small = object()
+    middleware = ModelRoutingMiddleware(
+        "anthropic:claude-sonnet-4-5", {"simple": (small, "anthropic:claude-haiku-4-5")}
+    )
+    calls: list = []
+    request = _request(HumanMessage(content="please review:\n```\nimport os\n```"))
+
+    context = RunContext()
+    with bind_run_context(context):
+        middleware.wrap_model_call(request, calls.append)
+    with bind_run_context(RunContext(model_route="summarize")):
+        middleware.wrap_model_call(_request(HumanMessage(content="ok")), calls.append)
+
+    assert calls[0] is request
+    assert calls[1].model is not small
+    assert context.model_route == "user"
+    assert context.routed_model is None
+
+
+@patch("openpaw.agent.runner.create_agent")
+@patch("openpaw.agent.runner.AgentRunner._create_model")
+class TestFactoryRouting:
+    """AgentFactory picks models per invocation type."""
+
+    def test_stateless_agent_built_on_routed_model(self, mock_create_model: Mock, mock_create_agent: Mock, workspace):
+        factory = _factory(workspace)
+
+        cron = factory.get_agent_factory_closure("cron")()
+        heartbeat = factory.get_agent_factory_closure("heartbeat")()
+
+        assert cron.model_id == "anthropic:claude-haiku-4-5"
+        assert cron.route == "cron"
+        assert "max_tokens" not in cron.extra_model_kwargs
+        assert heartbeat.model_id == "anthropic:claude-sonnet-4-5"
+        assert heartbeat.route is None
+
+    def test_main_agent_routes_drop_user_routes_under_override(
+        self, mock_create_model: Mock, mock_create_agent: Mock, workspace
+    ):
+        factory = _factory(workspace)
+
+        runner = factory.create_agent(checkpointer=Mock())
+        assert set(runner.routed_models) == {"summarize", "simple"}
+        middleware = mock_create_agent.call_args.kwargs["middleware"]
+        assert any(isinstance(mw, ModelRoutingMiddleware) for mw in middleware)
+
+        factory.set_runtime_override(RuntimeModelOverride(model="anthropic:claude-opus-4-1"))
+        assert set(factory.create_agent(checkpointer=Mock()).routed_models) == {"summarize"}
+
+
+def test_routes_reported_per_day(tmp_path):
+    logger = TokenUsageLogger(tmp_path)
+    for duration in (1000.0, 3000.0):
+        logger.log(
+            InvocationMetrics(total_tokens=500, duration_ms=duration, model="anthropic:claude-haiku-4-5", route="cron"),
+            workspace="ws",
+            invocation_type="cron",
+        )
+    logger.log(InvocationMetrics(total_tokens=900, duration_ms=500.0), workspace="ws", invocation_type="user")
+
+    routes = TokenUsageReader(tmp_path).routes_today()
+
+    assert routes == {
+        "cron": {"model": "anthropic:claude-haiku-4-5", "runs": 2, "avg_ms": 2000, "total_tokens": 1000}
+    }
@@ -0,0 +1,146 @@
+"""Tests for prompt-caching-friendly system prompt layout."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from openpaw.agent.metrics import TokenUsageLogger, TokenUsageReader, extract_metrics_from_callback
+from openpaw.agent.middleware.prompt_cache import (
+    BEDROCK_CACHE_POINT,
+    build_cached_system_message,
+    cache_breakpoint_style,
+)
+from openpaw.core.workspace import AgentWorkspace
+from openpaw.workspace.loader import WorkspaceLoader
+
+
+@pytest.fixture
+def mock_workspace(tmp_path: Path) -> AgentWorkspace:
+    """Create a minimal mock workspace."""
+    workspace_path = tmp_path / "test_workspace"
+    workspace_path.mkdir()
+
+    agent_path = workspace_path / "agent"
+    agent_path.mkdir(parents=True, exist_ok=True)
+    (agent_path / "AGENT.md").write_text("# Agent")
+    (agent_path / "USER.md").write_text("# User")
+    (agent_path / "SOUL.md").write_text("# Soul")
+    (agent_path / "HEARTBEAT.md").write_text("# Heartbeat with content")
+
+    loader = WorkspaceLoader(tmp_path)
+    return loader.load("test_workspace")
+
+
+class TestPromptLayout:
+    """Stable prefix and volatile suffix of the system prompt."""
+
+    def test_stable_prompt_excludes_volatile_sections(self, mock_workspace: AgentWorkspace) -> None:
+        """Datetime, heartbeat and workspace listing stay out of the prefix."""
+        stable = mock_workspace.build_stable_prompt(enabled_builtins=None)
+
+        assert "<soul>" in stable
+        assert "<framework>" in stable
+        assert "<current_datetime>" not in stable
+        assert "<heartbeat>" not in stable
+        assert "<workspace_context>" not in stable
+
+    def test_stable_prompt_unaffected_by_workspace_contents(
+        self, mock_workspace: AgentWorkspace
+    ) -> None:
+        """New files in the workspace do not change the cached prefix."""
+        before = mock_workspace.build_stable_prompt(enabled_builtins=["spawn"])
+        (mock_workspace.path / "notes.md").write_text("new")
+        after = mock_workspace.build_stable_prompt(enabled_builtins=["spawn"])
+
+        assert before == after
+
+    def test_volatile_context_contents(self, mock_workspace: AgentWorkspace) -> None:
+        """Volatile suffix carries datetime, heartbeat and workspace listing."""
+        volatile = mock_workspace.build_volatile_context("Monday, 2026-01-05 09:30 UTC")
+
+        assert "<workspace_context>" in volatile
+        assert "Monday, 2026-01-05 09:30 UTC" in volatile
+        assert "<heartbeat>" in volatile
+
+    def test_full_prompt_places_volatile_after_stable(self, mock_workspace: AgentWorkspace) -> None:
+        """build_system_prompt() concatenates prefix then suffix."""
+        prompt = mock_workspace.build_system_prompt(
+            enabled_builtins=None, current_datetime="Monday, 2026-01-05 09:30 UTC"
+        )
+
+        assert prompt.index("</framework>") < prompt.index("<current_datetime>")
+        assert prompt.startswith(mock_workspace.build_stable_prompt(enabled_builtins=None))
+
+
+class TestCacheBreakpoints:
+    """Provider-specific cache breakpoint formatting."""
+
+    @pytest.mark.parametrize(
+        ("model_id", "expected"),
+        [
+            ("anthropic:claude-sonnet-4-5", "anthropic"),
+            ("bedrock_converse:us.anthropic.claude-haiku-4-5-20251001-v1:0", "bedrock"),
+            ("bedrock_converse:amazon.nova-pro-v1:0", "bedrock"),
+            ("bedrock_converse:moonshot.kimi-k2-thinking", None),
+            ("openai:gpt-4o", None),
+            ("gpt-4o", None),
+        ],
+    )
+    def test_breakpoint_style(self, model_id: str, expected: str | None) -> None:
+        """Breakpoints are only emitted for providers that accept them."""
+        assert cache_breakpoint_style(model_id) == expected
+
+    def test_anthropic_cache_control_on_stable_block(self) -> None:
+        """Anthropic marks the stable block with cache_control."""
+        message = build_cached_system_message("stable", "volatile", "anthropic")
+
+        assert message.content[0]["text"] == "stable"
+        assert message.content[0]["cache_control"] == {"type": "ephemeral"}
+        assert message.content[1] == {"type": "text", "text": "volatile"}
+
+    def test_bedrock_cache_point_after_stable_block(self) -> None:
+        """Bedrock inserts a cachePoint block between the two parts."""
+        message = build_cached_system_message("stable", "volatile", "bedrock")
+
+        assert message.content[0] == {"type": "text", "text": "stable"}
+        assert message.content[1] == BEDROCK_CACHE_POINT
+        assert message.content[2] == {"type": "text", "text": "volatile"}
+
+    def test_plain_string_without_breakpoints(self) -> None:
+        """Other providers receive a single string."""
+        message = build_cached_system_message("stable", "volatile", None)
+
+        assert message.content == "stable\n\nvolatile"
+
+
+class MockCallbackHandler:
+    """Mock UsageMetadataCallbackHandler for testing."""
+
+    def __init__(self, usage_metadata: dict | None = None):
+        self.usage_metadata = usage_metadata
+
+
+def test_cache_tokens_extracted_and_logged(tmp_path: Path) -> None:
+    """Cache read/write counts flow from usage metadata into token_usage.jsonl."""
+    handler = MockCallbackHandler({
+        "claude-sonnet-4-5": {
+            "input_tokens": 1200,
+            "output_tokens": 100,
+            "total_tokens": 1300,
+            "input_token_details": {"cache_read": 1000, "cache_creation": 150},
+        }
+    })
+    metrics = extract_metrics_from_callback(handler, 10.0, "anthropic:claude-sonnet-4-5")
+
+    assert metrics.cache_read_tokens == 1000
+    assert metrics.cache_write_tokens == 150
+
+    TokenUsageLogger(tmp_path).log(metrics, workspace="test", invocation_type="user")
+    entry = json.loads((tmp_path / "data" / "token_usage.jsonl").read_text().splitlines()[0])
+    assert entry["cache_read_tokens"] == 1000
+    assert entry["cache_write_tokens"] == 150
+
+    today = TokenUsageReader(tmp_path).tokens_today()
+    assert today.cache_read_tokens == 1000
+    assert today.cache_write_tokens == 150
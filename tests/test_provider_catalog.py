@@ -118,6 +118,17 @@ class TestResolveProvider:
         assert "api_key" not in result.extra_kwargs
         assert "region" not in result.extra_kwargs
 
+    def test_rate_limit_kept_out_of_extra_kwargs(self):
+        """rate_limit is surfaced with the catalog name instead of reaching the model constructor."""
+        catalog = _make_catalog(
+            anthropic={"api_key": "k", "rate_limit": {"requests_per_minute": 50}}
+        )
+        result = resolve_provider("anthropic:claude-test", catalog)
+
+        assert result.catalog_name == "anthropic"
+        assert result.rate_limit.requests_per_minute == 50
+        assert "rate_limit" not in result.extra_kwargs
+
     def test_region_passes_through(self):
         """Region set on a provider definition is surfaced on the resolved object."""
         catalog = _make_catalog(bedrock={"region": "us-east-1"})
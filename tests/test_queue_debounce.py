@@ -0,0 +1,101 @@
+"""Tests for adaptive per-session debounce in the queue manager."""
+
+import asyncio
+
+import pytest
+from pydantic import ValidationError
+
+from openpaw.core.config.models import AdaptiveDebounceConfig
+from openpaw.runtime.queue.debounce import AdaptiveDebounce, ArrivalStats
+from openpaw.runtime.queue.lane import LaneQueue
+from openpaw.runtime.queue.manager import QueueManager
+
+
+class TestAdaptiveDebounce:
+    """Delay selection from a session's arrival history."""
+
+    def test_first_message_uses_default_delay(self):
+        policy = AdaptiveDebounce()
+        stats = ArrivalStats()
+        policy.observe(stats, now=0.0)
+
+        assert policy.delay_ms(stats, default_ms=1000, waited_ms=0) == 1000
+
+    def test_isolated_messages_flush_at_min(self):
+        """Sessions that never send follow-ups stop paying the debounce."""
+        policy = AdaptiveDebounce(min_ms=0, max_ms=3000)
+        stats = ArrivalStats()
+        for i in range(5):
+            policy.observe(stats, now=i * 60.0)
+
+        assert stats.burst_rate < policy.burst_threshold
+        assert policy.delay_ms(stats, default_ms=1000, waited_ms=0) == 0
+
+    def test_burst_waits_for_typical_gap(self):
+        policy = AdaptiveDebounce(min_ms=0, max_ms=3000)
+        stats = ArrivalStats()
+        for i in range(10):
+            policy.observe(stats, now=i * 0.4)
+
+        delay = policy.delay_ms(stats, default_ms=1000, waited_ms=0)
+        assert 400 <= delay < 1000
+
+    def test_slow_typist_extends_past_fixed_default(self):
+        policy = AdaptiveDebounce(min_ms=0, max_ms=5000)
+        stats = ArrivalStats()
+        for i in range(10):
+            policy.observe(stats, now=i * 1.8)
+
+        assert policy.delay_ms(stats, default_ms=1000, waited_ms=0) > 1800
+
+    def test_added_latency_is_capped(self):
+        policy = AdaptiveDebounce(min_ms=0, max_ms=3000)
+        stats = ArrivalStats()
+        for i in range(10):
+            policy.observe(stats, now=i * 2.0)
+
+        assert policy.delay_ms(stats, default_ms=1000, waited_ms=2500) == 500
+        assert policy.delay_ms(stats, default_ms=1000, waited_ms=4000) == 0
+
+
+@pytest.mark.asyncio
+async def test_learned_session_flushes_without_fixed_delay():
+    lane_queue = LaneQueue()
+    manager = QueueManager(lane_queue, default_debounce_ms=1000, adaptive_debounce=AdaptiveDebounce())
+    session = await manager._get_or_create_session("telegram:1")
+    # History of isolated messages a minute apart
+    for i in range(5):
+        manager.adaptive_debounce.observe(session.arrivals, now=i * 60.0)
+
+    await manager.submit("telegram:1", "telegram", "hello")
+    await asyncio.sleep(0.05)
+
+    assert len(lane_queue.get_lane("main").queue) == 1
+    stats = manager.get_stats()["debounce"]
+    assert stats["adaptive"] is True
+    assert stats["flushes"] == 1
+    assert stats["max_added_ms"] < 1000
+
+
+@pytest.mark.asyncio
+async def test_stats_count_coalesced_messages():
+    lane_queue = LaneQueue()
+    manager = QueueManager(lane_queue, default_debounce_ms=20)
+
+    for text in ("one", "two", "three"):
+        await manager.submit("telegram:1", "telegram", text)
+    await asyncio.sleep(0.1)
+
+    stats = manager.get_stats()["debounce"]
+    assert stats["adaptive"] is False
+    assert stats["flushes"] == 1
+    assert stats["messages"] == 3
+    assert stats["coalesced"] == 2
+    assert stats["avg_added_ms"] >= 20
+
+
+def test_adaptive_debounce_config_validates_bounds():
+    with pytest.raises(ValidationError):
+        AdaptiveDebounceConfig(min_ms=500, max_ms=100)
+    with pytest.raises(ValidationError):
+        AdaptiveDebounceConfig(burst_threshold=1.5)
@@ -0,0 +1,105 @@
+"""Tests for bounded session state in QueueManager and LaneQueue."""
+
+import asyncio
+
+import pytest
+
+from openpaw.runtime.queue.lane import LaneQueue, QueueItem, QueueMode
+from openpaw.runtime.queue.manager import QueueManager
+
+
+def _make_manager(max_sessions: int = 3, session_idle_seconds: float = 3600.0) -> QueueManager:
+    return QueueManager(
+        LaneQueue(max_session_locks=max_sessions),
+        max_sessions=max_sessions,
+        session_idle_seconds=session_idle_seconds,
+    )
+
+
+@pytest.mark.asyncio
+async def test_lru_sessions_evicted_beyond_cap():
+    """Quiescent sessions beyond max_sessions are evicted least-recently-used first."""
+    manager = _make_manager(max_sessions=3)
+    for key in ("a", "b", "c"):
+        await manager._get_or_create_session(key)
+    # Touch "a" so "b" becomes least recently used
+    await manager._get_or_create_session("a")
+    await manager._get_or_create_session("d")
+
+    assert list(manager._sessions) == ["c", "a", "d"]
+    stats = manager.get_stats()["sessions"]
+    assert stats["live"] == 3
+    assert stats["evicted"] == 1
+
+
+@pytest.mark.asyncio
+async def test_sessions_with_buffered_messages_are_kept():
+    """Sessions with buffered messages or a pending debounce are never evicted."""
+    manager = _make_manager(max_sessions=1)
+    busy = await manager._get_or_create_session("busy")
+    busy.messages.append(("telegram", "hello"))
+    debouncing = await manager._get_or_create_session("debouncing")
+    debouncing._debounce_task = asyncio.create_task(asyncio.sleep(10))
+
+    await manager._get_or_create_session("new")
+
+    assert "busy" in manager._sessions
+    assert "debouncing" in manager._sessions
+    debouncing._debounce_task.cancel()
+
+
+@pytest.mark.asyncio
+async def test_idle_sessions_evicted_under_cap():
+    """Idle quiescent sessions are evicted even when under the cap."""
+    manager = _make_manager(max_sessions=100, session_idle_seconds=0.01)
+    await manager._get_or_create_session("old")
+    await asyncio.sleep(0.02)
+    await manager._get_or_create_session("fresh")
+
+    assert "old" not in manager._sessions
+    assert "fresh" in manager._sessions
+
+
+@pytest.mark.asyncio
+async def test_mode_override_survives_eviction():
+    """A /queue override is restored from the side table after eviction."""
+    manager = _make_manager(max_sessions=1)
+    await manager.set_session_mode("a", QueueMode.STEER)
+    await manager._get_or_create_session("b")
+    assert "a" not in manager._sessions
+
+    assert await manager.get_session_mode("a") == QueueMode.STEER
+    session = await manager._get_or_create_session("a")
+    assert session.mode == QueueMode.STEER
+    assert manager.get_stats()["sessions"]["mode_overrides"] == 1
+
+
+@pytest.mark.asyncio
+async def test_setting_default_mode_clears_override():
+    manager = _make_manager()
+    await manager.set_session_mode("a", QueueMode.STEER)
+    await manager.set_session_mode("a", QueueMode.COLLECT)
+    assert manager.get_stats()["sessions"]["mode_overrides"] == 0
+
+
+@pytest.mark.asyncio
+async def test_get_session_mode_does_not_create_state():
+    manager = _make_manager()
+    assert await manager.get_session_mode("unknown") == QueueMode.COLLECT
+    assert "unknown" not in manager._sessions
+
+
+@pytest.mark.asyncio
+async def test_session_locks_evicted_when_unused():
+    """Unused session locks beyond the cap are dropped; held or busy ones are kept."""
+    lane_queue = LaneQueue(max_session_locks=2)
+    held = await lane_queue.get_session_lock("held")
+    await held.acquire()
+    await lane_queue.enqueue(QueueItem(session_key="queued", payload=1))
+    await lane_queue.get_session_lock("queued")
+    await lane_queue.get_session_lock("idle")
+    await lane_queue.get_session_lock("new")
+
+    assert set(lane_queue._session_locks) == {"held", "queued", "new"}
+    assert lane_queue.get_lock_stats() == {"live": 3, "evicted": 1}
+    held.release()
@@ -0,0 +1,133 @@
+"""Tests for fair sharing of lane concurrency between channels and sessions."""
+
+import asyncio
+
+import pytest
+from pydantic import ValidationError
+
+from openpaw.core.config.models import WorkspaceQueueConfig
+from openpaw.runtime.queue.lane import LaneBuffer, LaneQueue, QueueItem, channel_of
+
+
+async def _fill_and_start(lane_queue: LaneQueue, session_keys: list[str]) -> tuple[asyncio.Task[None], asyncio.Event]:
+    """Queue one item per session, start a blocking processor, return (task, release)."""
+    release = asyncio.Event()
+
+    async def handler(item: QueueItem) -> None:
+        await release.wait()
+
+    for key in session_keys:
+        await lane_queue.enqueue(QueueItem(session_key=key, payload=key))
+    processor = asyncio.create_task(lane_queue.process("main", handler))
+    await asyncio.sleep(0.02)
+    return processor, release
+
+
+async def _stop(processor: asyncio.Task[None], release: asyncio.Event) -> None:
+    release.set()
+    processor.cancel()
+    try:
+        await processor
+    except asyncio.CancelledError:
+        pass
+
+
+def test_channel_of_uses_session_key_prefix():
+    assert channel_of("discord:123") == "discord"
+    assert channel_of("telegram:-100:42") == "telegram"
+    assert channel_of("heartbeat") == "heartbeat"
+
+
+@pytest.mark.asyncio
+async def test_busy_channel_capped_at_fair_share():
+    """A flooding channel cannot take slots another channel is waiting for."""
+    lane_queue = LaneQueue(main_concurrency=4)
+    # Discord traffic arrives first and is older, so it would win every slot
+    keys = [f"discord:{i}" for i in range(10)] + ["telegram:1", "telegram:2"]
+    processor, release = await _fill_and_start(lane_queue, keys)
+
+    lane = lane_queue.get_lane("main")
+    assert lane.active_channels == {"discord": 2, "telegram": 2}
+    await _stop(processor, release)
+
+
+@pytest.mark.asyncio
+async def test_single_channel_uses_all_slots():
+    """Fair sharing is work-conserving when no other channel is waiting."""
+    lane_queue = LaneQueue(main_concurrency=4)
+    processor, release = await _fill_and_start(lane_queue, [f"discord:{i}" for i in range(6)])
+
+    assert lane_queue.get_lane("main").active_channels == {"discord": 4}
+    await _stop(processor, release)
+
+
+@pytest.mark.asyncio
+async def test_channel_weights_set_share():
+    lane_queue = LaneQueue(main_concurrency=4, channel_weights={"telegram": 3.0})
+    keys = [f"discord:{i}" for i in range(6)] + [f"telegram:{i}" for i in range(6)]
+    processor, release = await _fill_and_start(lane_queue, keys)
+
+    assert lane_queue.get_lane("main").active_channels == {"telegram": 3, "discord": 1}
+    await _stop(processor, release)
+
+
+def test_served_session_backlog_goes_behind_waiting_sessions():
+    """Equal-priority sessions in a channel are served round-robin."""
+    buffer = LaneBuffer(aging_per_second=0.0)
+    a1 = QueueItem(session_key="discord:a", payload=1, enqueued_at=1.0)
+    a2 = QueueItem(session_key="discord:a", payload=2, enqueued_at=2.0)
+    b1 = QueueItem(session_key="discord:b", payload=3, enqueued_at=3.0)
+    for item in (a1, a2, b1):
+        buffer.append(item)
+
+    assert buffer.peek_next(exclude_sessions=set()) is a1
+    buffer.remove(a1)
+    buffer.restart_session("discord:a", now=10.0)
+
+    assert buffer.peek_next(exclude_sessions=set()) is b1
+    assert buffer.peek_next(exclude_sessions=set(), channel="discord") is b1
+    assert buffer.peek_next(exclude_sessions=set(), channel="telegram") is None
+
+
+@pytest.mark.asyncio
+async def test_session_wait_percentiles():
+    lane_queue = LaneQueue(main_concurrency=1)
+
+    async def handler(item: QueueItem) -> None:
+        return None
+
+    for i in range(5):
+        await lane_queue.enqueue(QueueItem(session_key="telegram:1", payload=i))
+    await lane_queue.enqueue(QueueItem(session_key="telegram:2", payload=99))
+    processor = asyncio.create_task(lane_queue.process("main", handler))
+    await asyncio.sleep(0.05)
+    await _stop(processor, asyncio.Event())
+
+    stats = lane_queue.get_session_wait_stats()
+    assert stats["telegram:1"]["samples"] == 5
+    assert stats["telegram:2"]["samples"] == 1
+    assert stats["telegram:1"]["p50_wait_ms"] <= stats["telegram:1"]["p99_wait_ms"]
+    assert set(lane_queue.get_session_wait_stats(session_key="telegram:2")) == {"telegram:2"}
+    assert lane_queue.get_session_wait_stats(session_key="unknown") == {}
+    assert "p95_wait_ms" in lane_queue.get_stats()["main"]
+
+
+@pytest.mark.asyncio
+async def test_session_wait_samples_are_bounded():
+    lane_queue = LaneQueue(main_concurrency=4, max_session_locks=2)
+
+    async def handler(item: QueueItem) -> None:
+        return None
+
+    for i in range(5):
+        await lane_queue.enqueue(QueueItem(session_key=f"telegram:{i}", payload=i))
+    processor = asyncio.create_task(lane_queue.process("main", handler))
+    await asyncio.sleep(0.05)
+    await _stop(processor, asyncio.Event())
+
+    assert len(lane_queue.get_session_wait_stats()) == 2
+
+
+def test_channel_weights_must_be_positive():
+    with pytest.raises(ValidationError):
+        WorkspaceQueueConfig(channel_weights={"discord": 0})
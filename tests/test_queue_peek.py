@@ -217,3 +217,26 @@ async def test_consume_pending_drains_all_regardless_of_steer_eligible(queue_man
     # Consume should return both
     messages = await queue_manager.consume_pending(session_key)
     assert len(messages) == 2
+
+
+@pytest.mark.asyncio
+async def test_wait_pending_wakes_on_steer_eligible_submit(queue_manager):
+    """wait_pending returns once a message arrives, ignoring system events."""
+    waiter = asyncio.create_task(queue_manager.wait_pending("test_session"))
+    await asyncio.sleep(0)
+
+    await queue_manager.submit("test_session", "system", "cron event", steer_eligible=False)
+    await asyncio.sleep(0.01)
+    assert not waiter.done()
+
+    await queue_manager.submit("test_session", "telegram", "Stop that")
+    await asyncio.wait_for(waiter, timeout=1.0)
+    assert queue_manager._arrival_events == {}
+
+
+@pytest.mark.asyncio
+async def test_wait_pending_returns_when_already_pending(queue_manager):
+    session = await queue_manager._get_or_create_session("test_session")
+    session.messages.append(("telegram", "Hello"))
+
+    await asyncio.wait_for(queue_manager.wait_pending("test_session"), timeout=1.0)
@@ -0,0 +1,157 @@
+"""Tests for priority scheduling with aging in the lane queue."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from openpaw.core.config.models import WorkspaceQueueConfig
+from openpaw.runtime.queue.lane import LaneBuffer, LaneQueue, QueueItem, QueueMode
+from openpaw.runtime.queue.manager import QueueManager
+from openpaw.runtime.queue.priority import PriorityPolicy
+
+
+def _item(session_key: str, priority: int, enqueued_at: float) -> QueueItem:
+    return QueueItem(session_key=session_key, payload=session_key, priority=priority, enqueued_at=enqueued_at)
+
+
+class TestLaneBufferPriority:
+    """Dispatch ordering of LaneBuffer.peek_next()."""
+
+    def test_higher_priority_dispatches_first(self):
+        buffer = LaneBuffer(aging_per_second=0.0)
+        low = _item("group", 0, enqueued_at=1.0)
+        high = _item("dm", 10, enqueued_at=2.0)
+        buffer.append(low)
+        buffer.append(high)
+
+        assert buffer.peek_next(exclude_sessions=set()) is high
+
+    def test_equal_priority_is_fifo(self):
+        buffer = LaneBuffer(aging_per_second=0.1)
+        first = _item("a", 5, enqueued_at=1.0)
+        second = _item("b", 5, enqueued_at=1.0)
+        buffer.append(first)
+        buffer.append(second)
+
+        assert buffer.peek_next(exclude_sessions=set()) is first
+
+    def test_aging_prevents_starvation(self):
+        """An old low-priority item overtakes newer high-priority traffic."""
+        buffer = LaneBuffer(aging_per_second=1.0)
+        old_low = _item("group", 0, enqueued_at=0.0)
+        new_high = _item("dm", 10, enqueued_at=20.0)
+        buffer.append(new_high)
+        buffer.append(old_low)
+
+        assert buffer.peek_next(exclude_sessions=set()) is old_low
+
+    def test_removed_items_are_skipped(self):
+        buffer = LaneBuffer()
+        high = _item("a", 10, enqueued_at=1.0)
+        low = _item("b", 0, enqueued_at=1.0)
+        buffer.append(high)
+        buffer.append(low)
+        buffer.pop_session("a")
+
+        assert buffer.peek_next(exclude_sessions=set()) is low
+
+    def test_excluded_sessions_are_restored(self):
+        buffer = LaneBuffer()
+        high = _item("busy", 10, enqueued_at=1.0)
+        low = _item("free", 0, enqueued_at=1.0)
+        buffer.append(high)
+        buffer.append(low)
+
+        assert buffer.peek_next(exclude_sessions={"busy"}) is low
+        assert buffer.peek_next(exclude_sessions=set()) is high
+
+
+class TestPriorityPolicy:
+    """Priority resolution for messages and system events."""
+
+    @pytest.fixture
+    def policy(self) -> PriorityPolicy:
+        return PriorityPolicy(
+            direct_message=10,
+            group_message=0,
+            steer_boost=5,
+            system_event=-5,
+            channels={"vip": 50},
+            invocation_types={"subagent": 3},
+        )
+
+    def test_dm_beats_group(self, policy: PriorityPolicy):
+        dm = SimpleNamespace(metadata={"chat_type": "private"})
+        group = SimpleNamespace(metadata={"guild_id": 123})
+        assert policy.resolve("telegram", dm, QueueMode.COLLECT) == 10
+        assert policy.resolve("discord", group, QueueMode.COLLECT) == 0
+
+    def test_steer_mode_gets_boost(self, policy: PriorityPolicy):
+        dm = SimpleNamespace(metadata={})
+        assert policy.resolve("telegram", dm, QueueMode.STEER) == 15
+        assert policy.resolve("telegram", dm, QueueMode.INTERRUPT) == 15
+
+    def test_channel_override(self, policy: PriorityPolicy):
+        group = SimpleNamespace(metadata={"guild_id": 123})
+        assert policy.resolve("vip", group, QueueMode.COLLECT) == 50
+
+    def test_system_events_by_invocation_type(self, policy: PriorityPolicy):
+        assert policy.resolve("telegram", "event", QueueMode.COLLECT, "subagent") == 3
+        assert policy.resolve("telegram", "event", QueueMode.COLLECT, "cron") == -5
+
+
+@pytest.mark.asyncio
+async def test_dm_dispatched_before_queued_group_traffic():
+    """With one slot, a DM submitted after group traffic runs before it."""
+    lane_queue = LaneQueue(main_concurrency=1, aging_per_second=0.0)
+    manager = QueueManager(
+        lane_queue,
+        default_debounce_ms=0,
+        priority_policy=PriorityPolicy(direct_message=10, group_message=0),
+    )
+    order: list[str] = []
+    gate = asyncio.Event()
+
+    async def handler(item: QueueItem) -> None:
+        order.append(item.session_key)
+        await gate.wait()
+
+    processor = asyncio.create_task(lane_queue.process("main", handler))
+    # Occupy the only slot so later items queue up
+    await lane_queue.enqueue(QueueItem(session_key="blocker", payload=None))
+    await asyncio.sleep(0.01)
+
+    group_msg = SimpleNamespace(metadata={"guild_id": 1})
+    dm_msg = SimpleNamespace(metadata={"chat_type": "private"})
+    await manager.submit("discord:group", "discord", group_msg)
+    await manager.submit("telegram:dm", "telegram", dm_msg)
+    await asyncio.sleep(0.02)
+
+    gate.set()
+    await asyncio.sleep(0.02)
+    assert order == ["blocker", "telegram:dm", "discord:group"]
+
+    processor.cancel()
+    try:
+        await processor
+    except asyncio.CancelledError:
+        pass
+
+
+@pytest.mark.asyncio
+async def test_system_event_priority_applied():
+    """Non-steer-eligible system events use the invocation-type priority."""
+    lane_queue = LaneQueue()
+    manager = QueueManager(lane_queue, priority_policy=PriorityPolicy(invocation_types={"cron": -7}))
+
+    await manager.submit("telegram:1", "telegram", "event", steer_eligible=False, invocation_type="cron")
+
+    assert lane_queue.get_lane("main").queue[0].priority == -7
+
+
+def test_workspace_queue_config_priority_defaults():
+    config = WorkspaceQueueConfig()
+    assert config.priority.direct_message > config.priority.group_message
+    assert config.priority.system_event < config.priority.group_message
+    assert config.priority.aging_per_second > 0
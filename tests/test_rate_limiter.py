@@ -0,0 +1,144 @@
+"""Tests for the shared provider rate limiter and its middleware."""
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage
+
+from openpaw.agent.middleware.rate_limit import ProviderRateLimitMiddleware
+from openpaw.agent.rate_limiter import ProviderRateLimiter, retry_after_seconds
+from openpaw.agent.run_context import RunContext, bind_run_context
+from openpaw.core.config.models import ProviderRateLimitConfig
+
+
+class FakeRateLimitError(Exception):
+    """429 error shaped like the Anthropic/OpenAI SDK exceptions."""
+
+    def __init__(self, headers: dict[str, str], status_code: int = 429):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+        self.response = SimpleNamespace(headers=headers)
+
+
+def _request(model: object) -> SimpleNamespace:
+    return SimpleNamespace(model=model, messages=[HumanMessage(content="hi")], system_message=None)
+
+
+def _response(tokens: int = 10) -> SimpleNamespace:
+    message = AIMessage(
+        content="ok",
+        usage_metadata={"input_tokens": tokens, "output_tokens": 0, "total_tokens": tokens},
+    )
+    return SimpleNamespace(result=[message])
+
+
+@pytest.mark.asyncio
+async def test_calls_wait_for_token_budget():
+    limiter = ProviderRateLimiter()
+    limiter.configure("anthropic", ProviderRateLimitConfig(tokens_per_minute=6000))
+
+    assert await limiter.acquire("anthropic", 6000) == 0
+    waited = await limiter.acquire("anthropic", 10)
+
+    # 6000 tokens/minute refills 100 per second
+    assert 0.05 < waited < 0.5
+    stats = limiter.get_stats()["anthropic"]
+    assert stats["calls"] == 2
+    assert stats["waits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_unknown_provider_not_limited():
+    assert await ProviderRateLimiter().acquire("openai", 10**9) == 0
+
+
+def test_retry_after_headers():
+    assert retry_after_seconds(FakeRateLimitError({"retry-after": "3"})) == 3.0
+    assert retry_after_seconds(FakeRateLimitError({"retry-after-ms": "250", "retry-after": "1"})) == 0.25
+    assert retry_after_seconds(FakeRateLimitError({"retry-after": "Wed, 21 Oct 2015 07:28:00 GMT"})) == 0.0
+    assert retry_after_seconds(FakeRateLimitError({})) is None
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_error_pauses_and_retries():
+    """A 429 pauses the provider for retry-after, then the call is retried instead of failing."""
+    limiter = ProviderRateLimiter()
+    model = object()
+    middleware = ProviderRateLimitMiddleware(
+        "anthropic", ProviderRateLimitConfig(requests_per_minute=1000), model, limiter=limiter
+    )
+    calls: list[float] = []
+
+    async def handler(request):
+        calls.append(time.monotonic())
+        if len(calls) == 1:
+            raise FakeRateLimitError({"retry-after": "0.1"})
+        return _response()
+
+    context = RunContext()
+    with bind_run_context(context):
+        response = await middleware.awrap_model_call(_request(model), handler)
+
+    assert response.result[0].content == "ok"
+    assert calls[1] - calls[0] >= 0.09
+    assert context.rate_limit_wait_ms >= 90
+    assert limiter.get_stats()["anthropic"]["throttled"] == 1
+
+
+@pytest.mark.asyncio
+async def test_retries_exhausted_or_other_errors_raise():
+    limiter = ProviderRateLimiter()
+    model = object()
+    middleware = ProviderRateLimitMiddleware(
+        "anthropic", ProviderRateLimitConfig(max_retries=0), model, limiter=limiter
+    )
+
+    async def rate_limited(request):
+        raise FakeRateLimitError({"retry-after": "0"})
+
+    async def server_error(request):
+        raise FakeRateLimitError({}, status_code=500)
+
+    with pytest.raises(FakeRateLimitError):
+        await middleware.awrap_model_call(_request(model), rate_limited)
+    with pytest.raises(FakeRateLimitError):
+        await asyncio.wait_for(middleware.awrap_model_call(_request(model), server_error), timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_other_models_pass_through():
+    """Calls made with another model (e.g. a hedging secondary) use that model's limit."""
+    limiter = ProviderRateLimiter()
+    middleware = ProviderRateLimitMiddleware(
+        "anthropic", ProviderRateLimitConfig(requests_per_minute=10), object(), limiter=limiter
+    )
+
+    async def handler(request):
+        return _response()
+
+    await middleware.awrap_model_call(_request(object()), handler)
+
+    assert limiter.get_stats()["anthropic"]["calls"] == 0
+
+
+@pytest.mark.asyncio
+async def test_direct_model_calls_are_paced():
+    """Model calls outside the agent (background summaries) share the provider budget."""
+    limiter = ProviderRateLimiter()
+    model = SimpleNamespace()
+
+    async def ainvoke(messages, config=None):
+        return _response(tokens=50).result[0]
+
+    model.ainvoke = ainvoke
+    middleware = ProviderRateLimitMiddleware(
+        "anthropic", ProviderRateLimitConfig(requests_per_minute=10), model, limiter=limiter
+    )
+
+    response = await middleware.ainvoke([HumanMessage(content="summarize")])
+
+    assert response.content == "ok"
+    assert middleware.limits(model)
+    assert limiter.get_stats()["anthropic"]["calls"] == 1
@@ -8,6 +8,7 @@ import pytest
 from pydantic import ValidationError
 
 from openpaw.agent.metrics import InvocationMetrics
+from openpaw.agent.run_context import RunContext
 from openpaw.agent.session_logger import SessionLogger, SessionRecord
 from openpaw.core.config.models import CronDefinition, CronOutputConfig, HeartbeatConfig
 from openpaw.core.prompts.system_events import (
@@ -305,11 +306,15 @@ class TestHeartbeatDeliveryRouting:
     def mock_agent_runner(self):
         """Create mock agent runner."""
         runner = MagicMock()
-        runner.run = AsyncMock(return_value="Test response")
-        runner.last_metrics = InvocationMetrics(
-            input_tokens=100, output_tokens=50, total_tokens=150, llm_calls=1
+        runner.run = AsyncMock(
+            return_value=RunContext(
+                response="Test response",
+                metrics=InvocationMetrics(
+                    input_tokens=100, output_tokens=50, total_tokens=150, llm_calls=1
+                ),
+                tools_used=["brave_search"],
+            )
         )
-        runner.last_tools_used = ["brave_search"]
         return runner
 
     @pytest.fixture
@@ -430,7 +435,7 @@ class TestHeartbeatDeliveryRouting:
     async def test_heartbeat_ok_suppresses_all_delivery(self, workspace, mock_agent_runner, mock_channel):
         """HEARTBEAT_OK: neither channel nor callback called (regardless of delivery mode)."""
         # Set response to HEARTBEAT_OK
-        mock_agent_runner.run = AsyncMock(return_value="HEARTBEAT_OK")
+        mock_agent_runner.run.return_value.response = "HEARTBEAT_OK"
 
         config = HeartbeatConfig(
             enabled=True,
@@ -493,14 +498,14 @@ class TestHeartbeatDeliveryRouting:
         call_kwargs = session_logger.write_session.call_args[1]
         assert call_kwargs["name"] == "heartbeat"
         assert call_kwargs["response"] == "Test response"
-        assert call_kwargs["metrics"] == mock_agent_runner.last_metrics
+        assert call_kwargs["metrics"] == mock_agent_runner.run.return_value.metrics
 
     @pytest.mark.asyncio
     async def test_heartbeat_session_log_written_on_heartbeat_ok(
         self, workspace, mock_agent_runner, mock_channel
     ):
         """Session log written even for HEARTBEAT_OK."""
-        mock_agent_runner.run = AsyncMock(return_value="HEARTBEAT_OK")
+        mock_agent_runner.run.return_value.response = "HEARTBEAT_OK"
 
         config = HeartbeatConfig(
             enabled=True,
@@ -548,11 +553,15 @@ class TestCronDeliveryRouting:
     def mock_agent_runner(self):
         """Create mock agent runner."""
         runner = MagicMock()
-        runner.run = AsyncMock(return_value="Cron response")
-        runner.last_metrics = InvocationMetrics(
-            input_tokens=80, output_tokens=40, total_tokens=120, llm_calls=1
+        runner.run = AsyncMock(
+            return_value=RunContext(
+                response="Cron response",
+                metrics=InvocationMetrics(
+                    input_tokens=80, output_tokens=40, total_tokens=120, llm_calls=1
+                ),
+                tools_used=["read_file"],
+            )
         )
-        runner.last_tools_used = ["read_file"]
         return runner
 
     @pytest.fixture
@@ -745,11 +754,15 @@ class TestSubAgentSessionLogging:
     def mock_agent_runner(self):
         """Create mock agent runner."""
         runner = MagicMock()
-        runner.run = AsyncMock(return_value="Subagent response")
-        runner.last_metrics = InvocationMetrics(
-            input_tokens=50, output_tokens=30, total_tokens=80, llm_calls=1
+        runner.run = AsyncMock(
+            return_value=RunContext(
+                response="Subagent response",
+                metrics=InvocationMetrics(
+                    input_tokens=50, output_tokens=30, total_tokens=80, llm_calls=1
+                ),
+                tools_used=["grep_files"],
+            )
         )
-        runner.last_tools_used = ["grep_files"]
         runner.additional_tools = []
         runner._build_agent = MagicMock(return_value=MagicMock())
         runner.timeout_seconds = 120
@@ -792,7 +805,7 @@ class TestSubAgentSessionLogging:
         assert call_kwargs["name"] == "subagent_test-subagent"
         assert call_kwargs["prompt"] == "Test task"
         assert call_kwargs["response"] == "Subagent response"
-        assert call_kwargs["metrics"] == mock_agent_runner.last_metrics
+        assert call_kwargs["metrics"] == mock_agent_runner.run.return_value.metrics
 
     @pytest.mark.asyncio
     async def test_subagent_session_log_written_on_timeout(self, workspace, store, mock_agent_runner):
@@ -804,7 +817,7 @@ class TestSubAgentSessionLogging:
 
         async def slow_run(message):
             await asyncio.sleep(10)  # Sleep longer than timeout
-            return "Should not reach here"
+            return RunContext(response="Should not reach here")
 
         mock_agent_runner.run = slow_run
 
@@ -855,9 +868,7 @@ class TestBackwardsCompatibility:
         (workspace / "HEARTBEAT.md").write_text("# Test")
 
         mock_runner = MagicMock()
-        mock_runner.run = AsyncMock(return_value="Test")
-        mock_runner.last_metrics = None
-        mock_runner.last_tools_used = []
+        mock_runner.run = AsyncMock(return_value=RunContext(response="Test"))
 
         mock_channel = MagicMock()
         mock_channel.send_message = AsyncMock()
@@ -891,9 +902,7 @@ class TestBackwardsCompatibility:
         workspace.mkdir()
 
         mock_runner = MagicMock()
-        mock_runner.run = AsyncMock(return_value="Cron test")
-        mock_runner.last_metrics = None
-        mock_runner.last_tools_used = []
+        mock_runner.run = AsyncMock(return_value=RunContext(response="Cron test"))
 
         mock_channel = MagicMock()
         mock_channel.send_message = AsyncMock()
@@ -932,9 +941,7 @@ class TestBackwardsCompatibility:
         store = SubAgentStore(workspace)
 
         mock_runner = MagicMock()
-        mock_runner.run = AsyncMock(return_value="Subagent test")
-        mock_runner.last_metrics = None
-        mock_runner.last_tools_used = []
+        mock_runner.run = AsyncMock(return_value=RunContext(response="Subagent test"))
         mock_runner.additional_tools = []
         mock_runner._build_agent = MagicMock(return_value=MagicMock())
         mock_runner.timeout_seconds = 120
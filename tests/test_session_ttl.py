@@ -77,8 +77,6 @@ def _make_processor(
         session_manager=session_manager,
         queue_manager=MagicMock(),
         builtin_loader=MagicMock(),
-        queue_middleware=MagicMock(),
-        approval_middleware=MagicMock(),
         approval_manager=None,
         workspace_name="test-workspace",
         token_logger=MagicMock(),
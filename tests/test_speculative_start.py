@@ -0,0 +1,113 @@
+"""Tests for speculative agent starts during the debounce window."""
+
+import asyncio
+import time
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from openpaw.agent.middleware import InterruptSignalError
+from openpaw.model.message import Message
+from openpaw.runtime.queue.lane import LaneQueue
+from openpaw.runtime.queue.manager import QueueManager
+from openpaw.runtime.session.manager import SessionManager
+from openpaw.workspace.message_processor import MessageProcessor
+
+
+def _message(content: str) -> Message:
+    return Message(id="1", channel="telegram", session_key="telegram:1", user_id="123", content=content)
+
+
+@pytest.mark.asyncio
+async def test_first_message_flushed_immediately():
+    lane_queue = LaneQueue()
+    manager = QueueManager(lane_queue, default_debounce_ms=5000, speculative_start=True)
+
+    await manager.submit("telegram:1", "telegram", "hello")
+
+    assert len(lane_queue.get_lane("main").queue) == 1
+    deadline = manager.speculation_deadline("telegram:1")
+    assert deadline is not None and deadline > time.monotonic() + 4
+
+    # A follow-up inside the window is buffered for the restart
+    await manager.submit("telegram:1", "telegram", "and also")
+    assert len(lane_queue.get_lane("main").queue) == 1
+    assert await manager.peek_pending("telegram:1")
+
+
+@pytest.mark.asyncio
+async def test_commit_closes_window_and_counts_saved_latency():
+    manager = QueueManager(LaneQueue(), default_debounce_ms=2000, speculative_start=True)
+    await manager.submit("telegram:1", "telegram", "hello")
+
+    manager.record_speculation("telegram:1", time.monotonic(), restarted=False)
+
+    assert manager.speculation_deadline("telegram:1") is None
+    stats = manager.get_stats()["speculation"]
+    assert stats["starts"] == 1
+    assert stats["restarts"] == 0
+    assert stats["saved_ms"] > 1500
+
+    # The next message opens a new speculative batch
+    await manager.submit("telegram:1", "telegram", "next")
+    assert manager.get_stats()["speculation"]["starts"] == 2
+
+
+@pytest.mark.asyncio
+async def test_disabled_by_default():
+    lane_queue = LaneQueue()
+    manager = QueueManager(lane_queue, default_debounce_ms=5000)
+
+    await manager.submit("telegram:1", "telegram", "hello")
+
+    assert len(lane_queue.get_lane("main").queue) == 0
+    assert manager.speculation_deadline("telegram:1") is None
+
+
+@pytest.mark.asyncio
+async def test_run_restarts_with_coalesced_input(tmp_path: Path):
+    """A message inside the window cancels the run, rolls back and restarts."""
+    lane_queue = LaneQueue()
+    manager = QueueManager(lane_queue, default_debounce_ms=5000, speculative_start=True)
+    await manager.submit("telegram:1", "telegram", "first")
+    # The lane worker has taken the speculative batch
+    await lane_queue.consume_session_pending("telegram:1")
+
+    agent_runner = AsyncMock()
+    agent_runner.thread_message_ids = AsyncMock(return_value={"m1"})
+    inputs: list[str] = []
+
+    async def run(message, thread_id, context):
+        inputs.append(message)
+        if len(inputs) == 1:
+            await manager.submit("telegram:1", "telegram", "second")
+            # What AgentRunner raises when interrupt_watch fires first
+            await context.interrupt_watch()
+            raise InterruptSignalError([])
+        context.response = "done"
+        return context
+
+    agent_runner.run = run
+    channel = AsyncMock()
+    processor = MessageProcessor(
+        agent_runner=agent_runner,
+        session_manager=SessionManager(tmp_path),
+        queue_manager=manager,
+        builtin_loader=MagicMock(),
+        approval_manager=None,
+        workspace_name="test_workspace",
+        token_logger=MagicMock(),
+        logger=MagicMock(),
+        speculative_start=True,
+    )
+
+    await asyncio.wait_for(processor.process_messages("telegram:1", [_message("first")], channel), timeout=2)
+
+    assert inputs == ["first", "first\nsecond"]
+    thread_id = processor._session_manager.get_thread_id("telegram:1")
+    agent_runner.rollback_thread.assert_awaited_once_with(thread_id, {"m1"})
+    channel.send_message.assert_awaited_with("telegram:1", "done")
+    stats = manager.get_stats()["speculation"]
+    assert stats["restarts"] == 1
+    assert manager.speculation_deadline("telegram:1") is None
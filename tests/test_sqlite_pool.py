@@ -0,0 +1,103 @@
+"""Tests for tuned SQLite connections and the pooled checkpointer."""
+
+import asyncio
+import sqlite3
+
+import pytest
+from langgraph.checkpoint.base import empty_checkpoint
+
+from openpaw.core.config.models import SqliteConfig
+from openpaw.stores.checkpoint import PooledSqliteSaver
+from openpaw.stores.sqlite import SqliteConnectionPool
+
+
+async def _pragma(conn, name: str):
+    cursor = await conn.execute(f"PRAGMA {name}")
+    row = await cursor.fetchone()
+    return row[0]
+
+
+@pytest.fixture
+async def pool(tmp_path):
+    pool = SqliteConnectionPool(tmp_path / "conversations.db", SqliteConfig(readers=2))
+    await pool.open()
+    yield pool
+    await pool.close()
+
+
+async def _put(saver: PooledSqliteSaver, thread_id: str) -> dict:
+    config = {"configurable": {"thread_id": thread_id, "checkpoint_ns": ""}}
+    return await saver.aput(config, empty_checkpoint(), {"step": 1}, {})
+
+
+@pytest.mark.asyncio
+async def test_pragmas_applied(pool):
+    writer = pool.writer
+    assert await _pragma(writer, "journal_mode") == "wal"
+    assert await _pragma(writer, "synchronous") == 1  # NORMAL
+    assert await _pragma(writer, "cache_size") == -16384
+    assert await _pragma(writer, "busy_timeout") == 5000
+
+    async with pool.reader() as reader:
+        assert reader is not writer
+        assert await _pragma(reader, "query_only") == 1
+        with pytest.raises(sqlite3.OperationalError):
+            await reader.execute("CREATE TABLE t (x)")
+
+
+@pytest.mark.asyncio
+async def test_without_wal_readers_share_the_writer(tmp_path):
+    pool = SqliteConnectionPool(tmp_path / "c.db", SqliteConfig(journal_mode="delete"))
+    await pool.open()
+    async with pool.reader() as conn:
+        assert conn is pool.writer
+    assert pool.readers == 0
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_checkpoints_round_trip_through_readers(pool):
+    saver = PooledSqliteSaver(pool)
+    await saver.setup()
+    stored = await _put(saver, "telegram:1:conv")
+
+    loaded = await saver.aget_tuple({"configurable": {"thread_id": "telegram:1:conv"}})
+    listed = [item async for item in saver.alist({"configurable": {"thread_id": "telegram:1:conv"}})]
+
+    assert loaded.config["configurable"]["checkpoint_id"] == stored["configurable"]["checkpoint_id"]
+    assert loaded.metadata == {"step": 1}
+    assert len(listed) == 1
+    assert pool.get_stats()["reads"] == 2
+
+
+@pytest.mark.asyncio
+async def test_reads_do_not_wait_for_writes(pool):
+    saver = PooledSqliteSaver(pool)
+    await saver.setup()
+    await _put(saver, "telegram:1:conv")
+
+    # A write in progress holds the writer lock for the whole statement and commit
+    async with saver.lock:
+        loaded = await asyncio.wait_for(
+            saver.aget_tuple({"configurable": {"thread_id": "telegram:1:conv"}}), timeout=2
+        )
+
+    assert loaded is not None
+
+
+@pytest.mark.asyncio
+async def test_readers_are_lent_one_task_at_a_time(tmp_path):
+    pool = SqliteConnectionPool(tmp_path / "c.db", SqliteConfig(readers=1))
+    await pool.open()
+
+    async def read() -> None:
+        async with pool.reader() as conn:
+            await conn.execute("SELECT 1")
+            await asyncio.sleep(0.01)
+
+    await asyncio.gather(read(), read(), read())
+
+    stats = pool.get_stats()
+    assert stats["reads"] == 3
+    assert stats["reader_waits"] == 2
+    await pool.close()
@@ -501,3 +501,28 @@ async def test_status_shows_in_progress_tasks(workspace_path: Path):
     assert "Tasks: 1 pending, 2 in progress, 0 completed" in result.response
     assert "Deploy production server" in result.response
     assert "Update documentation" in result.response
+
+
+@pytest.mark.asyncio
+async def test_status_shows_agent_graph_cache(command_context: CommandContext):
+    """Test /status reports the stateless agent graph cache hit rate."""
+    factory = Mock()
+    factory.graph_cache_stats.return_value = {
+        "entries": 1,
+        "hits": 3,
+        "misses": 1,
+        "hit_rate": 0.75,
+        "builds": 1,
+        "avg_build_ms": 120,
+        "last_build_ms": 120,
+        "invalidations": 0,
+    }
+    command_context.agent_factory = factory
+
+    command = StatusCommand()
+    message = Mock()
+    message.session_key = "telegram:12345"
+
+    result = await command.handle(message, "", command_context)
+
+    assert "Agent cache: 75% hit rate (3/4), avg build 120ms" in result.response
@@ -1,5 +1,6 @@
 """Tests for steer/interrupt WorkspaceRunner integration."""
 
+import asyncio
 from pathlib import Path
 from typing import Any
 from unittest.mock import AsyncMock, Mock, patch
@@ -7,11 +8,21 @@ from unittest.mock import AsyncMock, Mock, patch
 import pytest
 
 from openpaw.agent import AgentRunner
-from openpaw.agent.middleware import InterruptSignalError, QueueAwareToolMiddleware
+from openpaw.agent.middleware import (
+    InterruptSignalError,
+    PromptCacheMiddleware,
+    QueueAwareToolMiddleware,
+)
+from openpaw.agent.run_context import RunContext, bind_run_context, get_run_context
 from openpaw.core.workspace import AgentWorkspace
 from openpaw.runtime.queue.lane import QueueMode
 
 
+def _custom_middleware(middleware: list[Any]) -> list[Any]:
+    """Middleware passed to create_agent, minus the framework's prompt layout middleware."""
+    return [mw for mw in middleware if not isinstance(mw, PromptCacheMiddleware)]
+
+
 @pytest.fixture
 def mock_workspace(tmp_path: Path) -> AgentWorkspace:
     """Create a minimal mock workspace."""
@@ -32,12 +43,6 @@ def mock_workspace(tmp_path: Path) -> AgentWorkspace:
     return loader.load("test_workspace")
 
 
-@pytest.fixture
-def mock_middleware() -> QueueAwareToolMiddleware:
-    """Create a QueueAwareToolMiddleware instance."""
-    return QueueAwareToolMiddleware()
-
-
 class TestAgentRunnerMiddleware:
     """Test AgentRunner accepts and passes middleware to create_agent."""
 
@@ -79,7 +84,8 @@ class TestAgentRunnerMiddleware:
         assert mock_create_agent.called
         call_kwargs = mock_create_agent.call_args[1]
         assert "middleware" in call_kwargs
-        assert call_kwargs["middleware"] == [middleware_fn]
+        assert _custom_middleware(call_kwargs["middleware"]) == [middleware_fn]
+        assert isinstance(call_kwargs["middleware"][-1], PromptCacheMiddleware)
 
     @patch("openpaw.agent.runner.create_agent")
     @patch("openpaw.agent.runner.AgentRunner._create_model")
@@ -95,7 +101,7 @@ class TestAgentRunnerMiddleware:
 
         assert runner._middleware == []
         call_kwargs = mock_create_agent.call_args[1]
-        assert call_kwargs["middleware"] == []
+        assert _custom_middleware(call_kwargs["middleware"]) == []
 
 
 class TestInterruptSignalPropagation:
@@ -128,76 +134,118 @@ class TestInterruptSignalPropagation:
 
             assert len(exc_info.value.pending_messages) == 1
 
+    @pytest.mark.asyncio
+    async def test_interrupt_watch_cancels_in_flight_stream(
+        self, mock_workspace: AgentWorkspace
+    ) -> None:
+        """A firing interrupt_watch cancels a long generation instead of waiting for it."""
+        with patch("openpaw.agent.runner.create_agent") as mock_create_agent, patch(
+            "openpaw.agent.runner.AgentRunner._create_model"
+        ):
+            stream_closed = asyncio.Event()
+            mock_agent = Mock()
 
-class TestMiddlewareSetReset:
-    """Test middleware set_queue_awareness and reset called per invocation."""
+            async def slow_stream(*args: Any, **kwargs: Any) -> Any:
+                try:
+                    await asyncio.sleep(10)
+                    yield {}
+                finally:
+                    stream_closed.set()
 
-    def test_middleware_set_called_before_run(self, mock_middleware: QueueAwareToolMiddleware) -> None:
-        """set_queue_awareness is called before each agent run."""
-        mock_queue_manager = Mock()
-        session_key = "telegram:12345"
+            mock_agent.astream = slow_stream
+            mock_create_agent.return_value = mock_agent
+            runner = AgentRunner(workspace=mock_workspace)
 
-        mock_middleware.set_queue_awareness(
-            queue_manager=mock_queue_manager,
-            session_key=session_key,
-            queue_mode=QueueMode.STEER,
-        )
+            async def watch() -> None:
+                await asyncio.sleep(0.01)
 
-        assert mock_middleware._queue_manager == mock_queue_manager
-        assert mock_middleware._session_key == session_key
-        assert mock_middleware._queue_mode == QueueMode.STEER
+            context = RunContext(queue_mode=QueueMode.INTERRUPT, interrupt_watch=watch)
+            with pytest.raises(InterruptSignalError) as exc_info:
+                await asyncio.wait_for(runner.run(message="test", context=context), timeout=2)
 
-    def test_middleware_reset_clears_state(self, mock_middleware: QueueAwareToolMiddleware) -> None:
-        """reset() clears per-invocation state."""
-        mock_queue_manager = Mock()
-        mock_middleware.set_queue_awareness(
-            queue_manager=mock_queue_manager,
-            session_key="telegram:12345",
-            queue_mode=QueueMode.INTERRUPT,
-        )
+            assert exc_info.value.pending_messages == []
+            assert stream_closed.is_set()
+            assert context.interrupt_latency_ms is not None
+            assert context.metrics is not None and context.metrics.is_partial
+            assert context.metrics.interrupt_latency_ms == context.interrupt_latency_ms
 
-        mock_middleware.reset()
+    @pytest.mark.asyncio
+    async def test_completed_stream_wins_over_idle_watch(self, mock_workspace: AgentWorkspace) -> None:
+        """Without an interrupting message the run completes and the watch is cancelled."""
+        with patch("openpaw.agent.runner.create_agent") as mock_create_agent, patch(
+            "openpaw.agent.runner.AgentRunner._create_model"
+        ):
+            from langchain_core.messages import AIMessage
 
-        assert mock_middleware._queue_manager is None
-        assert mock_middleware._session_key is None
-        assert mock_middleware._queue_mode == QueueMode.COLLECT
-        assert mock_middleware._pending_steer_message is None
-        assert mock_middleware._steered is False
+            mock_agent = Mock()
 
+            async def quick_stream(*args: Any, **kwargs: Any) -> Any:
+                yield {"model": {"messages": [AIMessage(content="Done")]}}
 
-class TestSteerMode:
-    """Test steer mode behavior in WorkspaceRunner integration."""
+            mock_agent.astream = quick_stream
+            mock_create_agent.return_value = mock_agent
+            runner = AgentRunner(workspace=mock_workspace)
+
+            watch_cancelled = asyncio.Event()
+
+            async def watch() -> None:
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    watch_cancelled.set()
+                    raise
+
+            context = RunContext(queue_mode=QueueMode.INTERRUPT, interrupt_watch=watch)
+            await runner.run(message="test", context=context)
+
+            assert context.response == "Done"
+            assert watch_cancelled.is_set()
+            assert context.interrupt_latency_ms is None
 
-    @pytest.mark.asyncio
-    async def test_steer_resets_followup_depth(self) -> None:
-        """Steer mode resets followup depth to 0."""
-        # This is a behavioral test - verify that when steer occurs,
-        # followup_depth is reset. We'll check this via the log message.
 
-        mock_middleware = QueueAwareToolMiddleware()
+class TestRunContextState:
+    """Test per-invocation state lives on RunContext, not on the middleware."""
 
-        # Simulate steer by setting internal state
-        mock_middleware._steered = True
-        mock_middleware._pending_steer_message = [("telegram", Mock(content="new message"))]
+    def test_middleware_holds_no_session_state(self) -> None:
+        """Middleware only keeps the workspace queue manager."""
+        mock_queue_manager = Mock()
+        middleware = QueueAwareToolMiddleware(mock_queue_manager)
+
+        assert vars(middleware) == {"_queue_manager": mock_queue_manager}
+
+    def test_run_context_defaults(self) -> None:
+        """A fresh RunContext starts in collect mode with no steer state."""
+        context = RunContext(session_key="telegram:12345")
+
+        assert context.queue_mode == QueueMode.COLLECT
+        assert context.steered is False
+        assert context.steer_messages is None
+        assert context.tools_used == []
+        assert context.metrics is None
+
+    def test_bind_run_context_restores_previous(self) -> None:
+        """Binding a context is scoped to the with-block."""
+        outer = RunContext(session_key="telegram:1")
+        inner = RunContext(session_key="telegram:2")
 
-        # Verify steer state
-        assert mock_middleware.was_steered is True
-        assert mock_middleware.pending_steer_message is not None
+        assert get_run_context() is None
+        with bind_run_context(outer):
+            with bind_run_context(inner):
+                assert get_run_context() is inner
+            assert get_run_context() is outer
+        assert get_run_context() is None
 
 
 class TestCollectMode:
     """Test collect mode has no queue checking behavior."""
 
     @pytest.mark.asyncio
-    async def test_collect_mode_no_queue_check(self, mock_middleware: QueueAwareToolMiddleware) -> None:
+    async def test_collect_mode_no_queue_check(self) -> None:
         """In collect mode, tools execute normally without queue checks."""
         # Set to collect mode
         mock_queue_manager = Mock()
-        mock_middleware.set_queue_awareness(
-            queue_manager=mock_queue_manager,
-            session_key="telegram:12345",
-            queue_mode=QueueMode.COLLECT,
-        )
+        middleware = QueueAwareToolMiddleware(mock_queue_manager)
+        context = RunContext(session_key="telegram:12345", queue_mode=QueueMode.COLLECT)
 
         # Mock handler
         async def mock_handler(request: Any) -> str:
@@ -208,7 +256,8 @@ class TestCollectMode:
         mock_request.tool_call = {"name": "test_tool", "id": "call_123", "args": {}}
 
         # Execute
-        result = await mock_middleware._check_and_execute(mock_request, mock_handler)
+        with bind_run_context(context):
+            result = await middleware._check_and_execute(mock_request, mock_handler)
 
         assert result == "tool executed"
         # Verify queue manager was never called
@@ -246,14 +295,14 @@ class TestAgentFactoryNoMiddleware:
 
         # Verify factory agent has empty middleware
         call_kwargs = mock_create_agent.call_args[1]
-        assert call_kwargs["middleware"] == []
+        assert _custom_middleware(call_kwargs["middleware"]) == []
 
 
 class TestSteerInterruptIntegration:
     """Integration tests for steer/interrupt with middleware."""
 
     @pytest.mark.asyncio
-    async def test_steer_skips_tools_and_redirects(self, mock_middleware: QueueAwareToolMiddleware) -> None:
+    async def test_steer_skips_tools_and_redirects(self) -> None:
         """Steer mode skips remaining tools and redirects to new message."""
         # Mock queue manager that reports pending messages
         mock_queue_manager = AsyncMock()
@@ -263,11 +312,8 @@ class TestSteerInterruptIntegration:
         ]
 
         # Set middleware to steer mode
-        mock_middleware.set_queue_awareness(
-            queue_manager=mock_queue_manager,
-            session_key="telegram:12345",
-            queue_mode=QueueMode.STEER,
-        )
+        middleware = QueueAwareToolMiddleware(mock_queue_manager)
+        context = RunContext(session_key="telegram:12345", queue_mode=QueueMode.STEER)
 
         # Mock tool handler that should be skipped
         async def mock_handler(request: Any) -> str:
@@ -278,18 +324,19 @@ class TestSteerInterruptIntegration:
         mock_request.tool_call = {"name": "test_tool", "id": "call_123", "args": {}}
 
         # Execute
-        result = await mock_middleware._check_and_execute(mock_request, mock_handler)
+        with bind_run_context(context):
+            result = await middleware._check_and_execute(mock_request, mock_handler)
 
         # Verify tool was skipped
         assert hasattr(result, "content")
         assert "[Skipped:" in result.content
 
         # Verify steer state was captured
-        assert mock_middleware.was_steered is True
-        assert len(mock_middleware.pending_steer_message) == 1
+        assert context.steered is True
+        assert len(context.steer_messages) == 1
 
     @pytest.mark.asyncio
-    async def test_interrupt_aborts_run(self, mock_middleware: QueueAwareToolMiddleware) -> None:
+    async def test_interrupt_aborts_run(self) -> None:
         """Interrupt mode aborts run and raises InterruptSignalError."""
         # Mock queue manager that reports pending messages
         mock_queue_manager = AsyncMock()
@@ -299,11 +346,8 @@ class TestSteerInterruptIntegration:
         ]
 
         # Set middleware to interrupt mode
-        mock_middleware.set_queue_awareness(
-            queue_manager=mock_queue_manager,
-            session_key="telegram:12345",
-            queue_mode=QueueMode.INTERRUPT,
-        )
+        middleware = QueueAwareToolMiddleware(mock_queue_manager)
+        context = RunContext(session_key="telegram:12345", queue_mode=QueueMode.INTERRUPT)
 
         # Mock tool handler
         async def mock_handler(request: Any) -> str:
@@ -315,7 +359,8 @@ class TestSteerInterruptIntegration:
 
         # Execute and verify interrupt signal is raised
         with pytest.raises(InterruptSignalError) as exc_info:
-            await mock_middleware._check_and_execute(mock_request, mock_handler)
+            with bind_run_context(context):
+                await middleware._check_and_execute(mock_request, mock_handler)
 
         assert len(exc_info.value.pending_messages) == 1
         assert exc_info.value.pending_messages[0][0] == "telegram"
@@ -325,7 +370,7 @@ class TestSteerMultipleTools:
     """Test that steer only consumes messages once, even with multiple tool calls."""
 
     @pytest.mark.asyncio
-    async def test_steer_consumes_once(self, mock_middleware: QueueAwareToolMiddleware) -> None:
+    async def test_steer_consumes_once(self) -> None:
         """Steer only consumes pending messages on first tool skip."""
         # Mock queue manager
         mock_queue_manager = AsyncMock()
@@ -335,11 +380,8 @@ class TestSteerMultipleTools:
         ]
 
         # Set middleware to steer mode
-        mock_middleware.set_queue_awareness(
-            queue_manager=mock_queue_manager,
-            session_key="telegram:12345",
-            queue_mode=QueueMode.STEER,
-        )
+        middleware = QueueAwareToolMiddleware(mock_queue_manager)
+        context = RunContext(session_key="telegram:12345", queue_mode=QueueMode.STEER)
 
         # Mock handler
         async def mock_handler(request: Any) -> str:
@@ -352,12 +394,14 @@ class TestSteerMultipleTools:
         mock_request2.tool_call = {"name": "tool2", "id": "call_2", "args": {}}
 
         # Execute first tool (should consume)
-        result1 = await mock_middleware._check_and_execute(mock_request1, mock_handler)
+        with bind_run_context(context):
+            result1 = await middleware._check_and_execute(mock_request1, mock_handler)
         assert "[Skipped:" in result1.content
         assert mock_queue_manager.consume_pending.call_count == 1
 
         # Execute second tool (should NOT consume again)
-        result2 = await mock_middleware._check_and_execute(mock_request2, mock_handler)
+        with bind_run_context(context):
+            result2 = await middleware._check_and_execute(mock_request2, mock_handler)
         assert "[Skipped:" in result2.content
         # Still only called once
         assert mock_queue_manager.consume_pending.call_count == 1
@@ -0,0 +1,202 @@
+"""Tests for progressive response streaming via message edits."""
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from openpaw.agent.middleware.llm_hooks import ThinkingStreamFilter
+from openpaw.channels.base import ChannelAdapter
+from openpaw.channels.streaming import STREAM_CURSOR, StreamingResponse
+from openpaw.model.message import Message, MessageDirection
+
+
+class EditableChannel(ChannelAdapter):
+    """In-memory channel that records sends, edits and deletes."""
+
+    name = "fake"
+    MAX_MESSAGE_LENGTH = 50
+
+    def __init__(self) -> None:
+        self.stream_edit_interval = 0.0
+        self.messages: dict[str, str] = {}
+        self.edits: list[tuple[str, str, bool]] = []
+        self.deleted: list[str] = []
+        self._next_id = 0
+
+    async def start(self) -> None:
+        pass
+
+    async def stop(self) -> None:
+        pass
+
+    def on_message(self, callback: Any) -> None:
+        pass
+
+    async def send_message(self, session_key: str, content: str, **kwargs: Any) -> Message:
+        self._next_id += 1
+        message_id = str(self._next_id)
+        self.messages[message_id] = content
+        return Message(
+            id=message_id,
+            channel=self.name,
+            session_key=session_key,
+            user_id="bot",
+            content=content,
+            direction=MessageDirection.OUTBOUND,
+        )
+
+    async def edit_message(
+        self, session_key: str, message_id: str, content: str, final: bool = False
+    ) -> None:
+        assert len(content) <= self.MAX_MESSAGE_LENGTH
+        self.messages[message_id] = content
+        self.edits.append((message_id, content, final))
+
+    async def delete_message(self, session_key: str, message_id: str) -> None:
+        self.deleted.append(message_id)
+        self.messages.pop(message_id, None)
+
+
+async def _drain() -> None:
+    """Let scheduled flush tasks run."""
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+class TestStreamingResponse:
+    """StreamingResponse edit cadence, rollover and cleanup."""
+
+    async def test_first_update_sends_message(self) -> None:
+        channel = EditableChannel()
+        stream = StreamingResponse(channel, "fake:1")
+
+        await stream.update("Hello")
+        await _drain()
+
+        assert stream.started
+        assert list(channel.messages.values()) == ["Hello" + STREAM_CURSOR]
+
+    async def test_finish_applies_final_edit_without_cursor(self) -> None:
+        channel = EditableChannel()
+        stream = StreamingResponse(channel, "fake:1")
+
+        await stream.update("Hel")
+        await _drain()
+        await stream.finish("Hello world")
+
+        assert list(channel.messages.values()) == ["Hello world"]
+        assert channel.edits[-1][2] is True
+
+    async def test_edits_are_rate_limited(self) -> None:
+        channel = EditableChannel()
+        channel.stream_edit_interval = 60.0
+        stream = StreamingResponse(channel, "fake:1")
+
+        await stream.update("a")
+        await _drain()
+        for text in ("ab", "abc", "abcd"):
+            await stream.update(text)
+            await _drain()
+
+        # Only the first render happened; later text waits for the interval
+        assert [content for _, content, _ in channel.edits] == ["a" + STREAM_CURSOR]
+        await stream.finish("abcd")
+        assert list(channel.messages.values()) == ["abcd"]
+
+    async def test_rollover_at_message_limit(self) -> None:
+        channel = EditableChannel()
+        stream = StreamingResponse(channel, "fake:1")
+        text = "first paragraph " * 2 + "\n\n" + "second paragraph " * 2
+
+        await stream.finish(text)
+
+        assert len(channel.messages) == 2
+        assert all(len(content) <= channel.MAX_MESSAGE_LENGTH for content in channel.messages.values())
+        assert "".join(channel.messages.values()).replace("\n", "") == text.replace("\n", "")
+
+    async def test_shorter_final_text_deletes_extra_messages(self) -> None:
+        channel = EditableChannel()
+        stream = StreamingResponse(channel, "fake:1")
+
+        await stream.update("x" * 80)
+        await _drain()
+        assert len(channel.messages) == 2
+
+        await stream.finish("short")
+
+        assert list(channel.messages.values()) == ["short"]
+        assert len(channel.deleted) == 1
+
+    async def test_discard_deletes_sent_messages(self) -> None:
+        channel = EditableChannel()
+        stream = StreamingResponse(channel, "fake:1")
+
+        await stream.update("partial")
+        await _drain()
+        await stream.discard()
+
+        assert channel.messages == {}
+        assert not stream.started
+
+    async def test_failed_final_edit_falls_back_to_send(self) -> None:
+        channel = EditableChannel()
+        stream = StreamingResponse(channel, "fake:1")
+        await stream.update("partial")
+        await _drain()
+
+        async def failing_edit(*args: Any, **kwargs: Any) -> None:
+            raise RuntimeError("edit rejected")
+
+        channel.edit_message = failing_edit  # type: ignore[method-assign]
+        await stream.finish("complete")
+
+        assert list(channel.messages.values()) == ["complete"]
+
+    async def test_finish_during_first_send_waits_for_placeholder(self) -> None:
+        channel = EditableChannel()
+        sent = asyncio.Event()
+        release = asyncio.Event()
+        send = channel.send_message
+
+        async def slow_send(session_key: str, content: str, **kwargs: Any) -> Message:
+            # Delivered at once, but the reply carrying the ID is slow
+            message = await send(session_key, content, **kwargs)
+            sent.set()
+            await release.wait()
+            return message
+
+        channel.send_message = slow_send  # type: ignore[method-assign]
+        stream = StreamingResponse(channel, "fake:1")
+        await stream.update("Sure")
+        await sent.wait()
+        assert not stream.started
+
+        finishing = asyncio.create_task(stream.finish("Sure!"))
+        await _drain()
+        release.set()
+        await finishing
+        await _drain()
+
+        assert channel.messages == {"1": "Sure!"}
+        assert channel.edits[-1] == ("1", "Sure!", True)
+        assert all(STREAM_CURSOR not in content for content in channel.messages.values())
+
+
+class TestThinkingStreamFilter:
+    """Incremental <think> stripping across chunk boundaries."""
+
+    @pytest.mark.parametrize(
+        ("chunks", "expected"),
+        [
+            (["Hello ", "world"], "Hello world"),
+            (["<thi", "nk>plan</th", "ink>\n\nAnswer"], "Answer"),
+            (["Before <THINK>x</think> after"], "Before after"),
+            (["a <", "b"], "a <b"),
+            (["<think>never closed"], ""),
+        ],
+    )
+    def test_filter(self, chunks: list[str], expected: str) -> None:
+        stream_filter = ThinkingStreamFilter()
+        visible = "".join(stream_filter.feed(chunk) for chunk in chunks) + stream_filter.flush()
+        assert visible == expected
@@ -6,6 +6,7 @@ from unittest.mock import AsyncMock, Mock
 import pytest
 
 from openpaw.agent.metrics import InvocationMetrics, TokenUsageLogger
+from openpaw.agent.run_context import RunContext
 from openpaw.agent.runner import AgentRunner
 from openpaw.channels.base import ChannelAdapter
 from openpaw.model.subagent import SubAgentRequest, SubAgentResult, SubAgentStatus
@@ -50,15 +51,17 @@ def mock_agent_runner():
     # Default behavior: return quickly
     async def quick_run(message):
         await asyncio.sleep(0.01)  # Small delay to simulate work
-        return "Test response"
+        return RunContext(
+            response="Test response",
+            metrics=InvocationMetrics(
+                input_tokens=100, output_tokens=50, total_tokens=150, llm_calls=1
+            ),
+        )
 
     runner.run = AsyncMock(side_effect=quick_run)
     runner.additional_tools = []
     runner._build_agent = Mock(return_value=Mock())
     runner._agent = Mock()
-    runner.last_metrics = InvocationMetrics(
-        input_tokens=100, output_tokens=50, total_tokens=150, llm_calls=1
-    )
     return runner
 
 
@@ -126,13 +129,12 @@ async def test_spawn_enforces_concurrent_limit(mock_store, mock_channel, mock_to
 
     async def slow_run(message):
         await asyncio.sleep(5)  # Long enough to keep tasks active
-        return "Test response"
+        return RunContext(response="Test response")
 
     slow_runner.run = AsyncMock(side_effect=slow_run)
     slow_runner.additional_tools = []
     slow_runner._build_agent = Mock(return_value=Mock())
     slow_runner._agent = Mock()
-    slow_runner.last_metrics = None
 
     def slow_factory():
         return slow_runner
@@ -278,7 +280,7 @@ async def test_execute_handles_timeout(
     # Make agent runner hang
     async def slow_run(message):
         await asyncio.sleep(10)
-        return "Should not reach here"
+        return RunContext(response="Should not reach here")
 
     mock_agent_runner.run = slow_run
 
@@ -325,7 +327,7 @@ async def test_execute_handles_cancellation(
     # Make agent runner hang so we can cancel it
     async def slow_run(message):
         await asyncio.sleep(10)
-        return "Should not reach here"
+        return RunContext(response="Should not reach here")
 
     mock_agent_runner.run = slow_run
 
@@ -378,13 +380,12 @@ async def test_cancel_cancels_running_task(mock_store, mock_channel, mock_token_
 
     async def slow_run(message):
         await asyncio.sleep(5)  # Long enough to keep task active
-        return "Test response"
+        return RunContext(response="Test response")
 
     slow_runner.run = AsyncMock(side_effect=slow_run)
     slow_runner.additional_tools = []
     slow_runner._build_agent = Mock(return_value=Mock())
     slow_runner._agent = Mock()
-    slow_runner.last_metrics = None
 
     def slow_factory():
         return slow_runner
@@ -441,13 +442,12 @@ async def test_shutdown_cancels_all_active_tasks(mock_store, mock_channel, mock_
 
     async def slow_run(message):
         await asyncio.sleep(5)  # Long enough to keep tasks active
-        return "Test response"
+        return RunContext(response="Test response")
 
     slow_runner.run = AsyncMock(side_effect=slow_run)
     slow_runner.additional_tools = []
     slow_runner._build_agent = Mock(return_value=Mock())
     slow_runner._agent = Mock()
-    slow_runner.last_metrics = None
 
     def slow_factory():
         return slow_runner
@@ -505,11 +505,10 @@ async def test_tool_filtering_removes_excluded_tools(
     excluded_tool.name = "spawn_agent"
 
     mock_runner = Mock(spec=AgentRunner)
-    mock_runner.run = AsyncMock(return_value="Test response")
+    mock_runner.run = AsyncMock(return_value=RunContext(response="Test response"))
     mock_runner.additional_tools = [allowed_tool, excluded_tool]
     mock_runner._build_agent = Mock(return_value=Mock())
     mock_runner._agent = Mock()
-    mock_runner.last_metrics = None
 
     def factory():
         return mock_runner
@@ -917,13 +916,12 @@ async def test_timeout_sends_notification_when_notify_true(
 
     async def slow_run(message):
         await asyncio.sleep(10)
-        return "Should not reach here"
+        return RunContext(response="Should not reach here")
 
     mock_runner.run = slow_run
     mock_runner.additional_tools = []
     mock_runner._build_agent = Mock(return_value=Mock())
     mock_runner._agent = Mock()
-    mock_runner.last_metrics = None
     mock_runner.timeout_seconds = 300.0
 
     mock_callback = AsyncMock()
@@ -972,13 +970,12 @@ async def test_timeout_override_sets_inner_timeout_higher(
         nonlocal captured_timeout
         captured_timeout = mock_runner.timeout_seconds
         await asyncio.sleep(0.01)
-        return "Test response"
+        return RunContext(response="Test response")
 
     mock_runner.run = capture_run
     mock_runner.additional_tools = []
     mock_runner._build_agent = Mock(return_value=Mock())
     mock_runner._agent = Mock()
-    mock_runner.last_metrics = None
 
     runner = SubAgentRunner(
         agent_factory=lambda: mock_runner,
@@ -0,0 +1,174 @@
+"""Tests for per-workspace token budgets enforced at lane admission."""
+
+import asyncio
+import json
+import time
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+from langchain_core.messages import HumanMessage
+
+from openpaw.agent.metrics import InvocationMetrics, TokenUsageLogger
+from openpaw.agent.middleware.budget_downgrade import BudgetDowngradeMiddleware
+from openpaw.agent.middleware.prompt_cache import build_cached_system_message
+from openpaw.core.config.models import TokenBudgetConfig, TokenBudgetLimit
+from openpaw.core.paths import TOKEN_USAGE_JSONL
+from openpaw.runtime.queue.budget import (
+    BudgetAction,
+    TokenBudget,
+    TokenBudgetExceededError,
+    budget_downgrade,
+    budget_downgrade_active,
+)
+from openpaw.runtime.queue.lane import LaneQueue, QueueItem
+
+
+async def _stop(task: asyncio.Task[None]) -> None:
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
+
+
+def _budget(**kwargs) -> TokenBudget:
+    return TokenBudget(TokenBudgetConfig(enabled=True, **kwargs))
+
+
+def test_workspace_limit_defers_until_window_has_room():
+    budget = _budget(tokens_per_hour=1000)
+    budget.record("user", 600)
+    assert budget.check("user").action is BudgetAction.ADMIT
+
+    budget.record("cron", 400)
+    decision = budget.check("user")
+
+    assert decision.action is BudgetAction.DEFER
+    assert decision.reason == "workspace tokens/hour"
+    assert 0 < decision.retry_after <= 3600
+
+
+def test_usage_expires_from_rolling_window():
+    budget = _budget(tokens_per_hour=1000)
+    budget.record("user", 1000, at=time.time() - 3700)
+
+    assert budget.check("user").action is BudgetAction.ADMIT
+    assert budget.get_stats()["scopes"]["workspace"]["hour"] == 0
+
+
+def test_invocation_type_limits_and_strictest_policy():
+    budget = _budget(
+        tokens_per_day=10_000,
+        policy="downgrade",
+        downgrade_model="anthropic:claude-haiku-4-5",
+        invocation_types={"cron": TokenBudgetLimit(tokens_per_hour=100, policy="reject")},
+    )
+    budget.record("cron", 100)
+
+    assert budget.check("cron").action is BudgetAction.REJECT
+    assert budget.check("user").action is BudgetAction.ADMIT
+
+    budget.record("user", 10_000)
+    # Both the cron and workspace limits are used up; reject is stricter
+    assert budget.check("cron").action is BudgetAction.REJECT
+    assert budget.check("user").action is BudgetAction.DOWNGRADE
+
+
+def test_disabled_budget_admits_everything():
+    budget = TokenBudget(TokenBudgetConfig(enabled=False, tokens_per_hour=1))
+    budget.record("user", 100)
+    assert budget.check("user").action is BudgetAction.ADMIT
+
+
+def test_downgrade_policy_requires_model():
+    with pytest.raises(ValueError, match="downgrade_model"):
+        TokenBudgetConfig(invocation_types={"subagent": TokenBudgetLimit(policy="downgrade")})
+
+
+def test_usage_logger_feeds_budget_and_load_seeds_last_day(tmp_path):
+    budget = _budget(tokens_per_day=1000)
+    logger = TokenUsageLogger(tmp_path, budget=budget)
+    logger.log(InvocationMetrics(total_tokens=300), workspace="ws", invocation_type="heartbeat")
+    assert budget.get_stats()["scopes"]["workspace"]["day"] == 300
+
+    log_path = tmp_path / str(TOKEN_USAGE_JSONL)
+    old = {"timestamp": (datetime.now(UTC) - timedelta(days=2)).isoformat(), "total_tokens": 5000}
+    with open(log_path, "a") as f:
+        f.write(json.dumps(old) + "\n")
+
+    restarted = _budget(tokens_per_day=1000)
+    assert restarted.load(log_path) == 1
+    assert restarted.get_stats()["scopes"]["workspace"]["day"] == 300
+
+
+@pytest.mark.asyncio
+async def test_deferred_session_does_not_block_others():
+    budget = _budget(invocation_types={"cron": TokenBudgetLimit(tokens_per_hour=10)})
+    budget.record("cron", 10)
+    lane_queue = LaneQueue(token_budget=budget)
+    handled: list[str] = []
+
+    async def handler(item: QueueItem) -> None:
+        handled.append(item.session_key)
+
+    await lane_queue.enqueue(QueueItem(session_key="telegram:1", payload=None, invocation_type="cron"))
+    await lane_queue.enqueue(QueueItem(session_key="telegram:2", payload=None))
+    processor = asyncio.create_task(lane_queue.process("main", handler))
+    await asyncio.sleep(0.05)
+
+    assert handled == ["telegram:2"]
+    assert lane_queue.get_stats()["main"]["queued"] == 1
+    assert budget.get_stats()["deferred"] == 1
+    await _stop(processor)
+
+
+@pytest.mark.asyncio
+async def test_slot_rejected_or_downgraded_by_policy():
+    budget = _budget(
+        downgrade_model="anthropic:claude-haiku-4-5",
+        invocation_types={
+            "cron": TokenBudgetLimit(tokens_per_hour=10, policy="reject"),
+            "subagent": TokenBudgetLimit(tokens_per_hour=10, policy="downgrade"),
+        },
+    )
+    budget.record("cron", 10)
+    budget.record("subagent", 10)
+    lane_queue = LaneQueue(token_budget=budget)
+    processors = [asyncio.create_task(lane_queue.process_slots(name)) for name in ("cron", "subagent")]
+
+    with pytest.raises(TokenBudgetExceededError):
+        async with lane_queue.slot("cron", "cron:nightly", invocation_type="cron"):
+            pass
+    async with lane_queue.slot("subagent", "subagent:a", invocation_type="subagent"):
+        assert budget_downgrade_active()
+    assert not budget_downgrade_active()
+
+    stats = budget.get_stats()
+    assert stats["rejected"] == 1
+    assert stats["downgraded"] == 1
+    for processor in processors:
+        await _stop(processor)
+
+
+def test_downgrade_middleware_retargets_flagged_calls():
+    cheap = object()
+    middleware = BudgetDowngradeMiddleware("anthropic:claude-sonnet-4-5", cheap, "openai:gpt-4.1-mini")
+    calls: list = []
+
+    class FakeRequest(SimpleNamespace):
+        def override(self, **overrides):
+            return FakeRequest(**{**vars(self), **overrides})
+
+    request = FakeRequest(
+        model=object(),
+        messages=[HumanMessage(content="hi")],
+        system_message=build_cached_system_message("stable", "volatile", "anthropic"),
+    )
+    middleware.wrap_model_call(request, calls.append)
+    with budget_downgrade():
+        middleware.wrap_model_call(request, calls.append)
+
+    assert calls[0] is request
+    assert calls[1].model is cheap
+    assert calls[1].system_message.content == "stable\n\nvolatile"
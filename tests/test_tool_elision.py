@@ -0,0 +1,110 @@
+"""Tests for the stale tool output elision middleware."""
+
+from types import SimpleNamespace
+
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+
+from openpaw.agent.middleware.tool_elision import (
+    ToolOutputElisionMiddleware,
+    build_elision_stub,
+)
+from openpaw.agent.run_context import RunContext, bind_run_context
+
+
+class FakeRequest(SimpleNamespace):
+    """Minimal ModelRequest stand-in supporting override()."""
+
+    def override(self, **overrides):
+        return FakeRequest(**{**vars(self), **overrides})
+
+
+def _turn(index: int, size: int, args: dict | None = None) -> list:
+    """One user turn with a tool round trip and a reply."""
+    return [
+        HumanMessage(content=f"question {index}"),
+        AIMessage(
+            content="",
+            tool_calls=[{
+                "name": "read_file",
+                "args": args if args is not None else {"file_path": f"notes/{index}.md"},
+                "id": f"call_{index}",
+            }],
+        ),
+        ToolMessage(content="y" * size, tool_call_id=f"call_{index}", name="read_file"),
+        AIMessage(content=f"answer {index}"),
+    ]
+
+
+def test_stub_points_at_path():
+    stub = build_elision_stub("read_file", {"file_path": "notes/a.md"}, 12000)
+    assert "read_file" in stub
+    assert "12,000 chars" in stub
+    assert "read_file('notes/a.md')" in stub
+
+    stub = build_elision_stub("shell", {"command": "ls -la"}, 900)
+    assert "ls -la" in stub
+    assert "call the tool again" in stub
+
+
+def test_old_outputs_elided_latest_turn_kept():
+    """Outputs past max_age_turns are stubbed; the current turn is untouched."""
+    middleware = ToolOutputElisionMiddleware(max_age_turns=2, max_chars=100000)
+    messages = _turn(0, 2000) + _turn(1, 2000) + _turn(2, 2000)
+
+    elided, saved = middleware.elide(messages)
+
+    assert "elided" in elided[2].content
+    assert "notes/0.md" in elided[2].content
+    assert elided[2].tool_call_id == "call_0"
+    assert elided[6] is messages[6]
+    assert elided[10] is messages[10]
+    assert saved > 0
+    # Originals are left alone for the checkpointer
+    assert messages[2].content == "y" * 2000
+
+
+def test_large_outputs_elided_after_one_turn():
+    middleware = ToolOutputElisionMiddleware(max_age_turns=5, max_chars=3000)
+    messages = _turn(0, 1000) + _turn(1, 8000) + _turn(2, 8000)
+
+    elided, _ = middleware.elide(messages)
+
+    assert elided[2] is messages[2]  # Small and recent enough
+    assert "8,000 chars" in elided[6].content
+    assert elided[10] is messages[10]  # Latest turn
+
+
+def test_small_outputs_never_elided():
+    middleware = ToolOutputElisionMiddleware(max_age_turns=1, max_chars=10)
+    messages = _turn(0, 100) + _turn(1, 100)
+
+    elided, saved = middleware.elide(messages)
+
+    assert elided == messages
+    assert saved == 0
+
+
+def test_savings_recorded_on_run_context():
+    middleware = ToolOutputElisionMiddleware(max_age_turns=1, max_chars=100000)
+    messages = _turn(0, 4000) + _turn(1, 100)
+    context = RunContext()
+
+    with bind_run_context(context):
+        first = middleware._prepare(FakeRequest(messages=messages))
+        middleware._prepare(FakeRequest(messages=messages))
+
+    assert first.messages[2].content.startswith("[Output of read_file")
+    assert context.elided_tokens_dropped > 0
+    assert context.elided_tokens_saved == 2 * context.elided_tokens_dropped
+
+
+def test_nothing_to_elide_returns_request():
+    middleware = ToolOutputElisionMiddleware(max_age_turns=1, max_chars=100)
+    original = FakeRequest(messages=_turn(0, 5000))
+    context = RunContext()
+
+    with bind_run_context(context):
+        request = middleware._prepare(original)
+
+    assert request is original
+    assert context.elided_tokens_saved == 0
@@ -1,20 +1,16 @@
 """Tests for QueueAwareToolMiddleware."""
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from langchain_core.messages import ToolMessage
 
 from openpaw.agent.middleware.queue_aware import InterruptSignalError, QueueAwareToolMiddleware
+from openpaw.agent.run_context import RunContext, bind_run_context
 from openpaw.runtime.queue.lane import QueueMode
 
 
-@pytest.fixture
-def middleware():
-    """Create a QueueAwareToolMiddleware instance for testing."""
-    return QueueAwareToolMiddleware()
-
-
 @pytest.fixture
 def mock_queue_manager():
     """Create a mock QueueManager."""
@@ -24,6 +20,17 @@ def mock_queue_manager():
     return manager
 
 
+@pytest.fixture
+def middleware(mock_queue_manager):
+    """Create a QueueAwareToolMiddleware instance for testing."""
+    return QueueAwareToolMiddleware(mock_queue_manager)
+
+
+def _context(mode: QueueMode, session_key: str = "test_session") -> RunContext:
+    """Build a run context for a session in the given queue mode."""
+    return RunContext(session_key=session_key, queue_mode=mode)
+
+
 @pytest.fixture
 def mock_request():
     """Create a mock tool request."""
@@ -51,12 +58,13 @@ def mock_handler():
 @pytest.mark.asyncio
 async def test_collect_mode_executes_normally(middleware, mock_queue_manager, mock_request, mock_handler):
     """Collect mode: tool executes normally (no-op)."""
-    middleware.set_queue_awareness(mock_queue_manager, "test_session", QueueMode.COLLECT)
+    context = _context(QueueMode.COLLECT)
 
     # Even if messages are pending, collect mode executes normally
     mock_queue_manager.peek_pending.return_value = True
 
-    result = await middleware._check_and_execute(mock_request, mock_handler)
+    with bind_run_context(context):
+        result = await middleware._check_and_execute(mock_request, mock_handler)
 
     # Handler was called
     mock_handler.assert_called_once_with(mock_request)
@@ -68,9 +76,8 @@ async def test_collect_mode_executes_normally(middleware, mock_queue_manager, mo
 
 
 @pytest.mark.asyncio
-async def test_no_queue_awareness_executes_normally(middleware, mock_request, mock_handler):
-    """No queue awareness set: tool executes normally."""
-    # Don't call set_queue_awareness
+async def test_no_run_context_executes_normally(middleware, mock_request, mock_handler):
+    """No run context bound: tool executes normally."""
     result = await middleware._check_and_execute(mock_request, mock_handler)
 
     # Handler was called
@@ -83,10 +90,11 @@ async def test_steer_mode_no_pending_executes_normally(
     middleware, mock_queue_manager, mock_request, mock_handler
 ):
     """Steer mode with no pending: tool executes normally."""
-    middleware.set_queue_awareness(mock_queue_manager, "test_session", QueueMode.STEER)
+    context = _context(QueueMode.STEER)
     mock_queue_manager.peek_pending.return_value = False
 
-    result = await middleware._check_and_execute(mock_request, mock_handler)
+    with bind_run_context(context):
+        result = await middleware._check_and_execute(mock_request, mock_handler)
 
     # Handler was called
     mock_handler.assert_called_once_with(mock_request)
@@ -100,14 +108,15 @@ async def test_steer_mode_no_pending_executes_normally(
 @pytest.mark.asyncio
 async def test_steer_mode_with_pending_skips_tool(middleware, mock_queue_manager, mock_request, mock_handler):
     """Steer mode with pending: tool skipped, pending messages stored."""
-    middleware.set_queue_awareness(mock_queue_manager, "test_session", QueueMode.STEER)
+    context = _context(QueueMode.STEER)
     mock_queue_manager.peek_pending.return_value = True
     mock_queue_manager.consume_pending.return_value = [
         ("telegram", "New message 1"),
         ("telegram", "New message 2"),
     ]
 
-    result = await middleware._check_and_execute(mock_request, mock_handler)
+    with bind_run_context(context):
+        result = await middleware._check_and_execute(mock_request, mock_handler)
 
     # Handler was NOT called
     mock_handler.assert_not_called()
@@ -122,8 +131,8 @@ async def test_steer_mode_with_pending_skips_tool(middleware, mock_queue_manager
     assert result.tool_call_id == "test-tool-call-id"
 
     # Middleware stored pending messages
-    assert middleware.was_steered is True
-    assert middleware.pending_steer_message == [
+    assert context.steered is True
+    assert context.steer_messages == [
         ("telegram", "New message 1"),
         ("telegram", "New message 2"),
     ]
@@ -134,12 +143,13 @@ async def test_interrupt_mode_with_pending_raises_signal(
     middleware, mock_queue_manager, mock_request, mock_handler
 ):
     """Interrupt mode with pending: InterruptSignalError raised with messages."""
-    middleware.set_queue_awareness(mock_queue_manager, "test_session", QueueMode.INTERRUPT)
+    context = _context(QueueMode.INTERRUPT)
     mock_queue_manager.peek_pending.return_value = True
     mock_queue_manager.consume_pending.return_value = [("telegram", "Interrupt message")]
 
     with pytest.raises(InterruptSignalError) as exc_info:
-        await middleware._check_and_execute(mock_request, mock_handler)
+        with bind_run_context(context):
+            await middleware._check_and_execute(mock_request, mock_handler)
 
     # Handler was NOT called
     mock_handler.assert_not_called()
@@ -157,10 +167,11 @@ async def test_interrupt_mode_no_pending_executes_normally(
     middleware, mock_queue_manager, mock_request, mock_handler
 ):
     """Interrupt mode with no pending: tool executes normally."""
-    middleware.set_queue_awareness(mock_queue_manager, "test_session", QueueMode.INTERRUPT)
+    context = _context(QueueMode.INTERRUPT)
     mock_queue_manager.peek_pending.return_value = False
 
-    result = await middleware._check_and_execute(mock_request, mock_handler)
+    with bind_run_context(context):
+        result = await middleware._check_and_execute(mock_request, mock_handler)
 
     # Handler was called
     mock_handler.assert_called_once_with(mock_request)
@@ -172,61 +183,73 @@ async def test_interrupt_mode_no_pending_executes_normally(
 
 
 @pytest.mark.asyncio
-async def test_reset_clears_state(middleware, mock_queue_manager):
-    """reset() clears all state."""
-    # Set up state
-    middleware.set_queue_awareness(mock_queue_manager, "test_session", QueueMode.STEER)
-    middleware._pending_steer_message = [("telegram", "Message")]
-    middleware._steered = True
-
-    # Reset
-    middleware.reset()
-
-    # State is cleared
-    assert middleware._queue_manager is None
-    assert middleware._session_key is None
-    assert middleware._queue_mode == QueueMode.COLLECT
-    assert middleware._pending_steer_message is None
-    assert middleware._steered is False
-    assert middleware.was_steered is False
-    assert middleware.pending_steer_message is None
+async def test_no_queue_manager_executes_normally(mock_request, mock_handler):
+    """Middleware without a queue manager is a pass-through in every mode."""
+    middleware = QueueAwareToolMiddleware()
+    context = _context(QueueMode.INTERRUPT)
+
+    with bind_run_context(context):
+        result = await middleware._check_and_execute(mock_request, mock_handler)
+
+    mock_handler.assert_called_once_with(mock_request)
+    assert result.content == "Tool executed successfully"
 
 
 @pytest.mark.asyncio
-async def test_set_queue_awareness_configures_state(middleware, mock_queue_manager):
-    """set_queue_awareness() configures state correctly."""
-    middleware.set_queue_awareness(mock_queue_manager, "test_session", QueueMode.INTERRUPT)
+async def test_steer_state_is_isolated_per_run_context(middleware, mock_queue_manager, mock_handler):
+    """A steer in one session's run does not skip tools in another session's run."""
+
+    async def peek_pending(session_key):
+        return session_key == "session_a"
+
+    mock_queue_manager.peek_pending.side_effect = peek_pending
+    mock_queue_manager.consume_pending.return_value = [("telegram", "New message")]
+    context_a = _context(QueueMode.STEER, session_key="session_a")
+    context_b = _context(QueueMode.STEER, session_key="session_b")
+
+    async def call_tool(context, tool_id):
+        request = MagicMock()
+        request.tool_call = {"id": tool_id, "name": "test_tool", "args": {}}
+        with bind_run_context(context):
+            return await middleware._check_and_execute(request, mock_handler)
 
-    assert middleware._queue_manager is mock_queue_manager
-    assert middleware._session_key == "test_session"
-    assert middleware._queue_mode == QueueMode.INTERRUPT
-    assert middleware._pending_steer_message is None
-    assert middleware._steered is False
+    result_a, result_b = await asyncio.gather(
+        call_tool(context_a, "tool-a"), call_tool(context_b, "tool-b")
+    )
+
+    assert "[Skipped" in result_a.content
+    assert result_b.content == "Tool executed successfully"
+    assert context_a.steered is True
+    assert context_a.steer_messages == [("telegram", "New message")]
+    assert context_b.steered is False
+    assert context_b.steer_messages is None
+    mock_queue_manager.consume_pending.assert_called_once_with("session_a")
 
 
 @pytest.mark.asyncio
-async def test_was_steered_property_tracks_state(middleware, mock_queue_manager, mock_request, mock_handler):
-    """was_steered property tracks steer state."""
-    middleware.set_queue_awareness(mock_queue_manager, "test_session", QueueMode.STEER)
+async def test_steered_tracks_state(middleware, mock_queue_manager, mock_request, mock_handler):
+    """RunContext.steered tracks steer state."""
+    context = _context(QueueMode.STEER)
 
     # Initially not steered
-    assert middleware.was_steered is False
+    assert context.steered is False
 
     # Trigger steer
     mock_queue_manager.peek_pending.return_value = True
     mock_queue_manager.consume_pending.return_value = [("telegram", "Message")]
-    await middleware._check_and_execute(mock_request, mock_handler)
+    with bind_run_context(context):
+        await middleware._check_and_execute(mock_request, mock_handler)
 
     # Now steered
-    assert middleware.was_steered is True
+    assert context.steered is True
 
 
 @pytest.mark.asyncio
-async def test_pending_steer_message_stores_consumed_messages(
+async def test_steer_messages_stores_consumed_messages(
     middleware, mock_queue_manager, mock_request, mock_handler
 ):
-    """pending_steer_message stores consumed messages."""
-    middleware.set_queue_awareness(mock_queue_manager, "test_session", QueueMode.STEER)
+    """RunContext.steer_messages stores consumed messages."""
+    context = _context(QueueMode.STEER)
     mock_queue_manager.peek_pending.return_value = True
     mock_queue_manager.consume_pending.return_value = [
         ("telegram", "Message 1"),
@@ -234,13 +257,14 @@ async def test_pending_steer_message_stores_consumed_messages(
     ]
 
     # Initially None
-    assert middleware.pending_steer_message is None
+    assert context.steer_messages is None
 
     # Trigger steer
-    await middleware._check_and_execute(mock_request, mock_handler)
+    with bind_run_context(context):
+        await middleware._check_and_execute(mock_request, mock_handler)
 
     # Messages stored
-    assert middleware.pending_steer_message == [
+    assert context.steer_messages == [
         ("telegram", "Message 1"),
         ("telegram", "Message 2"),
     ]
@@ -255,26 +279,28 @@ async def test_multiple_tools_first_triggers_steer_all_subsequent_skipped(
     This prevents the ReAct loop from continuing to execute tools after the LLM
     sees skip messages and generates new tool calls in a subsequent iteration.
     """
-    middleware.set_queue_awareness(mock_queue_manager, "test_session", QueueMode.STEER)
+    context = _context(QueueMode.STEER)
     mock_queue_manager.peek_pending.return_value = True
     mock_queue_manager.consume_pending.return_value = [("telegram", "New message")]
 
     # First tool call — triggers steer and consumes
     request1 = MagicMock()
     request1.tool_call = {"id": "tool-1", "name": "tool_1", "args": {}}
-    result1 = await middleware._check_and_execute(request1, mock_handler)
+    with bind_run_context(context):
+        result1 = await middleware._check_and_execute(request1, mock_handler)
 
-    assert middleware.was_steered is True
+    assert context.steered is True
     assert isinstance(result1, ToolMessage)
     assert "[Skipped" in result1.content
     mock_queue_manager.consume_pending.assert_called_once()
 
     # Second tool call — same batch, no pending anymore (already consumed)
-    # Must still be skipped because _steered is True
+    # Must still be skipped because context.steered is True
     request2 = MagicMock()
     request2.tool_call = {"id": "tool-2", "name": "tool_2", "args": {}}
     mock_queue_manager.peek_pending.return_value = False
-    result2 = await middleware._check_and_execute(request2, mock_handler)
+    with bind_run_context(context):
+        result2 = await middleware._check_and_execute(request2, mock_handler)
 
     assert isinstance(result2, ToolMessage)
     assert "[Skipped" in result2.content
@@ -284,7 +310,8 @@ async def test_multiple_tools_first_triggers_steer_all_subsequent_skipped(
     # skip messages and generated new tool calls. Must still be skipped.
     request3 = MagicMock()
     request3.tool_call = {"id": "tool-3", "name": "tool_3", "args": {}}
-    result3 = await middleware._check_and_execute(request3, mock_handler)
+    with bind_run_context(context):
+        result3 = await middleware._check_and_execute(request3, mock_handler)
 
     assert isinstance(result3, ToolMessage)
     assert "[Skipped" in result3.content
@@ -296,10 +323,11 @@ async def test_multiple_tools_first_triggers_steer_all_subsequent_skipped(
 @pytest.mark.asyncio
 async def test_followup_mode_executes_normally(middleware, mock_queue_manager, mock_request, mock_handler):
     """FOLLOWUP mode executes tools normally (fallback behavior)."""
-    middleware.set_queue_awareness(mock_queue_manager, "test_session", QueueMode.FOLLOWUP)
+    context = _context(QueueMode.FOLLOWUP)
     mock_queue_manager.peek_pending.return_value = True
 
-    result = await middleware._check_and_execute(mock_request, mock_handler)
+    with bind_run_context(context):
+        result = await middleware._check_and_execute(mock_request, mock_handler)
 
     # Handler was called (FOLLOWUP doesn't interrupt tools)
     mock_handler.assert_called_once_with(mock_request)
@@ -311,10 +339,11 @@ async def test_steer_backlog_mode_executes_normally(
     middleware, mock_queue_manager, mock_request, mock_handler
 ):
     """STEER_BACKLOG mode executes tools normally (fallback behavior)."""
-    middleware.set_queue_awareness(mock_queue_manager, "test_session", QueueMode.STEER_BACKLOG)
+    context = _context(QueueMode.STEER_BACKLOG)
     mock_queue_manager.peek_pending.return_value = True
 
-    result = await middleware._check_and_execute(mock_request, mock_handler)
+    with bind_run_context(context):
+        result = await middleware._check_and_execute(mock_request, mock_handler)
 
     # Handler was called (STEER_BACKLOG doesn't interrupt tools yet)
     mock_handler.assert_called_once_with(mock_request)
@@ -0,0 +1,88 @@
+"""Tests for the oversized tool result spill middleware."""
+
+from pathlib import Path
+
+import pytest
+from langchain_core.messages import ToolMessage
+
+from openpaw.agent.middleware.tool_output_spill import ToolOutputSpillMiddleware
+from openpaw.core.config.models import ToolOutputSpillConfig
+from openpaw.core.paths import TOOL_OUTPUTS_DIR
+
+
+class FakeRequest:
+    """Mock request object for tool calls."""
+
+    def __init__(self, name: str, tool_call_id: str):
+        self.tool_call = {
+            "name": name,
+            "args": {},
+            "id": tool_call_id,
+        }
+
+
+def _handler_returning(content: str):
+    async def handler(request: FakeRequest) -> ToolMessage:
+        return ToolMessage(content=content, tool_call_id=request.tool_call["id"])
+
+    return handler
+
+
+@pytest.mark.asyncio
+async def test_oversized_result_spilled(tmp_path: Path):
+    """Large results are written to a file and replaced by a head/tail preview."""
+    config = ToolOutputSpillConfig(max_chars=1000, head_chars=100, tail_chars=50)
+    middleware = ToolOutputSpillMiddleware(config, tmp_path)
+    content = "HEAD" + "x" * 5000 + "\n" + "y" * 500 + "TAIL"
+
+    request = FakeRequest(name="grep_files", tool_call_id="call-abc")
+    result = await middleware._execute_with_spill(request, _handler_returning(content))
+
+    assert isinstance(result, ToolMessage)
+    assert result.tool_call_id == "call-abc"
+    assert len(result.content) < 1000
+    assert result.content.count("HEAD") == 1
+    assert result.content.endswith("TAIL")
+    assert "2 lines" in result.content
+
+    spilled = list((tmp_path / TOOL_OUTPUTS_DIR).glob("*.txt"))
+    assert len(spilled) == 1
+    assert spilled[0].read_text() == content
+    relative = str(spilled[0].relative_to(tmp_path))
+    assert f"read_file('{relative}'" in result.content
+
+
+@pytest.mark.asyncio
+async def test_small_result_passes(tmp_path: Path):
+    middleware = ToolOutputSpillMiddleware(ToolOutputSpillConfig(max_chars=1000), tmp_path)
+
+    request = FakeRequest(name="grep_files", tool_call_id="call-1")
+    result = await middleware._execute_with_spill(request, _handler_returning("short"))
+
+    assert result.content == "short"
+    assert not (tmp_path / TOOL_OUTPUTS_DIR).exists()
+
+
+@pytest.mark.asyncio
+async def test_excluded_tool_never_spilled(tmp_path: Path):
+    """read_file is excluded by default so paging a spill file cannot spill again."""
+    middleware = ToolOutputSpillMiddleware(ToolOutputSpillConfig(max_chars=10), tmp_path)
+
+    request = FakeRequest(name="read_file", tool_call_id="call-2")
+    result = await middleware._execute_with_spill(request, _handler_returning("z" * 500))
+
+    assert result.content == "z" * 500
+
+
+@pytest.mark.asyncio
+async def test_oldest_spill_files_pruned(tmp_path: Path):
+    config = ToolOutputSpillConfig(max_chars=10, max_files=2)
+    middleware = ToolOutputSpillMiddleware(config, tmp_path)
+
+    for index in range(4):
+        request = FakeRequest(name="shell", tool_call_id=f"call-{index}")
+        await middleware._execute_with_spill(request, _handler_returning("o" * 100))
+
+    names = sorted(p.name for p in (tmp_path / TOOL_OUTPUTS_DIR).glob("*.txt"))
+    assert len(names) == 2
+    assert names[-1].endswith("call-3.txt")
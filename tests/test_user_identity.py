@@ -16,8 +16,6 @@ def mock_processor_deps():
         "session_manager": MagicMock(),
         "queue_manager": MagicMock(),
         "builtin_loader": MagicMock(),
-        "queue_middleware": MagicMock(),
-        "approval_middleware": MagicMock(),
         "approval_manager": None,
         "workspace_name": "test_workspace",
         "token_logger": MagicMock(),
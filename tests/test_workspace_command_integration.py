@@ -7,6 +7,7 @@ import pytest
 
 from openpaw.channels.commands.router import CommandRouter
 from openpaw.core.config import Config
+from openpaw.core.config.models import ToolOutputSpillConfig
 
 
 @pytest.fixture
@@ -54,6 +55,7 @@ def mock_config():
     config.tool_timeouts = MagicMock()
     config.tool_timeouts.default_seconds = 120
     config.tool_timeouts.overrides = {}
+    config.tool_output_spill = ToolOutputSpillConfig()
     config.providers = {}
     return config
 
@@ -160,8 +160,12 @@ class TestSubAgentRunnerShutdown:
         runner._running = True
         runner._queue_processor_task = None
         runner._cleanup_task = None  # Added for periodic cleanup task
+        runner._retention_task = None
+        runner._background_lane_tasks = []  # Background lane processors
+        runner._warmup_task = None  # Model connection warm-up
+        runner._message_processor = None  # No background pre-compactions
         runner._channels = {}
-        runner._db_conn = None
+        runner._db_pool = None
         runner._approval_manager = None
         runner.workspace_name = "test_workspace"
         runner.logger = MagicMock()